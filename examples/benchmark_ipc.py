@@ -0,0 +1,140 @@
+"""
+pyubx2 inter-process (IPC) throughput benchmarking utility
+
+Compares the pickled size and queue throughput of parsed UBXMessage
+objects passed between processes via a multiprocessing.Queue, as in a
+"parse in workers, aggregate in parent" pipeline, using:
+
+- the compact UBXMessage pickle format (class, ID, mode and payload only),
+  which is only parsed again in the parent when its attributes are accessed
+- the full attribute dictionary of each message (the previous default)
+
+Usage (kwargs optional): python3 benchmark_ipc.py cycles=1000 workers=2
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+import pickle
+from multiprocessing import Process, Queue
+from platform import python_version
+from platform import version as osver
+from sys import argv
+from time import perf_counter_ns
+
+from benchmark import UBXMESSAGES
+
+from pyubx2._version import __version__ as ubxver
+from pyubx2.ubxreader import UBXReader
+
+
+def _producer(queue: Queue, cycles: int, full: bool):
+    """
+    Worker process - parse messages and put them on queue.
+
+    :param Queue queue: output queue
+    :param int cycles: number of test cycles
+    :param bool full: send full attribute dictionary rather than message
+    """
+
+    for _ in range(cycles):
+        for msg in UBXMESSAGES:
+            parsed = UBXReader.parse(msg)
+            queue.put(dict(vars(parsed)) if full else parsed)
+    queue.put(None)
+
+
+def _run(cycles: int, workers: int, full: bool) -> float:
+    """
+    Run IPC benchmark.
+
+    :param int cycles: number of test cycles per worker
+    :param int workers: number of worker processes
+    :param bool full: send full attribute dictionary rather than message
+    :return: messages per second
+    :rtype: float
+    """
+
+    queue = Queue(maxsize=1000)
+    procs = [
+        Process(target=_producer, args=(queue, cycles, full), daemon=True)
+        for _ in range(workers)
+    ]
+    start = perf_counter_ns()
+    for proc in procs:
+        proc.start()
+    count = 0
+    done = 0
+    while done < workers:
+        msg = queue.get()
+        if msg is None:
+            done += 1
+        else:
+            count += 1
+    duration = perf_counter_ns() - start
+    for proc in procs:
+        proc.join()
+    return count * 1e9 / duration
+
+
+def benchmark(**kwargs) -> tuple:
+    """
+    pyubx2 IPC benchmark test.
+
+    :param int cycles: (kwarg) number of test cycles per worker (1,000)
+    :param int workers: (kwarg) number of worker processes (2)
+    :returns: tuple of (compact, full) throughput as messages/second
+    :rtype: tuple
+    """
+
+    cyc = int(kwargs.get("cycles", 1000))
+    wrk = int(kwargs.get("workers", 2))
+    msgs = [UBXReader.parse(msg) for msg in UBXMESSAGES]
+    compact = [pickle.dumps(msg) for msg in msgs]
+    full = [pickle.dumps(dict(vars(msg))) for msg in msgs]
+
+    print(
+        f"\nOperating system: {osver()}",
+        f"\nPython version: {python_version()}",
+        f"\npyubx2 version: {ubxver}",
+        f"\nTest cycles: {cyc:,}",
+        f"\nWorker processes: {wrk:,}",
+        f"\nTxn per cycle: {len(msgs):,}",
+        f"\n\nPickled size per cycle: compact {sum(map(len, compact)):,} bytes, "
+        f"full {sum(map(len, full)):,} bytes",
+    )
+
+    for name, data in (("compact", compact), ("full", full)):
+        start = perf_counter_ns()
+        for _ in range(cyc):
+            for pkl in data:
+                pickle.loads(pkl)
+        duration = perf_counter_ns() - start
+        print(
+            f"Unpickle in parent: {name} {len(data) * cyc * 1e9 / duration:,.2f} msgs/second"
+        )
+
+    txc = _run(cyc, wrk, False)
+    txf = _run(cyc, wrk, True)
+    print(
+        f"IPC throughput: compact {txc:,.2f} msgs/second, full {txf:,.2f} msgs/second\n"
+    )
+
+    return txc, txf
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
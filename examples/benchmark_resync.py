@@ -0,0 +1,143 @@
+"""
+pyubx2 corrupt data (resync) benchmarking utility
+
+Times how long UBXReader takes to read through streams containing
+corrupt data, with errors ignored, using:
+
+- non-header noise (random bytes containing no UBX, NMEA or RTCM3 header)
+- bad checksums (tests/pygpsdata-MIXED3BADCK.log, repeated)
+- bad headers (tests/pygpsdata-BADHDR.log, repeated)
+
+Each stream is read via a peekable io.BufferedReader, which allows
+UBXReader to resync to the next plausible header in a single read,
+and via a non-peekable io.BytesIO, which is read a byte at a time.
+
+Only the public UBXReader API is used, so the script can also be run
+against earlier pyubx2 versions for comparison.
+
+Usage (kwargs optional): python3 benchmark_resync.py cycles=20 noise=100000 repeat=100
+
+Created on 19 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+import os
+from io import BufferedReader, BytesIO
+from platform import python_version
+from platform import version as osver
+from random import Random
+from sys import argv
+from time import perf_counter_ns
+
+from pyubx2._version import __version__ as ubxver
+from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxtypes_core import ERR_IGNORE
+
+DIRNAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "tests")
+HEADERS = (0xB5, 0x24, 0xD3)  # UBX, NMEA & RTCM3 first header bytes
+
+
+def _noise(size: int) -> bytes:
+    """
+    Generate repeatable random bytes containing no message header.
+
+    :param int size: number of bytes
+    :return: noise
+    :rtype: bytes
+    """
+
+    rng = Random(0)
+    values = [i for i in range(256) if i not in HEADERS]
+    return bytes(rng.choice(values) for _ in range(size))
+
+
+def _fixture(name: str) -> bytes:
+    """
+    Read test fixture.
+
+    :param str name: fixture file name
+    :return: file contents
+    :rtype: bytes
+    """
+
+    with open(os.path.join(DIRNAME, name), "rb") as infile:
+        return infile.read()
+
+
+def _run(data: bytes, cycles: int, peek: bool) -> float:
+    """
+    Read data through UBXReader.
+
+    :param bytes data: input data
+    :param int cycles: number of test cycles
+    :param bool peek: use peekable BufferedReader rather than BytesIO
+    :return: mean duration per cycle in milliseconds
+    :rtype: float
+    """
+
+    duration = 0
+    for _ in range(cycles):
+        stream = BufferedReader(BytesIO(data)) if peek else BytesIO(data)
+        ubr = UBXReader(stream, quitonerror=ERR_IGNORE)
+        start = perf_counter_ns()
+        for _ in ubr:
+            pass
+        duration += perf_counter_ns() - start
+    return duration / cycles / 1e6
+
+
+def benchmark(**kwargs) -> dict:
+    """
+    pyubx2 resync benchmark test.
+
+    :param int cycles: (kwarg) number of test cycles (20)
+    :param int noise: (kwarg) size of non-header noise in bytes (100,000)
+    :param int repeat: (kwarg) number of repeats of each fixture (100)
+    :returns: dict of {stream: (peekable, non-peekable)} duration in ms
+    :rtype: dict
+    """
+
+    cyc = int(kwargs.get("cycles", 20))
+    size = int(kwargs.get("noise", 100000))
+    rpt = int(kwargs.get("repeat", 100))
+    streams = {
+        "non-header noise": _noise(size),
+        "bad checksums": _fixture("pygpsdata-MIXED3BADCK.log") * rpt,
+        "bad headers": _fixture("pygpsdata-BADHDR.log") * rpt,
+    }
+
+    print(
+        f"\nOperating system: {osver()}",
+        f"\nPython version: {python_version()}",
+        f"\npyubx2 version: {ubxver}",
+        f"\nTest cycles: {cyc:,}\n",
+    )
+
+    results = {}
+    for name, data in streams.items():
+        results[name] = (_run(data, cyc, True), _run(data, cyc, False))
+        print(
+            f"{name} ({len(data):,} bytes): "
+            f"BufferedReader {results[name][0]:,.3f} ms, "
+            f"BytesIO {results[name][1]:,.3f} ms"
+        )
+    print()
+
+    return results
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
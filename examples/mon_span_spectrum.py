@@ -4,7 +4,11 @@ mon_span_spectrum.py
 Simple illustration of how to plot MON-SPAN spectrum data
 as a spectrum analysis chart using pyubx2 and matplotlib.
 
-Each MON-SPAN message can contain multiple RF Blocks.
+Each MON-SPAN message can contain multiple RF Blocks. The
+SpectrumWaterfall class decodes each RF block straight from
+the raw message into an array of 256 bins, and maintains a
+waterfall of recent spectra with max-hold and average
+aggregates.
 
 The sample mon_span.ubx file contains multiple MON-SPAN
 messages from M9N and F9P receivers, containing one (L1)
@@ -19,7 +23,7 @@ Created on 19 Nov 2020
 
 import matplotlib.pyplot as plt
 import numpy as np
-from pyubx2 import UBXMessage, UBXReader
+from pyubx2 import SpectrumWaterfall
 
 RF_SIGS = {
     "L1": 1.57542,
@@ -28,38 +32,29 @@ RF_SIGS = {
 }
 
 
-def plot_spectrum(msg: UBXMessage):
+def plot_spectrum(swf: SpectrumWaterfall):
     """
-    Plot frequency spectrum from MON-SPAN message
+    Plot latest and max-hold frequency spectra of each RF block
 
-    :param UBXMessage msg: MON-SPAN message
+    :param SpectrumWaterfall swf: spectrum waterfall
     """
 
-    # MON-SPAN message can contain multiple RF blocks
-    numrf = msg.numRfBlocks
-
     # plot each RF block
     maxdb = 0
     minhz = 999 * 1e9
     maxhz = 0
-    for i in range(1, numrf + 1):
-        # get MON-SPAN message attributes for this RF block
-        idx = f"_{i:02}"
-        spec = getattr(msg, "spectrum" + idx)
-        spn = getattr(msg, "span" + idx)
-        res = getattr(msg, "res" + idx)
-        ctr = getattr(msg, "center" + idx)
-        pga = getattr(msg, "pga" + idx)
-
+    for i in range(swf.blocks):
         # set data coordinates
-        x_axis = np.arange(ctr - spn / 2, ctr + spn / 2, res) / 1e9  # plot as GHz
-        y_axis = np.array(spec)  # - pga  # adjust by receiver gain
+        x_axis = np.frombuffer(swf.frequencies(i)) / 1e9  # plot as GHz
+        y_axis = np.frombuffer(swf.spectrum(i), np.uint8)  # - pga, receiver gain
+        y_max = np.frombuffer(swf.maxhold(i), np.uint8)
         minhz = min(minhz, np.min(x_axis))
         maxhz = max(maxhz, np.max(x_axis))
-        maxdb = max(maxdb, np.max(y_axis))
+        maxdb = max(maxdb, np.max(y_max))
 
         # create plot
-        plt.plot(x_axis, y_axis, label=f"RF {i}")
+        plt.plot(x_axis, y_axis, label=f"RF {i + 1}")
+        plt.plot(x_axis, y_max, label=f"RF {i + 1} max", linewidth=0.5)
 
     # plot L1, L2, L5 markers if within frequency span
     for nam, frq in RF_SIGS.items():
@@ -81,7 +76,7 @@ def plot_spectrum(msg: UBXMessage):
 if __name__ == "__main__":
     # read binary UBX data stream containing one or more MON-SPAN messages
     with open("mon_span.ubx", "rb") as stream:
-        ubr = UBXReader(stream)
-        for raw_data, parsed_data in ubr:
-            if parsed_data.identity == "MON-SPAN":
-                plot_spectrum(parsed_data)
+        spectra = SpectrumWaterfall(depth=100)
+        count = spectra.run(stream)
+    print(f"{count} MON-SPAN messages read")
+    plot_spectrum(spectra)
@@ -0,0 +1,50 @@
+"""
+ubx2rinex.py
+
+Usage:
+
+python3 ubx2rinex.py infile=base.ubx outfile=base.obs marker=BASE
+
+Optional arguments: receiver="u-blox ZED-F9P" antenna=ADVNULLANTENNA
+
+This example illustrates how to convert the RXM-RAWX raw measurement
+messages in a binary log to a RINEX 3 observation file for
+post-processing (e.g. PPK), using the RINEXWriter class.
+
+Created on 18 Oct 2026
+
+@author: semuadmin
+"""
+
+from sys import argv
+from time import perf_counter
+
+from pyubx2 import RINEXWriter
+
+
+def main(**kwargs):
+    """
+    Main Routine.
+    """
+
+    infile = kwargs.get("infile", "pygpsdata.ubx")
+    outfile = kwargs.get("outfile", "pygpsdata.obs")
+
+    print(f"Converting file {infile}...")
+    start = perf_counter()
+    with open(infile, "rb") as stream, open(outfile, "w", encoding="ascii") as output:
+        count = RINEXWriter(
+            output,
+            marker=kwargs.get("marker", "UNKNOWN"),
+            receiver=kwargs.get("receiver", ""),
+            antenna=kwargs.get("antenna", ""),
+        ).run(stream)
+    print(
+        f"{count} epochs written to {outfile} "
+        f"in {perf_counter() - start:.2f} seconds."
+    )
+
+
+if __name__ == "__main__":
+
+    main(**dict(arg.split("=") for arg in argv[1:]))
@@ -30,6 +30,11 @@ sqlite> .dbconfig
 and check for the entry 'load_extension on'.
 ***********************************************************
 
+Rows are inserted in batches via executemany() with a parameterised
+INSERT statement. See also pyubx2.SQLiteLoader, which loads any UBX
+message identity into its own generated table schema, with resumable
+ingestion.
+
 gnssdata example table has the following fields:
     pk integer
     geom POINTZ
@@ -75,13 +80,14 @@ SQLC1 = (
     + SQLCOMMIT
 )
 
-# INSERT SQL statement with 3D POINT
+# parameterised INSERT SQL statement with 3D POINT
 SQLI3D = (
     "INSERT INTO {table} (source, tow, fixtype, dop, hacc, geom) "
-    "VALUES ('{source}', {tow}, {fixtype}, {dop}, {hacc}, "
-    "GeomFromText('POINTZ({lon} {lat} {height})', 4326));"
+    "VALUES (?, ?, ?, ?, ?, MakePointZ(?, ?, ?, 4326));"
 )
 
+BATCHSIZE = 10000  # rows per executemany() call
+
 
 def fix2quality(parsed):
     """
@@ -144,6 +150,8 @@ def load_data(cur, infile, table):
     # iterate through UBX data log
     print(f"Loading data into {table} from GNSS data log")
     i = 0
+    sql = SQLI3D.format(table=table)
+    rows = []
     cur.execute(SQLBEGIN)
     with open(infile, "rb") as stream:
         ubr = UBXReader(
@@ -151,35 +159,38 @@ def load_data(cur, infile, table):
         )
         for _, parsed in ubr:
             if "NAV-PVT" in parsed.identity:
-                sql = SQLI3D.format(
-                    table=table,
-                    source=parsed.identity,
-                    tow=int(parsed.iTOW / 1000),  # seconds
-                    fixtype=fix2quality(parsed),
-                    dop=parsed.pDOP,
-                    hacc=parsed.hAcc,
-                    lon=parsed.lon,
-                    lat=parsed.lat,
-                    height=parsed.hMSL / 1000,  # meters
+                rows.append(
+                    (
+                        parsed.identity,
+                        int(parsed.iTOW / 1000),  # seconds
+                        fix2quality(parsed),
+                        parsed.pDOP,
+                        parsed.hAcc,
+                        parsed.lon,
+                        parsed.lat,
+                        parsed.hMSL / 1000,  # meters
+                    )
                 )
-                # print(sql)
-                cur.execute(sql)
-                i += 1
             elif "GGA" in parsed.identity:
-                sql = SQLI3D.format(
-                    table=table,
-                    source=parsed.identity,
-                    tow=tim2tow(parsed.time),  # seconds
-                    fixtype=parsed.quality,
-                    dop=parsed.HDOP,
-                    hacc=0,
-                    lon=parsed.lon,
-                    lat=parsed.lat,
-                    height=parsed.alt,  # meters
+                rows.append(
+                    (
+                        parsed.identity,
+                        tim2tow(parsed.time),  # seconds
+                        parsed.quality,
+                        parsed.HDOP,
+                        0,
+                        parsed.lon,
+                        parsed.lat,
+                        parsed.alt,  # meters
+                    )
                 )
-                # print(sql)
-                cur.execute(sql)
-                i += 1
+            # insert in batches using a single prepared statement
+            if len(rows) >= BATCHSIZE:
+                cur.executemany(sql, rows)
+                i += len(rows)
+                rows = []
+    cur.executemany(sql, rows)
+    i += len(rows)
     cur.execute(SQLCOMMIT)
     print(f"{i} records loaded into {table}")
 
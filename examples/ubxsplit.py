@@ -0,0 +1,74 @@
+"""
+ubxsplit.py
+
+Usage:
+
+python3 ubxsplit.py infile=pygpsdata.log outfile=rawx.ubx identities=RXM-RAWX,RXM-SFRBX
+
+python3 ubxsplit.py infile=pygpsdata.log outfile=pygpsdata-{:03d}.ubx period=3600
+
+Optional arguments: protfilter=7 itowstart=0 itowend=604800000
+bytestart=0 byteend=1000000 period=0
+
+This example illustrates how to split or filter a binary log by
+protocol, message identity, iTOW range or byte range using the
+UBXSplitter class. Messages are only framed, not parsed, so this
+runs at close to disk speed.
+
+Created on 18 Oct 2026
+
+@author: semuadmin
+"""
+
+from sys import argv
+from time import perf_counter
+
+from pyubx2 import UBXSplitter
+
+
+def main(**kwargs):
+    """
+    Main Routine.
+    """
+
+    infile = kwargs.get("infile", "pygpsdata.log")
+    outfile = kwargs.get("outfile", "pygpsdata-split.ubx")
+    identities = kwargs.get("identities", None)
+    protfilter = int(kwargs.get("protfilter", 7))
+    period = int(kwargs.get("period", 0))
+    itowrange = None
+    if "itowstart" in kwargs or "itowend" in kwargs:
+        itowrange = (
+            int(kwargs.get("itowstart", 0)),
+            int(kwargs.get("itowend", 604800000)),
+        )
+    byterange = None
+    if "bytestart" in kwargs or "byteend" in kwargs:
+        byterange = (int(kwargs.get("bytestart", 0)), int(kwargs.get("byteend", 0)))
+        byterange = (byterange[0], byterange[1] or None)
+
+    options = {
+        "identities": None if identities is None else identities.split(","),
+        "itowrange": itowrange,
+        "protfilter": protfilter,
+    }
+
+    print(f"Splitting file {infile}...")
+    start = perf_counter()
+    with open(infile, "rb") as stream:
+        if period:
+            splitter = UBXSplitter(outfile, period=period, **options)
+            count = splitter.run(stream, byterange=byterange)
+            outfile = ", ".join(splitter.files)
+        else:
+            with open(outfile, "wb") as output:
+                count = UBXSplitter(output, **options).run(stream, byterange=byterange)
+    print(
+        f"{count} messages written to {outfile} "
+        f"in {perf_counter() - start:.2f} seconds."
+    )
+
+
+if __name__ == "__main__":
+
+    main(**dict(arg.split("=") for arg in argv[1:]))
@@ -14,11 +14,13 @@ from datums import DATUMS  # assumes this is in same folder
 
 from pyubx2 import (
     bearing,
+    datum_batch,
     ecef2llh,
     haversine,
     latlon2dmm,
     latlon2dms,
     llh2ecef,
+    llh2enu_batch,
     llh2iso6709,
 )
 
@@ -79,9 +81,29 @@ print(
     f"\nConvert ECEF X: {X}, Y: {Y}, Z: {Z} to",
     f"geodetic using alternate {DATUM} ({ellipsoid}) datum ...",
 )
-lat, lon, height = ecef2llh(X - delta_x, Y - delta_z, Z - delta_z, a, f)
+lat, lon, height = ecef2llh(X - delta_x, Y - delta_y, Z - delta_z, a, f)
 print(f"Geodetic lat: {lat}, lon: {lon}, height: {height}")
 
 print(f"\nConvert geodetic {lat}, {lon}, {height} back to ECEF ...")
 x, y, z = llh2ecef(lat, lon, height, a, f)
 print(f"ECEF X: {x + delta_x}, Y: {y + delta_y}, Z: {z + delta_z}")
+
+# Batch versions of the conversion methods take columns (lists, arrays or
+# NumPy arrays) of coordinates and return array.array columns. If NumPy is
+# installed, ndarray=True vectorises them and returns numpy.ndarray columns
+try:
+    import numpy  # pylint: disable=unused-import
+
+    NDARRAY = True
+except ImportError:
+    NDARRAY = False
+
+LATS, LONS, HGTS = [LAT1, LAT2], [LON1, LON2], [ALT1, ALT1]
+
+print(f"\nConvert {LATS}, {LONS} to alternate {DATUM} ({ellipsoid}) datum ...")
+lats, lons, hgts = datum_batch(LATS, LONS, HGTS, dst=datum_dict, ndarray=NDARRAY)
+print(f"Geodetic lats: {lats}, lons: {lons}, heights: {hgts}")
+
+print(f"\nConvert {LATS}, {LONS} to local ENU relative to {LAT1}, {LON1} ...")
+east, north, up = llh2enu_batch(LATS, LONS, HGTS, (LAT1, LON1, ALT1), ndarray=NDARRAY)
+print(f"East: {east}, North: {north}, Up: {up}")
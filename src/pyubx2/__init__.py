@@ -34,9 +34,38 @@ from pyubx2.exceptions import (
     UBXStreamError,
     UBXTypeError,
 )
+from pyubx2.ubxcache import LatestMessageCache
+from pyubx2.ubxcompress import CompressedStream
+from pyubx2.ubxcovariance import CovarianceStack, navcov, naveell
+from pyubx2.ubxdispatcher import UBXDispatcher
+from pyubx2.ubxephemeris import EphemerisCache
+from pyubx2.ubxepoch import EpochAssembler, NavEpoch
+from pyubx2.ubxgeodesy import (
+    bearing_batch,
+    datum_batch,
+    ecef2enu_batch,
+    ecef2llh_batch,
+    haversine_batch,
+    llh2ecef_batch,
+    llh2enu_batch,
+)
 from pyubx2.ubxhelpers import *
+from pyubx2.ubxmerge import UBXMerger
 from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxmultireader import MultiUBXReader
+from pyubx2.ubxposition import PositionStats
+from pyubx2.ubxqueue import ThreadedUBXReader, UBXMessageQueue
 from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxrecorder import UBXRecorder, UBXReplayer
+from pyubx2.ubxrinex import RINEXWriter
+from pyubx2.ubxsatellites import SatelliteTracker
+from pyubx2.ubxsensor import SensorBuffer
+from pyubx2.ubxspectrum import SpectrumWaterfall
+from pyubx2.ubxsplit import UBXSplitter
+from pyubx2.ubxsqlite import SQLiteLoader
+from pyubx2.ubxstats import UBXReaderStats
+from pyubx2.ubxtimestamp import FrameTimestamp
+from pyubx2.ubxtrack import TrackWriter
 from pyubx2.ubxtypes_configdb import *
 from pyubx2.ubxtypes_core import *
 from pyubx2.ubxtypes_decodes import *
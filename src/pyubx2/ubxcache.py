@@ -0,0 +1,272 @@
+"""
+LatestMessageCache class.
+
+Thread-safe cache of the most recent NMEA, UBX or RTCM3 message
+for each message identity (e.g. 'NAV-PVT', 'NAV-DOP', 'GNGGA').
+
+Intended to be populated by a single UBXReader loop and queried
+by any number of consumers (e.g. web dashboards or REST endpoints)
+in O(1) time by identity, without the need for per-consumer queues.
+
+If 'lazy' is set, only the raw message is stored and each entry is
+decoded on first read (and the decoded message retained thereafter).
+In this mode the UBXReader can be instantiated with parsing=False.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from threading import Event, Lock
+from time import monotonic
+from types import NoneType
+from typing import Literal
+
+from pynmeagps import NMEAMessage, NMEAReader
+from pyrtcm import RTCMMessage, RTCMReader
+
+from pyubx2.ubxhelpers import protocol, raw2identity
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxtypes_core import (
+    GET,
+    NMEA_PROTOCOL,
+    UBX_PROTOCOL,
+    VALCKSUM,
+)
+
+_RAW = 0
+_PARSED = 1
+_SEQ = 2
+_TIME = 3
+
+
+class LatestMessageCache:
+    """
+    LatestMessageCache class.
+    """
+
+    def __init__(
+        self,
+        lazy: bool = False,
+        msgmode: Literal[0, 1, 2, 3] = GET,
+        validate: int = VALCKSUM,
+        parsebitfield: Literal[0, 1, 2] = 1,
+    ):
+        """
+        Constructor.
+
+        :param bool lazy: store raw data only and decode on first read (False)
+        :param Literal[0,1,2,3] msgmode: message mode used for lazy decoding (0)
+        :param int validate: checksum validation used for lazy decoding (1)
+        :param Literal[0,1,2] parsebitfield: bitfield parsing used for lazy decoding (1)
+        """
+
+        self._lazy = lazy
+        self._msgmode = msgmode
+        self._validate = validate
+        self._parsebf = parsebitfield
+        self._lock = Lock()
+        self._cache = {}  # identity: [raw, parsed, seq, time]
+        self._seq = 0
+
+    def __len__(self) -> int:
+        """
+        Number of identities in cache.
+
+        :return: number of identities
+        :rtype: int
+        """
+
+        return len(self._cache)
+
+    def __contains__(self, identity: str) -> bool:
+        """
+        Check if identity is in cache.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :return: True if identity cached
+        :rtype: bool
+        """
+
+        return identity in self._cache
+
+    def update(
+        self,
+        raw_data: bytes,
+        parsed_data: UBXMessage | NMEAMessage | RTCMMessage | NoneType = None,
+    ) -> int:
+        """
+        Store message as latest value for its identity.
+
+        If no parsed data is provided (or the cache is lazy), the identity
+        is derived from the raw data without parsing.
+
+        :param bytes raw_data: raw message
+        :param UBXMessage | NMEAMessage | RTCMMessage | NoneType parsed_data: parsed
+            message (None)
+        :return: sequence number assigned to message
+        :rtype: int
+        """
+
+        if self._lazy:
+            parsed_data = None
+        if parsed_data is None:
+            identity = raw2identity(raw_data)
+        else:
+            identity = parsed_data.identity
+        now = monotonic()
+        with self._lock:
+            self._seq += 1
+            self._cache[identity] = [raw_data, parsed_data, self._seq, now]
+            return self._seq
+
+    def get(
+        self, identity: str, maxage: float | NoneType = None
+    ) -> UBXMessage | NMEAMessage | RTCMMessage | NoneType:
+        """
+        Get latest parsed message for identity, decoding it if necessary.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :param float | NoneType maxage: ignore entries older than maxage seconds (None)
+        :return: parsed message, or None if not cached (or too old)
+        :rtype: UBXMessage | NMEAMessage | RTCMMessage | NoneType
+        """
+
+        entry = self._cache.get(identity, None)
+        if entry is None:
+            return None
+        if maxage is not None and monotonic() - entry[_TIME] > maxage:
+            return None
+        parsed = entry[_PARSED]
+        if parsed is None:
+            parsed = self._decode(entry[_RAW])
+            with self._lock:
+                # retain decoded message unless entry has since been replaced
+                if self._cache.get(identity, None) is entry:
+                    entry[_PARSED] = parsed
+        return parsed
+
+    def getraw(self, identity: str) -> bytes | NoneType:
+        """
+        Get latest raw message for identity.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :return: raw message, or None if not cached
+        :rtype: bytes | NoneType
+        """
+
+        entry = self._cache.get(identity, None)
+        return None if entry is None else entry[_RAW]
+
+    def sequence(self, identity: str) -> int:
+        """
+        Get sequence number of latest message for identity. Sequence
+        numbers increase monotonically across all identities, so can
+        be used by consumers to detect updates.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :return: sequence number, or 0 if not cached
+        :rtype: int
+        """
+
+        entry = self._cache.get(identity, None)
+        return 0 if entry is None else entry[_SEQ]
+
+    def age(self, identity: str) -> float | NoneType:
+        """
+        Get age of latest message for identity.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :return: age in seconds, or None if not cached
+        :rtype: float | NoneType
+        """
+
+        entry = self._cache.get(identity, None)
+        return None if entry is None else monotonic() - entry[_TIME]
+
+    def snapshot(self, *identities: str) -> dict:
+        """
+        Get latest parsed messages for selected identities (or all
+        identities if none specified).
+
+        :param str identities: message identities e.g. 'NAV-PVT', 'NAV-DOP'
+        :return: dict of {identity: parsed message}
+        :rtype: dict
+        """
+
+        if not identities:
+            identities = self.identities
+        return {idn: self.get(idn) for idn in identities if idn in self._cache}
+
+    def clear(self):
+        """
+        Clear cache (sequence numbers are not reset).
+        """
+
+        with self._lock:
+            self._cache = {}
+
+    def run(self, ubr: UBXReader, stopevent: Event | NoneType = None) -> int:
+        """
+        Populate cache from UBXReader until end of stream or stop event.
+
+        :param UBXReader ubr: UBXReader instance
+        :param Event | NoneType stopevent: optional stop event (None)
+        :return: number of messages cached
+        :rtype: int
+        """
+
+        count = 0
+        while stopevent is None or not stopevent.is_set():
+            raw_data, parsed_data = ubr.read()
+            if raw_data is None:
+                break
+            self.update(raw_data, parsed_data)
+            count += 1
+        return count
+
+    def _decode(self, raw: bytes) -> UBXMessage | NMEAMessage | RTCMMessage:
+        """
+        Decode raw message according to protocol.
+
+        :param bytes raw: raw message
+        :return: parsed message
+        :rtype: UBXMessage | NMEAMessage | RTCMMessage
+        """
+
+        prot = protocol(raw)
+        if prot == UBX_PROTOCOL:
+            return UBXReader.parse(
+                raw,
+                msgmode=self._msgmode,
+                validate=self._validate,
+                parsebitfield=self._parsebf,
+            )
+        if prot == NMEA_PROTOCOL:
+            return NMEAReader.parse(raw, validate=self._validate)
+        return RTCMReader.parse(raw, validate=self._validate)
+
+    @property
+    def identities(self) -> list:
+        """
+        Getter for cached identities.
+
+        :return: list of cached identities
+        :rtype: list
+        """
+
+        return list(self._cache)
+
+    @property
+    def lastseq(self) -> int:
+        """
+        Getter for most recently assigned sequence number.
+
+        :return: sequence number
+        :rtype: int
+        """
+
+        return self._seq
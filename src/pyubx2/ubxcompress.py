@@ -0,0 +1,258 @@
+"""
+CompressedStream class.
+
+Binary input stream which transparently decompresses gzip, bzip2 or xz
+(lzma) files, for use as a UBXReader datastream, e.g.::
+
+    with CompressedStream("archive.ubx.gz") as stream:
+        for raw_data, parsed_data in UBXReader(stream):
+            ...
+
+The compression format is detected from the file signature rather
+than the file extension; uncompressed files are passed through as-is.
+Multi-member (concatenated) compressed files are supported.
+
+Compressed data is read and decompressed in large chunks, optionally on
+a read-ahead thread so that decompression overlaps with parsing.
+Decompressed chunks are served from an in-memory buffer, which avoids
+the per-call overhead of gzip.open() etc. when UBXReader makes many
+small reads. The stream also supports peek(), so UBXReader can skip
+non-header bytes in a single read.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+import bz2
+import lzma
+import zlib
+from os import PathLike
+from queue import Queue
+from threading import Event, Thread
+from types import NoneType
+
+from pyubx2.exceptions import UBXStreamError
+
+COMPRESSION_SIGNATURES = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+}
+"""Compressed file signatures"""
+
+_DECOMPRESSORS = {
+    "gzip": lambda: zlib.decompressobj(wbits=zlib.MAX_WBITS | 16),
+    "bz2": bz2.BZ2Decompressor,
+    "xz": lzma.LZMADecompressor,
+}
+
+
+class CompressedStream:
+    """
+    CompressedStream class.
+    """
+
+    def __init__(
+        self,
+        source: str | PathLike | object,
+        chunksize: int = 65536,
+        readahead: int = 4,
+    ):
+        """
+        Constructor.
+
+        :param str | PathLike | object source: file path, or binary file-like
+            object supporting read(n)
+        :param int chunksize: size of compressed chunks read from source (65536)
+        :param int readahead: number of decompressed chunks to buffer on
+            read-ahead thread, 0 = decompress on calling thread (4)
+        """
+
+        if isinstance(source, (str, PathLike)):
+            self._source = open(source, "rb")  # pylint: disable=consider-using-with
+            self._owned = True
+        else:
+            self._source = source
+            self._owned = False
+        self._chunksize = chunksize
+        self._buf = b""
+        self._pos = 0
+        self._eof = False
+        self._compression = None
+        self._decomp = None
+        first = self._source.read(chunksize)
+        for sig, name in COMPRESSION_SIGNATURES.items():
+            if first.startswith(sig):
+                self._compression = name
+                self._decomp = _DECOMPRESSORS[name]()
+                break
+        self._pending = first  # data read but not yet decompressed
+        self._queue = None
+        self._stopevent = Event()
+        if readahead > 0:
+            self._queue = Queue(maxsize=readahead)
+            self._thread = Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def _decompress(self) -> bytes | NoneType:
+        """
+        Read and decompress next chunk from source.
+
+        :return: decompressed chunk (possibly empty), or None at end of source
+        :rtype: bytes | NoneType
+        :raises: UBXStreamError if compressed data is invalid
+        """
+
+        data = self._pending or self._source.read(self._chunksize)
+        self._pending = b""
+        if not data:
+            return None
+        if self._decomp is None:
+            return data
+        out = []
+        try:
+            while data:
+                if self._decomp.eof:  # start of next member
+                    self._decomp = _DECOMPRESSORS[self._compression]()
+                out.append(self._decomp.decompress(data))
+                data = self._decomp.unused_data if self._decomp.eof else b""
+        except (OSError, EOFError, zlib.error, lzma.LZMAError) as err:
+            raise UBXStreamError(
+                f"Invalid {self._compression} compressed data - {err}"
+            ) from err
+        return b"".join(out)
+
+    def _run(self):
+        """
+        THREADED - decompress chunks into read-ahead queue until end of
+        source, error or close. None marks the end of the stream.
+        """
+
+        try:
+            while not self._stopevent.is_set():
+                data = self._decompress()
+                self._queue.put(data)
+                if data is None:
+                    return
+        except (UBXStreamError, OSError, ValueError) as err:
+            self._queue.put(err)
+
+    def _fill(self, size: int) -> bool:
+        """
+        Append decompressed chunks to buffer until at least size bytes are
+        available from current position, or end of stream.
+
+        :param int size: number of bytes required
+        :return: True if size bytes are available
+        :rtype: bool
+        :raises: UBXStreamError if compressed data is invalid
+        """
+
+        buf = [self._buf[self._pos :]]
+        avail = len(buf[0])
+        while avail < size and not self._eof:
+            data = self._decompress() if self._queue is None else self._queue.get()
+            if isinstance(data, Exception):
+                self._eof = True
+                raise data
+            if data is None:
+                self._eof = True
+            else:
+                buf.append(data)
+                avail += len(data)
+        self._buf = b"".join(buf)
+        self._pos = 0
+        return avail >= size
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read up to size bytes of decompressed data.
+
+        :param int size: number of bytes to read, -1 = all remaining (-1)
+        :return: bytes (fewer than size at end of stream)
+        :rtype: bytes
+        """
+
+        pos = self._pos
+        end = pos + size
+        if size < 0 or end > len(self._buf):
+            self._fill(float("inf") if size < 0 else size)
+            pos = 0
+            end = len(self._buf) if size < 0 else size
+        data = self._buf[pos:end]
+        self._pos = pos + len(data)
+        return data
+
+    def readline(self) -> bytes:
+        """
+        Read decompressed data up to and including LF (0x0a).
+
+        :return: bytes (not LF-terminated at end of stream)
+        :rtype: bytes
+        """
+
+        idx = self._buf.find(b"\x0a", self._pos)
+        while idx == -1 and not self._eof:
+            size = len(self._buf) - self._pos
+            self._fill(size + 1)
+            idx = self._buf.find(b"\x0a", size)
+        end = len(self._buf) if idx == -1 else idx + 1
+        data = self._buf[self._pos : end]
+        self._pos = end
+        return data
+
+    def peek(self, size: int = 1) -> bytes:
+        """
+        Return buffered decompressed data without advancing position.
+        At least size bytes are returned unless at end of stream.
+
+        :param int size: minimum number of bytes to return (1)
+        :return: bytes
+        :rtype: bytes
+        """
+
+        if len(self._buf) - self._pos < size:
+            self._fill(size)
+        return self._buf[self._pos :]
+
+    def close(self):
+        """
+        Stop read-ahead thread and close source if opened by this stream.
+        """
+
+        self._stopevent.set()
+        if self._queue is not None:
+            while self._thread.is_alive():  # unblock thread if queue full
+                while not self._queue.empty():
+                    self._queue.get_nowait()
+                self._thread.join(0.01)
+        if self._owned:
+            self._source.close()
+
+    @property
+    def compression(self) -> str | NoneType:
+        """
+        Getter for detected compression format.
+
+        :return: "gzip", "bz2", "xz" or None if uncompressed
+        :rtype: str | NoneType
+        """
+
+        return self._compression
@@ -0,0 +1,268 @@
+"""
+NAV-COV and NAV-EELL covariance decoding.
+
+Decodes raw NAV-COV (and NAV2-COV) messages directly into 3x3 NED position
+and velocity covariance matrices, and raw NAV-EELL (and NAV2-EELL) messages
+into error ellipse parameters, each in a single struct unpack, rather than
+via a parsed UBXMessage with separate posCovNN, posCovNE ... velCovDD
+attributes.
+
+Matrices are returned as nested tuples, e.g. ((NN, NE, ND), (NE, EE, ED),
+(ND, ED, DD)), which can be passed directly to numpy.array() if required.
+
+CovarianceStack accumulates successive epochs as flat array.array columns
+(9 elements per matrix), which support the buffer protocol, so can be
+wrapped without copying as NumPy arrays, e.g.
+numpy.frombuffer(stack.poscov, numpy.float64).reshape(-1, 3, 3).
+
+e.g. compute horizontal position variance every epoch::
+
+    for raw, _ in UBXReader(stream, parsing=False):
+        cov = navcov(raw)
+        if cov is not None and cov[1] is not None:
+            hvar = cov[1][0][0] + cov[1][1][1]
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from array import array
+from math import nan
+from struct import Struct
+from threading import Event
+from types import NoneType
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxreader import validframes
+
+_NAVCOV = (b"\x01\x36", b"\x29\x36")  # NAV-COV, NAV2-COV class and id
+_NAVEELL = (b"\x01\x3d", b"\x29\x3d")  # NAV-EELL, NAV2-EELL class and id
+_COV = Struct("<LxBB9x12f")  # iTOW, posCovValid, velCovValid, covariances
+_EELL = Struct("<L2xHLL")  # iTOW, errEllipseOrient, Major, Minor
+_NANS = (nan,) * 9
+
+
+def _flat(nn: float, ne: float, nd: float, ee: float, ed: float, dd: float) -> tuple:
+    """
+    Build row-major elements of symmetric 3x3 matrix from upper triangle.
+
+    :return: 9 matrix elements
+    :rtype: tuple
+    """
+
+    return (nn, ne, nd, ne, ee, ed, nd, ed, dd)
+
+
+def _matrix(flat) -> tuple:
+    """
+    Build 3x3 matrix from row-major elements.
+
+    :param flat: 9 matrix elements
+    :return: matrix as nested tuples
+    :rtype: tuple
+    """
+
+    return (tuple(flat[0:3]), tuple(flat[3:6]), tuple(flat[6:9]))
+
+
+def navcov(raw_data: bytes) -> tuple | NoneType:
+    """
+    Decode raw NAV-COV or NAV2-COV message to NED position and velocity
+    covariance matrices.
+
+    :param bytes raw_data: raw UBX message
+    :return: tuple of (iTOW in ms, position covariance in m^2, velocity
+        covariance in m^2/s^2), where each matrix is None if not valid,
+        or None if not a NAV-COV message
+    :rtype: tuple | NoneType
+    """
+
+    if raw_data[2:4] not in _NAVCOV or len(raw_data) < _COV.size + 8:
+        return None
+    itow, posvalid, velvalid, *cov = _COV.unpack_from(raw_data, 6)
+    return (
+        itow,
+        _matrix(_flat(*cov[:6])) if posvalid else None,
+        _matrix(_flat(*cov[6:])) if velvalid else None,
+    )
+
+
+def naveell(raw_data: bytes) -> tuple | NoneType:
+    """
+    Decode raw NAV-EELL or NAV2-EELL message to error ellipse parameters.
+
+    :param bytes raw_data: raw UBX message
+    :return: tuple of (iTOW in ms, orientation of semi-major axis in degrees
+        clockwise from true north, semi-major axis in mm, semi-minor axis
+        in mm), or None if not a NAV-EELL message
+    :rtype: tuple | NoneType
+    """
+
+    if raw_data[2:4] not in _NAVEELL or len(raw_data) < _EELL.size + 8:
+        return None
+    itow, orient, major, minor = _EELL.unpack_from(raw_data, 6)
+    return itow, orient / 100, major, minor
+
+
+class CovarianceStack:
+    """
+    CovarianceStack class.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self._covitow = array("I")
+        self._poscov = array("d")
+        self._velcov = array("d")
+        self._eellitow = array("I")
+        self._eell = array("d")
+
+    def update(self, raw_data: bytes) -> bool:
+        """
+        Add epoch from raw NAV-COV or NAV-EELL message. Any other message
+        is ignored. Invalid covariance matrices are added as NaN.
+
+        :param bytes raw_data: raw UBX message
+        :return: True if epoch added, False if not
+        :rtype: bool
+        """
+
+        msgid = raw_data[2:4]
+        if msgid in _NAVCOV and len(raw_data) >= _COV.size + 8:
+            itow, posvalid, velvalid, *cov = _COV.unpack_from(raw_data, 6)
+            self._covitow.append(itow)
+            self._poscov.extend(_flat(*cov[:6]) if posvalid else _NANS)
+            self._velcov.extend(_flat(*cov[6:]) if velvalid else _NANS)
+            return True
+        eell = naveell(raw_data)
+        if eell is None:
+            return False
+        self._eellitow.append(eell[0])
+        self._eell.extend(eell[1:])
+        return True
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and add epoch from each valid NAV-COV or NAV-EELL
+        message until end of stream or stopevent is set.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of messages processed
+        :rtype: int
+        """
+
+        count = 0
+        for raw_data in validframes(stream, _NAVCOV + _NAVEELL, stopevent):
+            count += self.update(raw_data)
+        return count
+
+    def matrices(self, epoch: int = -1) -> tuple:
+        """
+        Get position and velocity covariance matrices of NAV-COV epoch.
+
+        :param int epoch: epoch index (-1 = latest) (-1)
+        :return: tuple of (iTOW, position covariance, velocity covariance)
+        :rtype: tuple
+        :raises: ParameterError if epoch is not held
+        """
+
+        num = len(self._covitow)
+        if not -num <= epoch < num:
+            raise ParameterError(f"Epoch {epoch} not held - {num} available")
+        epoch %= num
+        pos = epoch * 9
+        return (
+            self._covitow[epoch],
+            _matrix(self._poscov[pos : pos + 9]),
+            _matrix(self._velcov[pos : pos + 9]),
+        )
+
+    def clear(self):
+        """
+        Remove all epochs.
+        """
+
+        for col in (
+            self._covitow,
+            self._poscov,
+            self._velcov,
+            self._eellitow,
+            self._eell,
+        ):
+            del col[:]
+
+    def __len__(self) -> int:
+        """
+        Number of NAV-COV epochs held.
+
+        :return: number of epochs
+        :rtype: int
+        """
+
+        return len(self._covitow)
+
+    @property
+    def covitow(self) -> array:
+        """
+        Getter for iTOW of each NAV-COV epoch.
+
+        :return: iTOW in ms
+        :rtype: array.array
+        """
+
+        return array("I", self._covitow)
+
+    @property
+    def poscov(self) -> array:
+        """
+        Getter for position covariance matrices of each NAV-COV epoch, as
+        9 row-major elements per epoch.
+
+        :return: NED position covariances in m^2
+        :rtype: array.array
+        """
+
+        return array("d", self._poscov)
+
+    @property
+    def velcov(self) -> array:
+        """
+        Getter for velocity covariance matrices of each NAV-COV epoch, as
+        9 row-major elements per epoch.
+
+        :return: NED velocity covariances in m^2/s^2
+        :rtype: array.array
+        """
+
+        return array("d", self._velcov)
+
+    @property
+    def eellitow(self) -> array:
+        """
+        Getter for iTOW of each NAV-EELL epoch.
+
+        :return: iTOW in ms
+        :rtype: array.array
+        """
+
+        return array("I", self._eellitow)
+
+    @property
+    def eell(self) -> array:
+        """
+        Getter for error ellipse of each NAV-EELL epoch, as 3 elements
+        per epoch (orientation in degrees, semi-major and semi-minor axes
+        in mm).
+
+        :return: error ellipse parameters
+        :rtype: array.array
+        """
+
+        return array("d", self._eell)
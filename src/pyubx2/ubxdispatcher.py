@@ -0,0 +1,248 @@
+"""
+UBXDispatcher class.
+
+Publish/subscribe dispatcher for UBXReader output.
+
+Handlers subscribe to a message identity (e.g. 'NAV-PVT', 'GNGGA', '1077'),
+a UBX message class (e.g. 'NAV', as defined in UBX_CLASSES) or a protocol
+(NMEA_PROTOCOL, UBX_PROTOCOL, RTCM3_PROTOCOL). Each handler is called with
+the arguments (raw_data, parsed_data).
+
+Incoming frames are routed via a table keyed on the raw UBX class/id bytes
+(or the raw NMEA/RTCM3 identity), which is populated on first sight of each
+key and invalidated whenever the subscriptions change. Frames with no
+subscribers are never decoded, so the UBXReader should be instantiated
+with parsing=False.
+
+Handlers can be run inline (default), via a concurrent.futures.Executor
+(e.g. ThreadPoolExecutor) or on an asyncio event loop (coroutine functions
+are scheduled as tasks, other callables via call_soon_threadsafe).
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from asyncio import AbstractEventLoop, iscoroutinefunction, run_coroutine_threadsafe
+from concurrent.futures import Executor
+from threading import Event, Lock
+from types import NoneType
+
+from pynmeagps import NMEAMessage
+from pyrtcm import RTCMMessage
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxhelpers import protocol, raw2identity
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import PARSE_ERRORS, UBXReader
+from pyubx2.ubxtypes_core import UBX_CLASSES, UBX_PROTOCOL
+
+
+class UBXDispatcher:
+    """
+    UBXDispatcher class.
+    """
+
+    def __init__(self, ubxreader: UBXReader):
+        """
+        Constructor.
+
+        :param UBXReader ubxreader: UBXReader instance (ideally with parsing=False)
+        """
+
+        self._ubxreader = ubxreader
+        self._lock = Lock()
+        self._subs = {}  # subid: (handler, identity, msgclass, protocol, executor)
+        self._subid = 0
+        self._routes = {}  # route key: tuple of (handler, executor)
+        self._decoded = 0
+        self._skipped = 0
+
+    def subscribe(
+        self,
+        handler: callable,
+        identity: str | NoneType = None,
+        msgclass: str | NoneType = None,
+        protfilter: int = 0,
+        executor: Executor | AbstractEventLoop | NoneType = None,
+    ) -> int:
+        """
+        Subscribe handler to messages of a given identity, UBX class or
+        protocol. Exactly one of identity, msgclass or protfilter must be
+        specified.
+
+        :param callable handler: function or coroutine function
+            taking arguments (raw_data, parsed_data)
+        :param str | NoneType identity: message identity e.g. 'NAV-PVT' (None)
+        :param str | NoneType msgclass: UBX message class e.g. 'NAV' (None)
+        :param int protfilter: NMEA_PROTOCOL (1), UBX_PROTOCOL (2),
+            RTCM3_PROTOCOL (4), can be OR'd (0)
+        :param Executor | AbstractEventLoop | NoneType executor: executor or
+            event loop on which to run handler, None = inline (None)
+        :return: subscription id
+        :rtype: int
+        :raises: ParameterError
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        if (identity is not None) + (msgclass is not None) + (protfilter != 0) != 1:
+            raise ParameterError(
+                "Exactly one of identity, msgclass or protfilter must be specified"
+            )
+        if msgclass is not None and msgclass not in UBX_CLASSES.values():
+            raise ParameterError(f"Unknown UBX message class {msgclass}")
+        if iscoroutinefunction(handler) and not isinstance(executor, AbstractEventLoop):
+            raise ParameterError("Coroutine handlers require an asyncio event loop")
+
+        with self._lock:
+            self._subid += 1
+            self._subs[self._subid] = (
+                handler,
+                identity,
+                msgclass,
+                protfilter,
+                executor,
+            )
+            self._routes = {}  # invalidate routing table
+            return self._subid
+
+    def unsubscribe(self, subid: int):
+        """
+        Remove subscription.
+
+        :param int subid: subscription id returned by subscribe()
+        """
+
+        with self._lock:
+            self._subs.pop(subid, None)
+            self._routes = {}  # invalidate routing table
+
+    def dispatch(
+        self,
+        raw_data: bytes,
+        parsed_data: UBXMessage | NMEAMessage | RTCMMessage | NoneType = None,
+    ) -> int:
+        """
+        Dispatch message to subscribed handlers, decoding it only
+        if there is at least one subscriber. Decoding errors are
+        handled according to the UBXReader's quitonerror setting.
+
+        :param bytes raw_data: raw message
+        :param UBXMessage | NMEAMessage | RTCMMessage | NoneType parsed_data: parsed
+            message, if already available (None)
+        :return: number of handlers invoked (0 if message could not be decoded)
+        :rtype: int
+        """
+
+        # UBX route key is the raw class/id bytes (plus the type byte for MGA)
+        if raw_data[0:1] == b"\xb5":
+            key = raw_data[2:4]
+            if key[0] == 0x13 and key[1] != 0x80:
+                key = raw_data[2:4] + raw_data[6:7]
+        else:
+            key = raw2identity(raw_data)
+
+        routes = self._routes  # local reference in case table is invalidated
+        handlers = routes.get(key, None)
+        if handlers is None:
+            handlers = self._route(raw_data)
+            routes[key] = handlers
+        if not handlers:
+            self._skipped += 1
+            return 0
+
+        if parsed_data is None:
+            try:
+                parsed_data = self._ubxreader.decode(raw_data)
+            except PARSE_ERRORS as err:
+                # handle as UBXReader.read() would, according to quitonerror
+                self._ubxreader._do_error(err)  # pylint: disable=protected-access
+                return 0
+            self._decoded += 1
+        for handler, executor in handlers:
+            if executor is None:
+                handler(raw_data, parsed_data)
+            elif isinstance(executor, AbstractEventLoop):
+                if iscoroutinefunction(handler):
+                    run_coroutine_threadsafe(handler(raw_data, parsed_data), executor)
+                else:
+                    executor.call_soon_threadsafe(handler, raw_data, parsed_data)
+            else:
+                executor.submit(handler, raw_data, parsed_data)
+        return len(handlers)
+
+    def run(self, stopevent: Event | NoneType = None) -> int:
+        """
+        Read and dispatch messages until end of stream or stop event.
+
+        :param Event | NoneType stopevent: optional stop event (None)
+        :return: number of messages read
+        :rtype: int
+        """
+
+        count = 0
+        while stopevent is None or not stopevent.is_set():
+            raw_data, parsed_data = self._ubxreader.read()
+            if raw_data is None:
+                break
+            self.dispatch(raw_data, parsed_data)
+            count += 1
+        return count
+
+    def _route(self, raw_data: bytes) -> tuple:
+        """
+        Find all subscribed handlers for raw message.
+
+        :param bytes raw_data: raw message
+        :return: tuple of (handler, executor)
+        :rtype: tuple
+        """
+
+        identity = raw2identity(raw_data)
+        prot = protocol(raw_data)
+        msgclass = (
+            UBX_CLASSES.get(raw_data[2:3], None) if prot == UBX_PROTOCOL else None
+        )
+        with self._lock:
+            return tuple(
+                (handler, executor)
+                for handler, idn, cls, prt, executor in self._subs.values()
+                if idn == identity
+                or (cls is not None and cls == msgclass)
+                or prt & prot
+            )
+
+    @property
+    def ubxreader(self) -> UBXReader:
+        """
+        Getter for UBXReader.
+
+        :return: UBXReader instance
+        :rtype: UBXReader
+        """
+
+        return self._ubxreader
+
+    @property
+    def decoded(self) -> int:
+        """
+        Getter for number of messages decoded for dispatch.
+
+        :return: number of messages decoded
+        :rtype: int
+        """
+
+        return self._decoded
+
+    @property
+    def skipped(self) -> int:
+        """
+        Getter for number of messages skipped (no subscribers).
+
+        :return: number of messages skipped
+        :rtype: int
+        """
+
+        return self._skipped
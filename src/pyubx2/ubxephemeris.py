@@ -0,0 +1,730 @@
+"""
+EphemerisCache class.
+
+Assembles the broadcast navigation data in raw UBX RXM-SFRBX subframes into
+ephemeris, almanac, ionosphere and UTC parameter sets, which can be output as
+the equivalent MGA SET assistance messages, e.g. to implement a local
+assistance server. Supported navigation messages are:
+
+- GPS LNAV - ephemeris (subframes 1-3), almanac (subframe 4 pages 2-5 & 7-10
+  and subframe 5), ionosphere and UTC (subframe 4 page 18).
+- Galileo I/NAV - ephemeris (word types 1-5) and UTC (word type 6).
+- BeiDou D1 (MEO/IGSO satellites) - ephemeris (subframes 1-3).
+- GLONASS - ephemeris (strings 1-4).
+
+Each subframe is first compared with the last subframe of the same type from
+the same satellite, excluding time of week fields. As broadcast data only
+changes every hour or two, the vast majority of subframes are identical
+repeats, which are counted and discarded without being decoded.
+
+An ephemeris is only assembled from subframes with the same issue of data
+(GPS IODE/IODC, Galileo IODnav, BeiDou toe/toc). GLONASS strings carry no
+issue of data, so a GLONASS ephemeris is assembled at the end of a frame
+(string 4) in which any of strings 1-4 have changed.
+
+Parameter sets are held per satellite as raw integer fields named as in the
+MGA SET payload definitions, so MGA messages can be generated from them
+without loss of precision.
+
+e.g. collect assistance data from a log and send it to a receiver::
+
+    cache = EphemerisCache()
+    with open("nav.ubx", "rb") as infile:
+        cache.run(infile)
+    for msg in cache.messages():
+        serial.write(msg.serialize())
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from struct import unpack_from
+from threading import Event
+from types import NoneType
+
+from pyrtcm import calc_crc24q
+
+from pyubx2.ubxhelpers import val2bytes
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import validframes
+from pyubx2.ubxtypes_core import SCALROUND, SET
+from pyubx2.ubxtypes_set import UBX_PAYLOADS_SET
+
+_SFRBX = b"\x02\x13"  # RXM-SFRBX message class and id
+_MGATYPES = {"EPH": 1, "ALM": 2, "UTC": 5, "IONO": 6}  # MGA 'type' attribute
+_GALMASK = {  # Galileo I/NAV word type: data word mask excluding time fields
+    5: ~(((1 << 32) - 1) << 23),  # WN & TOW, bits 73-104
+    6: ~(((1 << 20) - 1) << 3),  # TOW, bits 105-124
+}
+
+
+class _Bits:
+    """
+    Navigation data words as a big-endian bit string.
+    """
+
+    __slots__ = ("_val", "_size")
+
+    def __init__(self, words: tuple, width: int, shift: int = 0):
+        """
+        Constructor.
+
+        :param tuple words: data words
+        :param int width: number of data bits in each word
+        :param int shift: bit offset of data within each word (0)
+        """
+
+        mask = (1 << width) - 1
+        self._val = 0
+        for word in words:
+            self._val = (self._val << width) | ((word >> shift) & mask)
+        self._size = width * len(words)
+
+    def u(self, pos: int, length: int) -> int:
+        """
+        Get unsigned bit field.
+
+        :param int pos: bit position
+        :param int length: number of bits
+        :return: value
+        :rtype: int
+        """
+
+        return (self._val >> (self._size - pos - length)) & ((1 << length) - 1)
+
+    def s(self, pos: int, length: int) -> int:
+        """
+        Get two's complement signed bit field.
+
+        :param int pos: bit position
+        :param int length: number of bits
+        :return: value
+        :rtype: int
+        """
+
+        val = self.u(pos, length)
+        return val - (1 << length) if val >> (length - 1) else val
+
+    def g(self, pos: int, length: int) -> int:
+        """
+        Get sign-magnitude signed bit field (GLONASS).
+
+        :param int pos: bit position
+        :param int length: number of bits
+        :return: value
+        :rtype: int
+        """
+
+        val = self.u(pos + 1, length - 1)
+        return -val if self.u(pos, 1) else val
+
+    def s2(self, pos1: int, len1: int, pos2: int, len2: int) -> int:
+        """
+        Get two's complement signed bit field split over two words (BeiDou).
+
+        :param int pos1: bit position of MSBs
+        :param int len1: number of MSBs
+        :param int pos2: bit position of LSBs
+        :param int len2: number of LSBs
+        :return: value
+        :rtype: int
+        """
+
+        val = (self.u(pos1, len1) << len2) | self.u(pos2, len2)
+        length = len1 + len2
+        return val - (1 << length) if val >> (length - 1) else val
+
+    def u2(self, pos1: int, len1: int, pos2: int, len2: int) -> int:
+        """
+        Get unsigned bit field split over two words (BeiDou).
+
+        :param int pos1: bit position of MSBs
+        :param int len1: number of MSBs
+        :param int pos2: bit position of LSBs
+        :param int len2: number of LSBs
+        :return: value
+        :rtype: int
+        """
+
+        return (self.u(pos1, len1) << len2) | self.u(pos2, len2)
+
+
+def _split_gps(_svid: int, words: tuple) -> tuple | NoneType:
+    """
+    Get key and content of GPS LNAV subframe, excluding TLM and HOW.
+
+    :param int _svid: satellite id (unused)
+    :param tuple words: data words
+    :return: tuple of (key, content), or None if not required
+    :rtype: tuple | NoneType
+    """
+
+    if len(words) < 10 or (words[0] >> 22) & 0xFF != 0x8B:  # preamble
+        return None
+    sfid = (words[1] >> 8) & 7
+    if sfid > 3:  # pages of subframes 4 & 5 identified by data svid
+        page = (words[2] >> 22) & 0x3F
+        if not (sfid == 4 and page in (25, 26, 27, 28, 29, 30, 31, 32, 56)) and not (
+            sfid == 5 and (1 <= page <= 24 or page == 51)
+        ):
+            return None
+        sfid = (sfid, page)
+    return sfid, tuple((word >> 6) & 0xFFFFFF for word in words[2:10])
+
+
+def _split_gal(_svid: int, words: tuple) -> tuple | NoneType:
+    """
+    Get key (word type) and content (128-bit data word) of Galileo I/NAV
+    nominal page pair, excluding WN and TOW of word types 5 and 6.
+
+    :param int _svid: satellite id (unused)
+    :param tuple words: data words
+    :return: tuple of (key, content), or None if not required
+    :rtype: tuple | NoneType
+    """
+
+    if len(words) < 8 or words[0] >> 30 != 0 or words[4] >> 30 != 2:
+        return None  # not even/odd nominal page pair
+    even = _Bits(words[0:4], 32).u(2, 112)
+    odd = _Bits(words[4:8], 32).u(2, 16)
+    data = (even << 16) | odd
+    wtype = data >> 122
+    if not 1 <= wtype <= 6:
+        return None
+    return wtype, data & _GALMASK.get(wtype, -1)
+
+
+def _split_bds(svid: int, words: tuple) -> tuple | NoneType:
+    """
+    Get key (subframe id) and content of BeiDou D1 subframe, excluding SOW.
+
+    :param int svid: satellite id
+    :param tuple words: data words
+    :return: tuple of (key, content), or None if not required
+    :rtype: tuple | NoneType
+    """
+
+    if len(words) < 10 or svid <= 5 or svid >= 59:  # GEO satellites use D2
+        return None
+    fid = (words[0] >> 12) & 7
+    if not 1 <= fid <= 3:
+        return None
+    return fid, (words[1] & 0x3FFFF,) + tuple(word & 0x3FFFFFFF for word in words[2:10])
+
+
+def _split_glo(svid: int, words: tuple) -> tuple | NoneType:
+    """
+    Get key (string number) and content of GLONASS string, excluding tk.
+
+    :param int svid: satellite slot
+    :param tuple words: data words
+    :return: tuple of (key, content), or None if not required
+    :rtype: tuple | NoneType
+    """
+
+    if len(words) < 4 or not 1 <= svid <= 24:
+        return None
+    strnum = (words[0] >> 27) & 0xF
+    if not 1 <= strnum <= 4:
+        return None
+    first = words[0] & 0xFF8007FF if strnum == 1 else words[0]  # mask tk
+    return strnum, (first, words[1], words[2] >> 11)  # 85 bits
+
+
+class EphemerisCache:
+    """
+    EphemerisCache class.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self._splitters = {0: _split_gps, 2: _split_gal, 3: _split_bds, 6: _split_glo}
+        self._decoders = {
+            0: self._decode_gps,
+            2: self._decode_gal,
+            3: self._decode_bds,
+            6: self._decode_glo,
+        }
+        self._frames = {}  # (gnssId, svId): {key: content}
+        self._parts = {}  # (gnssId, svId): {key: decoded subframe fields}
+        self._pending = set()  # GLONASS slots with updated strings
+        self._almanacs = {}  # GPS almanac svId: almanac fields without WNa
+        self._wna = None  # GPS almanac reference week
+        self._sets = {}  # (identity, svId): parameter set
+        self._count = 0
+        self._duplicates = 0
+
+    def update(self, raw_data: bytes) -> list:
+        """
+        Process raw RXM-SFRBX message. Any other message is ignored.
+
+        :param bytes raw_data: raw UBX message
+        :return: list of (identity, svId) of new or changed parameter sets
+            e.g. [("MGA-GPS-EPH", 5)] - svId is 0 for system-wide sets
+        :rtype: list
+        """
+
+        if raw_data[2:4] != _SFRBX or len(raw_data) < 16:
+            return []
+        gnss, svid, _, freqid, numwords = raw_data[6:11]
+        splitter = self._splitters.get(gnss, None)
+        if splitter is None or len(raw_data) < 16 + numwords * 4:
+            return []
+        self._count += 1
+        words = unpack_from(f"<{numwords}L", raw_data, 14)
+        split = splitter(svid, words)
+        if split is None:
+            return []
+        key, content = split
+        frames = self._frames.setdefault((gnss, svid), {})
+        if frames.get(key, None) == content:
+            self._duplicates += 1
+            words = None  # no need to decode
+        else:
+            frames[key] = content
+        parts = self._parts.setdefault((gnss, svid), {})
+        return self._decoders[gnss](svid, freqid, key, words, parts)
+
+    def _set(self, identity: str, svid: int, params: dict) -> list:
+        """
+        Store parameter set if new or changed.
+
+        :param str identity: MGA identity e.g. "MGA-GPS-EPH"
+        :param int svid: satellite id, 0 for system-wide sets
+        :param dict params: parameter set as raw integer fields
+        :return: list of (identity, svId) if new or changed, otherwise empty
+        :rtype: list
+        """
+
+        if self._sets.get((identity, svid), None) == params:
+            return []
+        self._sets[(identity, svid)] = params
+        return [(identity, svid)]
+
+    def _decode_gps(
+        self, svid: int, _freqid: int, key: object, words: tuple, parts: dict
+    ) -> list:
+        """
+        Decode GPS LNAV subframe.
+
+        :param int svid: satellite id
+        :param int _freqid: frequency slot (unused)
+        :param object key: subframe id or (subframe id, page svid)
+        :param tuple words: data words, None if duplicate
+        :param dict parts: decoded subframes from this satellite
+        :return: list of (identity, svId) of new or changed parameter sets
+        :rtype: list
+        """
+
+        if words is None:
+            return []
+        bits = _Bits(words[0:10], 24, 6)
+        if key == 1:
+            parts[1] = {
+                "uraIndex": bits.u(60, 4),
+                "svHealth": bits.u(64, 6),
+                "iodc": (bits.u(70, 2) << 8) | bits.u(168, 8),
+                "tgd": bits.s(160, 8),
+                "toc": bits.u(176, 16),
+                "af2": bits.s(192, 8),
+                "af1": bits.s(200, 16),
+                "af0": bits.s(216, 22),
+            }
+        elif key == 2:
+            parts[2] = {
+                "iode2": bits.u(48, 8),
+                "crs": bits.s(56, 16),
+                "deltaN": bits.s(72, 16),
+                "m0": bits.s(88, 32),
+                "cuc": bits.s(120, 16),
+                "e": bits.u(136, 32),
+                "cus": bits.s(168, 16),
+                "sqrtA": bits.u(184, 32),
+                "toe": bits.u(216, 16),
+                "fitInterval": bits.u(232, 1),
+            }
+        elif key == 3:
+            parts[3] = {
+                "cic": bits.s(48, 16),
+                "omega0": bits.s(64, 32),
+                "cis": bits.s(96, 16),
+                "i0": bits.s(112, 32),
+                "crc": bits.s(144, 16),
+                "omega": bits.s(160, 32),
+                "omegaDot": bits.s(192, 24),
+                "iode3": bits.u(216, 8),
+                "idot": bits.s(224, 14),
+            }
+        elif key == (4, 56):
+            return self._set(
+                "MGA-GPS-IONO",
+                0,
+                {
+                    f"iono{name}{i}": bits.s(56 + (4 * j + i) * 8, 8)
+                    for j, name in enumerate(("Alpha", "Beta"))
+                    for i in range(4)
+                },
+            ) + self._set(
+                "MGA-GPS-UTC",
+                0,
+                {
+                    "utcA1": bits.s(120, 24),
+                    "utcA0": bits.s(144, 32),
+                    "utcTot": bits.u(176, 8),
+                    "utcWNt": bits.u(184, 8),
+                    "utcDtLS": bits.s(192, 8),
+                    "utcWNlsf": bits.u(200, 8),
+                    "utcDn": bits.u(208, 8),
+                    "utcDtLSF": bits.s(216, 8),
+                },
+            )
+        elif key == (5, 51):
+            self._wna = bits.u(64, 8)
+            updated = []
+            for almsv, alm in self._almanacs.items():
+                updated += self._set("MGA-GPS-ALM", almsv, {**alm, "almWNa": self._wna})
+            return updated
+        else:  # almanac page
+            almsv = key[1]
+            alm = {
+                "svId": almsv,
+                "e": bits.u(56, 16),
+                "toa": bits.u(72, 8),
+                "deltaI": bits.s(80, 16),
+                "omegaDot": bits.s(96, 16),
+                "svHealth": bits.u(112, 8),
+                "sqrtA": bits.u(120, 24),
+                "omega0": bits.s(144, 24),
+                "omega": bits.s(168, 24),
+                "m0": bits.s(192, 24),
+                "af0": (bits.s(216, 8) << 3) | bits.u(235, 3),
+                "af1": bits.s(224, 11),
+            }
+            if alm["sqrtA"] == 0:  # dummy almanac
+                return []
+            self._almanacs[almsv] = alm
+            if self._wna is None:
+                return []
+            return self._set("MGA-GPS-ALM", almsv, {**alm, "almWNa": self._wna})
+
+        sf1, sf2, sf3 = (parts.get(i, None) for i in (1, 2, 3))
+        if (
+            sf1 is None
+            or sf2 is None
+            or sf3 is None
+            or not sf2["iode2"] == sf3["iode3"] == sf1["iodc"] & 0xFF
+        ):
+            return []
+        eph = {**sf1, **sf2, **sf3}
+        del eph["iode2"], eph["iode3"]
+        return self._set("MGA-GPS-EPH", svid, eph)
+
+    def _decode_gal(
+        self, svid: int, _freqid: int, key: object, words: tuple, parts: dict
+    ) -> list:
+        """
+        Decode Galileo I/NAV word.
+
+        :param int svid: satellite id
+        :param int _freqid: frequency slot (unused)
+        :param object key: word type
+        :param tuple words: data words, None if duplicate
+        :param dict parts: decoded words from this satellite
+        :return: list of (identity, svId) of new or changed parameter sets
+        :rtype: list
+        """
+
+        if words is None:
+            return []
+        even = _Bits(words[0:4], 32)
+        odd = _Bits(words[4:8], 32)
+        crcdata = (even.u(0, 114) << 82) | odd.u(0, 82)  # 4 leading pad bits
+        if calc_crc24q(crcdata.to_bytes(25, "big")) != odd.u(82, 24):
+            del self._frames[(2, svid)][key]
+            return []
+        bits = _Bits(((even.u(2, 112) << 16) | odd.u(2, 16),), 128)
+        if key == 1:
+            parts[1] = {
+                "iodNav": bits.u(6, 10),
+                "toe": bits.u(16, 14),
+                "m0": bits.s(30, 32),
+                "e": bits.u(62, 32),
+                "sqrtA": bits.u(94, 32),
+            }
+        elif key == 2:
+            parts[2] = {
+                "iodNav": bits.u(6, 10),
+                "omega0": bits.s(16, 32),
+                "i0": bits.s(48, 32),
+                "omega": bits.s(80, 32),
+                "iDot": bits.s(112, 14),
+            }
+        elif key == 3:
+            parts[3] = {
+                "iodNav": bits.u(6, 10),
+                "omegaDot": bits.s(16, 24),
+                "deltaN": bits.s(40, 16),
+                "cuc": bits.s(56, 16),
+                "cus": bits.s(72, 16),
+                "crc": bits.s(88, 16),
+                "crs": bits.s(104, 16),
+                "sisaIndexE1E5b": bits.u(120, 8),
+            }
+        elif key == 4:
+            parts[4] = {
+                "iodNav": bits.u(6, 10),
+                "cic": bits.s(22, 16),
+                "cis": bits.s(38, 16),
+                "toc": bits.u(54, 14),
+                "af0": bits.s(68, 31),
+                "af1": bits.s(99, 21),
+                "af2": bits.s(120, 6),
+            }
+        elif key == 5:
+            parts[5] = {
+                "bgdE1E5b": bits.s(57, 10),
+                "healthE5b": bits.u(67, 2),
+                "healthE1B": bits.u(69, 2),
+                "dataValidityE5b": bits.u(71, 1),
+                "dataValidityE1B": bits.u(72, 1),
+            }
+        else:
+            return self._set(
+                "MGA-GAL-UTC",
+                0,
+                {
+                    "a0": bits.s(6, 32),
+                    "a1": bits.s(38, 24),
+                    "dtLS": bits.s(62, 8),
+                    "tot": bits.u(70, 8),
+                    "wnt": bits.u(78, 8),
+                    "wnLSF": bits.u(86, 8),
+                    "dN": bits.u(94, 3),
+                    "dTLSF": bits.s(97, 8),
+                },
+            )
+
+        pages = [parts.get(i, None) for i in range(1, 6)]
+        if None in pages or len({page["iodNav"] for page in pages[0:4]}) != 1:
+            return []
+        eph = {}
+        for page in pages:
+            eph.update(page)
+        return self._set("MGA-GAL-EPH", svid, eph)
+
+    def _decode_bds(
+        self, svid: int, _freqid: int, key: object, words: tuple, parts: dict
+    ) -> list:
+        """
+        Decode BeiDou D1 subframe.
+
+        :param int svid: satellite id
+        :param int _freqid: frequency slot (unused)
+        :param object key: subframe id
+        :param tuple words: data words, None if duplicate
+        :param dict parts: decoded subframes from this satellite
+        :return: list of (identity, svId) of new or changed parameter sets
+        :rtype: list
+        """
+
+        if words is None:
+            return []
+        bits = _Bits(words[0:10], 30)
+        if key == 1:
+            parts[1] = {
+                "SatH1": bits.u(42, 1),
+                "IODC": bits.u(43, 5),
+                "URAI": bits.u(48, 4),
+                "toc": bits.u2(73, 9, 90, 8),
+                "TGD1": bits.s(98, 10),
+                "a2": bits.s(214, 11),
+                "a0": bits.s2(225, 7, 240, 17),
+                "a1": bits.s2(257, 5, 270, 17),
+                "IODE": bits.u(287, 5),
+            }
+        elif key == 2:
+            parts[2] = {
+                "Deltan": bits.s2(42, 10, 60, 6),
+                "Cuc": bits.s2(66, 16, 90, 2),
+                "M0": bits.s2(92, 20, 120, 12),
+                "e": bits.u2(132, 10, 150, 22),
+                "Cus": bits.s(180, 18),
+                "Crc": bits.s2(198, 4, 210, 14),
+                "Crs": bits.s2(224, 8, 240, 10),
+                "sqrtA": bits.u2(250, 12, 270, 20),
+                "toe": bits.u(290, 2) << 15,
+            }
+        else:
+            parts[3] = {
+                "toe": bits.u2(42, 10, 60, 5),
+                "i0": bits.s2(65, 17, 90, 15),
+                "Cic": bits.s2(105, 7, 120, 11),
+                "OmegaDot": bits.s2(131, 11, 150, 13),
+                "Cis": bits.s2(163, 9, 180, 9),
+                "IDOT": bits.s2(189, 13, 210, 1),
+                "Omega0": bits.s2(211, 21, 240, 11),
+                "omega": bits.s2(251, 11, 270, 21),
+            }
+
+        sf1, sf2, sf3 = (parts.get(i, None) for i in (1, 2, 3))
+        if sf1 is None or sf2 is None or sf3 is None:
+            return []
+        toe = sf2["toe"] | sf3["toe"]
+        if toe != sf1["toc"]:  # subframes from different data sets
+            return []
+        return self._set("MGA-BDS-EPH", svid, {**sf1, **sf2, **sf3, "toe": toe})
+
+    def _decode_glo(
+        self, svid: int, freqid: int, key: object, words: tuple, parts: dict
+    ) -> list:
+        """
+        Decode GLONASS string.
+
+        :param int svid: satellite slot
+        :param int freqid: frequency slot + 7
+        :param object key: string number
+        :param tuple words: data words, None if duplicate
+        :param dict parts: decoded strings from this satellite
+        :return: list of (identity, svId) of new or changed parameter sets
+        :rtype: list
+        """
+
+        if words is not None:
+            bits = _Bits(words[0:3], 32)
+            axis = {1: "x", 2: "y", 3: "z"}.get(key, None)
+            if axis is None:
+                parts[4] = {
+                    "tau": bits.g(5, 22),
+                    "deltaTau": bits.g(27, 5),
+                    "E": bits.u(32, 5),
+                    "FT": bits.u(52, 4),
+                    "M": bits.u(75, 2),
+                }
+            else:
+                parts[key] = {
+                    f"d{axis}": bits.g(21, 24),
+                    f"dd{axis}": bits.g(45, 5),
+                    axis: bits.g(50, 27),
+                }
+                if key == 2:
+                    parts[2].update({"B": bits.u(5, 3), "tb": bits.u(9, 7)})
+                elif key == 3:
+                    parts[3]["gamma"] = bits.g(6, 11)
+            self._pending.add(svid)
+
+        if key != 4 or svid not in self._pending or len(parts) < 4:
+            return []
+        self._pending.discard(svid)
+        eph = {"H": freqid - 7}
+        for i in range(1, 5):
+            eph.update(parts[i])
+        return self._set("MGA-GLO-EPH", svid, eph)
+
+    def get(self, identity: str, svid: int = 0) -> dict | NoneType:
+        """
+        Get parameter set as scaled values, keyed by MGA attribute name.
+
+        :param str identity: MGA identity e.g. "MGA-GPS-EPH"
+        :param int svid: satellite id, 0 for system-wide sets (0)
+        :return: dict of parameter values, or None if not available
+        :rtype: dict | NoneType
+        """
+
+        params = self._sets.get((identity, svid), None)
+        if params is None:
+            return None
+        values = {}
+        for name, adef in UBX_PAYLOADS_SET[identity].items():
+            if name in ("type", "version") or name[0:8] == "reserved":
+                continue
+            val = params.get(name, svid if name == "svId" else 0)
+            if isinstance(adef, list):
+                val = round(val * adef[1], SCALROUND)
+            values[name] = val
+        return values
+
+    def message(self, identity: str, svid: int = 0) -> UBXMessage | NoneType:
+        """
+        Get parameter set as MGA SET message.
+
+        :param str identity: MGA identity e.g. "MGA-GPS-EPH"
+        :param int svid: satellite id, 0 for system-wide sets (0)
+        :return: MGA message, or None if not available
+        :rtype: UBXMessage | NoneType
+        """
+
+        params = self._sets.get((identity, svid), None)
+        if params is None:
+            return None
+        params = {"type": _MGATYPES[identity[8:]], "svId": svid, **params}
+        payload = b""
+        for name, adef in UBX_PAYLOADS_SET[identity].items():
+            payload += val2bytes(
+                params.get(name, 0), adef[0] if isinstance(adef, list) else adef
+            )
+        return UBXMessage("MGA", identity, SET, payload=payload)
+
+    def messages(self) -> list:
+        """
+        Get all available parameter sets as MGA SET messages.
+
+        :return: list of MGA messages
+        :rtype: list
+        """
+
+        return [self.message(identity, svid) for identity, svid in self._sets]
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and process each valid RXM-SFRBX message
+        until end of stream or stopevent is set.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of new or changed parameter sets
+        :rtype: int
+        """
+
+        count = 0
+        for raw_data in validframes(stream, (_SFRBX,), stopevent):
+            count += len(self.update(raw_data))
+        return count
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of subframes processed.
+
+        :return: number of subframes
+        :rtype: int
+        """
+
+        return self._count
+
+    @property
+    def duplicates(self) -> int:
+        """
+        Getter for number of duplicate subframes discarded without decoding.
+
+        :return: number of duplicates
+        :rtype: int
+        """
+
+        return self._duplicates
+
+    @property
+    def parameters(self) -> list:
+        """
+        Getter for (identity, svId) of all available parameter sets.
+
+        :return: list of (identity, svId)
+        :rtype: list
+        """
+
+        return list(self._sets)
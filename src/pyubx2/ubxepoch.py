@@ -0,0 +1,334 @@
+"""
+EpochAssembler and NavEpoch classes.
+
+Groups parsed UBX navigation messages sharing the same GPS time of week
+(iTOW) e.g. NAV-PVT, NAV-SAT, NAV-SIG, NAV-DOP, NAV-COV into a single
+NavEpoch object.
+
+An epoch is emitted as soon as the terminating NAV-EOE message arrives,
+when a message for a later epoch arrives (if 'boundary' is set), when
+the epoch has been pending for longer than 'timeout' seconds, or when
+more than 'maxpending' epochs are pending. Memory is bounded by
+'maxpending' and 'maxlate'.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from collections import deque
+from threading import Event
+from time import monotonic
+from types import NoneType
+
+from pynmeagps import NMEAMessage
+from pyrtcm import RTCMMessage
+
+from pyubx2.ubxhelpers import itow2utc
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxtypes_core import (
+    EPOCH_BOUNDARY,
+    EPOCH_EOE,
+    EPOCH_FLUSH,
+    EPOCH_OVERFLOW,
+    EPOCH_TIMEOUT,
+)
+
+
+class NavEpoch:
+    """
+    NavEpoch class - all navigation messages sharing a single iTOW.
+    """
+
+    def __init__(self, itow: int):
+        """
+        Constructor.
+
+        :param int itow: GPS time of week in milliseconds
+        """
+
+        self.itow = itow
+        self.messages = {}  # identity: parsed message
+        self.created = monotonic()
+        self.reason = None  # reason for emission e.g. EPOCH_EOE
+
+    def __getitem__(self, identity: str) -> UBXMessage:
+        """
+        Get message by identity.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :return: parsed message
+        :rtype: UBXMessage
+        :raises: KeyError
+        """
+
+        return self.messages[identity]
+
+    def __contains__(self, identity: str) -> bool:
+        """
+        Check if epoch contains identity.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :return: True if identity in epoch
+        :rtype: bool
+        """
+
+        return identity in self.messages
+
+    def __len__(self) -> int:
+        """
+        Number of messages in epoch.
+
+        :return: number of messages
+        :rtype: int
+        """
+
+        return len(self.messages)
+
+    def __str__(self) -> str:
+        """
+        Human readable representation.
+
+        :return: human readable representation
+        :rtype: str
+        """
+
+        return (
+            f"<NavEpoch(iTOW={itow2utc(self.itow)}, reason={self.reason}, "
+            f"messages={list(self.messages)})>"
+        )
+
+    def get(self, identity: str, default: object = None) -> UBXMessage | object:
+        """
+        Get message by identity, or default if not present.
+
+        :param str identity: message identity e.g. 'NAV-PVT'
+        :param object default: default value (None)
+        :return: parsed message or default
+        :rtype: UBXMessage | object
+        """
+
+        return self.messages.get(identity, default)
+
+    @property
+    def complete(self) -> bool:
+        """
+        Getter for complete flag (epoch was terminated by NAV-EOE).
+
+        :return: True if complete
+        :rtype: bool
+        """
+
+        return self.reason == EPOCH_EOE
+
+    @property
+    def identities(self) -> list:
+        """
+        Getter for identities in epoch.
+
+        :return: list of identities
+        :rtype: list
+        """
+
+        return list(self.messages)
+
+
+class EpochAssembler:
+    """
+    EpochAssembler class.
+    """
+
+    def __init__(
+        self,
+        identities: tuple | NoneType = None,
+        expected: tuple | NoneType = None,
+        timeout: float = 1.0,
+        boundary: bool = True,
+        maxpending: int = 4,
+        maxlate: int = 16,
+        callback: callable = None,
+    ):
+        """
+        Constructor.
+
+        :param tuple | NoneType identities: identities to group, None = all NAV and
+            NAV2 messages with an iTOW attribute; NAV-EOE is always included (None)
+        :param tuple | NoneType expected: identities expected in each epoch, used for
+            missing member counts, None = learn from previous complete epochs (None)
+        :param float timeout: emit epoch after this many seconds, 0 = no timeout (1.0)
+        :param bool boundary: emit pending epochs when a later epoch starts (True)
+        :param int maxpending: maximum number of pending epochs (4)
+        :param int maxlate: number of emitted epochs remembered for late detection (16)
+        :param callable callback: optional function called with each emitted NavEpoch (None)
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        # NAV-EOE always passes the filter, as it terminates the epoch
+        self._identities = None if identities is None else set(identities) | {"NAV-EOE"}
+        self._expected = set() if expected is None else set(expected)
+        self._learn = expected is None
+        self._timeout = timeout
+        self._boundary = boundary
+        self._maxpending = maxpending
+        self._callback = callback
+        self._pending = {}  # iTOW: NavEpoch, in insertion order
+        self._emitted = deque(maxlen=maxlate)  # recently emitted iTOWs
+        self._counts = {
+            "epochs": 0,
+            EPOCH_EOE: 0,
+            EPOCH_BOUNDARY: 0,
+            EPOCH_TIMEOUT: 0,
+            EPOCH_OVERFLOW: 0,
+            EPOCH_FLUSH: 0,
+            "late": 0,
+        }
+        self._missing = {}  # identity: count
+
+    def process(
+        self,
+        raw_data: bytes,  # pylint: disable=unused-argument
+        parsed_data: UBXMessage | NMEAMessage | RTCMMessage | NoneType,
+    ) -> list:
+        """
+        Process a single parsed message. Messages which are not navigation
+        messages with an iTOW attribute are ignored.
+
+        Signature is compatible with UBXDispatcher handlers.
+
+        :param bytes raw_data: raw message (not used)
+        :param UBXMessage | NMEAMessage | RTCMMessage | NoneType parsed_data: parsed
+            message
+        :return: list of NavEpochs emitted as a result of this message
+        :rtype: list
+        """
+
+        emitted = self.poll()
+        if not isinstance(parsed_data, UBXMessage):
+            return emitted
+        identity = parsed_data.identity
+        if self._identities is None:
+            if identity[0:3] != "NAV":
+                return emitted
+        elif identity not in self._identities:
+            return emitted
+        itow = getattr(parsed_data, "iTOW", None)
+        if itow is None:
+            return emitted
+
+        epoch = self._pending.get(itow, None)
+        if epoch is None:
+            if itow in self._emitted:  # epoch has already been emitted
+                self._counts["late"] += 1
+                return emitted
+            if self._boundary:
+                for pitow in list(self._pending):
+                    emitted.append(self._emit(pitow, EPOCH_BOUNDARY))
+            epoch = NavEpoch(itow)
+            self._pending[itow] = epoch
+            while len(self._pending) > self._maxpending:
+                emitted.append(self._emit(next(iter(self._pending)), EPOCH_OVERFLOW))
+        if identity == "NAV-EOE":
+            emitted.append(self._emit(itow, EPOCH_EOE))
+        else:
+            epoch.messages[identity] = parsed_data
+        return emitted
+
+    def poll(self) -> list:
+        """
+        Emit any pending epochs which have timed out. Can be called
+        periodically if the data stream is idle.
+
+        :return: list of NavEpochs emitted
+        :rtype: list
+        """
+
+        emitted = []
+        if self._timeout:
+            now = monotonic()
+            for itow, epoch in list(self._pending.items()):
+                if now - epoch.created > self._timeout:
+                    emitted.append(self._emit(itow, EPOCH_TIMEOUT))
+        return emitted
+
+    def flush(self) -> list:
+        """
+        Emit all pending epochs (e.g. at end of stream).
+
+        :return: list of NavEpochs emitted
+        :rtype: list
+        """
+
+        return [self._emit(itow, EPOCH_FLUSH) for itow in list(self._pending)]
+
+    def run(self, ubr: UBXReader, stopevent: Event | NoneType = None) -> int:
+        """
+        Read messages from UBXReader and assemble epochs until end of
+        stream or stop event. Any remaining epochs are flushed at end of
+        stream. Emitted epochs are passed to the callback.
+
+        :param UBXReader ubr: UBXReader instance
+        :param Event | NoneType stopevent: optional stop event (None)
+        :return: number of epochs emitted
+        :rtype: int
+        """
+
+        count = 0
+        while stopevent is None or not stopevent.is_set():
+            raw_data, parsed_data = ubr.read()
+            if raw_data is None:
+                count += len(self.flush())
+                break
+            count += len(self.process(raw_data, parsed_data))
+        return count
+
+    def _emit(self, itow: int, reason: str) -> NavEpoch:
+        """
+        Remove epoch from pending list, update counters and
+        invoke callback.
+
+        :param int itow: iTOW of epoch
+        :param str reason: reason for emission e.g. EPOCH_EOE
+        :return: emitted epoch
+        :rtype: NavEpoch
+        """
+
+        epoch = self._pending.pop(itow)
+        epoch.reason = reason
+        self._emitted.append(itow)
+        self._counts["epochs"] += 1
+        self._counts[reason] += 1
+        for identity in self._expected:
+            if identity not in epoch.messages:
+                self._missing[identity] = self._missing.get(identity, 0) + 1
+        if self._learn and reason == EPOCH_EOE:
+            self._expected.update(epoch.messages)
+        if self._callback is not None:
+            self._callback(epoch)
+        return epoch
+
+    @property
+    def pending(self) -> int:
+        """
+        Getter for number of pending epochs.
+
+        :return: number of pending epochs
+        :rtype: int
+        """
+
+        return len(self._pending)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for epoch counters - number of epochs emitted, number emitted
+        for each reason, number of late messages and number of missing
+        messages for each expected identity.
+
+        :return: dict of counters
+        :rtype: dict
+        """
+
+        return {**self._counts, "missing": dict(self._missing)}
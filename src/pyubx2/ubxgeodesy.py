@@ -0,0 +1,423 @@
+"""
+Batch coordinate conversion methods.
+
+Column-wise equivalents of the scalar ecef2llh(), llh2ecef(), haversine()
+and bearing() helper methods (re-exported from pynmeagps), plus conversion
+to local east, north, up (ENU) coordinates relative to a base point and
+datum transformation, for converting large numbers of positions (e.g.
+NAV-HPPOSECEF ECEF coordinates accumulated over a session) in a single
+call.
+
+Inputs are equal-length sequences of coordinates (lists, array.array,
+NumPy arrays etc.); the second point of haversine_batch() and
+bearing_batch() may also be a single fixed point.
+
+By default, each conversion is performed element by element using the
+scalar methods and returns array.array("d") columns. If ndarray is True,
+the conversion is instead vectorised using NumPy (an optional dependency)
+and returns numpy.ndarray columns; results may then differ from the scalar
+methods in the last few significant digits. The ECEF to LLH conversion uses
+the same Olson algorithm as ecef2llh() in both cases.
+
+Datums are specified as dicts of semi-major axis 'a', inverse flattening
+'f' and WGS84 minus datum ECEF offsets 'dx', 'dy', 'dz' in metres, as in
+examples/datums.py, e.g.::
+
+    from datums import DATUMS
+    lat, lon, hgt = datum_batch(lats, lons, hgts, dst=DATUMS["OSGB_1936"])
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from array import array
+from itertools import repeat
+from math import cos, radians, sin
+from types import ModuleType, NoneType
+
+from pynmeagps import (
+    WGS84_FLATTENING,
+    WGS84_SMAJ_AXIS,
+    bearing,
+    ecef2llh,
+    haversine,
+    llh2ecef,
+)
+
+from pyubx2.exceptions import ParameterError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def _numpy(ndarray: bool) -> ModuleType | NoneType:
+    """
+    Get NumPy module if numpy.ndarray output is requested.
+
+    :param bool ndarray: return numpy.ndarray columns
+    :return: numpy module, or None
+    :rtype: ModuleType | NoneType
+    :raises: ParameterError if ndarray is True and NumPy is not installed
+    """
+
+    if not ndarray:
+        return None
+    if numpy is None:
+        raise ParameterError(
+            "ndarray output requires NumPy - python3 -m pip install numpy"
+        )
+    return numpy
+
+
+def _column(val, num: int):
+    """
+    Get iterable column, repeating a single value if necessary.
+
+    :param val: sequence or single value
+    :param int num: number of elements
+    :return: iterable column
+    """
+
+    if isinstance(val, (int, float)):
+        return repeat(val, num)
+    return val
+
+
+def _columns(results, num: int = 3) -> tuple:
+    """
+    Transpose iterable of result tuples into array.array columns.
+
+    :param results: iterable of result tuples
+    :param int num: number of columns
+    :return: tuple of array.array("d") columns
+    :rtype: tuple
+    """
+
+    cols = tuple(array("d") for _ in range(num))
+    for row in results:
+        for col, val in zip(cols, row):
+            col.append(val)
+    return cols
+
+
+def llh2ecef_batch(
+    lat,
+    lon,
+    height,
+    a: float = WGS84_SMAJ_AXIS,
+    f: float = WGS84_FLATTENING,
+    ndarray: bool = False,
+) -> tuple:
+    """
+    Convert geodetic coordinates (LLH) to ECEF.
+
+    :param lat: latitudes in degrees
+    :param lon: longitudes in degrees
+    :param height: ellipsoidal heights in metres
+    :param float a: semi-major axis (6378137.0 for WGS84)
+    :param float f: inverse flattening (298.257223563 for WGS84)
+    :param bool ndarray: vectorise using NumPy and return numpy.ndarray
+        columns (False)
+    :return: tuple of ECEF (X, Y, Z) columns in metres
+    :rtype: tuple
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    np = _numpy(ndarray)
+    if np is None:
+        return _columns(map(llh2ecef, lat, lon, height, repeat(a), repeat(f)))
+
+    phi = np.radians(np.asarray(lat, dtype=float))
+    lam = np.radians(np.asarray(lon, dtype=float))
+    height = np.asarray(height, dtype=float)
+    e2 = (1 / f) * (2 - 1 / f)
+    nrad = a / np.sqrt(1 - e2 * np.sin(phi) ** 2)
+    return (
+        (nrad + height) * np.cos(phi) * np.cos(lam),
+        (nrad + height) * np.cos(phi) * np.sin(lam),
+        ((1 - e2) * nrad + height) * np.sin(phi),
+    )
+
+
+def ecef2llh_batch(
+    x,
+    y,
+    z,
+    a: float = WGS84_SMAJ_AXIS,
+    f: float = WGS84_FLATTENING,
+    ndarray: bool = False,
+) -> tuple:
+    """
+    Convert ECEF coordinates to geodetic (LLH) using Olson algorithm.
+
+    :param x: X coordinates in metres
+    :param y: Y coordinates in metres
+    :param z: Z coordinates in metres
+    :param float a: semi-major axis (6378137.0 for WGS84)
+    :param float f: inverse flattening (298.257223563 for WGS84)
+    :param bool ndarray: vectorise using NumPy and return numpy.ndarray
+        columns (False)
+    :return: tuple of (lat, lon, ellipsoidal height in m) columns
+    :rtype: tuple
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    np = _numpy(ndarray)
+    if np is None:
+        return _columns(map(ecef2llh, x, y, z, repeat(a), repeat(f)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _olson(np, *(np.asarray(val, dtype=float) for val in (x, y, z)), a, f)
+
+
+def _olson(np, x, y, z, a: float, f: float) -> tuple:
+    """
+    Vectorised Olson ECEF to LLH algorithm.
+
+    :param np: numpy module
+    :param x: X coordinates in metres
+    :param y: Y coordinates in metres
+    :param z: Z coordinates in metres
+    :param float a: semi-major axis
+    :param float f: inverse flattening
+    :return: tuple of (lat, lon, ellipsoidal height in m) columns
+    :rtype: tuple
+    """
+    # pylint: disable=too-many-locals, too-many-arguments, too-many-positional-arguments
+
+    flt = 1 / f
+    e2 = flt * (2 - flt)
+    a1 = a * e2
+    a2 = a1 * a1
+    a3 = a1 * e2 / 2
+    a4 = 2.5 * a2
+    a5 = a1 + a3
+    a6 = 1 - e2
+    zp = np.abs(z)
+    w2 = x * x + y * y
+    w = np.sqrt(w2)
+    z2 = z * z
+    r2 = w2 + z2
+    r = np.sqrt(r2)
+    core = r < 100000.0  # algorithm inaccurate near Earth's core
+    r = np.where(core, 100000.0, r)
+    lon = np.arctan2(y, x)
+    s2 = z2 / r2
+    c2 = w2 / r2
+    u = a2 / r
+    v = a3 - a4 / r
+    high = c2 > 0.3
+    s = np.where(high, (zp / r) * (1.0 + c2 * (a1 + u + s2 * v) / r), 0.0)
+    c = np.where(high, 0.0, (w / r) * (1.0 - s2 * (a5 - u - c2 * v) / r))
+    lat = np.where(high, np.arcsin(np.clip(s, -1, 1)), np.arccos(np.clip(c, -1, 1)))
+    ss = np.where(high, s * s, 1.0 - c * c)
+    s = np.where(high, s, np.sqrt(ss))
+    c = np.where(high, np.sqrt(1.0 - ss), c)
+    g = 1.0 - e2 * ss
+    rg = a / np.sqrt(g)
+    rf = a6 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    fac = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + fac)
+    lat = np.where(z < 0.0, -(lat + p), lat + p)
+    height = fac + m * p / 2.0
+    return (
+        np.where(core, 0.0, np.degrees(lat)),
+        np.where(core, 0.0, np.degrees(lon)),
+        np.where(core, -1.0e7, height),
+    )
+
+
+def _enu(np, dx, dy, dz, ref: tuple) -> tuple:
+    """
+    Rotate ECEF offsets from reference point into local ENU frame.
+
+    :param np: numpy module, or None
+    :param dx: X offsets in metres
+    :param dy: Y offsets in metres
+    :param dz: Z offsets in metres
+    :param tuple ref: reference point as (lat, lon, height)
+    :return: tuple of (east, north, up) columns in metres
+    :rtype: tuple
+    """
+
+    phi, lam = radians(ref[0]), radians(ref[1])
+    sphi, cphi, slam, clam = sin(phi), cos(phi), sin(lam), cos(lam)
+    if np is None:
+        return _columns(
+            (
+                -slam * ex + clam * ey,
+                -sphi * clam * ex - sphi * slam * ey + cphi * ez,
+                cphi * clam * ex + cphi * slam * ey + sphi * ez,
+            )
+            for ex, ey, ez in zip(dx, dy, dz)
+        )
+    return (
+        -slam * dx + clam * dy,
+        -sphi * clam * dx - sphi * slam * dy + cphi * dz,
+        cphi * clam * dx + cphi * slam * dy + sphi * dz,
+    )
+
+
+def ecef2enu_batch(x, y, z, ref: tuple, ndarray: bool = False) -> tuple:
+    """
+    Convert WGS84 ECEF coordinates to local east, north, up (ENU)
+    coordinates relative to a reference (base) point.
+
+    :param x: X coordinates in metres
+    :param y: Y coordinates in metres
+    :param z: Z coordinates in metres
+    :param tuple ref: reference point as (lat, lon, ellipsoidal height)
+    :param bool ndarray: vectorise using NumPy and return numpy.ndarray
+        columns (False)
+    :return: tuple of (east, north, up) columns in metres
+    :rtype: tuple
+    """
+
+    np = _numpy(ndarray)
+    x0, y0, z0 = llh2ecef(*ref)
+    if np is None:
+        return _enu(
+            None, (v - x0 for v in x), (v - y0 for v in y), (v - z0 for v in z), ref
+        )
+    x, y, z = (np.asarray(val, dtype=float) for val in (x, y, z))
+    return _enu(np, x - x0, y - y0, z - z0, ref)
+
+
+def llh2enu_batch(lat, lon, height, ref: tuple, ndarray: bool = False) -> tuple:
+    """
+    Convert WGS84 geodetic coordinates (LLH) to local east, north, up (ENU)
+    coordinates relative to a reference (base) point.
+
+    :param lat: latitudes in degrees
+    :param lon: longitudes in degrees
+    :param height: ellipsoidal heights in metres
+    :param tuple ref: reference point as (lat, lon, ellipsoidal height)
+    :param bool ndarray: vectorise using NumPy and return numpy.ndarray
+        columns (False)
+    :return: tuple of (east, north, up) columns in metres
+    :rtype: tuple
+    """
+
+    return ecef2enu_batch(
+        *llh2ecef_batch(lat, lon, height, ndarray=ndarray), ref, ndarray
+    )
+
+
+def datum_batch(
+    lat,
+    lon,
+    height,
+    src: dict | NoneType = None,
+    dst: dict | NoneType = None,
+    ndarray: bool = False,
+) -> tuple:
+    """
+    Transform geodetic coordinates (LLH) from one datum to another, using
+    a three-parameter (Molodensky) ECEF shift via WGS84.
+
+    :param lat: latitudes in degrees
+    :param lon: longitudes in degrees
+    :param height: ellipsoidal heights in metres
+    :param dict | NoneType src: source datum as dict of a, f, dx, dy, dz,
+        None = WGS84 (None)
+    :param dict | NoneType dst: destination datum as dict of a, f, dx, dy, dz,
+        None = WGS84 (None)
+    :param bool ndarray: vectorise using NumPy and return numpy.ndarray
+        columns (False)
+    :return: tuple of (lat, lon, ellipsoidal height in m) columns
+    :rtype: tuple
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    wgs84 = {"a": WGS84_SMAJ_AXIS, "f": WGS84_FLATTENING, "dx": 0, "dy": 0, "dz": 0}
+    src = wgs84 if src is None else src
+    dst = wgs84 if dst is None else dst
+    x, y, z = llh2ecef_batch(lat, lon, height, src["a"], src["f"], ndarray)
+    shift = [src[key] - dst[key] for key in ("dx", "dy", "dz")]
+    if _numpy(ndarray) is None:
+        x, y, z = ([val + sft for val in col] for col, sft in zip((x, y, z), shift))
+    else:
+        x, y, z = x + shift[0], y + shift[1], z + shift[2]
+    return ecef2llh_batch(x, y, z, dst["a"], dst["f"], ndarray)
+
+
+def haversine_batch(
+    lat1,
+    lon1,
+    lat2,
+    lon2,
+    radius: float = WGS84_SMAJ_AXIS / 1000,
+    ndarray: bool = False,
+):
+    """
+    Calculate spherical distances in km between pairs of coordinates
+    using haversine formula. lat2 and lon2 may be a single point.
+
+    :param lat1: first latitudes in degrees
+    :param lon1: first longitudes in degrees
+    :param lat2: second latitude(s) in degrees
+    :param lon2: second longitude(s) in degrees
+    :param float radius: radius in km (Earth = 6378.137 km)
+    :param bool ndarray: vectorise using NumPy and return numpy.ndarray
+        columns (False)
+    :return: spherical distances in km
+    :rtype: array.array or numpy.ndarray
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    np = _numpy(ndarray)
+    if np is None:
+        num = len(lat1)
+        return array(
+            "d",
+            map(
+                haversine,
+                lat1,
+                lon1,
+                _column(lat2, num),
+                _column(lon2, num),
+                repeat(radius),
+            ),
+        )
+    phi1, lam1, phi2, lam2 = (
+        np.radians(np.asarray(val, dtype=float)) for val in (lat1, lon1, lat2, lon2)
+    )
+    cosd = np.cos(phi2 - phi1) - np.cos(phi1) * np.cos(phi2) * (1 - np.cos(lam2 - lam1))
+    return radius * np.arccos(np.clip(cosd, -1, 1))
+
+
+def bearing_batch(lat1, lon1, lat2, lon2, ndarray: bool = False):
+    """
+    Calculate bearings between pairs of coordinates. lat2 and lon2 may be
+    a single point.
+
+    :param lat1: first latitudes in degrees
+    :param lon1: first longitudes in degrees
+    :param lat2: second latitude(s) in degrees
+    :param lon2: second longitude(s) in degrees
+    :param bool ndarray: vectorise using NumPy and return numpy.ndarray
+        columns (False)
+    :return: bearings in degrees
+    :rtype: array.array or numpy.ndarray
+    """
+
+    np = _numpy(ndarray)
+    if np is None:
+        num = len(lat1)
+        return array(
+            "d", map(bearing, lat1, lon1, _column(lat2, num), _column(lon2, num))
+        )
+    phi1, lam1, phi2, lam2 = (
+        np.radians(np.asarray(val, dtype=float)) for val in (lat1, lon1, lat2, lon2)
+    )
+    y = np.sin(lam2 - lam1) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(lam2 - lam1)
+    return (np.degrees(np.arctan2(y, x)) + 360) % 360
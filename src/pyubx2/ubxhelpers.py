@@ -13,7 +13,7 @@ import struct
 from datetime import datetime, time, timedelta
 from math import cos, pi, sin, trunc
 
-from pynmeagps.nmeatypes_core import NMEA_HDR
+from pynmeagps.nmeatypes_core import NMEA_HDR, NMEA_PREFIX_PROP
 
 import pyubx2.exceptions as ube
 import pyubx2.ubxtypes_configdb as ubcdb
@@ -400,6 +400,29 @@ def itow2utc(itow: int, leaps: int = LEAPOFFSET) -> time:
     return utc.time()
 
 
+def itowspan(raw: bytes) -> tuple | None:
+    """
+    Get position of iTOW (or RXM-RAWX rcvTow) attribute in raw UBX message.
+
+    :param bytes raw: raw (binary) UBX message
+    :return: (start, end) byte offsets of attribute in raw message,
+        or None if not available
+    :rtype: tuple | None
+    """
+
+    global _ITOWOFFSETS  # pylint: disable=global-statement
+    if _ITOWOFFSETS is None:
+        _ITOWOFFSETS = _itow_offsets()
+    offset = _ITOWOFFSETS.get(raw[2:4], None)
+    if offset is None or raw[0:2] != UBX_HDR:
+        return None
+    start = offset[0] + 6
+    end = start + offset[1]
+    if len(raw) < end + 2:
+        return None
+    return (start, end)
+
+
 def key_from_val(dictionary: dict, value: object) -> bytes:
     """
     Helper method - get dictionary key corresponding to (unique) value.
@@ -558,6 +581,90 @@ def protocol(raw: bytes) -> int:
     return 0
 
 
+def raw2identity(raw: bytes) -> str:
+    """
+    Get identity of raw NMEA, UBX or RTCM3 message without parsing it
+    e.g. 'NAV-PVT', 'GNGGA', '1077'.
+
+    :param bytes raw: raw (binary) message
+    :return: message identity, or "UNKNOWN" if protocol unrecognised
+    :rtype: str
+    """
+
+    prot = protocol(raw)
+    if prot == UBX_PROTOCOL:
+        return ubxidentity(raw[2:3], raw[3:4], raw[6:-2])
+    if prot == NMEA_PROTOCOL:
+        hdr, *payload = raw[1:].split(b"*", 1)[0].split(b",", 2)
+        s = 1 if hdr[:1] == b"P" else 2
+        talker = hdr[:s].decode(errors="replace")
+        msgid = hdr[s:].decode(errors="replace")
+        if talker == "P" and msgid in NMEA_PREFIX_PROP and payload:
+            return talker + msgid + payload[0].decode(errors="replace")
+        return talker + msgid
+    if prot == RTCM3_PROTOCOL and len(raw) > 5:
+        mid = raw[3] << 4 | raw[4] >> 4
+        if mid == 4076:  # proprietary IGS SSR message type
+            mid = f"{mid}_{(raw[4] & 0x1) << 7 | raw[5] >> 1:03d}"
+        return str(mid)
+    return "UNKNOWN"
+
+
+def raw2itow(raw: bytes) -> int | None:
+    """
+    Get GPS Time Of Week of raw UBX message without parsing it, for any
+    message type with an iTOW attribute at a fixed payload offset
+    (e.g. NAV-PVT, NAV-RELPOSNED, NAV2-PVT) or RXM-RAWX (rcvTow).
+
+    :param bytes raw: raw (binary) UBX message
+    :return: GPS Time Of Week in milliseconds, or None if not available
+    :rtype: int | None
+    """
+
+    span = itowspan(raw)
+    if span is None:
+        return None
+    start, end = span
+    if end - start == 8:  # RXM-RAWX rcvTow in seconds
+        return round(struct.unpack("<d", raw[start:end])[0] * 1000)
+    return int.from_bytes(raw[start:end], "little")
+
+
+def _itow_offsets() -> dict:
+    """
+    Build lookup of payload offset and size of iTOW (or rcvTow) attribute
+    by UBX message class and id, from the output message definitions.
+    Only attributes preceding any repeating group or variable length
+    attribute are considered.
+
+    :return: dict of {msgclass + msgid: (offset, size)}
+    :rtype: dict
+    """
+
+    from pyubx2.ubxtypes_get import (  # pylint: disable=import-outside-toplevel
+        UBX_PAYLOADS_GET,
+    )
+
+    offsets = {}
+    for key, identity in ubt.UBX_MSGIDS.items():
+        if len(key) != 2 or identity not in UBX_PAYLOADS_GET:
+            continue
+        pos = 0
+        for name, att in UBX_PAYLOADS_GET[identity].items():
+            if isinstance(att, (list, tuple)):  # scaled or bitfield
+                att = att[0]
+            if not isinstance(att, str) or att[0:1] not in "UIXRE" or att == "CH":
+                break  # repeating group or variable length
+            if name in ("iTOW", "rcvTow"):
+                offsets[key] = (pos, attsiz(att))
+                break
+            pos += attsiz(att)
+    return offsets
+
+
+_ITOWOFFSETS = None
+
+
 def sigid2str(gnss_id: int, sig_id: int) -> str:
     """
     Convert GNSS ID and Signal ID to descriptive string
@@ -575,6 +682,34 @@ def sigid2str(gnss_id: int, sig_id: int) -> str:
         return str(sig_id)
 
 
+def ubxidentity(msgclass: bytes, msgid: bytes, payload: bytes | None = None) -> str:
+    """
+    Get UBX message identity from message class, id and (optionally) payload.
+
+    All MGA messages except MGA-DBD are identified by the first byte of
+    the payload. If the message is unrecognised, 'NOMINAL' is appended
+    to the identity.
+
+    :param bytes msgclass: message class e.g. b'\\x01'
+    :param bytes msgid: message id e.g. b'\\x07'
+    :param bytes | None payload: raw payload (None)
+    :return: message identity e.g. 'NAV-PVT'
+    :rtype: str
+    """
+
+    try:
+        if msgclass == b"\x13" and msgid != b"\x80" and payload:
+            return ubt.UBX_MSGIDS[msgclass + msgid + payload[0:1]]
+        return ubt.UBX_MSGIDS[msgclass + msgid]
+    except KeyError:
+        # unrecognised u-blox message, parsed to UBX-NOMINAL definition
+        cls = ubt.UBX_CLASSES.get(msgclass, "UNKNOWN")
+        return (
+            f"{cls}-{int.from_bytes(msgclass, 'little'):02x}"
+            + f"{int.from_bytes(msgid, 'little'):02x}-NOMINAL"
+        )
+
+
 def utc2itow(utc: datetime, leaps: int = LEAPOFFSET) -> tuple:
     """
     Convert UTC datetime to GPS Week Number, Time Of Week
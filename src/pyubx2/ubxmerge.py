@@ -0,0 +1,186 @@
+"""
+UBXMerger class.
+
+Merges several logs of the same (or redundant) receivers into a single
+stream ordered by GPS time, dropping exact duplicate frames, e.g. where
+the same receiver has been logged over both USB and UART2.
+
+Each input stream is read by its own UBXReader, so only one frame per
+input is held at any time and memory use is independent of log size.
+Frames are ordered by a k-way heap merge on (GPS week, iTOW):
+
+- iTOW is taken from the parsed message (e.g. NAV-PVT), or derived
+  from rcvTow (RXM-RAWX).
+- The GPS week is taken from messages which carry it (e.g. NAV-SOL,
+  NAV-TIMEGPS, RXM-RAWX) and is incremented if iTOW
+  wraps around at the end of the week. On a stream whose week is not
+  yet known, it is inferred from the most recent GPS time seen on any
+  stream.
+- Frames without an iTOW (e.g. NMEA, RTCM3, MON-*) keep their position
+  relative to the preceding timed frame on the same stream.
+- Ties are broken by input order, then by position within each input.
+
+Each input is assumed to be in GPS time order. A frame is a duplicate
+if its raw bytes are identical to a frame already output with the same
+iTOW, so only the frames of the current epoch need to be retained.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from heapq import heappop, heappush
+from threading import Event
+from types import NoneType
+
+from pynmeagps import NMEAMessage
+from pyrtcm import RTCMMessage
+
+from pyubx2.ubxhelpers import SIW
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import ReadIterator, UBXReader
+
+_HALFWEEK = SIW * 500  # half a week in milliseconds
+_GPSWEEK = (  # messages with GPS week number attribute 'week'
+    "NAV-SOL",
+    "NAV-TIMEGPS",
+    "NAV2-TIMEGPS",
+    "RXM-RAW",
+    "RXM-RAWX",
+    "RXM-SVSI",
+)
+
+
+class UBXMerger(ReadIterator):
+    """
+    UBXMerger class.
+    """
+
+    def __init__(self, streams: list, dedupe: bool = True, **kwargs):
+        """
+        Constructor.
+
+        :param list streams: list of input data streams, in order of priority
+        :param bool dedupe: drop exact duplicate frames (True)
+        :param kwargs: optional UBXReader keyword arguments (parsing must
+            not be False, as GPS time is taken from the parsed message)
+        """
+
+        self._readers = [UBXReader(stream, **kwargs) for stream in streams]
+        self._times = [[-1, -1] for _ in streams]  # [week, iTOW] per stream
+        self._seqs = [0] * len(streams)
+        self._heap = []
+        self._dedupe = dedupe
+        self._epoch = None  # iTOW of last frame output
+        self._ref = None  # most recent (week, iTOW) with known week
+        self._seen = set()  # raw frames output for current epoch
+        self._count = 0
+        self._duplicates = 0
+        for idx in range(len(self._readers)):
+            self._advance(idx)
+
+    def _advance(self, idx: int):
+        """
+        Read next frame from input stream and push it onto heap.
+
+        :param int idx: input stream index
+        """
+
+        raw_data, parsed_data = self._readers[idx].read()
+        if raw_data is None:
+            return
+        gpstime = self._times[idx]
+        week = None
+        if getattr(parsed_data, "identity", None) in _GPSWEEK:
+            week = gpstime[0] = parsed_data.week
+        itow = getattr(parsed_data, "iTOW", None)
+        if itow is None and hasattr(parsed_data, "rcvTow"):
+            itow = round(parsed_data.rcvTow * 1000)
+        if itow is not None:
+            if week is None:
+                if gpstime[0] < 0 and self._ref is not None:
+                    gpstime[0] = self._ref[0]  # infer week from other streams
+                    gpstime[1] = self._ref[1]
+                if gpstime[0] >= 0:
+                    if gpstime[1] - itow > _HALFWEEK:  # week rollover
+                        gpstime[0] += 1
+                    elif itow - gpstime[1] > _HALFWEEK:  # previous week
+                        gpstime[0] -= 1
+            gpstime[1] = itow
+            if gpstime[0] >= 0:
+                self._ref = tuple(gpstime)
+        self._seqs[idx] += 1
+        heappush(
+            self._heap,
+            (tuple(gpstime), idx, self._seqs[idx], raw_data, parsed_data),
+        )
+
+    def read(
+        self,
+    ) -> tuple[bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]:
+        """
+        Read next frame in GPS time order.
+
+        :return: tuple of (raw_data, parsed_data), or (None, None) when
+            all inputs are exhausted
+        :rtype: tuple[bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]
+        """
+
+        while self._heap:
+            gpstime, idx, _, raw_data, parsed_data = heappop(self._heap)
+            self._advance(idx)
+            if self._dedupe:
+                if gpstime[1] != self._epoch:
+                    self._epoch = gpstime[1]
+                    self._seen.clear()
+                if raw_data in self._seen:
+                    self._duplicates += 1
+                    continue
+                self._seen.add(raw_data)
+            self._count += 1
+            return (raw_data, parsed_data)
+        return (None, None)
+
+    def run(self, outstream, stopevent: Event | NoneType = None) -> int:
+        """
+        Write merged raw frames to output stream until all inputs are
+        exhausted or stopevent is set.
+
+        :param outstream outstream: output binary stream (supporting write(bytes))
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of frames written
+        :rtype: int
+        """
+
+        count = 0
+        while stopevent is None or not stopevent.is_set():
+            raw_data, _ = self.read()
+            if raw_data is None:
+                break
+            outstream.write(raw_data)
+            count += 1
+        return count
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of frames output.
+
+        :return: number of frames
+        :rtype: int
+        """
+
+        return self._count
+
+    @property
+    def duplicates(self) -> int:
+        """
+        Getter for number of duplicate frames dropped.
+
+        :return: number of duplicates
+        :rtype: int
+        """
+
+        return self._duplicates
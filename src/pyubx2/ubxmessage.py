@@ -30,6 +30,7 @@ from pyubx2.ubxhelpers import (
     msgstr2bytes,
     nomval,
     sigid2str,
+    ubxidentity,
     val2bytes,
 )
 from pyubx2.ubxtypes_core import (
@@ -525,6 +526,7 @@ class UBXMessage:
         clsid = None
         msgid = None
 
+        self._undefer()
         umsg_name = self.identity
         if self.payload is None:
             return f"<UBX({umsg_name})>"
@@ -602,6 +604,59 @@ class UBXMessage:
 
         super().__setattr__(name, value)
 
+    def __getattr__(self, name):
+        """
+        Parse deferred payload of unpickled message on first access to
+        any of its attributes. Only called if attribute is not found.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError
+
+        """
+
+        if "_deferred" in self.__dict__:
+            self._undefer()
+            return getattr(self, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _undefer(self):
+        """
+        Parse deferred payload of unpickled message, if not already parsed.
+        """
+
+        if self.__dict__.pop("_deferred", False):
+            super().__setattr__("_immutable", False)
+            self._do_attributes(payload=self._payload)
+            self._immutable = True
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle support. Only the message class, ID, mode, bitfield parsing
+        option and raw payload are pickled, rather than the full attribute
+        dictionary. The unpickled payload is only parsed when one of its
+        attributes is first accessed.
+
+        :return: tuple of (callable, arguments)
+        :rtype: tuple
+
+        """
+
+        return (
+            _unpickle,
+            (
+                self.__class__,
+                self._ubxClass,
+                self._ubxID,
+                self._mode,
+                self._parsebf,
+                self._payload,
+            ),
+        )
+
     def serialize(self) -> bytes:
         """
         Serialize message.
@@ -634,26 +689,7 @@ class UBXMessage:
 
         """
 
-        try:
-            # all MGA messages except MGA-DBD need to be identified by the
-            # 'type' attribute - the first byte of the payload
-            if self._ubxClass == b"\x13" and self._ubxID != b"\x80" and (self._payload):
-                umsg_name = UBX_MSGIDS[
-                    self._ubxClass + self._ubxID + self._payload[0:1]
-                ]
-            else:
-                umsg_name = UBX_MSGIDS[self._ubxClass + self._ubxID]
-        except KeyError:
-            # unrecognised u-blox message, parsed to UBX-NOMINAL definition
-            if self._ubxClass in UBX_CLASSES:  # known class
-                cls = UBX_CLASSES[self._ubxClass]
-            else:  # unknown class
-                cls = "UNKNOWN"
-            umsg_name = (
-                f"{cls}-{int.from_bytes(self._ubxClass, 'little'):02x}"
-                + f"{int.from_bytes(self._ubxID, 'little'):02x}-NOMINAL"
-            )
-        return umsg_name
+        return ubxidentity(self._ubxClass, self._ubxID, self._payload)
 
     @property
     def msg_cls(self) -> bytes:
@@ -835,3 +871,43 @@ class UBXMessage:
             lis = lis + keyb
 
         return UBXMessage("CFG", "CFG-VALGET", POLL, payload=payload + lis)
+
+
+def _unpickle(
+    cls: type,
+    ubxClass: bytes,
+    ubxID: bytes,
+    msgmode: int,
+    parsebitfield: int,
+    payload: bytes | NoneType,
+) -> UBXMessage:
+    """
+    Reconstruct pickled UBXMessage from its raw payload, deferring
+    parsing of the payload until its attributes are first accessed.
+
+    :param type cls: UBXMessage class
+    :param bytes ubxClass: message class
+    :param bytes ubxID: message ID
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param int parsebitfield: bitfield parsing option
+    :param bytes | NoneType payload: raw payload
+    :return: UBXMessage
+    :rtype: UBXMessage
+    """
+
+    if payload is None:
+        return cls(ubxClass, ubxID, msgmode, parsebitfield)
+    length = val2bytes(len(payload), U2)
+    msg = cls.__new__(cls)
+    msg.__dict__.update(  # bypass immutability
+        _immutable=True,
+        _mode=msgmode,
+        _payload=payload,
+        _length=length,
+        _checksum=calc_checksum(ubxClass + ubxID + length + payload),
+        _parsebf=parsebitfield,
+        _ubxClass=ubxClass,
+        _ubxID=ubxID,
+        _deferred=True,
+    )
+    return msg
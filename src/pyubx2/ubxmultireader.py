@@ -0,0 +1,298 @@
+"""
+MultiUBXReader class.
+
+Reads and parses NMEA, UBX or RTCM3 messages from multiple data streams
+(e.g. serial ports and TCP sockets) on a single thread, using a
+'selectors' event loop rather than one UBXReader thread per stream.
+
+Each stream is identified by a caller-supplied source id and is framed
+independently in its own buffer, by a dedicated UBXReader instance, so
+partial messages on one stream never block or corrupt the others.
+Messages are yielded as (source_id, raw_data, parsed_data) tuples, one
+message per ready stream in turn.
+
+Streams must support the fileno() method. Sockets are read via recv(),
+serial streams via read(in_waiting) and any other streams via os.read().
+A stream is removed when it reaches EOF.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from collections import deque
+from logging import getLogger
+from os import read as osread
+from selectors import EVENT_READ, DefaultSelector
+from types import NoneType
+
+from pynmeagps import DEFAULT_BUFSIZE, NMEAMessage
+from pyrtcm import RTCMMessage
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import UBXReader
+
+_HDRBYTES = (0xB5, 0x24, 0xD3)  # first bytes of UBX, NMEA & RTCM3 headers
+
+
+class _FrameBuffer:
+    """
+    In-memory stream buffer with rewind, used as the datastream for
+    each per-source UBXReader.
+
+    Reads which cannot be satisfied from the data currently buffered
+    return b"", which UBXReader treats as EOF. The buffer is then rewound
+    to the start of the incomplete message until more data arrives.
+    UBXReader calls startframe() at the start of each frame, so any
+    frames discarded before the incomplete one (e.g. with an invalid
+    checksum) are consumed rather than parsed and reported again.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self._buf = bytearray()
+        self._pos = 0  # current read position
+        self._mark = 0  # start of current (uncommitted) message
+        self._start = 0  # start of current frame
+
+    def feed(self, data: bytes):
+        """
+        Append incoming data to buffer, discarding committed data.
+
+        :param bytes data: incoming data
+        """
+
+        if self._mark:
+            del self._buf[: self._mark]
+            self._pos -= self._mark
+            self._start -= self._mark
+            self._mark = 0
+        self._buf += data
+
+    def read(self, size: int) -> bytes:
+        """
+        Read specified number of bytes, or b"" if not yet available.
+
+        :param int size: number of bytes to read
+        :return: bytes
+        :rtype: bytes
+        """
+
+        end = self._pos + size
+        if end > len(self._buf):
+            return b""
+        data = bytes(self._buf[self._pos : end])
+        self._pos = end
+        return data
+
+    def readline(self) -> bytes:
+        """
+        Read bytes up to and including LF (0x0a), or b"" if not yet available.
+
+        :return: bytes
+        :rtype: bytes
+        """
+
+        end = self._buf.find(b"\x0a", self._pos) + 1
+        if not end:
+            return b""
+        data = bytes(self._buf[self._pos : end])
+        self._pos = end
+        return data
+
+    def startframe(self):
+        """
+        Note start of frame (called by UBXReader).
+        """
+
+        self._start = self._pos
+
+    def commit(self):
+        """
+        Mark all data read so far as consumed.
+        """
+
+        self._mark = self._pos
+
+    def rewind(self):
+        """
+        Rewind to start of incomplete message, skipping any leading bytes
+        which cannot start a message. Any frames discarded before the
+        incomplete message are committed.
+        """
+
+        buf = self._buf
+        mark = max(self._mark, self._start)
+        while mark < len(buf) and buf[mark] not in _HDRBYTES:
+            mark += 1
+        self._mark = self._pos = mark
+
+
+class MultiUBXReader:
+    """
+    MultiUBXReader class.
+    """
+
+    def __init__(self, bufsize: int = DEFAULT_BUFSIZE, **kwargs):
+        """
+        Constructor.
+
+        :param int bufsize: maximum number of bytes read from a stream at a time (4096)
+        :param kwargs: default UBXReader keyword arguments for all streams
+            e.g. msgmode, protfilter, quitonerror, parsing
+        """
+
+        self._bufsize = bufsize
+        self._kwargs = kwargs
+        self._selector = DefaultSelector()
+        self._sources = {}  # source_id: (datastream, _FrameBuffer, UBXReader)
+        self._ready = deque()  # source_ids which may have buffered messages
+        self._logger = getLogger(__name__)
+
+    def __iter__(self):
+        """Iterator."""
+
+        return self
+
+    def __next__(
+        self,
+    ) -> tuple[
+        object, bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType
+    ]:
+        """
+        Return next item in iteration.
+
+        :return: tuple of (source_id, raw_data as bytes, parsed_data as UBXMessage,
+            NMEAMessage or RTCMMessage)
+        :rtype: tuple[object, bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]
+        :raises: StopIteration (when all streams have been removed)
+        """
+
+        while self._sources or self._ready:
+            source_id, raw_data, parsed_data = self.read()
+            if raw_data is not None:
+                return (source_id, raw_data, parsed_data)
+        raise StopIteration
+
+    def add(self, source_id: object, datastream: object, **kwargs):
+        """
+        Add data stream.
+
+        :param object source_id: unique, hashable source id e.g. port name
+        :param object datastream: input data stream supporting fileno()
+        :param kwargs: UBXReader keyword arguments for this stream, overriding
+            any defaults passed to the constructor
+        :raises: ParameterError if source id is already in use
+        """
+
+        if source_id in self._sources:
+            raise ParameterError(f"Source {source_id} already added")
+        buf = _FrameBuffer()
+        ubr = UBXReader(buf, **{**self._kwargs, **kwargs})
+        self._sources[source_id] = (datastream, buf, ubr)
+        self._selector.register(datastream, EVENT_READ, source_id)
+
+    def remove(self, source_id: object):
+        """
+        Remove data stream (the stream itself is not closed).
+
+        :param object source_id: source id
+        """
+
+        source = self._sources.pop(source_id, None)
+        if source is not None:
+            self._selector.unregister(source[0])
+
+    def read(
+        self, timeout: float | NoneType = None
+    ) -> tuple[
+        object, bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType
+    ]:
+        """
+        Read a single NMEA, UBX or RTCM3 message from the next ready stream.
+
+        :param float | NoneType timeout: maximum time to wait for data in seconds,
+            None = wait indefinitely (None)
+        :return: tuple of (source_id, raw_data as bytes, parsed_data as UBXMessage,
+            NMEAMessage or RTCMMessage), or (None, None, None) if timed out or
+            no streams remain
+        :rtype: tuple[object, bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]
+        """
+
+        while True:
+            # round robin through sources with buffered data
+            while self._ready:
+                source_id = self._ready.popleft()
+                source = self._sources.get(source_id, None)
+                if source is None:
+                    continue
+                _, buf, ubr = source
+                raw_data, parsed_data = ubr.read()
+                if raw_data is None:  # incomplete message
+                    buf.rewind()
+                    continue
+                buf.commit()
+                self._ready.append(source_id)
+                return (source_id, raw_data, parsed_data)
+
+            if not self._sources:
+                return (None, None, None)
+            events = self._selector.select(timeout)
+            if not events:
+                return (None, None, None)
+            for key, _ in events:
+                self._fill(key.data)
+
+    def close(self):
+        """
+        Remove all data streams and close selector (the streams
+        themselves are not closed).
+        """
+
+        for source_id in list(self._sources):
+            self.remove(source_id)
+        self._ready.clear()
+        self._selector.close()
+
+    def _fill(self, source_id: object):
+        """
+        Read available data from stream into its buffer. Stream is
+        removed on EOF or connection error.
+
+        :param object source_id: source id
+        """
+
+        stream, buf, _ = self._sources[source_id]
+        try:
+            if hasattr(stream, "recv"):  # socket
+                data = stream.recv(self._bufsize)
+            elif hasattr(stream, "in_waiting"):  # serial
+                data = stream.read(min(max(stream.in_waiting, 1), self._bufsize))
+            else:
+                data = osread(stream.fileno(), self._bufsize)
+        except OSError as err:
+            self._logger.error("Source %s read error %s", source_id, err)
+            data = b""
+        if data:
+            buf.feed(data)
+            if source_id not in self._ready:
+                self._ready.append(source_id)
+        else:
+            self.remove(source_id)
+
+    @property
+    def sources(self) -> list:
+        """
+        Getter for source ids of active streams.
+
+        :return: list of source ids
+        :rtype: list
+        """
+
+        return list(self._sources)
@@ -0,0 +1,496 @@
+"""
+PositionStats class.
+
+Accumulates position statistics in constant memory from a stream of raw
+NAV-PVT, NAV-HPPOSLLH or NAV-HPPOSECEF messages, e.g. for survey or base
+station qualification, without holding the positions themselves.
+
+Each position is converted to local east, north, up (ENU) coordinates in
+metres relative to a reference position (by default the first position
+received). Running mean and covariance are updated using Welford's online
+algorithm, and the horizontal ENU position is added to an approximate sketch
+(log-polar buckets about the reference position, with 1% relative accuracy
+in range). CEP50 and CEP95 are estimated from the distances of the sketch
+buckets from the final mean position, so their accuracy is relative to the
+spread of positions about the reference position. Statistics are maintained
+both overall and for each NAV-PVT fixType (for NAV-HPPOSLLH and
+NAV-HPPOSECEF, the fixType of the NAV-PVT message of the same epoch, if
+received).
+
+Accumulators from parallel workers (e.g. each processing part of a log) can
+be combined using merge(). Sketches are merged exactly if the accumulators
+share the same reference position (e.g. passed as 'ref' to each worker);
+otherwise the other sketch buckets are re-bucketed about this reference
+position, which adds a further 1% of their range. Accumulators are
+picklable, so can be returned from a multiprocessing pool.
+
+e.g.::
+
+    pos = PositionStats(identity="NAV-HPPOSLLH")
+    with open("survey.ubx", "rb") as stream:
+        pos.run(stream)
+    print(pos.stats()["cep95"], pos.stats(fixtype=3)["2drms"])
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from math import atan2, ceil, cos, floor, hypot, log, radians, sin, sqrt
+from struct import Struct
+from threading import Event
+from types import NoneType
+
+from pynmeagps import ecef2llh, llh2ecef
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxreader import validframes
+
+SKETCH_ACCURACY = 0.01
+"""Relative accuracy of CEP quantile sketch"""
+
+_GAMMA = (1 + SKETCH_ACCURACY) / (1 - SKETCH_ACCURACY)
+_LOGGAMMA = log(_GAMMA)
+_MINDIST = 1e-4  # distances below 0.1 mm are counted as zero
+_SECTOR = 2 * SKETCH_ACCURACY  # bearing bucket width in radians
+
+_NAVPVT = (b"\x01\x07",)  # NAV-PVT class and id
+_PVT = Struct("<L16xBB2xiii")  # iTOW, fixType, flags, lon, lat, height
+_HPLLH = Struct("<3xBLiii4xbbb")  # flags, iTOW, lon, lat, height, HP
+_HPECEF = Struct("<4xLiiibbbB")  # iTOW, ecefX, Y, Z, HP, flags
+_SOURCES = {
+    "NAV-PVT": _NAVPVT,
+    "NAV-HPPOSLLH": (b"\x01\x14",),
+    "NAV-HPPOSECEF": (b"\x01\x13",),
+}
+
+
+class _Sketch:
+    """
+    Mergeable approximate sketch of horizontal positions relative to a fixed
+    reference position, using logarithmically sized range buckets and fixed
+    width bearing buckets.
+    """
+
+    __slots__ = ("buckets", "zero", "total")
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self.buckets = {}  # (range index, bearing index): count
+        self.zero = 0
+        self.total = 0
+
+    def add(self, east: float, north: float, num: int = 1):
+        """
+        Add position to sketch.
+
+        :param float east: east in metres
+        :param float north: north in metres
+        :param int num: number of positions (1)
+        """
+
+        self.total += num
+        rng = hypot(east, north)
+        if rng < _MINDIST:
+            self.zero += num
+            return
+        key = (ceil(log(rng) / _LOGGAMMA), floor(atan2(north, east) / _SECTOR))
+        self.buckets[key] = self.buckets.get(key, 0) + num
+
+    @staticmethod
+    def centre(key: tuple) -> tuple:
+        """
+        Get representative position of bucket.
+
+        :param tuple key: (range index, bearing index)
+        :return: east, north in metres
+        :rtype: tuple
+        """
+
+        rng = 2 * _GAMMA ** key[0] / (_GAMMA + 1)
+        brg = (key[1] + 0.5) * _SECTOR
+        return rng * cos(brg), rng * sin(brg)
+
+    def merge(self, other: "_Sketch", shift: tuple):
+        """
+        Merge other sketch into this one.
+
+        :param _Sketch other: other sketch
+        :param tuple shift: offset of other reference position in this ENU frame
+        """
+
+        if not any(shift[:2]):  # same reference position
+            self.total += other.total
+            self.zero += other.zero
+            for key, num in other.buckets.items():
+                self.buckets[key] = self.buckets.get(key, 0) + num
+            return
+        if other.zero:
+            self.add(shift[0], shift[1], other.zero)
+        for key, num in other.buckets.items():
+            east, north = self.centre(key)
+            self.add(east + shift[0], north + shift[1], num)
+
+    def quantile(self, qtl: float, origin: tuple) -> float:
+        """
+        Get approximate quantile of horizontal distance from origin.
+
+        :param float qtl: quantile e.g. 0.5 = median
+        :param tuple origin: origin as east, north in metres e.g. mean position
+        :return: distance in metres
+        :rtype: float
+        """
+
+        dists = [(hypot(origin[0], origin[1]), self.zero)]
+        for key, num in self.buckets.items():
+            east, north = self.centre(key)
+            dists.append((hypot(east - origin[0], north - origin[1]), num))
+        dists.sort()
+        rank = qtl * (self.total - 1)
+        cum = 0
+        dist = 0.0
+        for dist, num in dists:
+            cum += num
+            if cum > rank:
+                break
+        return dist
+
+
+class _Moments:
+    """
+    Running count, mean and co-moment (Welford) of ENU coordinates, plus
+    sketch of horizontal positions.
+    """
+
+    __slots__ = ("count", "mean", "comoment", "sketch")
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self.count = 0
+        self.mean = [0.0, 0.0, 0.0]
+        self.comoment = [0.0] * 6  # EE, EN, EU, NN, NU, UU
+        self.sketch = _Sketch()
+
+    def add(self, enu: tuple):
+        """
+        Add position.
+
+        :param tuple enu: east, north, up in metres
+        """
+
+        self.count += 1
+        mean = self.mean
+        dlt = [val - avg for val, avg in zip(enu, mean)]
+        for i in range(3):
+            mean[i] += dlt[i] / self.count
+        dlt2 = [val - avg for val, avg in zip(enu, mean)]
+        com = self.comoment
+        com[0] += dlt[0] * dlt2[0]
+        com[1] += dlt[0] * dlt2[1]
+        com[2] += dlt[0] * dlt2[2]
+        com[3] += dlt[1] * dlt2[1]
+        com[4] += dlt[1] * dlt2[2]
+        com[5] += dlt[2] * dlt2[2]
+        self.sketch.add(enu[0], enu[1])
+
+    def merge(self, other: "_Moments", shift: tuple):
+        """
+        Merge other moments into these (Chan et al parallel algorithm).
+
+        :param _Moments other: other moments
+        :param tuple shift: offset of other reference position in this ENU frame
+        """
+
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        omean = [avg + sft for avg, sft in zip(other.mean, shift)]
+        dlt = [oth - avg for oth, avg in zip(omean, self.mean)]
+        fac = self.count * other.count / count
+        for k, (i, j) in enumerate(((0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2))):
+            self.comoment[k] += other.comoment[k] + dlt[i] * dlt[j] * fac
+        for i in range(3):
+            self.mean[i] += dlt[i] * other.count / count
+        self.count = count
+        self.sketch.merge(other.sketch, shift)
+
+
+class PositionStats:
+    """
+    PositionStats class.
+    """
+
+    def __init__(self, identity: str = "NAV-PVT", ref: tuple | NoneType = None):
+        """
+        Constructor.
+
+        :param str identity: source of positions - "NAV-PVT", "NAV-HPPOSLLH"
+            or "NAV-HPPOSECEF" ("NAV-PVT")
+        :param tuple | NoneType ref: reference position as (lat, lon, height)
+            in degrees and metres, None = first position (None)
+        :raises: ParameterError if identity is invalid
+        """
+
+        if identity not in _SOURCES:
+            raise ParameterError(
+                f"Invalid identity {identity} - must be one of {list(_SOURCES)}"
+            )
+        self._identity = identity
+        self._msgids = _SOURCES[identity]
+        self._ref = None
+        self._refecef = None
+        self._axes = None
+        if ref is not None:
+            self._setref(*ref)
+        self._all = _Moments()
+        self._fixtypes = {}  # fixType: _Moments
+        self._pvtepoch = (None, None)  # iTOW, fixType of latest NAV-PVT
+        self._rejected = 0
+
+    def _setref(self, lat: float, lon: float, height: float):
+        """
+        Set reference position and ENU axes.
+
+        :param float lat: latitude in degrees
+        :param float lon: longitude in degrees
+        :param float height: height above ellipsoid in metres
+        """
+
+        self._ref = (lat, lon, height)
+        self._refecef = llh2ecef(lat, lon, height)
+        phi, lam = radians(lat), radians(lon)
+        self._axes = (
+            (-sin(lam), cos(lam), 0.0),
+            (-sin(phi) * cos(lam), -sin(phi) * sin(lam), cos(phi)),
+            (cos(phi) * cos(lam), cos(phi) * sin(lam), sin(phi)),
+        )
+
+    def _enu(self, ecef: tuple) -> tuple:
+        """
+        Convert ECEF position to ENU relative to reference position.
+
+        :param tuple ecef: ECEF X, Y, Z in metres
+        :return: east, north, up in metres
+        :rtype: tuple
+        """
+
+        dlt = [val - ref for val, ref in zip(ecef, self._refecef)]
+        return tuple(sum(ax * d for ax, d in zip(axis, dlt)) for axis in self._axes)
+
+    def update(self, raw_data: bytes) -> bool:
+        """
+        Add position from raw NAV-PVT, NAV-HPPOSLLH or NAV-HPPOSECEF message
+        (according to the source identity). NAV-PVT messages are also used
+        to get the fixType of high precision positions. Any other message is
+        ignored, and positions flagged as invalid are rejected.
+
+        :param bytes raw_data: raw UBX message
+        :return: True if position added, False if not
+        :rtype: bool
+        """
+
+        msgid = raw_data[2:4]
+        fixtype = llh = ecef = None
+        if msgid in _NAVPVT and len(raw_data) >= _PVT.size + 8:
+            itow, fixtype, flags, lon, lat, height = _PVT.unpack_from(raw_data, 6)
+            self._pvtepoch = (itow, fixtype)
+            if msgid not in self._msgids:
+                return False
+            if not flags & 1:  # gnssFixOK
+                self._rejected += 1
+                return False
+            llh = (lat * 1e-7, lon * 1e-7, height / 1000)
+        elif msgid not in self._msgids:
+            return False
+        elif self._identity == "NAV-HPPOSLLH" and len(raw_data) >= _HPLLH.size + 8:
+            flags, itow, lon, lat, height, lonhp, lathp, hgthp = _HPLLH.unpack_from(
+                raw_data, 6
+            )
+            if flags & 1:  # invalidLlh
+                self._rejected += 1
+                return False
+            llh = (
+                lat * 1e-7 + lathp * 1e-9,
+                lon * 1e-7 + lonhp * 1e-9,
+                (height + hgthp / 10) / 1000,
+            )
+        elif self._identity == "NAV-HPPOSECEF" and len(raw_data) >= _HPECEF.size + 8:
+            itow, ecx, ecy, ecz, hpx, hpy, hpz, flags = _HPECEF.unpack_from(raw_data, 6)
+            if flags & 1:  # invalidEcef
+                self._rejected += 1
+                return False
+            ecef = (
+                (ecx + hpx / 100) / 100,
+                (ecy + hpy / 100) / 100,
+                (ecz + hpz / 100) / 100,
+            )
+        else:
+            return False
+
+        if fixtype is None and self._pvtepoch[0] == itow:
+            fixtype = self._pvtepoch[1]
+        if llh is not None:
+            ecef = llh2ecef(*llh)
+        if self._ref is None:
+            self._setref(*(ecef2llh(*ecef) if llh is None else llh))
+        enu = self._enu(ecef)
+        self._all.add(enu)
+        if fixtype is not None:
+            if fixtype not in self._fixtypes:
+                self._fixtypes[fixtype] = _Moments()
+            self._fixtypes[fixtype].add(enu)
+        return True
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and add position from each valid source message
+        until end of stream or stopevent is set.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of positions added
+        :rtype: int
+        """
+
+        count = 0
+        for raw_data in validframes(stream, self._msgids + _NAVPVT, stopevent):
+            count += self.update(raw_data)
+        return count
+
+    def merge(self, other: "PositionStats"):
+        """
+        Merge statistics from another accumulator, e.g. from a parallel
+        worker. If the reference positions differ, the other statistics are
+        translated to this reference position.
+
+        :param PositionStats other: other accumulator
+        :raises: ParameterError if source identities differ
+        """
+
+        if other.identity != self._identity:
+            raise ParameterError(
+                f"Cannot merge {other.identity} statistics into {self._identity}"
+            )
+        if other.ref is None:
+            return
+        if self._ref is None:
+            self._setref(*other.ref)
+        shift = self._enu(other._refecef)  # pylint: disable=protected-access
+        self._all.merge(other._all, shift)  # pylint: disable=protected-access
+        for fixtype, mom in other._fixtypes.items():  # pylint: disable=protected-access
+            if fixtype not in self._fixtypes:
+                self._fixtypes[fixtype] = _Moments()
+            self._fixtypes[fixtype].merge(mom, shift)
+        self._rejected += other.rejected
+
+    def stats(self, fixtype: int | NoneType = None) -> dict:
+        """
+        Get position statistics.
+
+        The returned dict contains:
+
+        - count - number of positions
+        - lat, lon, height - mean position in degrees and metres
+        - enu - mean position as east, north, up in metres relative to
+          reference position
+        - cov - 3x3 ENU covariance matrix as nested tuples, in m^2
+        - std - east, north, up standard deviations in metres
+        - drms, 2drms - horizontal (twice) distance root mean square in metres
+        - cep50, cep95 - approximate horizontal radius about the mean
+          position containing 50% and 95% of positions, in metres
+
+        :param int | NoneType fixtype: NAV-PVT fixType, None = all (None)
+        :return: dict of statistics
+        :rtype: dict
+        :raises: ParameterError if no positions received (for fixType)
+        """
+
+        mom = self._all if fixtype is None else self._fixtypes.get(fixtype, None)
+        if mom is None or mom.count == 0:
+            raise ParameterError(f"No positions received for fixType {fixtype}")
+        num = mom.count
+        ee, en, eu, nn, nu, uu = (
+            com / (num - 1) if num > 1 else 0.0 for com in mom.comoment
+        )
+        ecef = [
+            ref + sum(axis[i] * val for axis, val in zip(self._axes, mom.mean))
+            for i, ref in enumerate(self._refecef)
+        ]
+        lat, lon, height = ecef2llh(*ecef)
+        drms = sqrt(ee + nn)
+        return {
+            "count": num,
+            "lat": lat,
+            "lon": lon,
+            "height": height,
+            "enu": tuple(mom.mean),
+            "cov": ((ee, en, eu), (en, nn, nu), (eu, nu, uu)),
+            "std": (sqrt(ee), sqrt(nn), sqrt(uu)),
+            "drms": drms,
+            "2drms": 2 * drms,
+            "cep50": mom.sketch.quantile(0.5, mom.mean),
+            "cep95": mom.sketch.quantile(0.95, mom.mean),
+        }
+
+    @property
+    def identity(self) -> str:
+        """
+        Getter for source identity.
+
+        :return: identity e.g. "NAV-PVT"
+        :rtype: str
+        """
+
+        return self._identity
+
+    @property
+    def ref(self) -> tuple | NoneType:
+        """
+        Getter for reference position.
+
+        :return: (lat, lon, height) in degrees and metres, or None if not set
+        :rtype: tuple | NoneType
+        """
+
+        return self._ref
+
+    @property
+    def fixtypes(self) -> list:
+        """
+        Getter for NAV-PVT fixTypes received.
+
+        :return: sorted list of fixTypes
+        :rtype: list
+        """
+
+        return sorted(self._fixtypes)
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of positions added.
+
+        :return: number of positions
+        :rtype: int
+        """
+
+        return self._all.count
+
+    @property
+    def rejected(self) -> int:
+        """
+        Getter for number of positions rejected as invalid.
+
+        :return: number of positions
+        :rtype: int
+        """
+
+        return self._rejected
@@ -0,0 +1,338 @@
+"""
+UBXMessageQueue and ThreadedUBXReader classes.
+
+UBXMessageQueue is a bounded, thread-safe FIFO queue of (raw_data,
+parsed_data) tuples with a configurable overflow policy, so that memory
+use stays bounded when a consumer (e.g. a database writer) falls behind
+the data stream:
+
+- DROP_OLDEST - discard the oldest queued message to make room.
+- DROP_NEWEST - discard the incoming message.
+- DROP_COALESCE - an incoming message replaces any queued message of the
+  same identity in place, whether or not the queue is full (e.g. only the
+  latest NAV-PVT is kept). If the queue is full and no message of the
+  same identity is queued, the oldest is discarded.
+
+ThreadedUBXReader runs a UBXReader on a background thread and feeds
+its output into a UBXMessageQueue, for use in place of the unbounded
+Queue in the examples/ubxpoller.py pattern.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from collections import deque
+from queue import Empty
+from threading import Condition, Event, Thread
+from types import NoneType
+from typing import Literal
+
+from pynmeagps import NMEAMessage
+from pyrtcm import RTCMMessage
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxhelpers import raw2identity
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import ReadIterator, UBXReader
+from pyubx2.ubxtypes_core import DROP_COALESCE, DROP_NEWEST, DROP_OLDEST
+
+
+class UBXMessageQueue:
+    """
+    UBXMessageQueue class.
+    """
+
+    def __init__(self, maxsize: int = 1024, policy: Literal[0, 1, 2] = DROP_OLDEST):
+        """
+        Constructor.
+
+        :param int maxsize: maximum number of queued messages (1024)
+        :param Literal[0,1,2] policy: overflow policy DROP_OLDEST (0),
+            DROP_NEWEST (1), DROP_COALESCE (2) (0)
+        :raises: ParameterError if maxsize or policy are invalid
+        """
+
+        if maxsize < 1:
+            raise ParameterError(f"Invalid maxsize {maxsize} - must be >= 1")
+        if policy not in (DROP_OLDEST, DROP_NEWEST, DROP_COALESCE):
+            raise ParameterError(f"Invalid policy {policy} - must be 0, 1 or 2")
+        self._maxsize = maxsize
+        self._policy = policy
+        self._queue = deque()  # [identity, raw_data, parsed_data]
+        self._latest = {}  # identity: most recent queued entry (DROP_COALESCE only)
+        self._cond = Condition()
+        self._closed = False
+        self._counts = {
+            "queued": 0,
+            "dropped_oldest": 0,
+            "dropped_newest": 0,
+            "coalesced": 0,
+            "maxdepth": 0,
+        }
+
+    def put(
+        self,
+        raw_data: bytes,
+        parsed_data: UBXMessage | NMEAMessage | RTCMMessage | NoneType = None,
+    ) -> bool:
+        """
+        Add message to queue, applying overflow policy if queue is full.
+        With DROP_COALESCE, a queued message of the same identity is always
+        replaced. Never blocks.
+
+        :param bytes raw_data: raw message
+        :param UBXMessage | NMEAMessage | RTCMMessage | NoneType parsed_data: parsed
+            message (None)
+        :return: True if message added as new entry, False if dropped or coalesced
+        :rtype: bool
+        """
+
+        identity = None
+        if self._policy == DROP_COALESCE:
+            identity = (
+                raw2identity(raw_data) if parsed_data is None else parsed_data.identity
+            )
+        with self._cond:
+            entry = self._latest.get(identity, None)
+            if entry is not None:  # DROP_COALESCE, identity already queued
+                entry[1] = raw_data
+                entry[2] = parsed_data
+                self._counts["coalesced"] += 1
+                return False
+            if len(self._queue) >= self._maxsize:
+                if self._policy == DROP_NEWEST:
+                    self._counts["dropped_newest"] += 1
+                    return False
+                self._forget(self._queue.popleft())
+                self._counts["dropped_oldest"] += 1
+            entry = [identity, raw_data, parsed_data]
+            self._queue.append(entry)
+            if identity is not None:
+                self._latest[identity] = entry
+            self._counts["queued"] += 1
+            self._counts["maxdepth"] = max(self._counts["maxdepth"], len(self._queue))
+            self._cond.notify()
+            return True
+
+    def get(
+        self, block: bool = True, timeout: float | NoneType = None
+    ) -> tuple[bytes, UBXMessage | NMEAMessage | RTCMMessage | NoneType]:
+        """
+        Remove and return oldest message from queue.
+
+        :param bool block: wait for message if queue is empty (True)
+        :param float | NoneType timeout: maximum wait in seconds, None = indefinitely (None)
+        :return: tuple of (raw_data, parsed_data)
+        :rtype: tuple[bytes, UBXMessage | NMEAMessage | RTCMMessage | NoneType]
+        :raises: queue.Empty if no message available (or queue closed and empty)
+        """
+
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._queue or self._closed, timeout if block else 0
+            ):
+                raise Empty
+            if not self._queue:
+                raise Empty
+            entry = self._queue.popleft()
+            self._forget(entry)
+            return (entry[1], entry[2])
+
+    def close(self):
+        """
+        Close queue. Any blocked or subsequent get() calls will raise
+        queue.Empty once the queue has been drained.
+        """
+
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reopen(self):
+        """
+        Reopen closed queue. Any messages still queued are retained.
+        """
+
+        with self._cond:
+            self._closed = False
+
+    def qsize(self) -> int:
+        """
+        Return number of queued messages.
+
+        :return: number of queued messages
+        :rtype: int
+        """
+
+        return len(self._queue)
+
+    def empty(self) -> bool:
+        """
+        Return True if queue is empty.
+
+        :return: True if empty
+        :rtype: bool
+        """
+
+        return not self._queue
+
+    def _forget(self, entry: list):
+        """
+        Remove dequeued entry from coalescing index.
+
+        :param list entry: queue entry
+        """
+
+        if self._latest.get(entry[0], None) is entry:
+            del self._latest[entry[0]]
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Getter for maximum queue size.
+
+        :return: maximum number of queued messages
+        :rtype: int
+        """
+
+        return self._maxsize
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for queue counters - number of messages queued, dropped
+        (oldest or newest) and coalesced, and maximum queue depth.
+
+        :return: dict of counters
+        :rtype: dict
+        """
+
+        with self._cond:
+            return dict(self._counts)
+
+
+class ThreadedUBXReader(ReadIterator):
+    """
+    ThreadedUBXReader class.
+    """
+
+    def __init__(
+        self,
+        ubxreader: UBXReader,
+        maxsize: int = 1024,
+        policy: Literal[0, 1, 2] = DROP_OLDEST,
+    ):
+        """
+        Constructor.
+
+        :param UBXReader ubxreader: UBXReader instance
+        :param int maxsize: maximum number of queued messages (1024)
+        :param Literal[0,1,2] policy: overflow policy DROP_OLDEST (0),
+            DROP_NEWEST (1), DROP_COALESCE (2) (0)
+        :raises: ParameterError if maxsize or policy are invalid
+        """
+
+        self._ubxreader = ubxreader
+        self._queue = UBXMessageQueue(maxsize, policy)
+        self._stopevent = Event()
+        self._thread = None
+        self._error = None
+
+    def start(self):
+        """
+        Start reader thread. The queue is reopened if a previous
+        thread has stopped. Does nothing if the thread is already running.
+        """
+
+        if self.running:
+            return
+        self._queue.reopen()
+        self._stopevent.clear()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | NoneType = None):
+        """
+        Stop reader thread. The thread will exit after the current
+        UBXReader.read() call returns.
+
+        :param float | NoneType timeout: maximum time to wait for thread to exit (None)
+        """
+
+        self._stopevent.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def read(
+        self, timeout: float | NoneType = None
+    ) -> tuple[bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]:
+        """
+        Read next queued message.
+
+        :param float | NoneType timeout: maximum wait in seconds, None = indefinitely (None)
+        :return: tuple of (raw_data, parsed_data), or (None, None) if timed out
+            or reader thread has finished and queue is empty
+        :rtype: tuple[bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]
+        :raises: any exception raised by UBXReader on the reader thread
+        """
+
+        try:
+            return self._queue.get(timeout=timeout)
+        except Empty:
+            if self._error is not None:
+                err, self._error = self._error, None
+                raise err from err
+            return (None, None)
+
+    def _run(self):
+        """
+        THREADED - read from UBXReader into queue until end of stream,
+        error or stop.
+        """
+
+        try:
+            while not self._stopevent.is_set():
+                raw_data, parsed_data = self._ubxreader.read()
+                if raw_data is None:
+                    break
+                self._queue.put(raw_data, parsed_data)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._error = err
+        finally:
+            self._queue.close()
+
+    @property
+    def queue(self) -> UBXMessageQueue:
+        """
+        Getter for message queue.
+
+        :return: message queue
+        :rtype: UBXMessageQueue
+        """
+
+        return self._queue
+
+    @property
+    def running(self) -> bool:
+        """
+        Getter for running status.
+
+        :return: True if reader thread is running
+        :rtype: bool
+        """
+
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for queue counters.
+
+        :return: dict of counters
+        :rtype: dict
+        """
+
+        return self._queue.stats
@@ -19,8 +19,11 @@ Created on 2 Oct 2020
 :license: BSD 3-Clause
 """
 
+from functools import partial
 from logging import getLogger
 from socket import socket
+from threading import Event
+from time import monotonic, monotonic_ns, perf_counter_ns, sleep, time_ns
 from types import FunctionType, NoneType
 from typing import Literal
 
@@ -33,8 +36,10 @@ from pynmeagps import (
     NMEAMessage,
     NMEAReader,
     SocketWrapper,
+    get_parts,
 )
-from pyrtcm import RTCMMessage, RTCMReader
+from pynmeagps import calc_checksum as nmea_checksum
+from pyrtcm import RTCMMessage, RTCMReader, calc_crc24q
 
 from pyubx2.exceptions import (
     UBXMessageError,
@@ -42,8 +47,21 @@ from pyubx2.exceptions import (
     UBXStreamError,
     UBXTypeError,
 )
-from pyubx2.ubxhelpers import bytes2val, calc_checksum, getinputmode, val2bytes
+from pyubx2.ubxhelpers import (
+    SIW,
+    bytes2val,
+    calc_checksum,
+    getinputmode,
+    isvalid_checksum,
+    itowspan,
+    protocol,
+    raw2identity,
+    raw2itow,
+    val2bytes,
+)
 from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxstats import UBXReaderStats
+from pyubx2.ubxtimestamp import FrameTimestamp
 from pyubx2.ubxtypes_core import (
     ERR_LOG,
     ERR_RAISE,
@@ -57,9 +75,65 @@ from pyubx2.ubxtypes_core import (
     UBX_HDR,
     UBX_PROTOCOL,
     VALCKSUM,
+    VALNONE,
+)
+
+# internal frame status codes
+_VALID = 0
+_BADHDR = 1
+_BADLEN = 2
+_BADCKSUM = 3
+_UNKHDR = 4
+_MSGHDRS = (b"\xb5", b"\x24", b"\xd3")  # UBX, NMEA & RTCM3 first header bytes
+_POLLMIN = 0.001  # follow mode minimum poll interval in seconds
+_POLLMAX = 0.1  # follow mode maximum poll interval in seconds
+_WEEKMS = SIW * 1000  # GPS week in milliseconds
+
+# exceptions which may be raised when parsing an NMEA, UBX or RTCM3 message
+PARSE_ERRORS = (
+    UBXMessageError,
+    UBXTypeError,
+    UBXParseError,
+    UBXStreamError,
+    nme.NMEAMessageError,
+    nme.NMEATypeError,
+    nme.NMEAParseError,
+    nme.NMEAStreamError,
+    rte.RTCMMessageError,
+    rte.RTCMParseError,
+    rte.RTCMStreamError,
+    rte.RTCMTypeError,
 )
 
 
+class ReadIterator:
+    """
+    Mixin providing iteration over the (raw_data, parsed_data) tuples
+    returned by a read() method, until raw_data is None.
+    """
+
+    def __iter__(self):
+        """Iterator."""
+
+        return self
+
+    def __next__(
+        self,
+    ) -> tuple[bytes, UBXMessage | NMEAMessage | RTCMMessage | NoneType]:
+        """
+        Return next item in iteration.
+
+        :return: tuple of (raw_data, parsed_data)
+        :rtype: tuple[bytes, UBXMessage | NMEAMessage | RTCMMessage | NoneType]
+        :raises: StopIteration
+        """
+
+        raw_data, parsed_data = self.read()  # pylint: disable=no-member
+        if raw_data is None:
+            raise StopIteration
+        return (raw_data, parsed_data)
+
+
 class UBXReader:
     """
     UBXReader class.
@@ -78,6 +152,15 @@ class UBXReader:
         parsing: bool = True,
         errorhandler: FunctionType | NoneType = None,
         encoding: int = ENCODE_NONE,
+        stats: bool = False,
+        errorinterval: float = 0,
+        timestamps: bool = False,
+        follow: bool = False,
+        followtimeout: float = 0,
+        changeonly: tuple | list | set | NoneType = None,
+        changerefresh: float = 0,
+        decimate: dict | NoneType = None,
+        throttle: dict | NoneType = None,
     ):
         """Constructor.
 
@@ -97,6 +180,26 @@ class UBXReader:
         :param FunctionType | NoneType errorhandler: error handling object or function (None)
         :param int encoding: encoding for socket stream \
             (0 = none, 1 = chunk, 2 = gzip, 4 = compress, 8 = deflate (can be OR'd)) (0)
+        :param bool stats: collect per-identity counters and decode timings (False)
+        :param float errorinterval: if > 0, report at most one error every
+            errorinterval seconds if quitonerror = ERR_LOG (0)
+        :param bool timestamps: record receive timestamps for each frame (False)
+        :param bool follow: follow mode - wait for more data at end of stream
+            (e.g. a file still being written) rather than stopping (False)
+        :param float followtimeout: in follow mode, stop if no more data arrives
+            within followtimeout seconds, 0 = wait indefinitely (0)
+        :param tuple | list | set | NoneType changeonly: change-only mode - identities
+            (or identity prefixes ending in '*' e.g. 'CFG-*', '*' = all) whose frames
+            are suppressed if identical to the last frame of the same identity,
+            ignoring any iTOW (None)
+        :param float changerefresh: in change-only mode, emit unchanged frames
+            if changerefresh seconds have elapsed since the last frame of the
+            same identity was emitted, 0 = never (0)
+        :param dict | NoneType decimate: decimation - dict of {identity: n}, emit
+            only every nth frame of each identity e.g. {"NAV-PVT": 20} (None)
+        :param dict | NoneType throttle: decimation - dict of {identity: seconds},
+            emit at most one frame of each identity per interval, by iTOW where
+            available, otherwise by time of receipt e.g. {"NAV-SAT": 5} (None)
         :raises: UBXStreamError (if mode is invalid)
         """
         # pylint: disable=too-many-arguments
@@ -114,6 +217,39 @@ class UBXReader:
         self._msgmode = msgmode
         self._parsing = parsing
         self._logger = getLogger(__name__)
+        self._stats = UBXReaderStats() if stats else None
+        self._frameid = (0, "UNKNOWN")  # (protocol, identity) of current frame
+        self._badcksum = False  # current frame failed to parse due to checksum
+        self._errorinterval = errorinterval
+        self._errornext = 0  # time at which next error can be reported
+        self._suppressed = 0  # number of errors suppressed since last report
+        self._peek = hasattr(self._stream, "peek")
+        # stream wants to be told where each frame starts (e.g. MultiUBXReader buffer)
+        self._startframe = hasattr(self._stream, "startframe")
+        self._timestamps = timestamps
+        self._first = (0, 0)  # (monotonic, wall) time first byte of frame read
+        self._timestamp = None
+        self._follow = follow
+        self._followtimeout = followtimeout
+        self._changeonly = None
+        if changeonly:
+            self._changeonly = (
+                {idn for idn in changeonly if idn[-1:] != "*"},
+                tuple(idn[:-1] for idn in changeonly if idn[-1:] == "*"),
+            )
+        self._changerefresh = changerefresh
+        self._lastframes = {}  # identity: (payload, time) of last emitted frame
+        self._unchanged = {}  # identity: number of frames suppressed
+        self._decimate = decimate or None
+        self._throttle = throttle or None
+        self._framecounts = {}  # identity: number of frames seen for decimation
+        self._lastemit = {}  # identity: iTOW or receipt time of last emitted frame
+        self._decimated = {}  # identity: number of frames decimated
+        self._gated = not (
+            self._changeonly is None
+            and self._decimate is None
+            and self._throttle is None
+        )
 
         if self._msgmode not in (GET, SET, POLL, SETPOLL):
             raise UBXStreamError(
@@ -167,15 +303,26 @@ class UBXReader:
 
                 raw_data = None
                 parsed_data = None
+                self._frameid = (0, "UNKNOWN")
+                self._badcksum = False
+                if self._startframe:
+                    self._stream.startframe()
                 byte1 = self._read_bytes(1)  # read the first byte
                 # if not UBX, NMEA or RTCM3, discard and continue
-                if byte1 not in (b"\xb5", b"\x24", b"\xd3"):
+                if byte1 not in _MSGHDRS:
+                    discarded = 1 + self._resync() if self._peek else 1
+                    if self._stats is not None:
+                        self._stats.discard(discarded)
                     continue
+                if self._timestamps:
+                    self._first = (monotonic_ns(), time_ns())
                 byte2 = self._read_bytes(1)
                 bytehdr = byte1 + byte2
                 # if it's a UBX message (b'\xb5\x62')
                 if bytehdr == UBX_HDR:
                     raw_data, parsed_data = self._parse_ubx(bytehdr)
+                    if raw_data is None:  # invalid or suppressed frame
+                        continue
                     # if protocol filter passes UBX, return message,
                     # otherwise discard and continue
                     if self._protfilter & UBX_PROTOCOL:
@@ -185,6 +332,8 @@ class UBXReader:
                 # if it's an NMEA message (b'\x24\x..)
                 elif bytehdr in NMEA_HDR:
                     raw_data, parsed_data = self._parse_nmea(bytehdr)
+                    if raw_data is None:  # suppressed frame
+                        continue
                     # if protocol filter passes NMEA, return message,
                     # otherwise discard and continue
                     if self._protfilter & NMEA_PROTOCOL:
@@ -195,6 +344,8 @@ class UBXReader:
                 # (byte1 = 0xd3; byte2 = 0b000000**)
                 elif byte1 == b"\xd3" and (byte2[0] & ~0x03) == 0:
                     raw_data, parsed_data = self._parse_rtcm3(bytehdr)
+                    if raw_data is None:  # suppressed frame
+                        continue
                     # if protocol filter passes RTCM, return message,
                     # otherwise discard and continue
                     if self._protfilter & RTCM3_PROTOCOL:
@@ -203,24 +354,16 @@ class UBXReader:
                         continue
                 # unrecognised protocol header
                 else:
-                    raise UBXParseError(f"Unknown protocol header {bytehdr}.")
+                    if self._stats is not None:
+                        self._stats.discard(2)
+                    self._bad_frame(_UNKHDR, bytehdr)
+                    continue
 
             except EOFError:
                 return (None, None)
-            except (
-                UBXMessageError,
-                UBXTypeError,
-                UBXParseError,
-                UBXStreamError,
-                nme.NMEAMessageError,
-                nme.NMEATypeError,
-                nme.NMEAParseError,
-                nme.NMEAStreamError,
-                rte.RTCMMessageError,
-                rte.RTCMParseError,
-                rte.RTCMStreamError,
-                rte.RTCMTypeError,
-            ) as err:
+            except PARSE_ERRORS as err:
+                if self._stats is not None:
+                    self._stats.error(*self._frameid, self._badcksum)
                 if self._quitonerror:
                     self._do_error(err)
                 continue
@@ -246,11 +389,25 @@ class UBXReader:
         plb = byten[0:leni]
         cksum = byten[leni : leni + 2]
         raw_data = hdr + clsid + msgid + lenb + plb + cksum
-        # only parse if we need to (filter passes UBX)
-        if (self._protfilter & UBX_PROTOCOL) and self._parsing:
-            parsed_data = self.parse(
+        if self._timestamps:
+            self._timestamp = FrameTimestamp.now(*self._first)
+        if self._stats is not None:
+            self._frameid = (UBX_PROTOCOL, self._stats.frame(UBX_PROTOCOL, raw_data))
+        if not self._protfilter & UBX_PROTOCOL:
+            return (raw_data, None)
+        if self._parsing and self._validate & VALCKSUM:
+            status = self._check(raw_data)
+            if status != _VALID:
+                self._bad_frame(status, raw_data)
+                return (None, None)
+        if self._gated and self._suppress(raw_data):
+            return (None, None)
+        # only parse if we need to
+        if self._parsing:
+            parsed_data = self._timed(
+                self.parse,
                 raw_data,
-                validate=self._validate,
+                validate=VALNONE,  # already validated
                 msgmode=self._msgmode,
                 parsebitfield=self._parsebf,
             )
@@ -272,10 +429,21 @@ class UBXReader:
         # read the rest of the NMEA message from the buffer
         byten = self._read_line()  # NMEA protocol is CRLF-terminated
         raw_data = hdr + byten
+        if self._timestamps:
+            self._timestamp = FrameTimestamp.now(*self._first)
+        if self._stats is not None:
+            self._frameid = (NMEA_PROTOCOL, self._stats.frame(NMEA_PROTOCOL, raw_data))
+        if (
+            self._gated
+            and self._protfilter & NMEA_PROTOCOL
+            and self._suppress(raw_data)
+        ):
+            return (None, None)
         # only parse if we need to (filter passes NMEA)
         if (self._protfilter & NMEA_PROTOCOL) and self._parsing:
             # invoke pynmeagps parser
-            parsed_data = NMEAReader.parse(
+            parsed_data = self._timed(
+                NMEAReader.parse,
                 raw_data,
                 validate=self._validate,
                 msgmode=self._msgmode,
@@ -300,10 +468,24 @@ class UBXReader:
         payload = self._read_bytes(size)
         crc = self._read_bytes(3)
         raw_data = hdr + hdr3 + payload + crc
+        if self._timestamps:
+            self._timestamp = FrameTimestamp.now(*self._first)
+        if self._stats is not None:
+            self._frameid = (
+                RTCM3_PROTOCOL,
+                self._stats.frame(RTCM3_PROTOCOL, raw_data),
+            )
+        if (
+            self._gated
+            and self._protfilter & RTCM3_PROTOCOL
+            and self._suppress(raw_data)
+        ):
+            return (None, None)
         # only parse if we need to (filter passes RTCM)
         if (self._protfilter & RTCM3_PROTOCOL) and self._parsing:
             # invoke pyrtcm parser
-            parsed_data = RTCMReader.parse(
+            parsed_data = self._timed(
+                RTCMReader.parse,
                 raw_data,
                 validate=self._validate,
                 labelmsm=self._labelmsm,
@@ -312,6 +494,144 @@ class UBXReader:
             parsed_data = None
         return (raw_data, parsed_data)
 
+    def _timed(
+        self, parser: FunctionType, raw_data: bytes, **kwargs
+    ) -> UBXMessage | NMEAMessage | RTCMMessage:
+        """
+        Invoke parser, recording decode time if stats are enabled.
+
+        :param FunctionType parser: parse method e.g. NMEAReader.parse
+        :param bytes raw_data: raw message
+        :param kwargs: parser keyword arguments
+        :return: parsed message
+        :rtype: UBXMessage | NMEAMessage | RTCMMessage
+        """
+
+        if self._stats is None:
+            return parser(raw_data, **kwargs)
+        start = perf_counter_ns()
+        try:
+            parsed_data = parser(raw_data, **kwargs)
+        except PARSE_ERRORS:
+            self._badcksum = bool(kwargs["validate"] & VALCKSUM) and self._cksum_failed(
+                raw_data
+            )
+            raise
+        self._stats.decode(self._frameid[1], perf_counter_ns() - start)
+        return parsed_data
+
+    def _suppress(self, raw_data: bytes) -> bool:
+        """
+        Check if frame is to be suppressed before it is decoded.
+
+        Decimation - suppress frame if it is not every nth frame of its
+        identity, or if less than the throttle interval has elapsed since
+        the last frame of the same identity was emitted.
+
+        Change-only mode - suppress frame if its payload (excluding any
+        iTOW or checksum) is identical to that of the last frame of the
+        same identity emitted, unless changerefresh seconds have elapsed.
+
+        :param bytes raw_data: raw message
+        :return: True if frame is to be suppressed
+        :rtype: bool
+        """
+
+        identity = raw2identity(raw_data)
+        if self._decimate is not None and identity in self._decimate:
+            seen = self._framecounts.get(identity, 0)
+            self._framecounts[identity] = seen + 1
+            if seen % self._decimate[identity]:
+                self._decimated[identity] = self._decimated.get(identity, 0) + 1
+                return True
+        tnow = None
+        if self._throttle is not None and identity in self._throttle:
+            itow = raw2itow(raw_data)
+            tnow = int(monotonic() * 1000) if itow is None else itow
+            last = self._lastemit.get(identity, None)
+            if last is None:
+                elapsed = None
+            elif itow is None:  # time of receipt
+                elapsed = tnow - last
+            else:  # iTOW, allowing for week rollover
+                elapsed = (tnow - last) % _WEEKMS
+            if elapsed is not None and elapsed < int(self._throttle[identity] * 1000):
+                self._decimated[identity] = self._decimated.get(identity, 0) + 1
+                return True
+        if self._changeonly is not None and self._unchanging(identity, raw_data):
+            return True
+        if tnow is not None:
+            self._lastemit[identity] = tnow
+        return False
+
+    def _unchanging(self, identity: str, raw_data: bytes) -> bool:
+        """
+        Check if frame is unchanged in change-only mode.
+
+        :param str identity: message identity
+        :param bytes raw_data: raw message
+        :return: True if frame is unchanged
+        :rtype: bool
+        """
+
+        exact, prefixes = self._changeonly
+        if identity not in exact and not identity.startswith(prefixes):
+            return False
+        if raw_data[0:2] == UBX_HDR:
+            span = itowspan(raw_data)
+            if span is None:
+                payload = raw_data[6:-2]
+            else:
+                payload = raw_data[6 : span[0]] + raw_data[span[1] : -2]
+        else:
+            payload = raw_data
+        now = monotonic()
+        last = self._lastframes.get(identity, None)
+        if (
+            last is not None
+            and last[0] == payload
+            and not (self._changerefresh and now - last[1] >= self._changerefresh)
+        ):
+            self._unchanged[identity] = self._unchanged.get(identity, 0) + 1
+            return True
+        self._lastframes[identity] = (payload, now)
+        return False
+
+    def _resync(self) -> int:
+        """
+        Discard any buffered bytes up to the next plausible message header
+        in a single read, rather than one byte at a time. Only used if the
+        stream supports peek() (e.g. io.BufferedReader).
+
+        :return: number of bytes discarded
+        :rtype: int
+        """
+
+        buf = self._stream.peek(1)
+        size = len(buf)
+        for hdr in _MSGHDRS:
+            idx = buf.find(hdr, 0, size)
+            if idx != -1:
+                size = idx
+        if size:
+            self._stream.read(size)
+        return size
+
+    def _bad_frame(self, status: int, data: bytes):
+        """
+        Handle invalid frame without raising an exception, unless
+        quitonerror = ERR_RAISE. The error object is only created
+        if it is to be raised or reported.
+
+        :param int status: frame status code
+        :param bytes data: raw frame, or protocol header if unknown
+        """
+
+        if self._stats is not None:
+            self._stats.error(*self._frameid, status == _BADCKSUM)
+        if self._quitonerror:
+            self._do_error(partial(self._frame_error, status, data))
+
     def _read_bytes(self, size: int) -> bytes:
         """
         Read a specified number of bytes from stream.
@@ -323,6 +643,8 @@ class UBXReader:
         """
 
         data = self._stream.read(size)
+        if self._follow and len(data) < size:
+            data = self._poll(data, size)
         if len(data) == 0:  # EOF
             raise EOFError()
         if 0 < len(data) < size:  # truncated stream
@@ -342,6 +664,8 @@ class UBXReader:
         """
 
         data = self._stream.readline()  # NMEA protocol is CRLF-terminated
+        if self._follow and data[-1:] != b"\x0a":
+            data = self._poll(data)
         if len(data) == 0:
             raise EOFError()  # pragma: no cover
         if data[-1:] != b"\x0a":  # truncated stream
@@ -351,14 +675,62 @@ class UBXReader:
             )
         return data
 
-    def _do_error(self, err: Exception):
+    def _poll(self, data: bytes, size: int = 0) -> bytes:
+        """
+        Follow mode - poll stream until the requested number of bytes
+        (or if size = 0, a complete LF-terminated line) is available, or
+        no more data arrives within followtimeout seconds. The poll
+        interval doubles from _POLLMIN to _POLLMAX while the stream is idle
+        and reverts to _POLLMIN when data arrives.
+
+        :param bytes data: data read so far
+        :param int size: number of bytes required, 0 = read line (0)
+        :return: bytes (incomplete if timed out)
+        :rtype: bytes
+        """
+
+        interval = _POLLMIN
+        deadline = monotonic() + self._followtimeout
+        while len(data) < size if size else data[-1:] != b"\x0a":
+            if self._followtimeout and monotonic() >= deadline:
+                break
+            sleep(interval)
+            more = (
+                self._stream.read(size - len(data)) if size else self._stream.readline()
+            )
+            if more:
+                data += more
+                interval = _POLLMIN
+                deadline = monotonic() + self._followtimeout
+            else:
+                interval = min(interval * 2, _POLLMAX)
+        return data
+
+    def _do_error(self, err: Exception | partial):
         """
-        Handle error.
+        Handle error. If errorinterval is set, logged errors are
+        rate-limited and the number of suppressed errors is reported
+        with the next logged error.
 
-        :param Exception err: error
+        :param Exception | partial err: error, or callable returning error
         :raises: Exception if quitonerror = ERR_RAISE (2)
         """
 
+        if self._quitonerror == ERR_LOG and self._errorinterval:
+            now = monotonic()
+            if now < self._errornext:
+                self._suppressed += 1
+                return
+            self._errornext = now + self._errorinterval
+            if self._suppressed:
+                self._logger.warning(
+                    "%s errors suppressed in last %s seconds",
+                    self._suppressed,
+                    self._errorinterval,
+                )
+                self._suppressed = 0
+        if not isinstance(err, Exception):
+            err = err()
         if self._quitonerror == ERR_RAISE:
             raise err from err
         if self._quitonerror == ERR_LOG:
@@ -369,6 +741,55 @@ class UBXReader:
             else:
                 self._errorhandler(err)
 
+    def decode(
+        self, raw_data: bytes
+    ) -> UBXMessage | NMEAMessage | RTCMMessage | NoneType:
+        """
+        Parse raw NMEA, UBX or RTCM3 message using this reader's settings
+        (e.g. a message previously read with parsing=False).
+
+        :param bytes raw_data: raw message
+        :return: parsed message, or None if protocol unrecognised
+        :rtype: UBXMessage | NMEAMessage | RTCMMessage | NoneType
+        :raises: Exception (if data contains invalid data or unknown message type)
+        """
+
+        prot = protocol(raw_data)
+        if prot == UBX_PROTOCOL:
+            return self.parse(
+                raw_data,
+                validate=self._validate,
+                msgmode=self._msgmode,
+                parsebitfield=self._parsebf,
+            )
+        if prot == NMEA_PROTOCOL:
+            return NMEAReader.parse(
+                raw_data, validate=self._validate, msgmode=self._msgmode
+            )
+        if prot == RTCM3_PROTOCOL:
+            return RTCMReader.parse(
+                raw_data, validate=self._validate, labelmsm=self._labelmsm
+            )
+        return None
+
+    def stats(self, reset: bool = False) -> dict:
+        """
+        Return snapshot of per-protocol and per-identity counters and
+        decode timings (see UBXReaderStats.snapshot).
+
+        :param bool reset: reset counters after snapshot (False)
+        :return: dict of counters, or empty dict if reader was not
+            instantiated with stats=True
+        :rtype: dict
+        """
+
+        if self._stats is None:
+            return {}
+        snapshot = self._stats.snapshot()
+        if reset:
+            self._stats.reset()
+        return snapshot
+
     @property
     def datastream(self) -> object:
         """
@@ -380,6 +801,40 @@ class UBXReader:
 
         return self._stream
 
+    @property
+    def timestamp(self) -> FrameTimestamp | NoneType:
+        """
+        Getter for receive timestamp of most recently read frame.
+
+        :return: timestamp, or None if reader was not instantiated
+            with timestamps=True
+        :rtype: FrameTimestamp | NoneType
+        """
+
+        return self._timestamp
+
+    @property
+    def unchanged(self) -> dict:
+        """
+        Getter for number of unchanged frames suppressed in change-only mode.
+
+        :return: dict of {identity: number of frames suppressed}
+        :rtype: dict
+        """
+
+        return dict(self._unchanged)
+
+    @property
+    def decimated(self) -> dict:
+        """
+        Getter for number of frames suppressed by decimation.
+
+        :return: dict of {identity: number of frames suppressed}
+        :rtype: dict
+        """
+
+        return dict(self._decimated)
+
     @staticmethod
     def parse(
         message: bytes,
@@ -407,38 +862,16 @@ class UBXReader:
                 f"Invalid message mode {msgmode} - must be 0, 1, 2 or 3"
             )
 
-        lenm = len(message)
-        hdr = message[0:2]
+        if validate & VALCKSUM:
+            status = UBXReader._check(message)
+            if status != _VALID:
+                raise UBXReader._frame_error(status, message)
         clsid = message[2:3]
         msgid = message[3:4]
-        lenb = message[4:6]
-        if lenb == b"\x00\x00":
+        if message[4:6] == b"\x00\x00":
             payload = None
-            leni = 0
         else:
-            payload = message[6 : lenm - 2]
-            leni = len(payload)
-        ckm = message[lenm - 2 : lenm]
-        if payload is not None:
-            ckv = calc_checksum(clsid + msgid + lenb + payload)
-        else:
-            ckv = calc_checksum(clsid + msgid + lenb)
-        if validate & VALCKSUM:
-            if hdr != UBX_HDR:
-                raise UBXParseError(
-                    (f"Invalid message header {hdr}" f" - should be {UBX_HDR}")
-                )
-            if leni != bytes2val(lenb, U2):
-                raise UBXParseError(
-                    (
-                        f"Invalid payload length {lenb}"
-                        f" - should be {val2bytes(leni, U2)}"
-                    )
-                )
-            if ckm != ckv:
-                raise UBXParseError(
-                    (f"Message checksum {ckm}" f" invalid - should be {ckv}")
-                )
+            payload = message[6:-2]
         # if input message (SET or POLL), determine mode automatically
         if msgmode == SETPOLL:
             msgmode = getinputmode(message)  # returns SET or POLL
@@ -451,3 +884,98 @@ class UBXReader:
             payload=payload,
             parsebitfield=parsebitfield,
         )
+
+    @staticmethod
+    def _check(message: bytes) -> int:
+        """
+        Validate UBX frame header, length and checksum.
+
+        :param bytes message: raw UBX message
+        :return: status code (_VALID = 0 if valid)
+        :rtype: int
+        """
+
+        lenb = message[4:6]
+        if lenb == b"\x00\x00":
+            content = message[2:6]
+            leni = 0
+        else:
+            content = message[2:-2]
+            leni = len(content) - 4
+        if message[0:2] != UBX_HDR:
+            return _BADHDR
+        if leni != bytes2val(lenb, U2):
+            return _BADLEN
+        if message[-2:] != calc_checksum(content):
+            return _BADCKSUM
+        return _VALID
+
+    @staticmethod
+    def _cksum_failed(message: bytes) -> bool:
+        """
+        Check if NMEA or RTCM3 message has an invalid checksum
+        (UBX messages are checksummed before parsing).
+
+        :param bytes message: raw message
+        :return: True if checksum is invalid
+        :rtype: bool
+        """
+
+        if message[0:1] == b"\xd3":
+            return calc_crc24q(message) != 0
+        try:
+            content, _, _, _, cksum = get_parts(message)
+        except nme.NMEAMessageError:  # badly formed
+            return False
+        return cksum.upper() != nmea_checksum(content)
+
+    @staticmethod
+    def _frame_error(status: int, message: bytes) -> UBXParseError:
+        """
+        Create error for invalid frame status.
+
+        :param int status: frame status code
+        :param bytes message: raw UBX message, or protocol header if unknown
+        :return: error
+        :rtype: UBXParseError
+        """
+
+        if status == _UNKHDR:
+            return UBXParseError(f"Unknown protocol header {message}.")
+        if status == _BADHDR:
+            return UBXParseError(
+                f"Invalid message header {message[0:2]} - should be {UBX_HDR}"
+            )
+        lenb = message[4:6]
+        content = message[2:6] if lenb == b"\x00\x00" else message[2:-2]
+        if status == _BADLEN:
+            return UBXParseError(
+                f"Invalid payload length {lenb}"
+                f" - should be {val2bytes(max(len(content) - 4, 0), U2)}"
+            )
+        return UBXParseError(
+            f"Message checksum {message[-2:]} invalid"
+            f" - should be {calc_checksum(content)}"
+        )
+
+
+def validframes(stream, msgids, stopevent: Event | NoneType = None):
+    """
+    Generator yielding each raw UBX message in input stream which has one
+    of the specified message class and id values and a valid checksum,
+    until end of stream or stopevent is set. Messages are not parsed.
+
+    :param stream stream: input data stream
+    :param msgids: collection of 2-byte message class and id values
+    :param Event | NoneType stopevent: stop event (None)
+    :return: raw UBX message
+    :rtype: bytes
+    """
+
+    ubr = UBXReader(stream, protfilter=UBX_PROTOCOL, parsing=False)
+    while stopevent is None or not stopevent.is_set():
+        raw_data, _ = ubr.read()
+        if raw_data is None:
+            return
+        if raw_data[2:4] in msgids and isvalid_checksum(raw_data):
+            yield raw_data
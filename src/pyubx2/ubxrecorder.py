@@ -0,0 +1,243 @@
+"""
+UBXRecorder and UBXReplayer classes.
+
+UBXRecorder writes raw frames to a binary file together with their
+receive timestamps (see FrameTimestamp), so that a recorded session can
+be replayed faithfully, including original arrival times and latencies.
+
+Recording format - a file header followed by one record per frame::
+
+    header: b"UBXTS" + version (1 byte)
+    record: mono_first, mono_done, wall_first, wall_done (4 x int64 ns),
+            length (uint32), raw frame (length bytes)
+
+All integers are little-endian.
+
+UBXReplayer reads a recording through a UBXReader (so all the usual
+UBXReader keyword arguments apply), exposing each frame's recorded
+timestamp. If realtime=True, frames are released with their original
+inter-arrival spacing.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from struct import Struct
+from threading import Event
+from time import monotonic_ns, sleep
+from types import NoneType
+
+from pynmeagps import NMEAMessage
+from pyrtcm import RTCMMessage
+
+from pyubx2.exceptions import UBXStreamError
+from pyubx2.ubxmessage import UBXMessage
+from pyubx2.ubxreader import ReadIterator, UBXReader
+from pyubx2.ubxtimestamp import FrameTimestamp
+from pyubx2.ubxtypes_core import TS_MAGIC, TS_VERSION
+
+_RECORD = Struct("<qqqqI")
+
+
+class UBXRecorder:
+    """
+    UBXRecorder class.
+    """
+
+    def __init__(self, stream):
+        """
+        Constructor. Writes file header to stream.
+
+        :param stream stream: output binary stream (supporting write(bytes))
+        """
+
+        self._stream = stream
+        self._count = 0
+        self._stream.write(TS_MAGIC + bytes((TS_VERSION,)))
+
+    def write(self, raw_data: bytes, timestamp: FrameTimestamp | NoneType = None):
+        """
+        Write frame to recording.
+
+        :param bytes raw_data: raw frame
+        :param FrameTimestamp | NoneType timestamp: receive timestamp,
+            None = now (None)
+        """
+
+        if timestamp is None:
+            timestamp = FrameTimestamp.now()
+        self._stream.write(
+            _RECORD.pack(
+                timestamp.mono_first,
+                timestamp.mono_done,
+                timestamp.wall_first,
+                timestamp.wall_done,
+                len(raw_data),
+            )
+            + raw_data
+        )
+        self._count += 1
+
+    def run(self, ubr: UBXReader, stopevent: Event | NoneType = None) -> int:
+        """
+        Record all frames read from UBXReader until end of stream or
+        stopevent is set. The reader should be instantiated with
+        timestamps=True, otherwise frames are timestamped on receipt
+        from the reader.
+
+        :param UBXReader ubr: UBXReader instance
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of frames recorded
+        :rtype: int
+        """
+
+        count = 0
+        while stopevent is None or not stopevent.is_set():
+            raw_data, _ = ubr.read()
+            if raw_data is None:
+                break
+            self.write(raw_data, ubr.timestamp)
+            count += 1
+        return count
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of frames recorded.
+
+        :return: number of frames
+        :rtype: int
+        """
+
+        return self._count
+
+
+class _RecordStream:
+    """
+    Stream of raw frame bytes extracted from a timestamped recording,
+    for consumption by UBXReader.
+    """
+
+    def __init__(self, stream, realtime: bool = False):
+        """
+        Constructor.
+
+        :param stream stream: input binary stream
+        :param bool realtime: replay at original inter-arrival spacing (False)
+        :raises: UBXStreamError if stream is not a timestamped recording
+        """
+
+        hdr = stream.read(len(TS_MAGIC) + 1)
+        if hdr[:-1] != TS_MAGIC or hdr[-1:] != bytes((TS_VERSION,)):
+            raise UBXStreamError(f"Invalid timestamped recording header {hdr}")
+        self._stream = stream
+        self._realtime = realtime
+        self._buf = b""
+        self._pos = 0
+        self._start = None  # (recorded, actual) monotonic time of first record
+        self.timestamp = None  # timestamp of current record
+
+    def _next(self) -> bool:
+        """
+        Load next record.
+
+        :return: True if record loaded, False if end of recording
+        :rtype: bool
+        :raises: UBXStreamError if record truncated
+        """
+
+        hdr = self._stream.read(_RECORD.size)
+        if not hdr:
+            return False
+        if len(hdr) < _RECORD.size:
+            raise UBXStreamError(f"Truncated record header {hdr}")
+        *stamps, size = _RECORD.unpack(hdr)
+        self._buf = self._stream.read(size)
+        self._pos = 0
+        self.timestamp = FrameTimestamp(*stamps)
+        if self._realtime:
+            now = monotonic_ns()
+            if self._start is None:
+                self._start = (self.timestamp.mono_done, now)
+            wait = (self.timestamp.mono_done - self._start[0]) - (now - self._start[1])
+            if wait > 0:
+                sleep(wait / 1e9)
+        return True
+
+    def read(self, size: int) -> bytes:
+        """
+        Read bytes from current record, loading next record if
+        current record is exhausted.
+
+        :param int size: number of bytes to read
+        :return: bytes (fewer than size if record ends)
+        :rtype: bytes
+        """
+
+        if self._pos >= len(self._buf) and not self._next():
+            return b""
+        data = self._buf[self._pos : self._pos + size]
+        self._pos += len(data)
+        return data
+
+    def readline(self) -> bytes:
+        """
+        Read bytes up to and including LF from current record.
+
+        :return: bytes
+        :rtype: bytes
+        """
+
+        if self._pos >= len(self._buf) and not self._next():
+            return b""  # pragma: no cover
+        idx = self._buf.find(b"\x0a", self._pos)
+        end = len(self._buf) if idx == -1 else idx + 1
+        data = self._buf[self._pos : end]
+        self._pos = end
+        return data
+
+
+class UBXReplayer(ReadIterator):
+    """
+    UBXReplayer class.
+    """
+
+    def __init__(self, stream, realtime: bool = False, **kwargs):
+        """
+        Constructor.
+
+        :param stream stream: input binary stream containing recording
+        :param bool realtime: replay at original inter-arrival spacing (False)
+        :param kwargs: optional UBXReader keyword arguments
+        :raises: UBXStreamError if stream is not a timestamped recording
+        """
+
+        self._records = _RecordStream(stream, realtime)
+        self._ubr = UBXReader(self._records, **kwargs)
+
+    def read(
+        self,
+    ) -> tuple[bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]:
+        """
+        Read next recorded frame.
+
+        :return: tuple of (raw_data, parsed_data), or (None, None) at end
+            of recording
+        :rtype: tuple[bytes | NoneType, UBXMessage | NMEAMessage | RTCMMessage | NoneType]
+        """
+
+        return self._ubr.read()
+
+    @property
+    def timestamp(self) -> FrameTimestamp | NoneType:
+        """
+        Getter for recorded timestamp of most recently read frame.
+
+        :return: timestamp
+        :rtype: FrameTimestamp | NoneType
+        """
+
+        return self._records.timestamp
@@ -0,0 +1,306 @@
+"""
+RINEXWriter class.
+
+Converts UBX RXM-RAWX raw measurement messages to a RINEX 3.04
+observation file for post-processing (e.g. PPK). Each epoch is written
+as soon as it is read, so memory use is independent of log size.
+
+Measurements are decoded straight from the raw payload in a single
+struct.iter_unpack() pass per epoch, rather than via a parsed UBXMessage
+with hundreds of suffixed attributes (prMes_01, cpMes_01 ... cno_64).
+
+Signals are mapped to RINEX observation codes via RINEXSIG, and the
+pseudorange (C), carrier phase (L), Doppler (D) and signal strength (S)
+of each signal are written. As the header must be complete before the
+first epoch is written, it lists by default every signal which u-blox
+receivers can output, unless a subset is specified.
+
+e.g. convert a log containing RXM-RAWX messages::
+
+    with open("base.ubx", "rb") as infile, open("base.obs", "w") as outfile:
+        RINEXWriter(outfile, marker="BASE").run(infile)
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from datetime import datetime, timedelta, timezone
+from struct import Struct
+from threading import Event
+from types import NoneType
+
+from pyubx2._version import __version__ as VERSION
+from pyubx2.ubxhelpers import EPOCH0
+from pyubx2.ubxreader import validframes
+from pyubx2.ubxtypes_decodes import RINEXSIG, RINEXSYS
+
+RINEX_VERSION = 3.04
+"""RINEX observation file version"""
+
+_RAWX = b"\x02\x15"  # RXM-RAWX message class and id
+_RAWXHDR = Struct("<dHbBB3x")  # rcvTow, week, leapS, numMeas, recStat
+_RAWXMEAS = Struct("<ddfBBBBHBBBBBx")  # repeating group, 32 bytes
+_OBSTYPES = "CLDS"  # pseudorange, carrier phase, Doppler, signal strength
+_BLANK = " " * 16  # missing observation
+_DAY = 864000000000  # 100 ns units per day
+
+
+def _hdr(content: str, label: str) -> str:
+    """
+    Format RINEX header line.
+
+    :param str content: content (up to 60 characters)
+    :param str label: header label
+    :return: header line
+    :rtype: str
+    """
+
+    return f"{content:<60.60}{label}\n"
+
+
+def _gpstime(tow: float, week: int) -> tuple:
+    """
+    Convert GPS week and time of week to calendar date and time.
+
+    :param float tow: GPS time of week in seconds
+    :param int week: GPS week
+    :return: tuple of (year, month, day, hour, minute, second)
+    :rtype: tuple
+    """
+
+    days, rem = divmod(round(tow * 1e7), _DAY)  # 100 ns resolution
+    dte = EPOCH0 + timedelta(weeks=week, days=days)
+    hrs, rem = divmod(rem, 36000000000)
+    mins, rem = divmod(rem, 600000000)
+    return (dte.year, dte.month, dte.day, hrs, mins, rem / 1e7)
+
+
+class RINEXWriter:
+    """
+    RINEXWriter class.
+    """
+
+    def __init__(
+        self,
+        stream,
+        marker: str = "UNKNOWN",
+        observer: str = "",
+        agency: str = "",
+        receiver: str = "",
+        antenna: str = "",
+        position: tuple = (0.0, 0.0, 0.0),
+        signals: dict | NoneType = None,
+    ):
+        """
+        Constructor.
+
+        :param stream stream: output text stream (supporting write(str))
+        :param str marker: marker name ("UNKNOWN")
+        :param str observer: observer name ("")
+        :param str agency: agency name ("")
+        :param str receiver: receiver type e.g. "u-blox ZED-F9P" ("")
+        :param str antenna: antenna type ("")
+        :param tuple position: approximate marker position as ECEF (X, Y, Z)
+            in metres ((0.0, 0.0, 0.0))
+        :param dict | NoneType signals: dict of {system: observation codes} to
+            output e.g. {"G": ("1C", "2L"), "E": ("1C", "7Q")}, None = all (None)
+        """
+
+        self._stream = stream
+        self._marker = marker
+        self._observer = observer
+        self._agency = agency
+        self._receiver = receiver
+        self._antenna = antenna
+        self._position = position
+        if signals is None:
+            signals = {}
+            for (gnss, _), code in RINEXSIG.items():
+                codes = signals.setdefault(RINEXSYS[gnss], [])
+                if code not in codes:
+                    codes.append(code)
+        self._signals = {sys: tuple(codes) for sys, codes in signals.items()}
+        self._columns = {  # (system, code): observation column
+            (sys, code): i
+            for sys, codes in self._signals.items()
+            for i, code in enumerate(codes)
+        }
+        self._locktimes = {}  # (gnssId, svId, sigId): locktime in previous epoch
+        self._count = 0
+
+    def _header(self, tow: float, week: int, leaps: int | NoneType, glonass: dict):
+        """
+        Write RINEX header.
+
+        :param float tow: GPS time of week of first epoch
+        :param int week: GPS week of first epoch
+        :param int | NoneType leaps: leap seconds, None = unknown
+        :param dict glonass: dict of {GLONASS slot: frequency number}
+        """
+
+        now = datetime.now(timezone.utc).strftime("%Y%m%d %H%M%S UTC")
+        lines = [
+            _hdr(
+                f"{RINEX_VERSION:9.2f}{'':11}{'OBSERVATION DATA':<20}M",
+                "RINEX VERSION / TYPE",
+            ),
+            _hdr(f"{'pyubx2 ' + VERSION:<20}{'':<20}{now:<20}", "PGM / RUN BY / DATE"),
+            _hdr(self._marker, "MARKER NAME"),
+            _hdr("NON_GEODETIC", "MARKER TYPE"),
+            _hdr(f"{self._observer:<20}{self._agency:<40}", "OBSERVER / AGENCY"),
+            _hdr(f"{'':<20}{self._receiver:<20}", "REC # / TYPE / VERS"),
+            _hdr(f"{'':<20}{self._antenna:<20}", "ANT # / TYPE"),
+            _hdr(
+                "".join(f"{val:14.4f}" for val in self._position), "APPROX POSITION XYZ"
+            ),
+            _hdr(f"{0:14.4f}{0:14.4f}{0:14.4f}", "ANTENNA: DELTA H/E/N"),
+        ]
+        for sys, codes in self._signals.items():
+            obs = [f" {typ}{code}" for code in codes for typ in _OBSTYPES]
+            for i in range(0, len(obs), 13):
+                prefix = f"{sys}  {len(obs):3d}" if i == 0 else ""
+                lines.append(
+                    _hdr(
+                        f"{prefix:<6}" + "".join(obs[i : i + 13]), "SYS / # / OBS TYPES"
+                    )
+                )
+        lines.append(_hdr("DBHZ", "SIGNAL STRENGTH UNIT"))
+        yrs, mon, day, hrs, mins, secs = _gpstime(tow, week)
+        lines.append(
+            _hdr(
+                f"{yrs:6d}{mon:6d}{day:6d}{hrs:6d}{mins:6d}{secs:13.7f}{'':5}GPS",
+                "TIME OF FIRST OBS",
+            )
+        )
+        for sys in self._signals:
+            lines.append(_hdr(sys, "SYS / PHASE SHIFT"))
+        if "R" in self._signals:
+            slots = [f"R{slot:02d} {frq:2d} " for slot, frq in sorted(glonass.items())]
+            for i in range(0, max(len(slots), 1), 8):
+                prefix = f"{len(slots):3d} " if i == 0 else ""
+                lines.append(
+                    _hdr(
+                        f"{prefix:<4}" + "".join(slots[i : i + 8]),
+                        "GLONASS SLOT / FRQ #",
+                    )
+                )
+            lines.append(
+                _hdr(
+                    "".join(
+                        f" {code}    0.000" for code in ("C1C", "C1P", "C2C", "C2P")
+                    ),
+                    "GLONASS COD/PHS/BIS",
+                )
+            )
+        if leaps is not None:
+            lines.append(_hdr(f"{leaps:6d}", "LEAP SECONDS"))
+        lines.append(_hdr("", "END OF HEADER"))
+        self._stream.write("".join(lines))
+
+    def write(self, raw_data: bytes) -> bool:
+        """
+        Write epoch from raw RXM-RAWX message. Any other message is ignored.
+
+        :param bytes raw_data: raw UBX message
+        :return: True if epoch written
+        :rtype: bool
+        """
+
+        if raw_data[2:4] != _RAWX or len(raw_data) < 8 + _RAWXHDR.size:
+            return False
+        tow, week, leaps, nmeas, recstat = _RAWXHDR.unpack_from(raw_data, 6)
+        end = 6 + _RAWXHDR.size + nmeas * _RAWXMEAS.size
+        if end > len(raw_data) - 2:
+            return False
+
+        sats = {}  # satellite id: list of observation fields
+        glonass = {}
+        locktimes = {}
+        for (
+            prmes,
+            cpmes,
+            domes,
+            gnss,
+            svid,
+            sigid,
+            freqid,
+            locktime,
+            cno,
+            _,
+            _,
+            _,
+            trkstat,
+        ) in _RAWXMEAS.iter_unpack(raw_data[6 + _RAWXHDR.size : end]):
+            sys = RINEXSYS.get(gnss, None)
+            col = self._columns.get((sys, RINEXSIG.get((gnss, sigid), None)), None)
+            if col is None or svid == 255:  # untracked system/signal, unknown slot
+                continue
+            if gnss == 1:  # SBAS PRN 120-158
+                svid -= 100
+            elif gnss == 6:
+                glonass[svid] = freqid - 7
+            sat = f"{sys}{svid:02d}"
+            fields = sats.get(sat, None)
+            if fields is None:
+                fields = sats[sat] = [_BLANK] * (len(self._signals[sys]) * 4)
+
+            key = (gnss, svid, sigid)
+            locktimes[key] = locktime
+            last = self._locktimes.get(key, None)
+            lli = 0
+            if last is not None and locktime < last:  # loss of lock
+                lli |= 1
+            if not trkstat & 4:  # half cycle ambiguity unresolved
+                lli |= 2
+            ssi = min(max(cno // 6, 1), 9)
+            col *= 4
+            if trkstat & 1:  # pseudorange valid
+                fields[col] = f"{prmes:14.3f}  "
+            if trkstat & 2:  # carrier phase valid
+                fields[col + 1] = f"{cpmes:14.3f}{lli if lli else ' '}{ssi}"
+            fields[col + 2] = f"{domes:14.3f}  "
+            fields[col + 3] = f"{cno:14.3f}  "
+        self._locktimes = locktimes
+
+        if self._count == 0:
+            self._header(tow, week, leaps if recstat & 1 else None, glonass)
+        yrs, mon, day, hrs, mins, secs = _gpstime(tow, week)
+        lines = [
+            f"> {yrs:4d} {mon:02d} {day:02d} {hrs:02d} {mins:02d}{secs:11.7f}  0{len(sats):3d}\n"
+        ]
+        order = list(RINEXSYS.values())
+        for sat in sorted(sats, key=lambda s: (order.index(s[0]), s)):
+            lines.append(f"{sat}{''.join(sats[sat])}".rstrip() + "\n")
+        self._stream.write("".join(lines))
+        self._count += 1
+        return True
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and write an epoch for each valid RXM-RAWX
+        message until end of stream or stopevent is set.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of epochs written
+        :rtype: int
+        """
+
+        count = 0
+        for raw_data in validframes(stream, (_RAWX,), stopevent):
+            count += self.write(raw_data)
+        return count
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of epochs written.
+
+        :return: number of epochs
+        :rtype: int
+        """
+
+        return self._count
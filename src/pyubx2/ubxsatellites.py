@@ -0,0 +1,351 @@
+"""
+SatelliteTracker class.
+
+Maintains per-signal state, keyed by (gnssId, svId, sigId), updated
+incrementally from raw NAV-SAT, NAV-SIG and RXM-RAWX messages (and their
+NAV2 equivalents). The repeating groups of each message are decoded straight
+from the raw payload with struct.iter_unpack(), rather than via a parsed
+UBXMessage with hundreds of suffixed attributes (cno_01, elev_01 ... cno_64).
+
+State is held in compact column arrays (array.array), one element per
+signal, which can be copied as a snapshot in a single operation per column,
+e.g. for a sky plot or signal quality display. Snapshot arrays support the
+buffer protocol, so can be wrapped without copying as NumPy arrays via
+numpy.frombuffer() if required.
+
+NAV-SAT reports one entry per satellite rather than per signal. Its
+elevation and azimuth are applied to every signal of the satellite; its
+C/No, residual, health and quality are applied to the primary signal
+(sigId 0), as are those of satellites with no other signals.
+
+Each update returns a list of change events as (event, gnssId, svId, sigId)
+tuples, where event is one of:
+
+- SAT_ACQUIRED - signal is reported for the first time, or again after
+  being lost.
+- SAT_LOST - signal is no longer reported by any of the messages which
+  previously reported it. Primary (NAV) and secondary (NAV2) output
+  messages are tracked as separate sources.
+- SAT_HEALTH - signal health has changed.
+- SAT_SLIP - RXM-RAWX carrier phase lock time has decreased (i.e. a
+  possible cycle slip).
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from array import array
+from struct import Struct
+from threading import Event
+from time import monotonic
+from types import NoneType
+
+from pyubx2.ubxreader import validframes
+from pyubx2.ubxtypes_core import (
+    SAT_ACQUIRED,
+    SAT_HEALTH,
+    SAT_LOST,
+    SAT_SLIP,
+)
+
+_SAT = Struct("<BBBbhhI")  # NAV-SAT repeating group, 12 bytes
+_SIG = Struct("<BBBBhBBBBH4x")  # NAV-SIG repeating group, 16 bytes
+_RAWX = Struct("<20xBBBBHB3xBx")  # RXM-RAWX repeating group, 32 bytes
+_RAWXBIT = 4  # RXM-RAWX source bit
+_SOURCES = {  # message class & id: (source bit, count offset, header size, group)
+    b"\x01\x35": (1, 11, 8, _SAT),  # NAV-SAT
+    b"\x01\x43": (2, 11, 8, _SIG),  # NAV-SIG
+    b"\x02\x15": (_RAWXBIT, 17, 16, _RAWX),  # RXM-RAWX
+    b"\x29\x35": (8, 11, 8, _SAT),  # NAV2-SAT
+    b"\x29\x43": (16, 11, 8, _SIG),  # NAV2-SIG
+}
+
+FIELDS = {
+    "gnssId": "B",
+    "svId": "B",
+    "sigId": "B",
+    "cno": "B",
+    "elev": "b",
+    "azim": "h",
+    "prRes": "f",
+    "health": "B",
+    "qualityInd": "B",
+    "locktime": "H",
+    "firstSeen": "d",
+    "lastSeen": "d",
+}
+"""SatelliteTracker fields and array type codes"""
+
+
+class SatelliteTracker:
+    """
+    SatelliteTracker class.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self._index = {}  # (gnssId, svId, sigId): row
+        self._svrows = {}  # (gnssId, svId): list of rows
+        self._cols = {name: array(code) for name, code in FIELDS.items()}
+        self._sources = array("B")  # bitmask of sources currently reporting row
+        # source bit: rows reported by latest message from that source
+        self._present = {src[0]: set() for src in _SOURCES.values()}
+        self._decoders = {_SAT: self._sat, _SIG: self._sig, _RAWX: self._rawx}
+        self._count = 0
+
+    def _row(self, gnss: int, svid: int, sigid: int, now: float) -> int:
+        """
+        Get row for signal, adding it if new.
+
+        :param int gnss: gnssId
+        :param int svid: svId
+        :param int sigid: sigId
+        :param float now: time of update
+        :return: row
+        :rtype: int
+        """
+
+        row = self._index.get((gnss, svid, sigid), None)
+        if row is not None:
+            return row
+        row = self._index[(gnss, svid, sigid)] = len(self._sources)
+        svrows = self._svrows.setdefault((gnss, svid), [])
+        cols = self._cols
+        elev, azim = (
+            (cols["elev"][svrows[0]], cols["azim"][svrows[0]]) if svrows else (0, 0)
+        )
+        svrows.append(row)
+        for name, val in (
+            ("gnssId", gnss),
+            ("svId", svid),
+            ("sigId", sigid),
+            ("cno", 0),
+            ("elev", elev),
+            ("azim", azim),
+            ("prRes", 0.0),
+            ("health", 0),
+            ("qualityInd", 0),
+            ("locktime", 0),
+            ("firstSeen", now),
+            ("lastSeen", now),
+        ):
+            cols[name].append(val)
+        self._sources.append(0)
+        return row
+
+    def _sat(self, vals: tuple, now: float) -> tuple:
+        """
+        Apply NAV-SAT repeating group.
+
+        :param tuple vals: unpacked repeating group
+        :param float now: time of update
+        :return: tuple of (row, signal health, possible cycle slip)
+        :rtype: tuple
+        """
+
+        gnss, svid, svcno, svelev, svazim, svres, flags = vals
+        row = self._row(gnss, svid, 0, now)
+        cols = self._cols
+        for svrow in self._svrows[(gnss, svid)]:
+            cols["elev"][svrow] = svelev
+            cols["azim"][svrow] = svazim
+        cols["cno"][row] = svcno
+        cols["prRes"][row] = svres / 10
+        cols["qualityInd"][row] = flags & 7
+        return row, (flags >> 4) & 3, False
+
+    def _sig(self, vals: tuple, now: float) -> tuple:
+        """
+        Apply NAV-SIG repeating group.
+
+        :param tuple vals: unpacked repeating group
+        :param float now: time of update
+        :return: tuple of (row, signal health, possible cycle slip)
+        :rtype: tuple
+        """
+
+        gnss, svid, sigid, _, sigres, sigcno, sigqual, _, _, sigflags = vals
+        row = self._row(gnss, svid, sigid, now)
+        cols = self._cols
+        cols["cno"][row] = sigcno
+        cols["prRes"][row] = sigres / 10
+        cols["qualityInd"][row] = sigqual
+        return row, sigflags & 3, False
+
+    def _rawx(self, vals: tuple, now: float) -> tuple:
+        """
+        Apply RXM-RAWX repeating group.
+
+        :param tuple vals: unpacked repeating group
+        :param float now: time of update
+        :return: tuple of (row, signal health, possible cycle slip)
+        :rtype: tuple
+        """
+
+        gnss, svid, sigid, _, lock, sigcno, _ = vals
+        row = self._row(gnss, svid, sigid, now)
+        cols = self._cols
+        slip = lock < cols["locktime"][row] and bool(self._sources[row] & _RAWXBIT)
+        cols["locktime"][row] = lock
+        cols["cno"][row] = sigcno
+        return row, cols["health"][row], slip
+
+    def update(self, raw_data: bytes, now: float | NoneType = None) -> list:
+        """
+        Update state from raw NAV-SAT, NAV-SIG or RXM-RAWX message. Any other
+        message is ignored.
+
+        :param bytes raw_data: raw UBX message
+        :param float | NoneType now: time of update in seconds, None = time.monotonic() (None)
+        :return: list of change events as (event, gnssId, svId, sigId)
+        :rtype: list
+        """
+
+        source = _SOURCES.get(raw_data[2:4], None)
+        if source is None:
+            return []
+        bit, numpos, hdrlen, group = source
+        if len(raw_data) < 8 + hdrlen:
+            return []
+        end = 6 + hdrlen + raw_data[numpos] * group.size
+        if end > len(raw_data) - 2:
+            return []
+        if now is None:
+            now = monotonic()
+        self._count += 1
+        rows, events = self._apply(bit, group, raw_data[6 + hdrlen : end], now)
+        sources = self._sources
+        for row in self._present[bit] - rows:
+            sources[row] &= ~bit
+            if not sources[row]:
+                events.append((SAT_LOST, *self._signal(row)))
+        self._present[bit] = rows
+        return events
+
+    def _apply(self, bit: int, group: Struct, payload: bytes, now: float) -> tuple:
+        """
+        Apply repeating groups of message to state.
+
+        :param int bit: source bit
+        :param Struct group: repeating group structure
+        :param bytes payload: repeating groups
+        :param float now: time of update
+        :return: tuple of (set of rows reported, list of change events)
+        :rtype: tuple
+        """
+
+        decode = self._decoders[group]
+        health, lastseen = self._cols["health"], self._cols["lastSeen"]
+        sources = self._sources
+        events = []
+        rows = set()
+        for vals in group.iter_unpack(payload):
+            row, sighealth, slip = decode(vals, now)
+            if slip:
+                events.append((SAT_SLIP, *self._signal(row)))
+            if sighealth != health[row]:
+                health[row] = sighealth
+                if sources[row]:
+                    events.append((SAT_HEALTH, *self._signal(row)))
+            if not sources[row]:
+                events.append((SAT_ACQUIRED, *self._signal(row)))
+            sources[row] |= bit
+            lastseen[row] = now
+            rows.add(row)
+        return rows, events
+
+    def _signal(self, row: int) -> tuple:
+        """
+        Get signal identifiers of row.
+
+        :param int row: row
+        :return: tuple of (gnssId, svId, sigId)
+        :rtype: tuple
+        """
+
+        cols = self._cols
+        return cols["gnssId"][row], cols["svId"][row], cols["sigId"][row]
+
+    def snapshot(self, fields: tuple | NoneType = None, tracked: bool = True) -> dict:
+        """
+        Get copy of current state as column arrays.
+
+        :param tuple | NoneType fields: fields to include e.g. ("svId", "cno"),
+            None = all (None)
+        :param bool tracked: include only signals currently reported (True)
+        :return: dict of {field: array.array}
+        :rtype: dict
+        """
+
+        if fields is None:
+            fields = FIELDS
+        if not tracked:
+            return {name: array(FIELDS[name], self._cols[name]) for name in fields}
+        rows = [row for row, src in enumerate(self._sources) if src]
+        snap = {}
+        for name in fields:
+            col = self._cols[name]
+            snap[name] = array(FIELDS[name], [col[row] for row in rows])
+        return snap
+
+    def get(self, gnssid: int, svid: int, sigid: int = 0) -> dict | NoneType:
+        """
+        Get current state of single signal.
+
+        :param int gnssid: gnssId
+        :param int svid: svId
+        :param int sigid: sigId (0)
+        :return: dict of {field: value}, or None if signal not seen
+        :rtype: dict | NoneType
+        """
+
+        row = self._index.get((gnssid, svid, sigid), None)
+        if row is None:
+            return None
+        state = {name: col[row] for name, col in self._cols.items()}
+        state["tracked"] = bool(self._sources[row])
+        return state
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and update state from each valid NAV-SAT, NAV-SIG
+        or RXM-RAWX message until end of stream or stopevent is set.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of messages processed
+        :rtype: int
+        """
+
+        count = 0
+        for raw_data in validframes(stream, _SOURCES, stopevent):
+            self.update(raw_data)
+            count += 1
+        return count
+
+    def __len__(self) -> int:
+        """
+        Number of signals currently reported.
+
+        :return: number of signals
+        :rtype: int
+        """
+
+        return sum(1 for src in self._sources if src)
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of messages processed.
+
+        :return: number of messages
+        :rtype: int
+        """
+
+        return self._count
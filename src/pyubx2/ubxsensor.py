@@ -0,0 +1,257 @@
+"""
+SensorBuffer class.
+
+Decodes the repeating groups of raw ESF-MEAS and ESF-RAW messages directly
+into per-sensor numeric ring buffers, rather than via a parsed UBXMessage
+with one suffixed bitfield attribute per sample (dataField_01, dataType_01
+... dataField_40).
+
+Each sensor data type (gyro, accelerometer, wheel tick, speed etc.) has its
+own fixed-size ring buffer of the most recent 'size' samples, held as
+preallocated array.array columns of sensor time tags ('I', ms) and scaled
+values ('d'), so memory use is constant regardless of sensor rate or
+session length.
+
+ESF-MEAS samples are stamped with the message timeTag. If the
+calibTtagValid flag is set, the last 32-bit word of the message is the
+calibrated receiver time tag (calibTtag) rather than a data sample; this is
+excluded from the samples and is available via the calibttag property.
+ESF-RAW samples are stamped with their individual sensor time tags (sTag).
+
+Values are scaled according to ESFDATATYPE. Wheel tick counts (data types
+6 to 10) are unsigned 23-bit counts with a direction bit; these are held
+as negative counts if the direction bit is set (i.e. backward).
+
+Results support the buffer protocol, so can be wrapped without copying as
+NumPy arrays via numpy.frombuffer() if required.
+
+e.g. accumulate IMU history for sensor fusion::
+
+    sensors = SensorBuffer(size=1000)
+    for raw, _ in UBXReader(stream, parsing=False):
+        if sensors.update(raw):
+            ttags, gyroz = sensors.samples(5)
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from array import array
+from struct import Struct
+from threading import Event
+from types import NoneType
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxreader import validframes
+from pyubx2.ubxtypes_decodes import ESFDATATYPE
+
+_ESFMEAS = b"\x10\x02"  # ESF-MEAS message class and id
+_ESFRAW = b"\x10\x03"  # ESF-RAW message class and id
+_MEASHDR = Struct("<LH2x")  # ESF-MEAS timeTag, flags, id
+_WORD = Struct("<L")  # ESF-MEAS data
+_RAWGRP = Struct("<LL")  # ESF-RAW data, sTag
+_TICKS = range(6, 11)  # wheel tick data types
+
+
+class _Ring:
+    """
+    Time tag and value ring buffer for a single sensor data type.
+    """
+
+    __slots__ = ("ttags", "values", "head", "rows")
+
+    def __init__(self, size: int):
+        """
+        Constructor.
+
+        :param int size: number of samples held
+        """
+
+        self.ttags = array("I", [0]) * size
+        self.values = array("d", [0.0]) * size
+        self.head = 0  # row to be written next
+        self.rows = 0  # number of rows held
+
+
+class SensorBuffer:
+    """
+    SensorBuffer class.
+    """
+
+    def __init__(self, size: int = 1000):
+        """
+        Constructor.
+
+        :param int size: number of samples held for each sensor data type (1000)
+        :raises: ParameterError if size is not a positive integer
+        """
+
+        if not isinstance(size, int) or size < 1:
+            raise ParameterError(f"Invalid size {size} - must be integer > 0")
+        self._size = size
+        self._rings = {}  # dataType: _Ring
+        self._calibttag = None
+        self._count = 0
+
+    def update(self, raw_data: bytes) -> int:
+        """
+        Add samples from raw ESF-MEAS or ESF-RAW message. Any other message
+        is ignored.
+
+        :param bytes raw_data: raw UBX message
+        :return: number of samples added
+        :rtype: int
+        """
+
+        msgid = raw_data[2:4]
+        length = len(raw_data) - 8
+        if msgid == _ESFMEAS and length >= 8:
+            ttag, flags = _MEASHDR.unpack_from(raw_data, 6)
+            numwords = (flags >> 11) + ((flags >> 3) & 1)
+            if length < 8 + numwords * 4:
+                return 0
+            end = 14 + (flags >> 11) * 4
+            if flags & 8:  # calibTtagValid
+                self._calibttag = _WORD.unpack_from(raw_data, end)[0]
+            samples = ((word, ttag) for (word,) in _WORD.iter_unpack(raw_data[14:end]))
+        elif msgid == _ESFRAW and length >= 4:
+            end = 10 + (length - 4) // 8 * 8
+            samples = _RAWGRP.iter_unpack(raw_data[10:end])
+        else:
+            return 0
+
+        size = self._size
+        rings = self._rings
+        num = 0
+        for word, ttag in samples:
+            dtype = (word >> 24) & 0x3F
+            ring = rings.get(dtype, None)
+            if ring is None:
+                ring = rings[dtype] = _Ring(size)
+            field = word & 0xFFFFFF
+            if dtype in _TICKS:
+                value = -(field & 0x7FFFFF) if field & 0x800000 else field
+            else:
+                if field & 0x800000:
+                    field -= 0x1000000
+                value = field * ESFDATATYPE.get(dtype, (None, 1))[1]
+            head = ring.head
+            ring.ttags[head] = ttag
+            ring.values[head] = value
+            ring.head = (head + 1) % size
+            if ring.rows < size:
+                ring.rows += 1
+            num += 1
+        self._count += 1
+        return num
+
+    def _ring(self, datatype: int) -> _Ring:
+        """
+        Get ring buffer for sensor data type.
+
+        :param int datatype: sensor data type
+        :return: ring buffer
+        :rtype: _Ring
+        :raises: ParameterError if no samples received for data type
+        """
+
+        ring = self._rings.get(datatype, None)
+        if ring is None:
+            raise ParameterError(f"No samples received for data type {datatype}")
+        return ring
+
+    def samples(self, datatype: int) -> tuple:
+        """
+        Get all held samples for sensor data type, oldest first.
+
+        :param int datatype: sensor data type e.g. 5 = gyro z
+        :return: tuple of (time tags in ms, scaled values)
+        :rtype: tuple
+        :raises: ParameterError if no samples received for data type
+        """
+
+        ring = self._ring(datatype)
+        head = ring.head
+        if ring.rows < self._size:
+            return ring.ttags[:head], ring.values[:head]
+        return (
+            ring.ttags[head:] + ring.ttags[:head],
+            ring.values[head:] + ring.values[:head],
+        )
+
+    def latest(self, datatype: int) -> tuple:
+        """
+        Get latest sample for sensor data type.
+
+        :param int datatype: sensor data type e.g. 5 = gyro z
+        :return: tuple of (time tag in ms, scaled value)
+        :rtype: tuple
+        :raises: ParameterError if no samples received for data type
+        """
+
+        ring = self._ring(datatype)
+        head = (ring.head - 1) % self._size
+        return ring.ttags[head], ring.values[head]
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and add samples from each valid ESF-MEAS or
+        ESF-RAW message until end of stream or stopevent is set.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of messages processed
+        :rtype: int
+        """
+
+        count = self._count
+        for raw_data in validframes(stream, (_ESFMEAS, _ESFRAW), stopevent):
+            self.update(raw_data)
+        return self._count - count
+
+    @property
+    def datatypes(self) -> list:
+        """
+        Getter for sensor data types received.
+
+        :return: sorted list of data types
+        :rtype: list
+        """
+
+        return sorted(self._rings)
+
+    @property
+    def calibttag(self) -> int | NoneType:
+        """
+        Getter for latest ESF-MEAS calibrated receiver time tag.
+
+        :return: calibTtag in ms, or None if not received
+        :rtype: int | NoneType
+        """
+
+        return self._calibttag
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of messages processed.
+
+        :return: number of messages
+        :rtype: int
+        """
+
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """
+        Getter for number of samples held for each sensor data type.
+
+        :return: size
+        :rtype: int
+        """
+
+        return self._size
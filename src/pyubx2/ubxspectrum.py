@@ -0,0 +1,323 @@
+"""
+SpectrumWaterfall class.
+
+Decodes the RF blocks of raw MON-SPAN messages directly into unsigned 8-bit
+arrays of 256 spectrum bins, rather than via a parsed UBXMessage with 256
+attributes per block (spectrum_01_001 ... spectrum_02_256).
+
+The most recent 'depth' spectra of each RF block are held in a fixed-size
+ring buffer, forming a waterfall. Adding a spectrum is a single slice
+assignment; the max-hold and average aggregates are computed from the ring
+buffer in one pass per bin over many spectra when requested (or, for the
+max-hold, when an unprocessed spectrum is about to be evicted), which is far
+cheaper than updating them bin by bin for every spectrum. The frequency axis
+of each block is computed once from its span, resolution and center
+frequency and only recomputed if these change.
+
+All results are stdlib array.array or bytes objects which support the buffer
+protocol, so can be wrapped without copying as NumPy arrays if required,
+e.g. numpy.frombuffer(waterfall.waterfall(0), numpy.uint8).reshape(-1, 256).
+
+e.g. monitor interference on every RF block::
+
+    swf = SpectrumWaterfall(depth=600)
+    for raw, _ in UBXReader(stream, parsing=False):
+        if swf.update(raw):
+            peak = max(swf.spectrum(0))
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from array import array
+from struct import Struct
+from threading import Event
+from types import NoneType
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxreader import validframes
+
+SPAN_BINS = 256
+"""Number of spectrum bins in each MON-SPAN RF block"""
+
+_MONSPAN = b"\x0a\x31"  # MON-SPAN message class and id
+_BLOCK = Struct("<LLLB3x")  # span, res, center, pga following spectrum
+_BLOCKSIZE = SPAN_BINS + _BLOCK.size  # 272 bytes
+
+
+class _RFBlock:
+    """
+    Waterfall ring buffer and aggregates for a single RF block.
+    """
+
+    __slots__ = (
+        "ring",
+        "head",
+        "rows",
+        "maxhold",
+        "unfolded",
+        "span",
+        "res",
+        "center",
+        "pga",
+        "freqs",
+    )
+
+    def __init__(self, depth: int):
+        """
+        Constructor.
+
+        :param int depth: number of spectra held
+        """
+
+        self.ring = bytearray(depth * SPAN_BINS)
+        self.head = 0  # row to be written next
+        self.rows = 0  # number of rows held
+        self.maxhold = bytearray(SPAN_BINS)
+        self.unfolded = 0  # latest rows not yet included in maxhold
+        self.span = self.res = self.center = self.pga = None
+        self.freqs = None
+
+
+class SpectrumWaterfall:
+    """
+    SpectrumWaterfall class.
+    """
+
+    def __init__(self, depth: int = 100):
+        """
+        Constructor.
+
+        :param int depth: number of spectra held for each RF block (100)
+        :raises: ParameterError if depth is not a positive integer
+        """
+
+        if not isinstance(depth, int) or depth < 1:
+            raise ParameterError(f"Invalid depth {depth} - must be integer > 0")
+        self._depth = depth
+        self._blocks = []
+        self._count = 0
+
+    def update(self, raw_data: bytes) -> int:
+        """
+        Add spectra from raw MON-SPAN message. Any other message is ignored.
+
+        :param bytes raw_data: raw UBX message
+        :return: number of RF blocks added
+        :rtype: int
+        """
+
+        if raw_data[2:4] != _MONSPAN or len(raw_data) < 12:
+            return 0
+        numblocks = raw_data[7]
+        if 10 + numblocks * _BLOCKSIZE > len(raw_data) - 2:
+            return 0
+        depth = self._depth
+        for i in range(numblocks):
+            if i == len(self._blocks):
+                self._blocks.append(_RFBlock(depth))
+            blk = self._blocks[i]
+            offset = 10 + i * _BLOCKSIZE
+            spectrum = raw_data[offset : offset + SPAN_BINS]
+            span, res, center, pga = _BLOCK.unpack_from(raw_data, offset + SPAN_BINS)
+            if (span, res, center) != (blk.span, blk.res, blk.center):
+                blk.span, blk.res, blk.center = span, res, center
+                start = center - span / 2
+                blk.freqs = array("d", (start + res * j for j in range(SPAN_BINS)))
+            blk.pga = pga
+            pos = blk.head * SPAN_BINS
+            if blk.rows < depth:
+                blk.rows += 1
+            elif blk.unfolded == depth:  # oldest row not yet in max-hold
+                self._fold(blk)
+            blk.ring[pos : pos + SPAN_BINS] = spectrum
+            blk.head = (blk.head + 1) % depth
+            blk.unfolded += 1
+        self._count += 1
+        return numblocks
+
+    def _fold(self, blk: _RFBlock):
+        """
+        Fold latest spectra into max-hold aggregate. This is done in batches
+        (when the oldest unfolded spectrum is about to be evicted, or the
+        max-hold is requested), as a single max() call per bin over many
+        spectra is much cheaper than one per bin per spectrum.
+
+        :param _RFBlock blk: RF block
+        """
+
+        blk.maxhold = bytearray(map(max, blk.maxhold, *self._rows(blk, blk.unfolded)))
+        blk.unfolded = 0
+
+    def _rows(self, blk: _RFBlock, num: int) -> list:
+        """
+        Get latest spectra from ring buffer.
+
+        :param _RFBlock blk: RF block
+        :param int num: number of spectra
+        :return: list of spectra, latest first
+        :rtype: list
+        """
+
+        rows = []
+        for age in range(num):
+            pos = ((blk.head - 1 - age) % self._depth) * SPAN_BINS
+            rows.append(blk.ring[pos : pos + SPAN_BINS])
+        return rows
+
+    def _block(self, block: int) -> _RFBlock:
+        """
+        Get RF block.
+
+        :param int block: RF block index (0 = first)
+        :return: RF block
+        :rtype: _RFBlock
+        :raises: ParameterError if no spectra received for block
+        """
+
+        if not 0 <= block < len(self._blocks):
+            raise ParameterError(f"No spectra received for RF block {block}")
+        return self._blocks[block]
+
+    def spectrum(self, block: int = 0, age: int = 0) -> array:
+        """
+        Get spectrum from waterfall.
+
+        :param int block: RF block index (0 = first) (0)
+        :param int age: number of spectra before the latest (0 = latest) (0)
+        :return: spectrum in dB, one element per bin
+        :rtype: array.array
+        :raises: ParameterError if no such spectrum is held
+        """
+
+        blk = self._block(block)
+        if not 0 <= age < blk.rows:
+            raise ParameterError(f"Spectrum {age} not held - {blk.rows} available")
+        pos = ((blk.head - 1 - age) % self._depth) * SPAN_BINS
+        return array("B", blk.ring[pos : pos + SPAN_BINS])
+
+    def waterfall(self, block: int = 0) -> bytes:
+        """
+        Get all held spectra for RF block, oldest first, as a single
+        contiguous buffer of rows x 256 bins.
+
+        :param int block: RF block index (0 = first) (0)
+        :return: spectra in dB
+        :rtype: bytes
+        """
+
+        blk = self._block(block)
+        pos = blk.head * SPAN_BINS
+        if blk.rows < self._depth:
+            return bytes(blk.ring[:pos])
+        return bytes(blk.ring[pos:] + blk.ring[:pos])
+
+    def frequencies(self, block: int = 0) -> array:
+        """
+        Get frequency axis of RF block.
+
+        :param int block: RF block index (0 = first) (0)
+        :return: center frequency of each bin in Hz
+        :rtype: array.array
+        """
+
+        return array("d", self._block(block).freqs)
+
+    def maxhold(self, block: int = 0) -> array:
+        """
+        Get maximum of each bin over all spectra since the last reset.
+
+        :param int block: RF block index (0 = first) (0)
+        :return: max-hold spectrum in dB
+        :rtype: array.array
+        """
+
+        blk = self._block(block)
+        if blk.unfolded:
+            self._fold(blk)
+        return array("B", blk.maxhold)
+
+    def average(self, block: int = 0) -> array:
+        """
+        Get average of each bin over all held spectra.
+
+        :param int block: RF block index (0 = first) (0)
+        :return: average spectrum in dB
+        :rtype: array.array
+        """
+
+        blk = self._block(block)
+        sums = map(sum, zip(*self._rows(blk, blk.rows)))
+        return array("d", (val / blk.rows for val in sums))
+
+    def pga(self, block: int = 0) -> int:
+        """
+        Get receiver programmable gain amplifier setting of latest spectrum.
+
+        :param int block: RF block index (0 = first) (0)
+        :return: PGA gain in dB
+        :rtype: int
+        """
+
+        return self._block(block).pga
+
+    def reset_maxhold(self):
+        """
+        Reset max-hold aggregates of all RF blocks.
+        """
+
+        for blk in self._blocks:
+            blk.maxhold = bytearray(SPAN_BINS)
+            blk.unfolded = 0
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and add spectra from each valid MON-SPAN message
+        until end of stream or stopevent is set.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of MON-SPAN messages processed
+        :rtype: int
+        """
+
+        count = 0
+        for raw_data in validframes(stream, (_MONSPAN,), stopevent):
+            count += self.update(raw_data) > 0
+        return count
+
+    @property
+    def blocks(self) -> int:
+        """
+        Getter for number of RF blocks received.
+
+        :return: number of RF blocks
+        :rtype: int
+        """
+
+        return len(self._blocks)
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of MON-SPAN messages processed.
+
+        :return: number of messages
+        :rtype: int
+        """
+
+        return self._count
+
+    @property
+    def depth(self) -> int:
+        """
+        Getter for number of spectra held for each RF block.
+
+        :return: depth
+        :rtype: int
+        """
+
+        return self._depth
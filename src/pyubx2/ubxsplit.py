@@ -0,0 +1,175 @@
+"""
+UBXSplitter class.
+
+Splits or filters a log by protocol, identity, iTOW range or input byte
+range, writing the raw bytes of each selected frame straight to the
+output. Messages are only framed (UBXReader parsing=False), never parsed:
+
+- identities are derived from the raw header via raw2identity();
+- iTOW is read from the raw payload via raw2itow(); frames without an
+  iTOW (e.g. NMEA, RTCM3, RXM-SFRBX) take the iTOW of the preceding
+  timed frame.
+
+e.g. extract all RXM-RAWX and RXM-SFRBX messages::
+
+    with open("in.ubx", "rb") as infile, open("out.ubx", "wb") as outfile:
+        UBXSplitter(outfile, identities=("RXM-RAWX", "RXM-SFRBX")).run(infile)
+
+or split into hourly files named in-000.ubx, in-001.ubx, etc.::
+
+    with open("in.ubx", "rb") as infile:
+        UBXSplitter("in-{:03d}.ubx", period=3600).run(infile)
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from threading import Event
+from types import NoneType
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxhelpers import raw2identity, raw2itow
+from pyubx2.ubxreader import UBXReader
+
+
+class UBXSplitter:
+    """
+    UBXSplitter class.
+    """
+
+    def __init__(
+        self,
+        output: object,
+        identities: tuple | list | set | NoneType = None,
+        itowrange: tuple | NoneType = None,
+        period: int = 0,
+        **kwargs,
+    ):
+        """
+        Constructor.
+
+        :param object output: output binary stream (supporting write(bytes)), or
+            file name pattern if period > 0, formatted with the sequential file
+            number and (as keyword 'itow') the start of the period in ms,
+            e.g. "log-{:03d}.ubx" or "log-{itow}.ubx"
+        :param tuple | list | set | NoneType identities: identities to extract
+            e.g. ("RXM-RAWX", "RXM-SFRBX"), None = all (None)
+        :param tuple | NoneType itowrange: (start, end) iTOW range in ms to
+            extract, start inclusive, end exclusive, None = all (None)
+        :param int period: if > 0, split output into files each covering
+            period seconds of GPS time e.g. 3600 = hourly (0)
+        :param kwargs: optional UBXReader keyword arguments e.g. protfilter
+        :raises: ParameterError if output is not a file name pattern when
+            period > 0
+        """
+
+        if period > 0 and not isinstance(output, str):
+            raise ParameterError("Output must be a file name pattern if period > 0")
+        self._output = output
+        self._identities = None if identities is None else set(identities)
+        self._itowrange = itowrange
+        self._period = period * 1000
+        self._kwargs = kwargs
+        self._kwargs["parsing"] = False
+        self._files = []
+        self._count = 0
+
+    def run(
+        self,
+        stream,
+        byterange: tuple | NoneType = None,
+        stopevent: Event | NoneType = None,
+    ) -> int:
+        """
+        Read input stream and write selected frames to output until
+        end of stream (or byte range) or stopevent is set.
+
+        :param stream stream: input data stream
+        :param tuple | NoneType byterange: (start, end) byte offsets of input to
+            process - the stream must support seek() and tell(), and only frames
+            which end at or before the end offset are written, None = all (None)
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of frames written
+        :rtype: int
+        """
+
+        start, end = (0, None) if byterange is None else byterange
+        if start:
+            stream.seek(start)
+        ubr = UBXReader(stream, **self._kwargs)
+        itow = None
+        chunk = None  # current output period
+        outfile = None if self._period else self._output
+        count = 0
+        try:
+            while stopevent is None or not stopevent.is_set():
+                raw_data, _ = ubr.read()
+                if raw_data is None or (end is not None and stream.tell() > end):
+                    break
+                if self._itowrange is not None or self._period:
+                    rawitow = raw2itow(raw_data)
+                    if rawitow is not None:
+                        itow = rawitow
+                if (
+                    self._identities is not None
+                    and raw2identity(raw_data) not in self._identities
+                ):
+                    continue
+                if self._itowrange is not None and (
+                    itow is None or not self._itowrange[0] <= itow < self._itowrange[1]
+                ):
+                    continue
+                if self._period:
+                    period = None if itow is None else itow // self._period
+                    if outfile is None:
+                        outfile = self._open(itow)
+                    elif period != chunk and chunk is not None:
+                        outfile.close()
+                        outfile = self._open(itow)
+                    chunk = period
+                outfile.write(raw_data)
+                count += 1
+        finally:
+            if self._period and outfile is not None:
+                outfile.close()
+        self._count += count
+        return count
+
+    def _open(self, itow: int | NoneType) -> object:
+        """
+        Open next output file.
+
+        :param int | NoneType itow: iTOW of first frame in file
+        :return: output file
+        :rtype: object
+        """
+
+        start = 0 if itow is None else itow - itow % self._period
+        filename = self._output.format(len(self._files), itow=start)
+        self._files.append(filename)
+        return open(filename, "wb")  # pylint: disable=consider-using-with
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of frames written.
+
+        :return: number of frames
+        :rtype: int
+        """
+
+        return self._count
+
+    @property
+    def files(self) -> list:
+        """
+        Getter for names of output files written (if period > 0).
+
+        :return: list of file names
+        :rtype: list
+        """
+
+        return self._files
@@ -0,0 +1,551 @@
+"""
+SQLiteLoader class.
+
+Batched loader of parsed UBX messages into an SQLite database, with one
+table per message identity (e.g. 'nav_pvt', 'nav_sat') whose schema is
+generated from the payload definition in UBX_PAYLOADS_GET.
+
+Each table has one column per payload attribute, with bitfields expanded
+into their individual flags and fixed-size groups flattened into suffixed
+columns (e.g. 'cno_01'). Reserved attributes are omitted. Variable-size
+repeating groups are loaded into a child table named after the group
+(e.g. 'nav_sat_group'), one row per repeat, linked to the parent row by
+'_msg' (parent '_id') and '_idx' (repeat index, starting at 1). Each
+parent row also holds '_source' (id of source file in 'ubx_sources', if
+any) and '_offset' (byte offset of the message in the source).
+
+Rows are queued in memory and written in large transactions via
+executemany(), which reuses a single prepared INSERT statement per table.
+The database is opened in WAL journal mode with synchronous=NORMAL, so
+readers are not blocked by the loader and each commit costs a single
+WAL append rather than a full journal sync.
+
+Files loaded via load() are resumable. The byte offset reached in each
+file is stored in the 'ubx_sources' table in the same transaction as the
+rows themselves, so an interrupted load can be restarted from the last
+committed message without duplicating or losing rows.
+
+If 'spatialite' is set, the mod_spatialite extension is loaded and tables
+with 'lat' and 'lon' attributes are given a POINT 'geom' column (SRID
+4326). This requires a Python sqlite3 build which supports extensions
+(see examples/ubx_spatialite.py).
+
+e.g. load (or resume loading) a month of NAV-PVT and NAV-SAT telemetry::
+
+    with SQLiteLoader("gnss.sqlite", identities=("NAV-PVT", "NAV-SAT")) as sql:
+        for path in sorted(glob("logs/*.ubx")):
+            sql.load(path)
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+import os
+import sqlite3
+from threading import Event
+from types import NoneType
+
+import pyubx2.exceptions as ube
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxhelpers import raw2identity
+from pyubx2.ubxreader import UBXReader
+from pyubx2.ubxtypes_core import GET, UBX_PROTOCOL, VALCKSUM
+from pyubx2.ubxtypes_get import UBX_PAYLOADS_GET
+
+SOURCES = "ubx_sources"
+BITFIELDS = ("X001", "X002", "X004", "X006", "X008", "X024")
+
+_INT64 = 1 << 63
+
+
+def _sqltype(adef: str | list) -> str:
+    """
+    Get SQLite column type for UBX attribute type.
+
+    :param str | list adef: attribute definition e.g. 'U004' or ['I004', 1e-7]
+    :return: column type
+    :rtype: str
+    """
+
+    if isinstance(adef, list):  # scaled
+        return "REAL"
+    if adef == "CH":
+        return "TEXT"
+    return {"E": "INTEGER", "I": "INTEGER", "L": "INTEGER", "U": "INTEGER"}.get(
+        adef[0], "REAL" if adef[0] == "R" else "BLOB"
+    )
+
+
+def _columns(pdict: dict, suffix: str = "") -> tuple:
+    """
+    Generate column definitions from payload definition.
+
+    :param dict pdict: payload (or group) definition
+    :param str suffix: fixed group index suffix ("")
+    :return: tuple of ([(attribute, suffix, type)], [(group, [columns])])
+    :rtype: tuple
+    """
+
+    cols, groups = [], []
+    for anam, adef in pdict.items():
+        if isinstance(adef, tuple):
+            numr, gdict = adef
+            if numr in BITFIELDS:
+                cols += [
+                    (key, suffix, _sqltype(keyt))
+                    for key, keyt in gdict.items()
+                    if key[0:8] != "reserved"
+                ]
+            elif isinstance(numr, int):  # fixed size group
+                for i in range(numr):
+                    gcols, _ = _columns(gdict, f"{suffix}_{i + 1:02d}")
+                    cols += gcols
+            elif suffix == "":  # variable size group at top level
+                gcols, _ = _columns(gdict)
+                if gcols:
+                    groups.append((anam, gcols))
+        elif anam[0:8] != "reserved" and anam[0:3] != "_HP":
+            cols.append((anam, suffix, _sqltype(adef)))
+    return cols, groups
+
+
+def _bind(val: object) -> object:
+    """
+    Convert attribute value to SQLite bindable value.
+
+    :param object val: attribute value
+    :return: value
+    :rtype: object
+    """
+
+    if isinstance(val, list):  # array of U1
+        return bytes(val)
+    if isinstance(val, int) and not -_INT64 <= val < _INT64:
+        return str(val)
+    return val
+
+
+def _quote(name: str) -> str:
+    """
+    Quote SQL identifier.
+
+    :param str name: identifier
+    :return: quoted identifier
+    :rtype: str
+    """
+
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SQLiteLoader:
+    """
+    SQLiteLoader class.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        identities: tuple | list | NoneType = None,
+        batchsize: int = 10000,
+        spatialite: bool = False,
+    ):
+        """
+        Constructor.
+
+        :param str database: path to SQLite database file (or ':memory:')
+        :param tuple | list | NoneType identities: message identities to load
+            e.g. ("NAV-PVT", "NAV-SAT"), or None for all defined (None)
+        :param int batchsize: number of messages per transaction (10000)
+        :param bool spatialite: add spatialite geometry columns (False)
+        :raises: ParameterError
+        """
+
+        if identities is not None:
+            for identity in identities:
+                if identity not in UBX_PAYLOADS_GET:
+                    raise ParameterError(f"Invalid identity {identity}")
+            identities = frozenset(identities)
+        if batchsize < 1:
+            raise ParameterError(f"Invalid batchsize {batchsize}")
+        self._identities = identities
+        self._batchsize = batchsize
+        self._spatial = spatialite
+        self._tables = {}  # identity: (table, attrs, insert, children, nextid)
+        self._rows = {}  # insert SQL: list of rows
+        self._pending = 0
+        self._count = 0
+        self._rejected = 0
+        self._source = None  # [source id, offset] of current load()
+        self._con = sqlite3.connect(database, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        if spatialite:  # pragma: no cover
+            self._con.enable_load_extension(True)
+            self._con.load_extension("mod_spatialite")
+            if not self._con.execute(
+                "SELECT 1 FROM sqlite_master WHERE name='spatial_ref_sys'"
+            ).fetchone():
+                self._con.execute("SELECT InitSpatialMetaData(1)")
+        self._con.execute(
+            f"CREATE TABLE IF NOT EXISTS {SOURCES} "
+            "(_id INTEGER PRIMARY KEY, path TEXT UNIQUE, "
+            '"offset" INTEGER, size INTEGER)'
+        )
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+
+        Commits any pending rows and closes the database.
+        """
+
+        self.close()
+
+    def _create(self, table: str, meta: list, cols: list) -> list:
+        """
+        Create table if it doesn't exist, adding any columns missing from
+        an existing table (e.g. one created by an earlier pyubx2 version).
+
+        :param str table: table name
+        :param list meta: list of (column, type) metadata columns
+        :param list cols: list of (attribute, suffix, type) columns
+        :return: list of column names
+        :rtype: list
+        """
+
+        names, lower = [], set()
+        for nam in [col for col, _ in meta] + [anam + sfx for anam, sfx, _ in cols]:
+            # column names are case-insensitive (e.g. CFG-NAVX5 minCNO, minCno)
+            while nam.lower() in lower:
+                nam += "_"
+            names.append(nam)
+            lower.add(nam.lower())
+        types = [typ for _, typ in meta] + [typ for _, _, typ in cols]
+        self._con.execute(
+            f"CREATE TABLE IF NOT EXISTS {_quote(table)} ("
+            + ", ".join(f"{_quote(nam)} {typ}" for nam, typ in zip(names, types))
+            + ")"
+        )
+        existing = {
+            row[1].lower()
+            for row in self._con.execute(f"PRAGMA table_info({_quote(table)})")
+        }
+        for nam, typ in zip(names, types):
+            if nam.lower() not in existing:
+                self._con.execute(
+                    f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(nam)} {typ}"
+                )
+        return names
+
+    def _table(self, identity: str) -> list:
+        """
+        Get (or create) table definition for message identity.
+
+        :param str identity: message identity
+        :return: [table, attributes, insert SQL, children, next _id]
+        :rtype: list
+        """
+
+        tbl = self._tables.get(identity, None)
+        if tbl is not None:
+            return tbl
+
+        table = identity.lower().replace("-", "_")
+        cols, groups = _columns(UBX_PAYLOADS_GET[identity])
+        names = self._create(
+            table,
+            [
+                ("_id", "INTEGER PRIMARY KEY"),
+                ("_source", "INTEGER"),
+                ("_offset", "INTEGER"),
+            ],
+            cols,
+        )
+        values = ", ".join("?" * len(names))
+        attrs = [anam + sfx for anam, sfx, _ in cols]
+        if self._spatial and "lat" in attrs and "lon" in attrs:  # pragma: no cover
+            if not self._con.execute(
+                "SELECT 1 FROM geometry_columns WHERE f_table_name=?", (table,)
+            ).fetchone():
+                self._con.execute(
+                    "SELECT AddGeometryColumn(?, 'geom', 4326, 'POINT', 'XY')",
+                    (table,),
+                )
+            names.append("geom")
+            values += ", MakePoint(?, ?, 4326)"
+            attrs += ["lon", "lat"]
+        insert = (
+            f"INSERT INTO {_quote(table)} ("
+            + ", ".join(_quote(nam) for nam in names)
+            + f") VALUES ({values})"
+        )
+        children = []
+        for gnam, gcols in groups:
+            child = f"{table}_{gnam.lower()}"
+            cnames = self._create(
+                child, [("_msg", "INTEGER"), ("_idx", "INTEGER")], gcols
+            )
+            cinsert = (
+                f"INSERT INTO {_quote(child)} ("
+                + ", ".join(_quote(nam) for nam in cnames)
+                + f") VALUES ({', '.join('?' * len(cnames))})"
+            )
+            children.append((cinsert, [(anam, sfx) for anam, sfx, _ in gcols]))
+        nextid = self._con.execute(
+            f"SELECT COALESCE(MAX(_id), 0) + 1 FROM {_quote(table)}"
+        ).fetchone()[0]
+        tbl = [table, attrs, insert, children, nextid]
+        self._tables[identity] = tbl
+        return tbl
+
+    def update(self, raw: bytes, offset: int | NoneType = None) -> bool:
+        """
+        Parse raw UBX message and queue it for insertion if it is one of
+        the selected identities. Rows are committed every 'batchsize'
+        messages, or on flush() or close().
+
+        :param bytes raw: raw UBX message
+        :param int | NoneType offset: byte offset of message in source (None)
+        :return: True if message queued, False if ignored or rejected
+        :rtype: bool
+        """
+
+        identity = raw2identity(raw)
+        if identity not in UBX_PAYLOADS_GET or (
+            self._identities is not None and identity not in self._identities
+        ):
+            return False
+        try:
+            parsed = UBXReader.parse(raw, msgmode=GET, validate=VALCKSUM)
+        except (
+            ube.UBXParseError,
+            ube.UBXMessageError,
+            ube.UBXTypeError,
+        ):
+            self._rejected += 1
+            return False
+
+        tbl = self._table(identity)
+        _, attrs, insert, children, msgid = tbl
+        tbl[4] += 1
+        source = None if self._source is None else self._source[0]
+        self._rows.setdefault(insert, []).append(
+            [msgid, source, offset]
+            + [_bind(getattr(parsed, att, None)) for att in attrs]
+        )
+        for cinsert, gattrs in children:
+            rows = self._rows.setdefault(cinsert, [])
+            anam, sfx = gattrs[0]
+            i = 1
+            while hasattr(parsed, f"{anam}_{i:02d}{sfx}"):
+                rows.append(
+                    [msgid, i]
+                    + [
+                        _bind(getattr(parsed, f"{anam}_{i:02d}{sfx}", None))
+                        for anam, sfx in gattrs
+                    ]
+                )
+                i += 1
+        self._count += 1
+        self._pending += 1
+        if self._pending >= self._batchsize:
+            self.flush()
+        return True
+
+    def flush(self) -> int:
+        """
+        Insert all queued rows (and current source offset) in a single
+        transaction.
+
+        :return: number of messages committed
+        :rtype: int
+        """
+
+        pending = self._pending
+        self._con.execute("BEGIN")
+        try:
+            for insert, rows in self._rows.items():
+                self._con.executemany(insert, rows)
+            if self._source is not None:
+                self._con.execute(
+                    f'UPDATE {SOURCES} SET "offset"=?, size=? WHERE _id=?',
+                    (self._source[1], self._source[2], self._source[0]),
+                )
+            self._con.execute("COMMIT")
+        except sqlite3.Error:
+            self._con.execute("ROLLBACK")
+            raise
+        finally:
+            self._rows = {}
+            self._pending = 0
+        return pending
+
+    def _ingest(self, stream, stopevent: Event | NoneType) -> int:
+        """
+        Read stream and queue each selected message.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event
+        :return: number of messages queued
+        :rtype: int
+        """
+
+        ubr = UBXReader(stream, protfilter=UBX_PROTOCOL, parsing=False)
+        tell = getattr(stream, "tell", None) if self._source is not None else None
+        count = self._count
+        while stopevent is None or not stopevent.is_set():
+            raw_data, _ = ubr.read()
+            if raw_data is None:
+                break
+            if tell is None:
+                self.update(raw_data)
+            else:
+                end = tell()
+                self._source[1] = end
+                self.update(raw_data, end - len(raw_data))
+        return self._count - count
+
+    def load(
+        self, path: str, restart: bool = False, stopevent: Event | NoneType = None
+    ) -> int:
+        """
+        Load selected messages from binary UBX log file, resuming from the
+        offset reached by any previous load of the same file (unless
+        'restart' is set, or the file is now smaller than that offset).
+
+        NB: rows from a previous load are not deleted on restart.
+
+        :param str path: path to log file
+        :param bool restart: ignore stored offset and load from start (False)
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of messages loaded
+        :rtype: int
+        """
+
+        path = os.path.abspath(path)
+        size = os.path.getsize(path)
+        row = self._con.execute(
+            f'SELECT _id, "offset" FROM {SOURCES} WHERE path=?', (path,)
+        ).fetchone()
+        if row is None:
+            cur = self._con.execute(
+                f'INSERT INTO {SOURCES} (path, "offset", size) VALUES (?, 0, ?)',
+                (path, size),
+            )
+            row = (cur.lastrowid, 0)
+        start = 0 if restart or row[1] > size else row[1]
+        self.flush()  # don't commit earlier rows against this source
+        self._source = [row[0], start, size]
+        try:
+            with open(path, "rb") as stream:
+                stream.seek(start)
+                count = self._ingest(stream, stopevent)
+            self.flush()
+        finally:
+            self._source = None
+        return count
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Load selected messages from input stream (e.g. serial or socket)
+        until end of stream or stopevent is set. Not resumable.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of messages loaded
+        :rtype: int
+        """
+
+        count = self._ingest(stream, stopevent)
+        self.flush()
+        return count
+
+    def offset(self, path: str) -> int:
+        """
+        Get offset reached in previous load of file.
+
+        :param str path: path to log file
+        :return: byte offset, or 0 if not previously loaded
+        :rtype: int
+        """
+
+        row = self._con.execute(
+            f'SELECT "offset" FROM {SOURCES} WHERE path=?', (os.path.abspath(path),)
+        ).fetchone()
+        return 0 if row is None else row[0]
+
+    def close(self):
+        """
+        Commit any pending rows and close database. Idempotent.
+        """
+
+        if self._con is not None:
+            self.flush()
+            self._con.close()
+            self._con = None
+
+    @property
+    def connection(self) -> sqlite3.Connection | NoneType:
+        """
+        Getter for database connection.
+
+        :return: connection, or None if closed
+        :rtype: sqlite3.Connection | NoneType
+        """
+
+        return self._con
+
+    @property
+    def tables(self) -> dict:
+        """
+        Getter for tables created or used so far.
+
+        :return: dict of {identity: table name}
+        :rtype: dict
+        """
+
+        return {identity: tbl[0] for identity, tbl in self._tables.items()}
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of messages loaded.
+
+        :return: message count
+        :rtype: int
+        """
+
+        return self._count
+
+    @property
+    def pending(self) -> int:
+        """
+        Getter for number of messages queued but not yet committed.
+
+        :return: pending message count
+        :rtype: int
+        """
+
+        return self._pending
+
+    @property
+    def rejected(self) -> int:
+        """
+        Getter for number of selected messages rejected (e.g. invalid
+        checksum).
+
+        :return: rejected message count
+        :rtype: int
+        """
+
+        return self._rejected
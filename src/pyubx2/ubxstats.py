@@ -0,0 +1,161 @@
+"""
+UBXReaderStats class.
+
+Per-protocol and per-identity counters and decode timings collected
+by UBXReader when instantiated with stats=True:
+
+- frames and bytes read;
+- checksum (or CRC) failures and other parse errors;
+- bytes discarded while resynchronising to a valid header;
+- decode time histograms, in nanoseconds (via time.perf_counter_ns),
+  with power-of-two bucket boundaries.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from pyubx2.ubxhelpers import raw2identity
+from pyubx2.ubxtypes_core import NMEA_PROTOCOL, RTCM3_PROTOCOL, UBX_PROTOCOL
+
+PROTOCOLS = {NMEA_PROTOCOL: "NMEA", UBX_PROTOCOL: "UBX", RTCM3_PROTOCOL: "RTCM3", 0: ""}
+"""Protocol names used as keys in stats snapshot"""
+
+_FRAMES = 0
+_BYTES = 1
+_CHECKSUM = 2
+_ERRORS = 3
+
+
+class UBXReaderStats:
+    """
+    UBXReaderStats class.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self.reset()
+
+    def reset(self):
+        """
+        Reset all counters.
+        """
+
+        self._discarded = 0
+        self._counts = {}  # (protocol, identity): [frames, bytes, checksum, errors]
+        self._timings = {}  # identity: [count, total, min, max, histogram]
+
+    def frame(self, prot: int, raw_data: bytes) -> str:
+        """
+        Record framed message.
+
+        :param int prot: protocol e.g. UBX_PROTOCOL
+        :param bytes raw_data: raw message
+        :return: message identity
+        :rtype: str
+        """
+
+        identity = raw2identity(raw_data)
+        counts = self._counts.get((prot, identity), None)
+        if counts is None:
+            counts = self._counts[(prot, identity)] = [0, 0, 0, 0]
+        counts[_FRAMES] += 1
+        counts[_BYTES] += len(raw_data)
+        return identity
+
+    def decode(self, identity: str, elapsed: int):
+        """
+        Record decode time.
+
+        :param str identity: message identity
+        :param int elapsed: decode time in nanoseconds
+        """
+
+        tim = self._timings.get(identity, None)
+        if tim is None:
+            tim = self._timings[identity] = [0, 0, elapsed, elapsed, {}]
+        tim[0] += 1
+        tim[1] += elapsed
+        tim[2] = min(tim[2], elapsed)
+        tim[3] = max(tim[3], elapsed)
+        bucket = 1 << elapsed.bit_length()  # upper bound of power-of-two bucket
+        tim[4][bucket] = tim[4].get(bucket, 0) + 1
+
+    def error(self, prot: int = 0, identity: str = "UNKNOWN", checksum: bool = False):
+        """
+        Record checksum failure or parse error.
+
+        :param int prot: protocol of frame in error, if known (0)
+        :param str identity: identity of frame in error, if known ("UNKNOWN")
+        :param bool checksum: True if checksum (or CRC) failure (False)
+        """
+
+        counts = self._counts.get((prot, identity), None)
+        if counts is None:
+            counts = self._counts[(prot, identity)] = [0, 0, 0, 0]
+        counts[_CHECKSUM if checksum else _ERRORS] += 1
+
+    def discard(self, size: int = 1):
+        """
+        Record bytes discarded while resynchronising.
+
+        :param int size: number of bytes discarded (1)
+        """
+
+        self._discarded += size
+
+    def snapshot(self) -> dict:
+        """
+        Return snapshot of counters and timings, e.g.::
+
+            {"frames": 10, "bytes": 1234, "checksum": 0, "errors": 0,
+            "discarded": 3, "protocols": {"UBX": {"frames": 8, ...}, ...},
+            "identities": {"NAV-PVT": {"protocol": "UBX", "frames": 2, ...,
+            "decode": {"count": 2, "total_ns": 41000, "mean_ns": 20500,
+            "min_ns": 19000, "max_ns": 22000,
+            "histogram": {32768: 2}}}, ...}}
+
+        Histogram keys are the (exclusive) upper bounds of each bucket
+        in nanoseconds.
+
+        :return: dict of counters
+        :rtype: dict
+        """
+
+        keys = ("frames", "bytes", "checksum", "errors")
+        totals = [0, 0, 0, 0]
+        protocols = {}
+        identities = {}
+        for (prot, identity), counts in self._counts.items():
+            name = PROTOCOLS[prot]
+            if name:
+                pcounts = protocols.setdefault(name, [0, 0, 0, 0])
+            for i, val in enumerate(counts):
+                totals[i] += val
+                if name:
+                    pcounts[i] += val
+            entry = {"protocol": name, **dict(zip(keys, counts))}
+            tim = self._timings.get(identity, None)
+            if tim is not None:
+                entry["decode"] = {
+                    "count": tim[0],
+                    "total_ns": tim[1],
+                    "mean_ns": tim[1] // tim[0],
+                    "min_ns": tim[2],
+                    "max_ns": tim[3],
+                    "histogram": dict(sorted(tim[4].items())),
+                }
+            identities[identity] = entry
+        return {
+            **dict(zip(keys, totals)),
+            "discarded": self._discarded,
+            "protocols": {
+                name: dict(zip(keys, counts)) for name, counts in protocols.items()
+            },
+            "identities": identities,
+        }
@@ -0,0 +1,153 @@
+"""
+FrameTimestamp class.
+
+Receive timestamps attached to each frame by UBXReader when
+instantiated with timestamps=True:
+
+- monotonic and wall-clock time (in nanoseconds, via time.monotonic_ns
+  and time.time_ns) at which the first byte of the frame was read;
+- monotonic and wall-clock time at which the frame was complete.
+
+For navigation messages with an iTOW attribute, latency() gives the
+difference between the time the frame was received and the GPS time
+of the navigation epoch it describes.
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from datetime import datetime, timezone
+from time import monotonic_ns, time_ns
+from types import NoneType
+
+from pyubx2.ubxhelpers import LEAPOFFSET, SIW, utc2itow
+
+_WEEKMS = SIW * 1000  # milliseconds in week
+
+
+class FrameTimestamp:
+    """
+    FrameTimestamp class.
+    """
+
+    __slots__ = ("mono_first", "mono_done", "wall_first", "wall_done")
+
+    def __init__(
+        self,
+        mono_first: int,
+        mono_done: int,
+        wall_first: int,
+        wall_done: int,
+    ):
+        """
+        Constructor.
+
+        :param int mono_first: monotonic time first byte read, in ns
+        :param int mono_done: monotonic time frame complete, in ns
+        :param int wall_first: wall-clock time first byte read, in ns since Unix epoch
+        :param int wall_done: wall-clock time frame complete, in ns since Unix epoch
+        """
+
+        self.mono_first = mono_first
+        self.mono_done = mono_done
+        self.wall_first = wall_first
+        self.wall_done = wall_done
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        :return: representation
+        :rtype: str
+        """
+
+        return (
+            f"FrameTimestamp({self.mono_first}, {self.mono_done}, "
+            f"{self.wall_first}, {self.wall_done})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Equality comparison.
+
+        :param object other: object to compare
+        :return: True if timestamps are equal
+        :rtype: bool
+        """
+
+        return isinstance(other, FrameTimestamp) and all(
+            getattr(self, att) == getattr(other, att) for att in self.__slots__
+        )
+
+    @classmethod
+    def now(cls, mono_first: int | NoneType = None, wall_first: int | NoneType = None):
+        """
+        Create timestamp for frame completing now.
+
+        :param int | NoneType mono_first: monotonic time first byte read,
+            in ns, None = now (None)
+        :param int | NoneType wall_first: wall-clock time first byte read,
+            in ns, None = now (None)
+        :return: timestamp
+        :rtype: FrameTimestamp
+        """
+
+        mono = monotonic_ns()
+        wall = time_ns()
+        return cls(
+            mono if mono_first is None else mono_first,
+            mono,
+            wall if wall_first is None else wall_first,
+            wall,
+        )
+
+    @property
+    def transit(self) -> int:
+        """
+        Getter for time taken to receive frame, from first byte to last.
+
+        :return: receive time in ns
+        :rtype: int
+        """
+
+        return self.mono_done - self.mono_first
+
+    @property
+    def utc(self) -> datetime:
+        """
+        Getter for wall-clock time frame complete, as naive UTC datetime.
+
+        :return: UTC datetime
+        :rtype: datetime
+        """
+
+        return datetime.fromtimestamp(self.wall_done / 1e9, timezone.utc).replace(
+            tzinfo=None
+        )
+
+    def latency(self, parsed_data: object, leaps: int = LEAPOFFSET) -> int | NoneType:
+        """
+        Return latency of navigation message, i.e. the difference between
+        the wall-clock time the frame was complete (converted to GPS time
+        of week using utc2itow) and the message's own iTOW.
+
+        Accuracy depends on the host clock being synchronised to UTC
+        (e.g. via NTP or PPS).
+
+        :param object parsed_data: parsed message
+        :param int leaps: leapsecond offset (18)
+        :return: latency in milliseconds, or None if message has no iTOW
+        :rtype: int | NoneType
+        """
+
+        itow = getattr(parsed_data, "iTOW", None)
+        if itow is None:
+            return None
+        _, rxitow = utc2itow(self.utc, leaps)
+        latency = (rxitow - itow) % _WEEKMS  # allow for week rollover
+        if latency > _WEEKMS // 2:  # message time ahead of host clock
+            latency -= _WEEKMS
+        return latency
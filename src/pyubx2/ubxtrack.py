@@ -0,0 +1,404 @@
+"""
+TrackWriter class.
+
+Writes a GPX 1.1 or KML 2.2 track from raw NAV-PVT, NAV-POSLLH or
+NAV-HPPOSLLH messages, incrementally and with bounded memory, so it is
+suitable for very long (e.g. week-long) vehicle logs.
+
+The track is simplified on-line using a sliding-window Douglas-Peucker
+algorithm: positions are buffered until the window is full (or the
+segment ends), the buffer is simplified so that no discarded position is
+more than 'tolerance' metres (horizontally) from the simplified track, and
+the retained positions are written. The last retained position becomes
+the first of the next window. A tolerance of 0 disables simplification.
+
+A new track segment is started whenever the fix is lost (NAV-PVT with
+gnssFixOK not set or fixType 0, or NAV-HPPOSLLH with invalidLlh set),
+whatever the source identity. NAV-POSLLH and NAV-HPPOSLLH positions are
+dropped while the most recent NAV-PVT message reports no fix.
+
+NAV-PVT positions are timestamped from their UTC date and time fields.
+NAV-POSLLH and NAV-HPPOSLLH positions are timestamped relative to the
+most recent NAV-PVT message, if any.
+
+e.g. convert a log to a KML track simplified to 2 m::
+
+    with open("drive.ubx", "rb") as infile, open("drive.kml", "w") as outfile:
+        with TrackWriter(outfile, fmt="kml", tolerance=2.0) as trk:
+            trk.run(infile)
+
+Created on 18 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2026
+:license: BSD 3-Clause
+"""
+
+from datetime import datetime, timedelta, timezone
+from math import cos, hypot, radians
+from struct import Struct
+from threading import Event
+from types import NoneType
+from xml.sax.saxutils import escape
+
+from pyubx2.exceptions import ParameterError
+from pyubx2.ubxreader import validframes
+
+TRACK_FORMATS = ("gpx", "kml")
+"""Supported track file formats"""
+
+_NAVPVT = (b"\x01\x07",)  # NAV-PVT class and id
+_PVT = Struct("<LHBBBBBB4xiBB2xiiii")  # iTOW, date & time, valid, nano, fix, pos
+_POSLLH = Struct("<Liiii")  # iTOW, lon, lat, height, hMSL
+_HPLLH = Struct("<3xBLiiiibbbb")  # flags, iTOW, lon, lat, height, hMSL, HP
+_SOURCES = {
+    "NAV-PVT": _NAVPVT,
+    "NAV-POSLLH": (b"\x01\x02",),
+    "NAV-HPPOSLLH": (b"\x01\x14",),
+}
+_RADIUS = 6371008.8  # mean Earth radius in metres
+_GPX_NS = (
+    'xmlns="http://www.topografix.com/GPX/1/1" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xsi:schemaLocation="http://www.topografix.com/GPX/1/1 '
+    'http://www.topografix.com/GPX/1/1/gpx.xsd"'
+)
+
+
+def _simplify(points: list, tolerance: float) -> list:
+    """
+    Simplify polyline using Douglas-Peucker algorithm, with point-to-segment
+    distances calculated on a local plane through the first point.
+
+    :param list points: list of (lat, lon, ...) tuples
+    :param float tolerance: tolerance in metres
+    :return: list of retained points, including first and last
+    :rtype: list
+    """
+
+    lat0 = points[0][0]
+    scale = radians(1) * _RADIUS
+    xscale = scale * cos(radians(lat0))
+    xys = [
+        ((pnt[1] - points[0][1]) * xscale, (pnt[0] - lat0) * scale) for pnt in points
+    ]
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = xys[first], xys[last]
+        dx, dy = x2 - x1, y2 - y1
+        seglen2 = dx * dx + dy * dy
+        dmax, imax = 0.0, 0
+        for i in range(first + 1, last):
+            px, py = xys[i]
+            # distance to segment, not line, so that tolerance holds
+            # for points beyond either end (e.g. stationary jitter)
+            t = 0.0
+            if seglen2:
+                t = min(1.0, max(0.0, ((px - x1) * dx + (py - y1) * dy) / seglen2))
+            dist = hypot(px - x1 - t * dx, py - y1 - t * dy)
+            if dist > dmax:
+                dmax, imax = dist, i
+        if dmax > tolerance:
+            keep[imax] = True
+            stack.append((first, imax))
+            stack.append((imax, last))
+    return [pnt for pnt, kept in zip(points, keep) if kept]
+
+
+class TrackWriter:
+    """
+    TrackWriter class.
+    """
+
+    def __init__(
+        self,
+        stream,
+        fmt: str = "gpx",
+        identity: str = "NAV-PVT",
+        tolerance: float = 1.0,
+        window: int = 500,
+        name: str = "pyubx2 track",
+    ):
+        """
+        Constructor.
+
+        :param stream stream: output text stream (supporting write(str))
+        :param str fmt: track file format - "gpx" or "kml" ("gpx")
+        :param str identity: source of positions - "NAV-PVT", "NAV-POSLLH"
+            or "NAV-HPPOSLLH" ("NAV-PVT")
+        :param float tolerance: simplification tolerance in metres, 0 = none (1.0)
+        :param int window: maximum number of positions buffered for
+            simplification (500)
+        :param str name: track name ("pyubx2 track")
+        :raises: ParameterError if format, identity or window are invalid
+        """
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+        if fmt not in TRACK_FORMATS:
+            raise ParameterError(
+                f"Invalid format {fmt} - must be one of {TRACK_FORMATS}"
+            )
+        if identity not in _SOURCES:
+            raise ParameterError(
+                f"Invalid identity {identity} - must be one of {list(_SOURCES)}"
+            )
+        if not isinstance(window, int) or window < 3:
+            raise ParameterError(f"Invalid window {window} - must be integer > 2")
+        self._stream = stream
+        self._fmt = fmt
+        self._identity = identity
+        self._msgids = _SOURCES[identity]
+        self._tolerance = tolerance
+        self._window = window
+        self._name = name
+        self._places = 9 if identity == "NAV-HPPOSLLH" else 7
+        self._buffer = []  # (lat, lon, ele, time) of buffered positions
+        self._carried = False  # first buffered position already written
+        self._pvttime = None  # (iTOW, datetime) of latest NAV-PVT
+        self._pvtfix = True  # latest NAV-PVT (if any) reports fix
+        self._started = False  # header written
+        self._insegment = False
+        self._closed = False
+        self._count = 0
+        self._written = 0
+        self._segments = 0
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def write(self, raw_data: bytes) -> bool:
+        """
+        Add position from raw NAV-PVT, NAV-POSLLH or NAV-HPPOSLLH message
+        (according to the source identity). NAV-PVT messages are also used
+        to timestamp other positions and to end the track segment when the
+        fix is lost. Any other message is ignored.
+
+        :param bytes raw_data: raw UBX message
+        :return: True if position added, False if not
+        :rtype: bool
+        """
+
+        if self._closed:
+            return False
+        msgid = raw_data[2:4]
+        time = None
+        if msgid in _NAVPVT and len(raw_data) >= _PVT.size + 8:
+            itow, *dtm, valid, nano, fix, flags, lon, lat, _, hmsl = _PVT.unpack_from(
+                raw_data, 6
+            )
+            if valid & 3 == 3:  # validDate, validTime
+                time = datetime(*dtm[:5]) + timedelta(
+                    seconds=dtm[5], milliseconds=round(nano / 1e6)
+                )
+                self._pvttime = (itow, time)
+            self._pvtfix = bool(flags & 1) and fix != 0  # gnssFixOK
+            if not self._pvtfix:
+                self._endsegment()
+                return False
+            if msgid not in self._msgids:
+                return False
+            pos = (lat * 1e-7, lon * 1e-7, hmsl / 1000)
+        elif msgid not in self._msgids or not self._pvtfix:
+            return False
+        elif self._identity == "NAV-POSLLH" and len(raw_data) >= _POSLLH.size + 8:
+            itow, lon, lat, _, hmsl = _POSLLH.unpack_from(raw_data, 6)
+            pos = (lat * 1e-7, lon * 1e-7, hmsl / 1000)
+        elif self._identity == "NAV-HPPOSLLH" and len(raw_data) >= _HPLLH.size + 8:
+            flags, itow, lon, lat, _, hmsl, lonhp, lathp, _, hmslhp = (
+                _HPLLH.unpack_from(raw_data, 6)
+            )
+            if flags & 1:  # invalidLlh
+                self._endsegment()
+                return False
+            pos = (
+                lat * 1e-7 + lathp * 1e-9,
+                lon * 1e-7 + lonhp * 1e-9,
+                (hmsl + hmslhp / 10) / 1000,
+            )
+        else:
+            return False
+
+        if time is None and self._pvttime is not None:
+            time = self._pvttime[1] + timedelta(milliseconds=itow - self._pvttime[0])
+        self._count += 1
+        self._buffer.append(pos + (time,))
+        if self._tolerance <= 0 or len(self._buffer) >= self._window:
+            self._flush()
+        return True
+
+    def _flush(self, final: bool = False):
+        """
+        Simplify and write buffered positions. Unless this is the end of the
+        segment, the last retained position is kept as the start of the
+        next window.
+
+        :param bool final: end of segment (False)
+        """
+
+        buf = self._buffer
+        if not buf:
+            return
+        points = buf if self._tolerance <= 0 else _simplify(buf, self._tolerance)
+        if not self._insegment:
+            self._startsegment()
+        if self._carried:
+            points = points[1:]
+        self._carried = self._tolerance > 0 and not final
+        self._buffer = [buf[-1]] if self._carried else []
+        self._stream.write("".join(self._point(*pnt) for pnt in points))
+        self._written += len(points)
+
+    def _point(self, lat: float, lon: float, ele: float, time: datetime | NoneType):
+        """
+        Format track point.
+
+        :param float lat: latitude in degrees
+        :param float lon: longitude in degrees
+        :param float ele: height above mean sea level in metres
+        :param datetime | NoneType time: UTC time, None = unknown
+        :return: formatted track point
+        :rtype: str
+        """
+
+        plc = self._places
+        if self._fmt == "kml":
+            return f"{lon:.{plc}f},{lat:.{plc}f},{ele:.3f}\n"
+        tstr = ""
+        if time is not None:
+            spec = "milliseconds" if time.microsecond else "seconds"
+            tstr = f"<time>{time.isoformat(timespec=spec)}Z</time>"
+        return (
+            f'<trkpt lat="{lat:.{plc}f}" lon="{lon:.{plc}f}">'
+            f"<ele>{ele:.3f}</ele>{tstr}</trkpt>\n"
+        )
+
+    def _header(self):
+        """
+        Write track file header.
+        """
+
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        hdr = '<?xml version="1.0" encoding="UTF-8"?>\n'
+        if self._fmt == "kml":
+            hdr += (
+                '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+                f"<name>{escape(self._name)}</name>\n"
+            )
+        else:
+            hdr += (
+                f'<gpx version="1.1" creator="pyubx2" {_GPX_NS}>'
+                f"<metadata><time>{now}</time></metadata>"
+                f"<trk><name>{escape(self._name)}</name>\n"
+            )
+        self._stream.write(hdr)
+        self._started = True
+
+    def _startsegment(self):
+        """
+        Write track segment opening tags.
+        """
+
+        if not self._started:
+            self._header()
+        self._segments += 1
+        if self._fmt == "kml":
+            self._stream.write(
+                f"<Placemark><name>Segment {self._segments}</name><LineString>"
+                "<altitudeMode>absolute</altitudeMode><coordinates>\n"
+            )
+        else:
+            self._stream.write("<trkseg>\n")
+        self._insegment = True
+
+    def _endsegment(self):
+        """
+        Write any buffered positions and end current track segment.
+        """
+
+        self._flush(True)
+        if not self._insegment:
+            return
+        if self._fmt == "kml":
+            self._stream.write("</coordinates></LineString></Placemark>\n")
+        else:
+            self._stream.write("</trkseg>\n")
+        self._insegment = False
+
+    def run(self, stream, stopevent: Event | NoneType = None) -> int:
+        """
+        Read input stream and add position from each valid source message
+        until end of stream or stopevent is set. The track is not closed.
+
+        :param stream stream: input data stream
+        :param Event | NoneType stopevent: stop event (None)
+        :return: number of positions added
+        :rtype: int
+        """
+
+        count = 0
+        for raw_data in validframes(stream, self._msgids + _NAVPVT, stopevent):
+            count += self.write(raw_data)
+        return count
+
+    def close(self):
+        """
+        Write any buffered positions and close track. Further positions
+        are ignored.
+        """
+
+        if self._closed:
+            return
+        self._endsegment()
+        if not self._started:
+            self._header()
+        self._stream.write(
+            "</Document></kml>\n" if self._fmt == "kml" else "</trk></gpx>\n"
+        )
+        self._closed = True
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of positions added.
+
+        :return: number of positions
+        :rtype: int
+        """
+
+        return self._count
+
+    @property
+    def written(self) -> int:
+        """
+        Getter for number of positions written after simplification.
+
+        :return: number of positions
+        :rtype: int
+        """
+
+        return self._written
+
+    @property
+    def segments(self) -> int:
+        """
+        Getter for number of track segments.
+
+        :return: number of segments
+        :rtype: int
+        """
+
+        return self._segments
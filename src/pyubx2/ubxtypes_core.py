@@ -34,6 +34,34 @@ ERR_LOG = 1
 """Log errors"""
 ERR_IGNORE = 0
 """Ignore errors"""
+EPOCH_EOE = "eoe"
+"""Epoch terminated by NAV-EOE"""
+EPOCH_BOUNDARY = "boundary"
+"""Epoch terminated by arrival of later epoch"""
+EPOCH_TIMEOUT = "timeout"
+"""Epoch terminated by timeout"""
+EPOCH_OVERFLOW = "overflow"
+"""Epoch terminated because too many epochs pending"""
+EPOCH_FLUSH = "flush"
+"""Epoch terminated by explicit flush"""
+SAT_ACQUIRED = "acquired"
+"""Signal reported for first time or after being lost"""
+SAT_LOST = "lost"
+"""Signal no longer reported"""
+SAT_HEALTH = "health"
+"""Signal health changed"""
+SAT_SLIP = "slip"
+"""Signal carrier phase lock time decreased"""
+DROP_OLDEST = 0
+"""Queue overflow policy - discard oldest queued message"""
+DROP_NEWEST = 1
+"""Queue overflow policy - discard incoming message"""
+DROP_COALESCE = 2
+"""Queue overflow policy - replace queued message of same identity"""
+TS_MAGIC = b"UBXTS"
+"""Timestamped recording file signature"""
+TS_VERSION = 1
+"""Timestamped recording format version"""
 
 # scaling factor constants
 SCAL9 = 1e-9  # 0.000000001
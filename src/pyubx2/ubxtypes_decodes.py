@@ -486,6 +486,58 @@ GNSS, Signal ID from UBX-NAV-SIG
  - key is (gnssId, sigId)
 """
 
+RINEXSYS = {
+    0: "G",
+    1: "S",
+    2: "E",
+    3: "C",
+    5: "J",
+    6: "R",
+    7: "I",
+}
+"""RINEX satellite system identifier from GNSS code"""
+
+RINEXSIG = {
+    (0, 0): "1C",
+    (0, 3): "2L",
+    (0, 4): "2S",
+    (0, 6): "5I",
+    (0, 7): "5Q",
+    (1, 0): "1C",
+    (2, 0): "1C",
+    (2, 1): "1B",
+    (2, 3): "5I",
+    (2, 4): "5Q",
+    (2, 5): "7I",
+    (2, 6): "7Q",
+    (2, 8): "6B",
+    (2, 9): "6C",
+    (3, 0): "2I",
+    (3, 1): "2I",
+    (3, 2): "7I",
+    (3, 3): "7I",
+    (3, 4): "6I",
+    (3, 5): "1P",
+    (3, 6): "1D",
+    (3, 7): "5P",
+    (3, 8): "5D",
+    (3, 10): "6I",
+    (5, 0): "1C",
+    (5, 1): "1Z",
+    (5, 4): "2S",
+    (5, 5): "2L",
+    (5, 8): "5I",
+    (5, 9): "5Q",
+    (5, 12): "1E",
+    (6, 0): "1C",
+    (6, 2): "2C",
+    (7, 0): "5A",
+}
+"""
+RINEX 3 observation code (frequency band and attribute) from UBX-RXM-RAWX
+ - key is (gnssId, sigId)
+"""
+
 # UBX-NAV-STATUS
 SPOOFDETSTATE = {
     0: "unknown or deactivated",
@@ -557,3 +609,23 @@ ESFALG_STATUS = {
     4: ("FINEUSED", "fine IMU-mount alignment are used"),
 }
 """status from ESF-ALG"""
+
+ESFDATATYPE = {
+    5: ("GYRO_Z", 2**-12, "deg/s"),
+    6: ("WT_FL", 1, "ticks"),
+    7: ("WT_FR", 1, "ticks"),
+    8: ("WT_RL", 1, "ticks"),
+    9: ("WT_RR", 1, "ticks"),
+    10: ("SPEED_TICK", 1, "ticks"),
+    11: ("SPEED", 1e-3, "m/s"),
+    12: ("GYRO_TEMP", 1e-2, "deg C"),
+    13: ("GYRO_Y", 2**-12, "deg/s"),
+    14: ("GYRO_X", 2**-12, "deg/s"),
+    16: ("ACCEL_X", 2**-10, "m/s^2"),
+    17: ("ACCEL_Y", 2**-10, "m/s^2"),
+    18: ("ACCEL_Z", 2**-10, "m/s^2"),
+}
+"""
+ESF-MEAS and ESF-RAW sensor data types (name, scale factor, unit).
+Wheel tick types 6-10 are unsigned 23-bit counts plus direction bit.
+"""
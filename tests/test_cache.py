@@ -0,0 +1,99 @@
+"""
+LatestMessageCache tests for pyubx2.ubxcache
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from threading import Event, Thread
+
+from pyubx2 import GET, POLL, LatestMessageCache, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testcache(self):
+        cache = LatestMessageCache()
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            count = cache.run(UBXReader(stream))
+        self.assertEqual(count, cache.lastseq)
+        self.assertIn("NAV-PVT", cache)
+        self.assertIn("GPGGA", cache)
+        self.assertNotIn("NAV-XXX", cache)
+        self.assertEqual(len(cache), len(cache.identities))
+        pvt = cache.get("NAV-PVT")
+        self.assertEqual(pvt.identity, "NAV-PVT")
+        self.assertEqual(cache.getraw("NAV-PVT"), pvt.serialize())
+        self.assertGreater(cache.sequence("NAV-PVT"), 0)
+        self.assertGreaterEqual(cache.age("NAV-PVT"), 0)
+        self.assertIsNone(cache.get("NAV-XXX"))
+        self.assertIsNone(cache.getraw("NAV-XXX"))
+        self.assertIsNone(cache.age("NAV-XXX"))
+        self.assertEqual(cache.sequence("NAV-XXX"), 0)
+        self.assertIsNone(cache.get("NAV-PVT", maxage=-1))
+        self.assertEqual(cache.get("NAV-PVT", maxage=60), pvt)
+
+    def testcachelazy(self):
+        cache = LatestMessageCache(lazy=True)
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            ubr = UBXReader(stream, parsing=False)
+            cache.run(ubr)
+        snap = cache.snapshot()
+        self.assertEqual(set(snap), set(cache.identities))
+        for idn, msg in snap.items():
+            self.assertEqual(msg.identity, idn)
+            self.assertIs(cache.get(idn), msg)  # decoded once then retained
+        self.assertEqual(list(cache.snapshot("1077", "XXX")), ["1077"])
+
+    def testcacheupdate(self):
+        cache = LatestMessageCache()
+        msg1 = UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=1000)
+        msg2 = UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=2000)
+        seq1 = cache.update(msg1.serialize(), msg1)
+        seq2 = cache.update(msg2.serialize())  # identity derived from raw
+        self.assertEqual((seq1, seq2), (1, 2))
+        self.assertEqual(cache.sequence("NAV-CLOCK"), 2)
+        self.assertEqual(cache.get("NAV-CLOCK").iTOW, 2000)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.update(msg1.serialize(), msg1), 3)
+
+    def testcachemsgmode(self):
+        cache = LatestMessageCache(lazy=True, msgmode=POLL)
+        msg = UBXMessage("NAV", "NAV-PVT", POLL)
+        cache.update(msg.serialize(), msg)
+        self.assertEqual(cache.get("NAV-PVT").msgmode, POLL)
+
+    def testcachestop(self):
+        cache = LatestMessageCache()
+        stop = Event()
+        stop.set()
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            self.assertEqual(cache.run(UBXReader(stream), stop), 0)
+
+    def testcachethreaded(self):
+        cache = LatestMessageCache(lazy=True)
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            thd = Thread(target=cache.run, args=(UBXReader(stream, parsing=False),))
+            thd.start()
+            thd.join()
+        self.assertEqual(cache.get("NAV-SAT").identity, "NAV-SAT")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Change-only emission mode tests for pyubx2.ubxreader
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+from time import sleep
+
+from pyubx2 import GET, RTCM3_PROTOCOL, UBX_PROTOCOL, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+TXT = b"$GNTXT,01,01,02,ANTSTATUS=OK*25\r\n"
+
+
+def timels(itow: int, currls: int = 18) -> bytes:
+    return UBXMessage("NAV", "NAV-TIMELS", GET, iTOW=itow, currLs=currls).serialize()
+
+
+def monhw(agc: int) -> bytes:
+    return UBXMessage("MON", "MON-HW", GET, agcCnt=agc).serialize()
+
+
+def cfgrate(rate: int) -> bytes:
+    return UBXMessage("CFG", "CFG-RATE", GET, measRate=rate).serialize()
+
+
+class ChangeOnlyTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.data = (
+            timels(1000)
+            + monhw(1)
+            + TXT
+            + cfgrate(1000)
+            + timels(2000)  # unchanged apart from iTOW
+            + monhw(1)  # unchanged
+            + TXT  # unchanged
+            + cfgrate(1000)  # unchanged
+            + timels(3000, 19)  # changed
+            + monhw(2)  # changed
+            + cfgrate(200)  # changed
+            + monhw(2)  # unchanged
+        )
+
+    def tearDown(self):
+        pass
+
+    def testchangeonly(self):
+        ubr = UBXReader(
+            BytesIO(self.data), changeonly=("NAV-TIMELS", "MON-HW", "GNTXT", "CFG-*")
+        )
+        res = [(parsed.identity, getattr(parsed, "iTOW", None)) for _, parsed in ubr]
+        self.assertEqual(
+            res,
+            [
+                ("NAV-TIMELS", 1000),
+                ("MON-HW", None),
+                ("GNTXT", None),
+                ("CFG-RATE", None),
+                ("NAV-TIMELS", 3000),
+                ("MON-HW", None),
+                ("CFG-RATE", None),
+            ],
+        )
+        self.assertEqual(
+            ubr.unchanged, {"NAV-TIMELS": 1, "MON-HW": 2, "GNTXT": 1, "CFG-RATE": 1}
+        )
+
+    def testchangeonlyfiltered(self):  # only listed identities are suppressed
+        ubr = UBXReader(BytesIO(self.data), changeonly=("MON-HW",), parsing=False)
+        self.assertEqual(len(list(ubr)), 10)
+        self.assertEqual(ubr.unchanged, {"MON-HW": 2})
+        ubr = UBXReader(BytesIO(self.data), protfilter=UBX_PROTOCOL, changeonly=("*",))
+        self.assertEqual(len(list(ubr)), 6)
+        self.assertEqual(UBXReader(BytesIO(self.data)).unchanged, {})
+
+    def testchangerefresh(self):
+        data = monhw(1) * 2
+        ubr = UBXReader(BytesIO(data), changeonly=("*",), changerefresh=0.05)
+        self.assertIsNotNone(ubr.read()[0])
+        self.assertIsNone(ubr.read()[0])  # suppressed, end of stream
+        self.assertEqual(ubr.unchanged, {"MON-HW": 1})
+        ubr = UBXReader(BytesIO(data), changeonly=("*",), changerefresh=0.05)
+        self.assertIsNotNone(ubr.read()[0])
+        sleep(0.06)
+        self.assertIsNotNone(ubr.read()[0])  # refreshed
+        self.assertEqual(ubr.unchanged, {})
+
+    def testchangeonlyrtcm(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            rtcm = [raw for raw, _ in UBXReader(stream, protfilter=RTCM3_PROTOCOL)]
+        ubr = UBXReader(
+            BytesIO(rtcm[0] * 3 + rtcm[1]),
+            changeonly=("*",),
+            protfilter=RTCM3_PROTOCOL,
+        )
+        self.assertEqual([raw for raw, _ in ubr], [rtcm[0], rtcm[1]])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Compressed stream tests for pyubx2.ubxcompress
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import unittest
+from io import BytesIO
+from time import sleep
+
+from pyubx2 import ERR_RAISE, CompressedStream, UBXReader, UBXStreamError
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class CompressTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            self.data = stream.read()
+            stream.seek(0)
+            self.expected = [str(parsed) for _, parsed in UBXReader(stream)]
+
+    def tearDown(self):
+        pass
+
+    def testformats(self):
+        for compression, compress in (
+            ("gzip", gzip.compress),
+            ("bz2", bz2.compress),
+            ("xz", lzma.compress),
+            (None, bytes),
+        ):
+            for readahead in (0, 4):
+                with self.subTest(compression=compression, readahead=readahead):
+                    with CompressedStream(
+                        BytesIO(compress(self.data)), chunksize=100, readahead=readahead
+                    ) as stream:
+                        self.assertEqual(stream.compression, compression)
+                        res = [str(parsed) for _, parsed in UBXReader(stream)]
+                    self.assertEqual(res, self.expected)
+
+    def testpath(self):  # multi-member file opened by path
+        fd, path = tempfile.mkstemp(suffix=".ubx.gz")
+        with os.fdopen(fd, "wb") as outfile:
+            outfile.write(gzip.compress(self.data[:1000]))
+            outfile.write(gzip.compress(self.data[1000:]))
+        try:
+            with CompressedStream(path, chunksize=256) as stream:
+                res = [str(parsed) for _, parsed in UBXReader(stream)]
+            self.assertEqual(res, self.expected)
+        finally:
+            os.remove(path)
+
+    def testread(self):
+        data = b"\x00\x01$GPTXT,01\r\n\xb5b" * 100 + b"$GPTXT,noeol"
+        with CompressedStream(BytesIO(bz2.compress(data)), chunksize=50) as stream:
+            self.assertEqual(stream.peek(), data[: len(stream.peek())])
+            self.assertEqual(stream.read(2), b"\x00\x01")
+            self.assertEqual(stream.readline(), b"$GPTXT,01\r\n")
+            self.assertEqual(len(stream.peek(1500)), len(data) - 13)
+            self.assertEqual(stream.read(-1), data[13:])
+            self.assertEqual(stream.readline(), b"")
+        with CompressedStream(BytesIO(bz2.compress(data[-30:])), readahead=0) as stream:
+            stream.read(18)
+            self.assertEqual(stream.readline(), b"$GPTXT,noeol")
+            self.assertEqual(stream.read(1), b"")
+
+    def testcorrupt(self):
+        data = bytearray(gzip.compress(self.data))
+        data[100:110] = b"\xff" * 10
+        for readahead in (0, 4):
+            with self.subTest(readahead=readahead):
+                with CompressedStream(BytesIO(data), readahead=readahead) as stream:
+                    with self.assertRaisesRegex(
+                        UBXStreamError, "Invalid gzip compressed data"
+                    ):
+                        for _ in UBXReader(stream, quitonerror=ERR_RAISE):
+                            pass
+
+    def testclose(self):  # close with read-ahead thread blocked on full queue
+        stream = CompressedStream(
+            BytesIO(gzip.compress(self.data * 10)), chunksize=10, readahead=1
+        )
+        stream.read(10)
+        sleep(0.1)
+        stream.close()
+        self.assertFalse(stream._thread.is_alive())
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
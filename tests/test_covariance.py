@@ -0,0 +1,103 @@
+"""
+NAV-COV and NAV-EELL covariance tests for pyubx2.ubxcovariance
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from math import isnan
+
+from pyubx2 import (
+    GET,
+    CovarianceStack,
+    ParameterError,
+    UBXMessage,
+    UBXReader,
+    navcov,
+    naveell,
+)
+
+DIRNAME = os.path.dirname(__file__)
+ELEMENTS = ("NN", "NE", "ND", "NE", "EE", "ED", "ND", "ED", "DD")
+
+
+class CovarianceTest(unittest.TestCase):
+    def testNAVCOV(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV-ZED-X20P.log"), "rb") as stream:
+            msgs = [
+                (raw, parsed)
+                for raw, parsed in UBXReader(stream, protfilter=2)
+                if parsed.identity == "NAV-COV"
+            ]
+        self.assertEqual(len(msgs), 2)
+        for raw, parsed in msgs:
+            itow, pos, vel = navcov(raw)
+            self.assertEqual(itow, parsed.iTOW)
+            for i, name in enumerate(ELEMENTS):
+                self.assertEqual(pos[i // 3][i % 3], getattr(parsed, f"posCov{name}"))
+                self.assertEqual(vel[i // 3][i % 3], getattr(parsed, f"velCov{name}"))
+        self.assertIsNone(navcov(b"\xb5b\x01\x07\x00\x00"))
+        self.assertIsNone(navcov(msgs[0][0][:40]))
+        raw = UBXMessage(
+            "NAV", "NAV-COV", GET, iTOW=1000, posCovValid=1, posCovNN=1.5
+        ).serialize()
+        self.assertEqual(navcov(raw), (1000, ((1.5, 0, 0), (0, 0, 0), (0, 0, 0)), None))
+
+    def testNAVEELL(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            msgs = [
+                (raw, parsed)
+                for raw, parsed in UBXReader(stream, protfilter=2)
+                if parsed.identity == "NAV-EELL"
+            ]
+        for raw, parsed in msgs:
+            self.assertEqual(
+                naveell(raw),
+                (
+                    parsed.iTOW,
+                    parsed.errEllipseOrient,
+                    parsed.errEllipseMajor,
+                    parsed.errEllipseMinor,
+                ),
+            )
+        self.assertIsNone(naveell(msgs[0][0][:12]))
+
+    def testStack(self):
+        stack = CovarianceStack()
+        for log in ("pygpsdata-NAV-ZED-X20P.log", "pygpsdata-NAV.log"):
+            with open(os.path.join(DIRNAME, log), "rb") as stream:
+                self.assertEqual(stack.run(stream), 2)
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV-ZED-X20P.log"), "rb") as stream:
+            covs = [navcov(raw) for raw, _ in UBXReader(stream, protfilter=2)]
+        covs = [cov for cov in covs if cov is not None]
+        stack.update(UBXMessage("NAV", "NAV-COV", GET, iTOW=3000).serialize())
+        self.assertFalse(stack.update(b"\xb5b\x01\x07\x00\x00"))
+        self.assertEqual(len(stack), 4)
+        self.assertEqual(len(stack.poscov), 36)
+        self.assertEqual(len(stack.velcov), 36)
+        self.assertEqual(len(stack.eell), 3)
+        self.assertEqual(len(stack.eellitow), 1)
+        self.assertEqual(stack.matrices(1), covs[1])
+        self.assertEqual(stack.covitow.tolist()[:2], [cov[0] for cov in covs])
+        itow, pos, vel = stack.matrices(0)
+        self.assertEqual(vel[2][0], vel[0][2])  # symmetric
+        itow, pos, vel = stack.matrices()
+        self.assertEqual(itow, 3000)
+        self.assertTrue(isnan(pos[1][1]) and isnan(vel[2][2]))  # invalid
+        self.assertEqual(stack.eell.tolist(), [160.23, 3162, 1933])
+        with self.assertRaisesRegex(ParameterError, "Epoch 4 not held - 4 available"):
+            stack.matrices(4)
+        stack.clear()
+        self.assertEqual((len(stack), len(stack.eell)), (0, 0))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
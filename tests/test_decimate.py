@@ -0,0 +1,105 @@
+"""
+Per-identity decimation tests for pyubx2.ubxreader
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from pyubx2 import GET, SIW, UBXMessage, UBXReader
+
+TXT = b"$GNTXT,01,01,02,ANTSTATUS=OK*25\r\n"
+
+
+def navpvt(itow: int) -> bytes:
+    return UBXMessage("NAV", "NAV-PVT", GET, iTOW=itow).serialize()
+
+
+def navsat(itow: int) -> bytes:
+    return UBXMessage("NAV", "NAV-SAT", GET, iTOW=itow).serialize()
+
+
+def monhw(agc: int) -> bytes:
+    return UBXMessage("MON", "MON-HW", GET, agcCnt=agc).serialize()
+
+
+class DecimateTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        # 20 Hz NAV-PVT, 1 Hz NAV-SAT, 1 Hz MON-HW & NMEA over 3 seconds
+        self.data = b""
+        for itow in range(0, 3000, 50):
+            self.data += navpvt(itow)
+            if not itow % 1000:
+                self.data += navsat(itow) + monhw(itow // 1000) + TXT
+
+    def tearDown(self):
+        pass
+
+    def testdecimate(self):
+        ubr = UBXReader(BytesIO(self.data), decimate={"NAV-PVT": 20, "GNTXT": 2})
+        res = [(parsed.identity, getattr(parsed, "iTOW", None)) for _, parsed in ubr]
+        self.assertEqual(
+            [r for r in res if r[0] == "NAV-PVT"],
+            [("NAV-PVT", 0), ("NAV-PVT", 1000), ("NAV-PVT", 2000)],
+        )
+        self.assertEqual(len([r for r in res if r[0] == "NAV-SAT"]), 3)
+        self.assertEqual(len([r for r in res if r[0] == "GNTXT"]), 2)
+        self.assertEqual(ubr.decimated, {"NAV-PVT": 57, "GNTXT": 1})
+        self.assertEqual(UBXReader(BytesIO(self.data)).decimated, {})
+
+    def testthrottle(self):
+        ubr = UBXReader(
+            BytesIO(self.data),
+            throttle={"NAV-PVT": 0.5, "NAV-SAT": 2},
+            parsing=False,
+        )
+        res = [raw for raw, _ in ubr]
+        self.assertEqual(
+            [raw for raw in res if raw[2:4] == b"\x01\x07"],
+            [navpvt(itow) for itow in range(0, 3000, 500)],
+        )
+        self.assertEqual(
+            [raw for raw in res if raw[2:4] == b"\x01\x35"], [navsat(0), navsat(2000)]
+        )
+        self.assertEqual(ubr.decimated, {"NAV-PVT": 54, "NAV-SAT": 1})
+
+    def testthrottleweekrollover(self):
+        data = navpvt(604799000) + navpvt(604799500) + navpvt(0) + navpvt(500)
+        ubr = UBXReader(BytesIO(data), throttle={"NAV-PVT": 1})
+        self.assertEqual([parsed.iTOW for _, parsed in ubr], [604799000, 0])
+
+    def testthrottleuntimed(self):  # no iTOW, throttled by time of receipt
+        data = monhw(1) * 2
+        clock = [100.0]
+        with patch("pyubx2.ubxreader.monotonic", lambda: clock[0]):
+            ubr = UBXReader(BytesIO(data), throttle={"MON-HW": 0.05})
+            self.assertIsNotNone(ubr.read()[0])
+            clock[0] += 0.04
+            self.assertIsNone(ubr.read()[0])  # suppressed, end of stream
+            self.assertEqual(ubr.decimated, {"MON-HW": 1})
+            for gap in (0.06, SIW + 0.01):  # no week rollover for time of receipt
+                ubr = UBXReader(BytesIO(data), throttle={"MON-HW": 0.05})
+                self.assertIsNotNone(ubr.read()[0])
+                clock[0] += gap
+                self.assertIsNotNone(ubr.read()[0])
+
+    def testdecimatechangeonly(self):
+        data = (monhw(1) + monhw(1) + monhw(1)) * 2
+        ubr = UBXReader(BytesIO(data), decimate={"MON-HW": 2}, changeonly=("MON-HW",))
+        self.assertEqual(len(list(ubr)), 1)
+        self.assertEqual(ubr.decimated, {"MON-HW": 3})
+        self.assertEqual(ubr.unchanged, {"MON-HW": 2})
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+UBXDispatcher tests for pyubx2.ubxdispatcher
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import asyncio
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from pyubx2 import (
+    ERR_IGNORE,
+    ERR_LOG,
+    ERR_RAISE,
+    GET,
+    NMEA_PROTOCOL,
+    RTCM3_PROTOCOL,
+    UBX_PROTOCOL,
+    ParameterError,
+    UBXDispatcher,
+    UBXMessage,
+    UBXParseError,
+    UBXReader,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class DispatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.stream = open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb")
+        self.received = []
+
+    def tearDown(self):
+        self.stream.close()
+
+    def handler(self, raw, parsed):
+        self.received.append(parsed.identity)
+
+    def testdispatchidentity(self):
+        dsp = UBXDispatcher(UBXReader(self.stream, parsing=False))
+        dsp.subscribe(self.handler, identity="NAV-PVT")
+        dsp.subscribe(self.handler, identity="1077")
+        dsp.subscribe(self.handler, identity="GNRMC")
+        count = dsp.run()
+        self.assertEqual(count, 10)
+        self.assertEqual(self.received, ["1077", "NAV-PVT", "GNRMC"])
+        self.assertEqual(dsp.decoded, 3)
+        self.assertEqual(dsp.skipped, 7)
+
+    def testdispatchclassprotocol(self):
+        dsp = UBXDispatcher(UBXReader(self.stream, parsing=False))
+        dsp.subscribe(self.handler, msgclass="NAV")
+        subid = dsp.subscribe(self.handler, protfilter=NMEA_PROTOCOL | RTCM3_PROTOCOL)
+        dsp.run()
+        self.assertEqual(
+            self.received,
+            [
+                "GNGLL",
+                "1005",
+                "4072",
+                "1077",
+                "1087",
+                "1097",
+                "1127",
+                "1230",
+                "NAV-PVT",
+                "GNRMC",
+            ],
+        )
+        dsp.unsubscribe(subid)
+        dsp.unsubscribe(999)  # ignored
+        self.received = []
+        msg = UBXMessage("NAV", "NAV-CLOCK", 0)
+        self.assertEqual(dsp.dispatch(msg.serialize(), msg), 1)
+        self.assertEqual(dsp.dispatch(b"$GNGLL,,,,,,V,N*7A\r\n"), 0)
+        self.assertEqual(self.received, ["NAV-CLOCK"])
+        self.assertEqual(dsp.decoded, 10)  # parsed message supplied, not decoded
+
+    def testdispatchmga(self):
+        dsp = UBXDispatcher(UBXReader(self.stream, parsing=False))
+        dsp.subscribe(self.handler, identity="MGA-GPS-EPH")
+        eph = UBXMessage("MGA", "MGA-GPS-EPH", 1, type=1, svId=3)
+        alm = UBXMessage("MGA", "MGA-GPS-ALM", 1, type=2, svId=3)
+        self.assertEqual(dsp.dispatch(alm.serialize()), 0)
+        self.assertEqual(dsp.dispatch(eph.serialize(), eph), 1)
+        self.assertEqual(self.received, ["MGA-GPS-EPH"])
+
+    def testdispatchexecutor(self):
+        dsp = UBXDispatcher(UBXReader(self.stream, parsing=False))
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            dsp.subscribe(self.handler, protfilter=UBX_PROTOCOL, executor=pool)
+            dsp.run()
+        self.assertEqual(self.received, ["NAV-PVT"])
+        self.assertIs(dsp.ubxreader.datastream, self.stream)
+
+    def testdispatchasyncio(self):
+        received = []
+
+        async def ahandler(raw, parsed):
+            received.append(("async", parsed.identity))
+
+        def shandler(raw, parsed):
+            received.append(("sync", parsed.identity))
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            dsp = UBXDispatcher(UBXReader(self.stream, parsing=False))
+            dsp.subscribe(ahandler, identity="NAV-PVT", executor=loop)
+            dsp.subscribe(shandler, identity="1005", executor=loop)
+            await loop.run_in_executor(None, dsp.run)
+            await asyncio.sleep(0.1)
+
+        asyncio.run(main())
+        self.assertEqual(sorted(received), [("async", "NAV-PVT"), ("sync", "1005")])
+
+    def testdispatcherrors(self):
+        async def ahandler(raw, parsed):
+            pass
+
+        dsp = UBXDispatcher(UBXReader(self.stream, parsing=False))
+        with self.assertRaisesRegex(ParameterError, "Exactly one of"):
+            dsp.subscribe(self.handler)
+        with self.assertRaisesRegex(ParameterError, "Exactly one of"):
+            dsp.subscribe(self.handler, identity="NAV-PVT", msgclass="NAV")
+        with self.assertRaisesRegex(ParameterError, "Unknown UBX message class XXX"):
+            dsp.subscribe(self.handler, msgclass="XXX")
+        with self.assertRaisesRegex(ParameterError, "Coroutine handlers require"):
+            dsp.subscribe(ahandler, identity="NAV-PVT")
+
+    def testdispatchcorrupt(self):
+        raw = UBXMessage("NAV", "NAV-PVT", GET).serialize()
+        bad = raw[:-1] + bytes([raw[-1] ^ 1])  # invalid checksum
+        errors = []
+        ubr = UBXReader(
+            BytesIO(bad + raw + bad + raw),
+            parsing=False,
+            quitonerror=ERR_LOG,
+            errorhandler=errors.append,
+        )
+        dsp = UBXDispatcher(ubr)
+        dsp.subscribe(self.handler, identity="NAV-PVT")
+        self.assertEqual(dsp.run(), 4)  # loop survives corrupt frames
+        self.assertEqual(self.received, ["NAV-PVT", "NAV-PVT"])
+        self.assertEqual(len(errors), 2)
+        self.assertIsInstance(errors[0], UBXParseError)
+        self.assertEqual(dsp.decoded, 2)
+        dsp = UBXDispatcher(UBXReader(BytesIO(), parsing=False, quitonerror=ERR_IGNORE))
+        dsp.subscribe(self.handler, identity="NAV-PVT")
+        self.assertEqual(dsp.dispatch(bad), 0)
+        dsp = UBXDispatcher(UBXReader(BytesIO(), parsing=False, quitonerror=ERR_RAISE))
+        dsp.subscribe(self.handler, identity="NAV-PVT")
+        with self.assertRaisesRegex(UBXParseError, "checksum"):
+            dsp.dispatch(bad)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
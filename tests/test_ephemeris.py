@@ -0,0 +1,393 @@
+"""
+Navigation message decoder tests for pyubx2.ubxephemeris
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+
+from pyrtcm import calc_crc24q
+
+from pyubx2 import GET, SET, EphemerisCache, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def bits(size: int, fields: list) -> int:
+    """Pack list of (position, length, value) into size-bit big-endian bit string."""
+    val = 0
+    for pos, length, fld in fields:
+        val |= (fld & ((1 << length) - 1)) << (size - pos - length)
+    return val
+
+
+def sfrbx(gnss: int, svid: int, words: list, freqid: int = 0) -> bytes:
+    kwargs = {"gnssId": gnss, "svId": svid, "freqId": freqid, "numWords": len(words)}
+    for i, word in enumerate(words, 1):
+        kwargs[f"dwrd_{i:02d}"] = word
+    return UBXMessage("RXM", "RXM-SFRBX", GET, **kwargs).serialize()
+
+
+def gps(sfid: int, fields: list, tow: int = 0) -> bytes:
+    data = bits(240, [(0, 8, 0x8B), (24, 17, tow), (43, 3, sfid)] + fields)
+    return sfrbx(0, 7, [((data >> (24 * (9 - i))) & 0xFFFFFF) << 6 for i in range(10)])
+
+
+def gal(fields: list, svid: int = 11, crc: bool = True) -> bytes:
+    data = bits(128, fields)
+    even = (data >> 16) << 14  # page bits 2-113
+    odd = (1 << 127) | (data & 0xFFFF) << 110  # page bits 2-17
+    crcdata = (even >> 14 << 82) | (odd >> 46)
+    odd |= (calc_crc24q(crcdata.to_bytes(25, "big")) ^ (0 if crc else 1)) << 22
+    words = [(even >> (32 * (3 - i))) & 0xFFFFFFFF for i in range(4)]
+    words += [(odd >> (32 * (3 - i))) & 0xFFFFFFFF for i in range(4)]
+    return sfrbx(2, svid, words)
+
+
+def bds(fid: int, fields: list, sow: int = 0) -> bytes:
+    data = bits(300, [(15, 3, fid), (18, 8, sow >> 12), (30, 12, sow)] + fields)
+    return sfrbx(3, 21, [(data >> (30 * (9 - i))) & 0x3FFFFFFF for i in range(10)])
+
+
+def glo(strnum: int, fields: list) -> bytes:
+    data = bits(128, [(1, 4, strnum)] + fields)
+    return sfrbx(
+        6, 3, [(data >> (32 * (3 - i))) & 0xFFFFFFFF for i in range(4)], freqid=5
+    )
+
+
+def signmag(val: int, length: int) -> int:
+    return (1 << (length - 1)) | -val if val < 0 else val
+
+
+GPSFIELDS = [
+    (
+        1,
+        [
+            (60, 4, 2),
+            (64, 6, 0),
+            (70, 2, 1),
+            (160, 8, -11),
+            (168, 8, 0xA5),
+            (176, 16, 22500),
+            (192, 8, 0),
+            (200, 16, -7),
+            (216, 22, -123456),
+        ],
+    ),
+    (
+        2,
+        [
+            (48, 8, 0xA5),
+            (56, 16, -1234),
+            (72, 16, 12345),
+            (88, 32, -987654321),
+            (120, 16, -2345),
+            (136, 32, 40000000),
+            (168, 16, 3456),
+            (184, 32, 2702000000),
+            (216, 16, 22500),
+            (232, 1, 0),
+        ],
+    ),
+    (
+        3,
+        [
+            (48, 16, 45),
+            (64, 32, 1234567890),
+            (96, 16, -56),
+            (112, 32, 660000000),
+            (144, 16, 7000),
+            (160, 32, -1111111111),
+            (192, 24, -25000),
+            (216, 8, 0xA5),
+            (224, 14, -300),
+        ],
+    ),
+]
+GPSEPH = [gps(sfid, fields) for sfid, fields in GPSFIELDS]
+
+
+class EphemerisTest(unittest.TestCase):
+    def testGPSEphemeris(self):
+        cache = EphemerisCache()
+        self.assertEqual(cache.update(GPSEPH[0]), [])
+        self.assertEqual(cache.update(GPSEPH[1]), [])
+        self.assertEqual(cache.update(GPSEPH[2]), [("MGA-GPS-EPH", 7)])
+        eph = cache.get("MGA-GPS-EPH", 7)
+        self.assertEqual(eph["svId"], 7)
+        self.assertEqual(eph["iodc"], 0x1A5)
+        self.assertEqual(eph["toe"], 360000)
+        self.assertEqual(eph["sqrtA"], 2702000000 * 2**-19)
+        self.assertEqual(eph["af0"], round(-123456 * 2**-31, 12))
+        self.assertEqual(eph["omega"], round(-1111111111 * 2**-31, 12))
+        self.assertEqual(eph["idot"], round(-300 * 2**-43, 12))
+        msg = cache.message("MGA-GPS-EPH", 7)
+        self.assertEqual(msg.msgmode, SET)
+        parsed = UBXReader.parse(msg.serialize(), msgmode=SET)
+        self.assertEqual(str(parsed), str(msg))
+        self.assertEqual(
+            (parsed.type, parsed.svId, parsed.tgd), (1, 7, round(-11 * 2**-31, 12))
+        )
+        self.assertEqual(parsed.m0, round(-987654321 * 2**-31, 12))
+        # repeated subframes with a new time of week are not decoded
+        for sfid, fields in GPSFIELDS:
+            self.assertEqual(cache.update(gps(sfid, fields, tow=99)), [])
+        self.assertEqual((cache.count, cache.duplicates), (6, 3))
+        # new IODC only becomes an ephemeris once IODE matches
+        self.assertEqual(
+            cache.update(
+                gps(
+                    1,
+                    [fld for fld in GPSFIELDS[0][1] if fld[0] != 168]
+                    + [(168, 8, 0xA6)],
+                )
+            ),
+            [],
+        )
+        self.assertEqual((cache.count, cache.duplicates), (7, 3))
+        self.assertEqual(cache.parameters, [("MGA-GPS-EPH", 7)])
+
+    def testGPSAlmanac(self):
+        cache = EphemerisCache()
+        page18 = [(50, 6, 56), (56, 8, 5), (64, 8, -3), (88, 8, 80), (112, 8, -2)]
+        page18 += [(120, 24, -5), (144, 32, 1000), (176, 8, 147), (184, 8, 96)]
+        page18 += [(192, 8, 18), (200, 8, 137), (208, 8, 7), (216, 8, 18)]
+        self.assertEqual(
+            cache.update(gps(4, page18)), [("MGA-GPS-IONO", 0), ("MGA-GPS-UTC", 0)]
+        )
+        iono = cache.get("MGA-GPS-IONO")
+        self.assertEqual(
+            (iono["ionoAlpha0"], iono["ionoAlpha1"], iono["ionoBeta0"]),
+            (round(5 * 2**-30, 12), round(-3 * 2**-27, 12), 80 * 2048),
+        )
+        utc = cache.get("MGA-GPS-UTC")
+        self.assertEqual(
+            (utc["utcDtLS"], utc["utcTot"], utc["utcWNlsf"]), (18, 602112, 137)
+        )
+        self.assertEqual(utc["utcA1"], round(-5 * 2**-50, 12))
+        alm = [
+            (50, 6, 3),
+            (56, 16, 9971),
+            (72, 8, 99),
+            (112, 8, 0),
+            (120, 24, 10554403),
+        ]
+        alm += [(216, 8, -43), (235, 3, 4), (224, 11, -2)]
+        self.assertEqual(cache.update(gps(5, alm)), [])  # WNa not yet known
+        self.assertEqual(
+            cache.update(gps(5, [(50, 6, 51), (64, 8, 100)])), [("MGA-GPS-ALM", 3)]
+        )
+        self.assertEqual(cache.update(gps(5, [(50, 6, 4), (56, 16, 1)])), [])  # dummy
+        msg = cache.message("MGA-GPS-ALM", 3)
+        self.assertEqual(
+            (msg.svId, msg.almWNa, msg.toa, msg.e),
+            (3, 100, 405504, round(9971 * 2**-21, 12)),
+        )
+        self.assertEqual(msg.af0, round(-340 * 2**-20, 12))
+        self.assertEqual(cache.update(gps(4, [(50, 6, 57)])), [])  # page not required
+        self.assertEqual(len(cache.messages()), 3)
+
+    def testGalileo(self):
+        cache = EphemerisCache()
+        words = [
+            [
+                (0, 6, 1),
+                (6, 10, 55),
+                (16, 14, 6000),
+                (30, 32, -5),
+                (62, 32, 1000),
+                (94, 32, 3000000000),
+            ],
+            [
+                (0, 6, 2),
+                (6, 10, 55),
+                (16, 32, 7),
+                (48, 32, 8),
+                (80, 32, -9),
+                (112, 14, -10),
+            ],
+            [
+                (0, 6, 3),
+                (6, 10, 55),
+                (16, 24, -11),
+                (40, 16, 12),
+                (88, 16, -13),
+                (120, 8, 107),
+            ],
+            [
+                (0, 6, 4),
+                (6, 10, 55),
+                (16, 6, 11),
+                (54, 14, 6000),
+                (68, 31, -14),
+                (99, 21, 15),
+                (120, 6, -1),
+            ],
+            [(0, 6, 5), (57, 10, -20), (67, 2, 1), (69, 2, 2), (71, 1, 1), (72, 1, 0)],
+        ]
+        self.assertEqual(cache.update(gal(words[0], crc=False)), [])
+        for fields in words[:-1]:
+            self.assertEqual(cache.update(gal(fields)), [])
+        self.assertEqual(cache.update(gal(words[-1])), [("MGA-GAL-EPH", 11)])
+        eph = cache.message("MGA-GAL-EPH", 11)
+        self.assertEqual(
+            (eph.iodNav, eph.toe, eph.toc, eph.sisaIndexE1E5b),
+            (55, 360000, 360000, 107),
+        )
+        self.assertEqual(
+            (eph.bgdE1E5b, eph.healthE5b, eph.healthE1B, eph.dataValidityE5b),
+            (-20, 1, 2, 1),
+        )
+        self.assertEqual(
+            (eph.af0, eph.af2, eph.omega),
+            (round(-14 * 2**-34, 12), round(-(2**-59), 12), round(-9 * 2**-31, 12)),
+        )
+        self.assertEqual(
+            cache.update(gal(words[0] + [(6, 10, 56)])), []
+        )  # IODnav mismatch
+        self.assertEqual(
+            cache.update(
+                gal([(0, 6, 6), (6, 32, -1), (62, 8, 18), (70, 8, 24), (94, 3, 7)])
+            ),
+            [("MGA-GAL-UTC", 0)],
+        )
+        self.assertEqual(cache.get("MGA-GAL-UTC")["tot"], 86400)
+        self.assertEqual(cache.update(gal([(0, 6, 0)])), [])  # word type not required
+
+    def testGalileoTOW(self):  # word types 5 & 6 repeat with only WN/TOW changed
+        cache = EphemerisCache()
+        word5 = [(0, 6, 5), (57, 10, -20), (67, 2, 1)]
+        word6 = [(0, 6, 6), (6, 32, -1), (62, 8, 18), (70, 8, 24)]
+        for tow in range(100, 130, 10):
+            cache.update(gal(word5 + [(73, 12, 1300 + tow // 30), (85, 20, tow)]))
+            utc = cache.update(gal(word6 + [(105, 20, tow + 1)]))
+            self.assertEqual(utc, [("MGA-GAL-UTC", 0)] if tow == 100 else [])
+        self.assertEqual((cache.count, cache.duplicates), (6, 4))
+        cache.update(gal([(0, 6, 5), (57, 10, -21), (67, 2, 1), (85, 20, 140)]))
+        self.assertEqual(cache.duplicates, 4)  # data changed
+
+    def testBeiDou(self):
+        cache = EphemerisCache()
+        sf1 = [(42, 1, 1), (43, 5, 9), (48, 4, 2), (73, 9, 0x1F), (90, 8, 0x40)]
+        sf1 += [
+            (98, 10, -25),
+            (214, 11, 3),
+            (225, 7, -1),
+            (240, 17, 100),
+            (257, 5, 1),
+            (270, 17, 2),
+            (287, 5, 4),
+        ]
+        sf2 = [
+            (42, 10, -1),
+            (60, 6, 3),
+            (132, 10, 1),
+            (150, 22, 5),
+            (250, 12, 2700),
+            (270, 20, 7),
+            (290, 2, 0),
+        ]
+        sf3 = [
+            (42, 10, 0xFA),
+            (60, 5, 0),
+            (65, 17, -1),
+            (90, 15, 6),
+            (251, 11, 5),
+            (270, 21, 9),
+        ]
+        self.assertEqual(cache.update(bds(1, sf1)), [])
+        self.assertEqual(cache.update(bds(2, sf2)), [])
+        self.assertEqual(cache.update(bds(3, [(42, 10, 0xFB)])), [])  # toe != toc
+        self.assertEqual(cache.update(bds(3, sf3, 12)), [("MGA-BDS-EPH", 21)])
+        self.assertEqual(cache.update(bds(3, sf3, 42)), [])
+        self.assertEqual(cache.duplicates, 1)
+        eph = cache.message("MGA-BDS-EPH", 21)
+        self.assertEqual((eph.SatH1, eph.IODC, eph.URAI, eph.IODE), (1, 9, 2, 4))
+        self.assertEqual((eph.toc, eph.toe, eph.TGD1), (0x1F40 * 8, 0x1F40 * 8, -2.5))
+        self.assertEqual(eph.a0, round(((-1 << 17) + 100) * 2**-33, 12))
+        self.assertEqual(eph.Deltan, round(-61 * 2**-43, 12))
+        self.assertEqual(eph.sqrtA, ((2700 << 20) + 7) * 2**-19)
+        self.assertEqual(eph.i0, round(((-1 << 15) + 6) * 2**-31, 12))
+        self.assertEqual(cache.update(sfrbx(3, 2, [0] * 10)), [])  # GEO
+
+    def testGLONASS(self):
+        cache = EphemerisCache()
+        strings = [
+            (
+                1,
+                [
+                    (9, 12, 100),
+                    (21, 24, signmag(-1000, 24)),
+                    (45, 5, signmag(-2, 5)),
+                    (50, 27, 12345678),
+                ],
+            ),
+            (
+                2,
+                [
+                    (5, 3, 1),
+                    (9, 7, 40),
+                    (21, 24, 5),
+                    (45, 5, 1),
+                    (50, 27, signmag(-7654321, 27)),
+                ],
+            ),
+            (3, [(6, 11, signmag(-3, 11)), (21, 24, 6), (45, 5, 0), (50, 27, 1)]),
+            (
+                4,
+                [
+                    (5, 22, signmag(-4096, 22)),
+                    (27, 5, 3),
+                    (32, 5, 1),
+                    (52, 4, 2),
+                    (75, 2, 1),
+                ],
+            ),
+        ]
+        for strnum, fields in strings[:-1]:
+            self.assertEqual(cache.update(glo(strnum, fields)), [])
+        self.assertEqual(cache.update(glo(*strings[-1])), [("MGA-GLO-EPH", 3)])
+        eph = cache.message("MGA-GLO-EPH", 3)
+        self.assertEqual(
+            (eph.H, eph.B, eph.tb, eph.E, eph.FT, eph.M), (-2, 1, 600, 1, 2, 1)
+        )
+        self.assertEqual((eph.x, eph.y), (12345678 * 2**-11, -7654321 * 2**-11))
+        self.assertEqual(
+            (eph.dx, eph.ddx, eph.gamma),
+            (round(-1000 * 2**-20, 12), round(-2 * 2**-30, 12), round(-3 * 2**-40, 12)),
+        )
+        self.assertEqual(
+            (eph.tau, eph.deltaTau), (round(-4096 * 2**-30, 12), round(3 * 2**-30, 12))
+        )
+        # new frame with only tk changed is a duplicate
+        self.assertEqual(cache.update(glo(1, [(9, 12, 101)] + strings[0][1][1:])), [])
+        self.assertEqual(cache.update(glo(*strings[-1])), [])
+        self.assertEqual(cache.duplicates, 2)
+        self.assertEqual(cache.update(glo(5, [])), [])
+
+    def testRun(self):
+        cache = EphemerisCache()
+        with open(os.path.join(DIRNAME, "pygpsdata-RXM.log"), "rb") as stream:
+            self.assertEqual(cache.run(stream), 0)  # almanac page, WNa unknown
+        self.assertEqual(cache.count, 1)
+        stream = BytesIO(b"".join(GPSEPH) + GPSEPH[0])
+        self.assertEqual(cache.run(stream), 1)
+        self.assertEqual((cache.count, cache.duplicates), (5, 1))
+        self.assertEqual(cache.parameters, [("MGA-GPS-EPH", 7)])
+        self.assertEqual(cache.update(b"\xb5b\x01\x07\x00\x00"), [])
+        self.assertIsNone(cache.get("MGA-GPS-EPH", 8))
+        self.assertIsNone(cache.message("MGA-GPS-EPH", 8))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
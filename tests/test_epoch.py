@@ -0,0 +1,147 @@
+"""
+EpochAssembler tests for pyubx2.ubxepoch
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from threading import Event
+from time import sleep
+
+from pyubx2 import (
+    EPOCH_BOUNDARY,
+    EPOCH_EOE,
+    EPOCH_FLUSH,
+    EPOCH_OVERFLOW,
+    EPOCH_TIMEOUT,
+    GET,
+    POLL,
+    EpochAssembler,
+    UBXMessage,
+    UBXReader,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def nav(identity: str, itow: int) -> UBXMessage:
+    return UBXMessage("NAV", identity, GET, iTOW=itow)
+
+
+class EpochTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testepochlog(self):
+        epochs = []
+        asm = EpochAssembler(callback=epochs.append)
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            count = asm.run(UBXReader(stream))
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            [e.reason for e in epochs], [EPOCH_EOE, EPOCH_BOUNDARY, EPOCH_FLUSH]
+        )
+        epoch = epochs[0]
+        self.assertTrue(epoch.complete)
+        self.assertFalse(epochs[1].complete)
+        self.assertEqual(len(epoch), 25)
+        self.assertIn("NAV-PVT", epoch)
+        self.assertEqual(epoch["NAV-PVT"].iTOW, epoch.itow)
+        self.assertEqual(epoch.get("NAV-XXX", 0), 0)
+        self.assertEqual(epoch.identities[0:2], ["NAV-PVT", "NAV-ORB"])
+        self.assertEqual(
+            str(epochs[2]),
+            "<NavEpoch(iTOW=19:19:31, reason=flush, messages=['NAV-TIMETRUSTED'])>",
+        )
+        stats = asm.stats
+        self.assertEqual(stats["epochs"], 3)
+        self.assertEqual(stats["missing"]["NAV-PVT"], 2)
+        self.assertEqual(asm.pending, 0)
+
+    def testepochsequence(self):
+        asm = EpochAssembler(expected=("NAV-PVT", "NAV-DOP"), timeout=0)
+        res = []
+        for msg in (
+            nav("NAV-PVT", 1000),
+            nav("NAV-DOP", 1000),
+            nav("NAV-EOE", 1000),
+            nav("NAV-DOP", 1000),  # late
+            nav("NAV-PVT", 2000),
+            nav("NAV-PVT", 3000),  # boundary
+            UBXMessage("MON", "MON-HW", GET),  # ignored
+            UBXMessage("NAV", "NAV-PVT", POLL),  # ignored, no iTOW
+            b"not a UBX message",  # ignored
+            nav("NAV-EOE", 3000),
+        ):
+            res += asm.process(None, msg)
+        self.assertEqual(
+            [(e.itow, e.reason) for e in res],
+            [(1000, EPOCH_EOE), (2000, EPOCH_BOUNDARY), (3000, EPOCH_EOE)],
+        )
+        self.assertEqual(res[0].identities, ["NAV-PVT", "NAV-DOP"])
+        stats = asm.stats
+        self.assertEqual(stats["late"], 1)
+        self.assertEqual(stats["missing"], {"NAV-DOP": 2})
+
+    def testepochnoboundary(self):
+        asm = EpochAssembler(
+            identities=("NAV-PVT", "NAV-SAT", "NAV-EOE"),
+            boundary=False,
+            maxpending=2,
+            timeout=0,
+        )
+        res = []
+        res += asm.process(None, nav("NAV-PVT", 1000))
+        res += asm.process(None, nav("NAV-PVT", 2000))
+        res += asm.process(None, nav("NAV-SAT", 1000))  # out of order
+        res += asm.process(None, nav("NAV-DOP", 1000))  # not in identities
+        self.assertEqual(res, [])
+        self.assertEqual(asm.pending, 2)
+        res += asm.process(None, nav("NAV-PVT", 3000))  # overflow
+        self.assertEqual(
+            [(e.itow, e.reason, len(e)) for e in res], [(1000, EPOCH_OVERFLOW, 2)]
+        )
+        res = asm.flush()
+        self.assertEqual(
+            [(e.itow, e.reason) for e in res],
+            [(2000, EPOCH_FLUSH), (3000, EPOCH_FLUSH)],
+        )
+
+    def testepochidentitieseoe(self):
+        asm = EpochAssembler(identities=("NAV-PVT",), timeout=0)
+        res = []
+        for msg in (nav("NAV-PVT", 1000), nav("NAV-EOE", 1000), nav("NAV-PVT", 2000)):
+            res += asm.process(None, msg)
+        self.assertEqual([(e.itow, e.reason) for e in res], [(1000, EPOCH_EOE)])
+        self.assertTrue(res[0].complete)
+        self.assertEqual(res[0].identities, ["NAV-PVT"])
+
+    def testepochtimeout(self):
+        asm = EpochAssembler(timeout=0.01)
+        self.assertEqual(asm.process(None, nav("NAV-PVT", 1000)), [])
+        sleep(0.05)
+        res = asm.poll()
+        self.assertEqual([(e.itow, e.reason) for e in res], [(1000, EPOCH_TIMEOUT)])
+        self.assertEqual(asm.stats[EPOCH_TIMEOUT], 1)
+
+    def testepochstop(self):
+        asm = EpochAssembler()
+        stop = Event()
+        stop.set()
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            self.assertEqual(asm.run(UBXReader(stream), stop), 0)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Follow (tail -f) mode tests for pyubx2.ubxreader
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from unittest.mock import patch
+
+from pyubx2 import ERR_RAISE, UBXReader, UBXStreamError
+
+DIRNAME = os.path.dirname(__file__)
+POLLMIN, POLLMAX = 0.001, 0.1
+BACKOFF = [POLLMIN * 2**i for i in range(7)]  # poll intervals up to POLLMAX
+
+
+class GrowingStream:  # each short read appends next chunk to stream, b"" = idle
+    def __init__(self, chunks: list):
+        self._chunks = list(chunks)
+        self._buf = b""
+
+    def _arrive(self):
+        if self._chunks:
+            self._buf += self._chunks.pop(0)
+
+    def read(self, size: int) -> bytes:
+        if len(self._buf) < size:
+            self._arrive()
+        data, self._buf = self._buf[:size], self._buf[size:]
+        return data
+
+    def readline(self) -> bytes:
+        if b"\n" not in self._buf:
+            self._arrive()
+        idx = self._buf.find(b"\n") + 1 or len(self._buf)
+        data, self._buf = self._buf[:idx], self._buf[idx:]
+        return data
+
+
+class FollowTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            self.data = stream.read()
+            stream.seek(0)
+            self.expected = [str(parsed) for _, parsed in UBXReader(stream)]
+        self.now = 0.0
+        self.sleeps = []
+        for name, func in (("monotonic", self.monotonic), ("sleep", self.sleep)):
+            patcher = patch(f"pyubx2.ubxreader.{name}", func)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        pass
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, secs: float):
+        self.sleeps.append(secs)
+        self.now += secs
+
+    def chunks(self, size: int, idle: int) -> list:
+        res = []
+        for i in range(0, len(self.data), size):
+            res += [self.data[i : i + size]] + [b""] * idle
+        return res
+
+    def testfollow(self):  # data arrives in chunks which split frames
+        stream = GrowingStream(self.chunks(37, 2))
+        ubr = UBXReader(stream, quitonerror=ERR_RAISE, follow=True, followtimeout=0.5)
+        res = [str(parsed) for _, parsed in ubr]
+        self.assertEqual(res, self.expected)
+        polls, timeout = self.sleeps[:-11], self.sleeps[-11:]
+        self.assertLess(max(polls), POLLMAX)  # data kept arriving
+        self.assertEqual(timeout, BACKOFF + [POLLMAX] * 4)  # 0.527s > followtimeout
+
+    def testfollowidle(self):  # stream idle for longer than max poll interval
+        stream = GrowingStream(self.chunks(200, 10))
+        ubr = UBXReader(stream, follow=True, followtimeout=1)
+        res = [str(parsed) for _, parsed in ubr]
+        self.assertEqual(res, self.expected)
+        backoff = BACKOFF + [POLLMAX] * 3
+        self.assertEqual(self.sleeps[:10], backoff)
+        self.assertEqual(self.sleeps[10:20], backoff)  # reset when data arrived
+
+    def testfollowtimeout(self):  # partial frame at end of stream after timeout
+        stream = GrowingStream([self.data[:-5]])
+        ubr = UBXReader(stream, quitonerror=ERR_RAISE, follow=True, followtimeout=0.2)
+        with self.assertRaisesRegex(
+            UBXStreamError, "Serial stream terminated unexpectedly"
+        ):
+            for _ in ubr:
+                pass
+        self.assertGreaterEqual(self.now, 0.2)
+        self.assertLess(self.now, 0.2 + POLLMAX)
+
+    def testnofollow(self):
+        stream = GrowingStream([self.data[:-5]])
+        ubr = UBXReader(stream, quitonerror=ERR_RAISE)
+        with self.assertRaises(UBXStreamError):
+            for _ in ubr:
+                pass
+        self.assertEqual(self.sleeps, [])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
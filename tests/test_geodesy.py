@@ -0,0 +1,162 @@
+"""
+Batch coordinate conversion tests for pyubx2.ubxgeodesy
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from array import array
+from unittest.mock import patch
+
+from pyubx2 import (
+    ParameterError,
+    UBXReader,
+    bearing,
+    bearing_batch,
+    datum_batch,
+    ecef2enu_batch,
+    ecef2llh,
+    ecef2llh_batch,
+    haversine,
+    haversine_batch,
+    llh2ecef,
+    llh2ecef_batch,
+    llh2enu_batch,
+)
+
+DIRNAME = os.path.dirname(__file__)
+LATS = [53.0, -33.8, 89.9, -89.99, 0.0, 51.477]
+LONS = [-2.0, 151.2, 12.5, -120.0, 179.9, 0.0]
+HGTS = [100.0, -20.5, 3000.0, 0.0, 15000.0, 45.8]
+OSGB36 = {"a": 6377563.396, "f": 299.324964600004, "dx": 375, "dy": -111, "dz": 431}
+ED50 = {"a": 6378388, "f": 297.000000000048, "dx": -87, "dy": -98, "dz": -121}
+
+
+class GeodesyTest(unittest.TestCase):
+    def assertColumns(self, actual, expected, places=6):
+        self.assertEqual(len(actual), len(expected))
+        for acol, ecol in zip(actual, expected):
+            self.assertEqual(len(acol), len(ecol))
+            for act, exp in zip(acol, ecol):
+                self.assertAlmostEqual(float(act), exp, places)
+
+    def testLLHECEF(self):
+        expected = list(zip(*map(llh2ecef, LATS, LONS, HGTS)))
+        for ndarray in (True, False):
+            ecef = llh2ecef_batch(LATS, LONS, HGTS, ndarray=ndarray)
+            self.assertColumns(ecef, expected)
+            llh = ecef2llh_batch(*ecef, ndarray=ndarray)
+            self.assertColumns(llh, list(zip(*map(ecef2llh, *expected))), 9)
+            self.assertColumns(llh, (LATS, LONS, HGTS), 6)
+        # array.array columns identical to scalar methods by default
+        ecef = llh2ecef_batch(LATS, LONS, HGTS)
+        self.assertIsInstance(ecef[0], array)
+        self.assertEqual([tuple(col) for col in ecef], expected)
+        self.assertNotIsInstance(
+            llh2ecef_batch(LATS, LONS, HGTS, ndarray=True)[0], array
+        )
+        # nominal value near Earth's core, as ecef2llh()
+        for ndarray in (True, False):
+            self.assertColumns(
+                ecef2llh_batch([0.0, 10.0], [0.0, 0.0], [0.0, 5.0], ndarray=ndarray),
+                ([0.0, 0.0], [0.0, 0.0], [-1e7, -1e7]),
+            )
+
+    def testNoNumPy(self):
+        with patch("pyubx2.ubxgeodesy.numpy", None):
+            with self.assertRaisesRegex(
+                ParameterError, "ndarray output requires NumPy"
+            ):
+                llh2ecef_batch(LATS, LONS, HGTS, ndarray=True)
+            for col in datum_batch(LATS, LONS, HGTS, dst=OSGB36):
+                self.assertIsInstance(col, array)
+
+    def testENU(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-NAVHPPOS.log"), "rb") as stream:
+            msgs = [
+                parsed
+                for _, parsed in UBXReader(stream)
+                if parsed.identity == "NAV-HPPOSECEF"
+            ]
+        x, y, z = (
+            [getattr(msg, f"ecef{axis}") / 100 for msg in msgs] for axis in "XYZ"
+        )
+        ref = ecef2llh(x[0], y[0], z[0])
+        for ndarray in (True, False):
+            east, north, up = ecef2enu_batch(x, y, z, ref, ndarray)
+            self.assertAlmostEqual(float(east[0]), 0.0, 6)
+            self.assertAlmostEqual(float(up[0]), 0.0, 6)
+            dist = (
+                sum(
+                    (v1 - v0) ** 2
+                    for v0, v1 in ((x[0], x[1]), (y[0], y[1]), (z[0], z[1]))
+                )
+                ** 0.5
+            )
+            self.assertAlmostEqual(
+                float(east[1] ** 2 + north[1] ** 2 + up[1] ** 2) ** 0.5, dist, 6
+            )
+            # 1 m north and 2 m up of reference
+            east, north, up = llh2enu_batch(
+                [53.0 + 1 / 111257.5, 53.0],
+                [-2.0, -2.0],
+                [100.0, 102.0],
+                (53.0, -2.0, 100.0),
+                ndarray,
+            )
+            self.assertColumns(
+                (east, north, up), ([0.0, 0.0], [1.0, 0.0], [0.0, 2.0]), 3
+            )
+
+    def testDatum(self):
+        for ndarray in (True, False):
+            # as examples/utilities.py
+            llh = datum_batch(LATS, LONS, HGTS, dst=OSGB36, ndarray=ndarray)
+            for i, (lat, lon, hgt) in enumerate(zip(LATS, LONS, HGTS)):
+                x, y, z = llh2ecef(lat, lon, hgt)
+                exp = ecef2llh(x - 375, y + 111, z - 431, OSGB36["a"], OSGB36["f"])
+                for col, val in zip(llh, exp):
+                    self.assertAlmostEqual(float(col[i]), val, 9)
+            back = datum_batch(*llh, src=OSGB36, ndarray=ndarray)
+            self.assertColumns(back, (LATS, LONS, HGTS), 6)
+            direct = datum_batch(*llh, src=OSGB36, dst=ED50, ndarray=ndarray)
+            viawgs = datum_batch(*back, dst=ED50, ndarray=ndarray)
+            self.assertColumns(direct, [list(col) for col in viawgs], 6)
+
+    def testDistance(self):
+        lat2, lon2 = LATS[::-1], LONS[::-1]
+        for ndarray in (True, False):
+            self.assertColumns(
+                [haversine_batch(LATS, LONS, lat2, lon2, ndarray=ndarray)],
+                [list(map(haversine, LATS, LONS, lat2, lon2))],
+            )
+            self.assertColumns(
+                [bearing_batch(LATS, LONS, lat2, lon2, ndarray=ndarray)],
+                [list(map(bearing, LATS, LONS, lat2, lon2))],
+            )
+            # distance and bearing to fixed point
+            self.assertColumns(
+                [haversine_batch(LATS, LONS, 51.5, -0.1, 6371, ndarray)],
+                [
+                    [
+                        haversine(lat, lon, 51.5, -0.1, 6371)
+                        for lat, lon in zip(LATS, LONS)
+                    ]
+                ],
+            )
+            self.assertColumns(
+                [bearing_batch(LATS, LONS, 51.5, -0.1, ndarray)],
+                [[bearing(lat, lon, 51.5, -0.1) for lat, lon in zip(LATS, LONS)]],
+            )
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Log merge tests for pyubx2.ubxmerge
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+from threading import Event
+
+from pyubx2 import GET, UBXMerger, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+GGA = b"$GNGGA,103607,,N,,E,0,0,0.0,0.0,,0.0,,0.0,0*70\r\n"
+
+
+def clock(itow: int) -> bytes:
+    return UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=itow).serialize()
+
+
+def timegps(itow: int, week: int) -> bytes:
+    return UBXMessage("NAV", "NAV-TIMEGPS", GET, iTOW=itow, week=week).serialize()
+
+
+def itows(merger: UBXMerger) -> list:
+    return [getattr(parsed, "iTOW", "GGA") for _, parsed in merger]
+
+
+class MergeTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testinterleave(self):
+        log1 = clock(1000) + GGA + clock(3000) + clock(4000)
+        log2 = clock(2000) + clock(3000) + GGA + clock(5000)
+        mgr = UBXMerger([BytesIO(log1), BytesIO(log2)])
+        self.assertEqual(itows(mgr), [1000, "GGA", 2000, 3000, "GGA", 4000, 5000])
+        self.assertEqual(mgr.count, 7)
+        self.assertEqual(mgr.duplicates, 1)  # NAV-CLOCK 3000
+        mgr = UBXMerger([BytesIO(log1), BytesIO(log2)], dedupe=False)
+        self.assertEqual(len(itows(mgr)), 8)
+
+    def testweek(self):
+        log1 = timegps(604790000, 2300) + clock(604799000) + clock(1000)
+        log2 = clock(604795000) + clock(500) + timegps(2000, 2301)
+        mgr = UBXMerger([BytesIO(log1), BytesIO(log2)])
+        self.assertEqual(itows(mgr), [604790000, 604795000, 604799000, 500, 1000, 2000])
+
+    def testinferweek(self):
+        log1 = timegps(1000, 2301) + clock(2000)
+        log2 = clock(604799000) + clock(1500)  # week inferred from log1
+        mgr = UBXMerger([BytesIO(log1), BytesIO(log2)])
+        self.assertEqual(itows(mgr), [604799000, 1000, 1500, 2000])
+
+    def testrawx(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-RXMRAWX.log"), "rb") as stream:
+            data = stream.read()
+        raws = [raw for raw, _ in UBXReader(BytesIO(data))]
+        mgr = UBXMerger([BytesIO(b"".join(raws[1::2])), BytesIO(b"".join(raws[::2]))])
+        self.assertEqual([raw for raw, _ in mgr], raws)
+
+    def testduplicatelogs(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            data = stream.read()
+        expected = [raw for raw, _ in UBXReader(BytesIO(data))]
+        mgr = UBXMerger([BytesIO(data), BytesIO(data), BytesIO(data)])
+        out = BytesIO()
+        self.assertEqual(mgr.run(out), len(expected))
+        self.assertEqual(out.getvalue(), b"".join(expected))
+        self.assertEqual(mgr.duplicates, len(expected) * 2)
+        self.assertEqual(mgr.read(), (None, None))
+
+    def testrunstop(self):
+        stop = Event()
+        stop.set()
+        mgr = UBXMerger([BytesIO(clock(1000))])
+        self.assertEqual(mgr.run(BytesIO(), stop), 0)
+        self.assertEqual(UBXMerger([]).read(), (None, None))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+MultiUBXReader tests for pyubx2.ubxmultireader
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import socket
+import unittest
+from threading import Thread
+
+from pyubx2 import (
+    ERR_LOG,
+    GET,
+    MultiUBXReader,
+    ParameterError,
+    UBXMessage,
+    UBXReader,
+)
+
+DIRNAME = os.path.dirname(__file__)
+FILES = ("pygpsdata-MIXED3.log", "pygpsdata-MIXED-RTCM3.log", "pygpsdata-NAV.log")
+
+
+def readfile(name: str) -> bytes:
+    with open(os.path.join(DIRNAME, name), "rb") as stream:
+        return stream.read()
+
+
+def identities(data: bytes, **kwargs) -> list:
+    with open(os.path.join(DIRNAME, data), "rb") as stream:
+        return [parsed.identity for _, parsed in UBXReader(stream, **kwargs)]
+
+
+class MultiReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.socks = []
+
+    def tearDown(self):
+        for sock in self.socks:
+            sock.close()
+
+    def sender(self, data: bytes, chunk: int) -> socket.socket:
+        rsock, wsock = socket.socketpair()
+        self.socks += [rsock, wsock]
+
+        def send():
+            for i in range(0, len(data), chunk):
+                wsock.sendall(data[i : i + chunk])
+            wsock.shutdown(socket.SHUT_WR)
+
+        Thread(target=send, daemon=True).start()
+        return rsock
+
+    def testmultisockets(self):
+        mur = MultiUBXReader(bufsize=512)
+        for i, name in enumerate(FILES):
+            mur.add(name, self.sender(readfile(name), (7, 100, 4096)[i]))
+        self.assertEqual(mur.sources, list(FILES))
+        res = {name: [] for name in FILES}
+        for source, raw, parsed in mur:
+            self.assertEqual(raw, parsed.serialize())
+            res[source].append(parsed.identity)
+        for name in FILES:
+            self.assertEqual(res[name], identities(name))
+        self.assertEqual(mur.sources, [])
+        self.assertEqual(mur.read(), (None, None, None))
+        mur.close()
+
+    def testmultipipe(self):
+        rfd, wfd = os.pipe()
+        data = readfile("pygpsdata-MIXED3.log")
+        with open(rfd, "rb", buffering=0) as rstream:
+            mur = MultiUBXReader(parsing=False)
+            mur.add("pipe", rstream, parsing=True)
+            os.write(wfd, b"\x00garbage\xff" + data[0:150])  # ends mid NMEA
+            self.assertEqual(mur.read(timeout=1)[2].identity, "NAV-PVT")
+            self.assertEqual(mur.read(timeout=0.01), (None, None, None))  # timeout
+            self.assertEqual(mur.sources, ["pipe"])
+            os.write(wfd, data[150:] + b"junk")
+            os.close(wfd)
+            res = ["NAV-PVT"] + [parsed.identity for _, _, parsed in mur]
+            self.assertEqual(res, identities("pygpsdata-MIXED3.log"))
+            mur.close()
+
+    def testmultiserial(self):
+        class DummySerial:  # minimal serial-like stream
+            def __init__(self, sock):
+                self.sock = sock
+                self.in_waiting = 0
+
+            def fileno(self):
+                return self.sock.fileno()
+
+            def read(self, size):
+                return self.sock.recv(size)
+
+        mur = MultiUBXReader()
+        mur.add("serial", DummySerial(self.sender(readfile("pygpsdata-NAV.log"), 4096)))
+        self.assertEqual(
+            [p.identity for _, _, p in mur], identities("pygpsdata-NAV.log")
+        )
+
+    def testmultibadframe(self):
+        rfd, wfd = os.pipe()
+        raw = UBXMessage("NAV", "NAV-CLOCK", GET, payload=b"\x01" * 20).serialize()
+        bad = raw[:-1] + bytes([raw[-1] ^ 1])  # invalid checksum
+        errors = []
+        with open(rfd, "rb", buffering=0) as rstream:
+            mur = MultiUBXReader(quitonerror=ERR_LOG, errorhandler=errors.append)
+            mur.add("pipe", rstream)
+            os.write(wfd, raw + bad + raw[:10])  # ends mid message
+            self.assertEqual(mur.read(timeout=1)[2].identity, "NAV-CLOCK")
+            self.assertEqual(mur.read(timeout=0.01), (None, None, None))
+            self.assertEqual(len(errors), 1)
+            os.write(wfd, raw[10:] + bad[:5])
+            self.assertEqual(mur.read(timeout=1)[2].identity, "NAV-CLOCK")
+            self.assertEqual(mur.read(timeout=0.01), (None, None, None))
+            os.write(wfd, bad[5:] + raw)
+            os.close(wfd)
+            self.assertEqual([p.identity for _, _, p in mur], ["NAV-CLOCK"])
+            self.assertEqual(len(errors), 2)  # each bad frame reported once
+            mur.close()
+
+    def testmultierrors(self):
+        rsock, wsock = socket.socketpair()
+        self.socks += [rsock, wsock]
+        mur = MultiUBXReader()
+        mur.add("sock", rsock)
+        with self.assertRaisesRegex(ParameterError, "Source sock already added"):
+            mur.add("sock", rsock)
+        wsock.sendall(UBXMessage("NAV", "NAV-CLOCK", GET).serialize())
+        self.assertEqual(mur.read()[2].identity, "NAV-CLOCK")
+        mur.remove("sock")
+        self.assertEqual(mur.read(timeout=0), (None, None, None))
+        mur.remove("sock")  # ignored
+        mur.close()
+
+    def testmultireaderror(self):
+        class BadStream:
+            def __init__(self, sock):
+                self.sock = sock
+
+            def fileno(self):
+                return self.sock.fileno()
+
+            def recv(self, size):
+                raise ConnectionResetError("reset")
+
+        mur = MultiUBXReader()
+        mur.add("bad", BadStream(self.sender(b"\xb5b", 10)))
+        with self.assertLogs("pyubx2.ubxmultireader", level="ERROR") as log:
+            self.assertEqual(list(mur), [])
+        self.assertIn("Source bad read error reset", log.output[0])
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Pickle tests for pyubx2.ubxmessage
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import copy
+import os
+import pickle
+import unittest
+from multiprocessing import Queue
+
+from pyubx2 import GET, POLL, SET, UBXMessage, UBXMessageError, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class PickleTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testpicklelogs(self):
+        for log in (
+            "pygpsdata-RXMRAWX.log",
+            "pygpsdata-NAV-ZED-X20P.log",
+            "pygpsdata-CFG.log",
+        ):
+            with open(os.path.join(DIRNAME, log), "rb") as stream:
+                for raw, parsed in UBXReader(stream, protfilter=2):
+                    with self.subTest(log=log, identity=parsed.identity):
+                        pkl = pickle.dumps(parsed)
+                        self.assertLess(len(pkl), len(pickle.dumps(vars(parsed))))
+                        msg = pickle.loads(pkl)
+                        self.assertEqual(msg.serialize(), raw)
+                        self.assertEqual(str(msg), str(parsed))
+                        self.assertEqual(vars(msg), vars(parsed))
+
+    def testpicklelazy(self):
+        parsed = UBXMessage("NAV", "NAV-PVT", GET, iTOW=123456, numSV=12)
+        msg = pickle.loads(pickle.dumps(parsed))
+        self.assertNotIn("iTOW", vars(msg))  # not yet parsed
+        self.assertEqual(msg.identity, "NAV-PVT")
+        self.assertEqual(msg.length, 92)
+        self.assertEqual(msg.serialize(), parsed.serialize())
+        self.assertEqual(msg.numSV, 12)  # parsed on first access
+        self.assertEqual(vars(msg), vars(parsed))
+        self.assertFalse(hasattr(msg, "foo"))
+        with self.assertRaisesRegex(UBXMessageError, "Object is immutable"):
+            pickle.loads(pickle.dumps(parsed)).iTOW = 0
+
+    def testpicklemodes(self):
+        msgs = (
+            UBXMessage("CFG", "CFG-MSG", POLL),  # no payload
+            UBXMessage("CFG", "CFG-MSG", POLL, msgClass=1, msgID=7),
+            UBXMessage.config_set(1, 0, [("CFG_UART1_BAUDRATE", 115200)]),
+            UBXMessage("CFG", "CFG-PRT", SET, portID=1, baudRate=9600),
+            UBXReader.parse(
+                UBXMessage("NAV", "NAV-PVT", GET, iTOW=1).serialize(), parsebitfield=0
+            ),
+        )
+        for parsed in msgs:
+            msg = pickle.loads(pickle.dumps(parsed))
+            self.assertEqual(msg.msgmode, parsed.msgmode)
+            self.assertEqual(repr(msg), repr(parsed))
+            self.assertEqual(str(msg), str(parsed))
+        msg = copy.deepcopy(msgs[3])
+        self.assertEqual(msg.baudRate, 9600)
+        self.assertEqual(vars(msg), vars(msgs[3]))
+
+    def testpicklequeue(self):
+        queue = Queue()
+        parsed = UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=1000, clkB=-12)
+        queue.put(parsed)
+        msg = queue.get(timeout=5)
+        self.assertEqual(str(msg), str(parsed))
+        queue.close()
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
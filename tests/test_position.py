@@ -0,0 +1,178 @@
+"""
+Position statistics tests for pyubx2.ubxposition
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import pickle
+import unittest
+from random import Random
+from struct import pack
+
+from pyubx2 import GET, ParameterError, PositionStats, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def navpvt(
+    itow: int, lat: float, lon: float, height: float, fixtype: int = 3, flags: int = 1
+) -> bytes:
+    payload = (
+        pack(
+            "<L16xBB2xiii",
+            itow,
+            fixtype,
+            flags,
+            round(lon * 1e7),
+            round(lat * 1e7),
+            round(height * 1000),
+        )
+        + b"\x00" * 56
+    )
+    return UBXMessage("NAV", "NAV-PVT", GET, payload=payload).serialize()
+
+
+def scatter(num: int, seed: int = 0) -> list:
+    rng = Random(seed)  # ~1 m standard deviation east & north
+    return [
+        navpvt(
+            i * 1000,
+            53.0 + rng.gauss(0, 9e-6),
+            -2.0 + rng.gauss(0, 1.5e-5),
+            100 + rng.gauss(0, 2),
+            3 if i % 4 else 4,
+        )
+        for i in range(num)
+    ]
+
+
+class PositionTest(unittest.TestCase):
+    def testHPPOS(self):
+        results = {}
+        for identity in ("NAV-HPPOSLLH", "NAV-HPPOSECEF"):
+            pos = PositionStats(identity)
+            with open(os.path.join(DIRNAME, "pygpsdata-NAVHPPOS.log"), "rb") as stream:
+                self.assertEqual(pos.run(stream), 2)
+            results[identity] = pos.stats()
+            self.assertEqual(pos.fixtypes, [])  # no NAV-PVT
+        with open(os.path.join(DIRNAME, "pygpsdata-NAVHPPOS.log"), "rb") as stream:
+            llhs = [
+                parsed
+                for _, parsed in UBXReader(stream)
+                if parsed.identity == "NAV-HPPOSLLH"
+            ]
+        llh, ecef = results["NAV-HPPOSLLH"], results["NAV-HPPOSECEF"]
+        self.assertAlmostEqual(llh["lat"], sum(msg.lat for msg in llhs) / 2, 9)
+        self.assertAlmostEqual(llh["lon"], sum(msg.lon for msg in llhs) / 2, 9)
+        self.assertAlmostEqual(llh["height"], sum(msg.height for msg in llhs) / 2000, 4)
+        for key in ("lat", "lon"):  # same epochs, so within a few mm
+            self.assertAlmostEqual(llh[key], ecef[key], 7)
+        self.assertAlmostEqual(llh["height"], ecef["height"], 3)
+        self.assertAlmostEqual(llh["2drms"], ecef["2drms"], 3)
+
+    def testFixTypes(self):
+        pvt = PositionStats()
+        hpp = PositionStats("NAV-HPPOSLLH")
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV-ZED-X20P.log"), "rb") as stream:
+            for raw, _ in UBXReader(stream, parsing=False):
+                pvt.update(raw)
+                hpp.update(raw)
+        self.assertEqual((pvt.count, hpp.count), (2, 2))
+        self.assertEqual(pvt.fixtypes, hpp.fixtypes)  # from NAV-PVT of same epoch
+        fixtype = pvt.fixtypes[0]
+        self.assertEqual(hpp.stats(fixtype)["count"], hpp.stats()["count"])
+        self.assertAlmostEqual(pvt.stats(fixtype)["lat"], hpp.stats()["lat"], 6)
+
+    def testStatistics(self):
+        raws = scatter(2000)
+        pos = PositionStats(ref=(53.0, -2.0, 100.0))
+        for raw in raws:
+            pos.update(raw)
+        stats = pos.stats()
+        self.assertEqual(stats["count"], 2000)
+        self.assertEqual(pos.fixtypes, [3, 4])
+        self.assertEqual(pos.stats(4)["count"], 500)
+        self.assertAlmostEqual(stats["lat"], 53.0, 6)
+        for std, exp in zip(stats["std"], (1.0, 1.0, 2.0)):
+            self.assertAlmostEqual(std, exp, delta=exp * 0.05)
+        self.assertAlmostEqual(stats["cov"][0][1], stats["cov"][1][0])
+        self.assertAlmostEqual(stats["2drms"], 2 * stats["drms"])
+        # circular normal distribution: CEP50 = 0.8326 DRMS, CEP95 = 1.7308 DRMS
+        self.assertAlmostEqual(stats["cep50"] / stats["drms"], 0.8326, delta=0.04)
+        self.assertAlmostEqual(stats["cep95"] / stats["drms"], 1.7308, delta=0.08)
+
+    def testMerge(self):
+        raws = scatter(1000, 1)
+        whole = PositionStats()
+        parts = [PositionStats(), PositionStats(), PositionStats()]
+        for i, raw in enumerate(raws):
+            whole.update(raw)
+            parts[i * 3 // 1000].update(raw)
+        merged = PositionStats()
+        for part in parts:
+            merged.merge(pickle.loads(pickle.dumps(part)))
+        merged.merge(PositionStats())  # empty
+        self.assertEqual(merged.ref, parts[0].ref)
+        exp, act = whole.stats(), merged.stats()
+        self.assertEqual(act["count"], 1000)
+        for key in ("lat", "lon"):
+            self.assertAlmostEqual(act[key], exp[key], 9)
+        self.assertAlmostEqual(act["height"], exp["height"], 4)
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(act["cov"][i][j], exp["cov"][i][j], 4)
+        self.assertAlmostEqual(act["cep95"], exp["cep95"], delta=exp["cep95"] * 0.05)
+        self.assertEqual(merged.stats(4)["count"], whole.stats(4)["count"])
+        # CEP sketches with common reference position merge exactly
+        ref = (53.0, -2.0, 100.0)
+        whole = PositionStats(ref=ref)
+        parts = [PositionStats(ref=ref), PositionStats(ref=ref)]
+        for i, raw in enumerate(raws):
+            whole.update(raw)
+            parts[i % 2].update(raw)
+        parts[0].merge(parts[1])
+        exp, act = whole.stats(), parts[0].stats()
+        for key in ("cep50", "cep95"):  # same buckets, so equal but for mean rounding
+            self.assertAlmostEqual(act[key], exp[key], 9)
+
+    def testErrors(self):
+        with self.assertRaisesRegex(ParameterError, "Invalid identity NAV-SAT"):
+            PositionStats("NAV-SAT")
+        pos = PositionStats()
+        with self.assertRaisesRegex(
+            ParameterError, "No positions received for fixType None"
+        ):
+            pos.stats()
+        self.assertFalse(pos.update(navpvt(1000, 53, -2, 100, flags=0)))
+        self.assertFalse(pos.update(b"\xb5b\x01\x07\x00\x00"))
+        self.assertFalse(pos.update(b"\xb5b\x01\x14\x00\x00"))
+        nav2 = b"\xb5b\x29" + navpvt(1000, 53, -2, 100)[3:]
+        self.assertFalse(pos.update(nav2))  # NAV2-PVT ignored
+        hpp = PositionStats("NAV-HPPOSLLH")
+        raw = UBXMessage("NAV", "NAV-HPPOSLLH", GET, invalidLlh=1, lat=53.0).serialize()
+        self.assertFalse(hpp.update(raw))
+        raw = UBXMessage("NAV", "NAV-HPPOSECEF", GET, invalidEcef=1).serialize()
+        self.assertFalse(PositionStats("NAV-HPPOSECEF").update(raw))
+        self.assertTrue(pos.update(navpvt(2000, 53, -2, 100)))
+        self.assertEqual((pos.count, pos.rejected), (1, 1))
+        with self.assertRaisesRegex(
+            ParameterError, "No positions received for fixType 2"
+        ):
+            pos.stats(2)
+        with self.assertRaisesRegex(
+            ParameterError, "Cannot merge NAV-HPPOSLLH statistics into NAV-PVT"
+        ):
+            pos.merge(hpp)
+        self.assertEqual(pos.stats()["std"], (0.0, 0.0, 0.0))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
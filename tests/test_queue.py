@@ -0,0 +1,205 @@
+"""
+UBXMessageQueue and ThreadedUBXReader tests for pyubx2.ubxqueue
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from queue import Empty
+from threading import Event
+from time import sleep
+
+from pyubx2 import (
+    DROP_COALESCE,
+    DROP_NEWEST,
+    DROP_OLDEST,
+    ERR_RAISE,
+    GET,
+    ParameterError,
+    ThreadedUBXReader,
+    UBXMessage,
+    UBXMessageQueue,
+    UBXParseError,
+    UBXReader,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def msg(identity: str, itow: int) -> tuple:
+    parsed = UBXMessage("NAV", identity, GET, iTOW=itow)
+    return (parsed.serialize(), parsed)
+
+
+class QueueTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testdropoldest(self):
+        que = UBXMessageQueue(maxsize=2, policy=DROP_OLDEST)
+        for i in range(4):
+            self.assertTrue(que.put(*msg("NAV-PVT", i)))
+        self.assertEqual(que.qsize(), 2)
+        self.assertEqual(que.maxsize, 2)
+        self.assertEqual([que.get()[1].iTOW for _ in range(2)], [2, 3])
+        self.assertTrue(que.empty())
+        self.assertEqual(
+            que.stats,
+            {
+                "queued": 4,
+                "dropped_oldest": 2,
+                "dropped_newest": 0,
+                "coalesced": 0,
+                "maxdepth": 2,
+            },
+        )
+        with self.assertRaises(Empty):
+            que.get(block=False)
+        with self.assertRaises(Empty):
+            que.get(timeout=0.01)
+
+    def testdropnewest(self):
+        que = UBXMessageQueue(maxsize=2, policy=DROP_NEWEST)
+        res = [que.put(*msg("NAV-PVT", i)) for i in range(4)]
+        self.assertEqual(res, [True, True, False, False])
+        self.assertEqual([que.get()[1].iTOW for _ in range(2)], [0, 1])
+        self.assertEqual(que.stats["dropped_newest"], 2)
+
+    def testcoalesce(self):
+        que = UBXMessageQueue(maxsize=3, policy=DROP_COALESCE)
+        self.assertTrue(que.put(*msg("NAV-PVT", 1)))
+        self.assertTrue(que.put(*msg("NAV-DOP", 1)))
+        # below capacity, identity derived from raw data, coalesced in place
+        self.assertFalse(que.put(msg("NAV-PVT", 2)[0]))
+        self.assertFalse(que.put(*msg("NAV-PVT", 3)))
+        self.assertEqual(que.qsize(), 2)
+        self.assertTrue(que.put(*msg("NAV-CLOCK", 3)))
+        self.assertTrue(que.put(*msg("NAV-SOL", 3)))  # no match, drops oldest
+        res = []
+        while not que.empty():
+            raw, parsed = que.get()
+            res.append((raw, None if parsed is None else parsed.identity))
+        self.assertEqual(
+            res,
+            [
+                (msg("NAV-DOP", 1)[0], "NAV-DOP"),
+                (msg("NAV-CLOCK", 3)[0], "NAV-CLOCK"),
+                (msg("NAV-SOL", 3)[0], "NAV-SOL"),
+            ],
+        )
+        self.assertEqual(que.stats["coalesced"], 2)
+        self.assertEqual(que.stats["dropped_oldest"], 1)
+        self.assertTrue(que.put(*msg("NAV-PVT", 4)))  # no longer queued
+        self.assertEqual(que.get()[1].iTOW, 4)
+        que.close()
+        with self.assertRaises(Empty):
+            que.get()  # closed, does not block
+
+    def testqueueerrors(self):
+        with self.assertRaisesRegex(ParameterError, "Invalid maxsize 0"):
+            UBXMessageQueue(maxsize=0)
+        with self.assertRaisesRegex(ParameterError, "Invalid policy 3"):
+            UBXMessageQueue(policy=3)
+
+    def testthreadedreader(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            expected = [parsed.identity for _, parsed in UBXReader(stream)]
+            stream.seek(0)
+            tur = ThreadedUBXReader(UBXReader(stream), maxsize=1000)
+            tur.start()
+            res = [parsed.identity for _, parsed in tur]
+            tur.stop()
+        self.assertEqual(res, expected)
+        self.assertFalse(tur.running)
+        self.assertEqual(tur.stats["queued"], len(expected))
+        self.assertEqual(tur.queue.qsize(), 0)
+        self.assertEqual(tur.read(timeout=0), (None, None))
+
+    def testthreadedrestart(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            expected = [parsed.identity for _, parsed in UBXReader(stream)]
+            stream.seek(0)
+            tur = ThreadedUBXReader(UBXReader(stream), maxsize=1000)
+            tur.start()
+            self.assertEqual([parsed.identity for _, parsed in tur], expected)
+            tur.stop()
+            stream.seek(0)
+            tur.start()  # queue reopened
+            self.assertEqual([parsed.identity for _, parsed in tur], expected)
+            tur.stop()
+        self.assertEqual(tur.stats["queued"], len(expected) * 2)
+        que = UBXMessageQueue()
+        que.put(*msg("NAV-PVT", 1000))
+        que.close()
+        que.reopen()
+        self.assertEqual(que.get()[1].iTOW, 1000)  # retained
+        with self.assertRaises(Empty):
+            que.get(timeout=0.01)  # not closed, so waits
+
+    def testthreadedrunning(self):
+        class BlockingReader:  # read() blocks until released
+            def __init__(self):
+                self.release = Event()
+                self.calls = 0
+
+            def read(self):
+                self.calls += 1
+                self.release.wait()
+                return (None, None)
+
+        rdr = BlockingReader()
+        tur = ThreadedUBXReader(rdr)
+        tur.start()
+        thread = tur._thread
+        tur.start()  # already running, ignored
+        self.assertIs(tur._thread, thread)
+        rdr.release.set()
+        tur.stop()
+        self.assertFalse(tur.running)
+        self.assertEqual(rdr.calls, 1)
+
+    def testthreadedoverflow(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            tur = ThreadedUBXReader(UBXReader(stream), maxsize=5, policy=DROP_COALESCE)
+            tur.start()
+            while tur.running:  # consumer stalled until reader finished
+                sleep(0.01)
+        self.assertEqual(
+            tur.stats,
+            {
+                "queued": 3,
+                "dropped_oldest": 0,
+                "dropped_newest": 0,
+                "coalesced": 4,
+                "maxdepth": 3,
+            },
+        )
+        self.assertEqual(
+            [parsed.identity for _, parsed in tur],
+            ["NAV-PVT", "GPGGA", "GPGSA"],
+        )
+
+    def testthreadederror(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-BADHDR.log"), "rb") as stream:
+            tur = ThreadedUBXReader(UBXReader(stream, quitonerror=ERR_RAISE))
+            tur.start()
+            with self.assertRaises(UBXParseError):
+                while True:
+                    tur.read()
+            self.assertEqual(tur.read(), (None, None))
+            tur.stop()
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
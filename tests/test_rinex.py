@@ -0,0 +1,163 @@
+"""
+RINEX observation export tests for pyubx2.ubxrinex
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO, StringIO
+from threading import Event
+
+from pyubx2 import GET, RINEXWriter, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def rawx(meas: list, rcvtow: float = 302400.5, week: int = 2400) -> bytes:
+    kwargs = {"rcvTow": rcvtow, "week": week, "leapS": 18, "numMeas": len(meas)}
+    for i, (gnss, svid, sigid, locktime, trk) in enumerate(meas, 1):
+        kwargs.update(
+            {
+                f"prMes_{i:02d}": 20000000.123 + i,
+                f"cpMes_{i:02d}": 100000000.456 + i,
+                f"doMes_{i:02d}": -1000.5,
+                f"gnssId_{i:02d}": gnss,
+                f"svId_{i:02d}": svid,
+                f"sigId_{i:02d}": sigid,
+                f"freqId_{i:02d}": 9,
+                f"locktime_{i:02d}": locktime,
+                f"cno_{i:02d}": 40,
+                f"prValid_{i:02d}": trk & 1,
+                f"cpValid_{i:02d}": trk >> 1 & 1,
+                f"halfCyc_{i:02d}": trk >> 2 & 1,
+            }
+        )
+    return UBXMessage("RXM", "RXM-RAWX", GET, **kwargs).serialize()
+
+
+class RINEXTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testrinexlog(self):
+        out = StringIO()
+        rnx = RINEXWriter(out, marker="TEST", receiver="u-blox ZED-F9P")
+        with open(os.path.join(DIRNAME, "pygpsdata-RXMRAWX.log"), "rb") as stream:
+            self.assertEqual(rnx.run(stream), 14)
+        self.assertEqual(rnx.count, 14)
+        lines = out.getvalue().splitlines()
+        hdr = lines[: lines.index(f"{'':60}END OF HEADER") + 1]
+        for line in hdr:
+            self.assertLessEqual(len(line), 80)
+        self.assertEqual(
+            hdr[0],
+            f"{'     3.04           OBSERVATION DATA    M':<60}RINEX VERSION / TYPE",
+        )
+        self.assertIn(f"{'TEST':<60}MARKER NAME", hdr)
+        self.assertIn(
+            f"{'  2024     8    13    14     9   53.0000000     GPS':<60}TIME OF FIRST OBS",
+            hdr,
+        )
+        self.assertIn(
+            f"{'  8 R01  1 R02 -4 R03  5 R11  0 R12 -1 R17  4 R18 -3 R19  3':<60}GLONASS SLOT / FRQ #",
+            hdr,
+        )
+        self.assertIn(f"{'    18':<60}LEAP SECONDS", hdr)
+        epochs = [line for line in lines if line[0] == ">"]
+        self.assertEqual(len(epochs), 14)
+        self.assertEqual(epochs[0], "> 2024 08 13 14 09 53.0000000  0 23")
+        self.assertEqual(epochs[-1], "> 2024 08 13 14 10  6.0000000  0 21")
+        self.assertEqual(
+            lines[len(hdr) + 1],
+            "G06  21565176.165   113325769.799 5     -2675.573          33.000",
+        )
+        self.assertEqual(
+            lines[len(hdr) + 5],
+            "E03  27440101.140                       -3019.359          22.000",
+        )
+
+    def testrinexconsistent(self):  # values match parsed message
+        with open(os.path.join(DIRNAME, "pygpsdata-RXMRAWX.log"), "rb") as stream:
+            for raw, parsed in UBXReader(stream):
+                if parsed.identity == "RXM-RAWX":
+                    break
+        out = StringIO()
+        RINEXWriter(out, signals={"C": ("2I",)}).write(raw)
+        lines = out.getvalue().splitlines()
+        sats = {
+            line[:3]: line for line in lines[lines.index(f"{'':60}END OF HEADER") + 2 :]
+        }
+        self.assertEqual(len(sats), 6)
+        for i in range(1, parsed.numMeas + 1):
+            if getattr(parsed, f"gnssId_{i:02d}") == 3:
+                line = sats[f"C{getattr(parsed, f'svId_{i:02d}'):02d}"]
+                self.assertEqual(
+                    float(line[3:17]), round(getattr(parsed, f"prMes_{i:02d}"), 3)
+                )
+                self.assertEqual(float(line[51:65]), getattr(parsed, f"cno_{i:02d}"))
+
+    def testrinexlli(self):
+        out = StringIO()
+        rnx = RINEXWriter(out, signals={"G": ("1C", "2L"), "S": ("1C",)})
+        self.assertFalse(rnx.write(UBXMessage("NAV", "NAV-CLOCK", GET).serialize()))
+        self.assertTrue(
+            rnx.write(
+                rawx(
+                    [
+                        (0, 5, 0, 5000, 7),
+                        (0, 5, 3, 5000, 3),
+                        (1, 123, 0, 100, 7),
+                        (6, 255, 0, 100, 7),
+                    ]
+                )
+            )
+        )
+        self.assertTrue(
+            rnx.write(
+                rawx(
+                    [(0, 5, 0, 6000, 5), (0, 5, 3, 1000, 7), (0, 7, 4, 100, 7)],
+                    302401.0,
+                )
+            )
+        )
+        lines = out.getvalue().splitlines()
+        idx = lines.index(f"{'':60}END OF HEADER")
+        self.assertNotIn("GLONASS SLOT / FRQ #", out.getvalue())
+        self.assertNotIn("LEAP SECONDS", out.getvalue())  # leapSec not valid
+        self.assertEqual(
+            lines[idx + 1 :],
+            [
+                "> 2026 01 07 12 00  0.5000000  0  2",
+                "G05  20000001.123   100000001.456 6     -1000.500          40.000    20000002.123   100000002.45626     -1000.500          40.000",
+                "S23  20000003.123   100000003.456 6     -1000.500          40.000",
+                "> 2026 01 07 12 00  1.0000000  0  1",  # G07 2S not output
+                "G05  20000001.123                       -1000.500          40.000    20000002.123   100000002.45616     -1000.500          40.000",
+            ],
+        )
+        self.assertEqual(rnx.count, 2)
+
+    def testrinexinvalid(self):
+        rnx = RINEXWriter(StringIO())
+        raw = rawx([(0, 5, 0, 5000, 7)])
+        self.assertFalse(rnx.write(raw[:20]))
+        self.assertFalse(rnx.write(raw[:6] + raw[6:22] + raw[-2:]))  # truncated group
+        stop = Event()
+        stop.set()
+        self.assertEqual(rnx.run(BytesIO(raw), stop), 0)
+        self.assertEqual(rnx.run(BytesIO(raw[:-1] + b"\x00")), 0)  # bad checksum
+        self.assertEqual(rnx.count, 0)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
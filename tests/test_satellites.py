@@ -0,0 +1,192 @@
+"""
+Satellite state tracker tests for pyubx2.ubxsatellites
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from array import array
+
+from pyubx2 import (
+    GET,
+    SAT_ACQUIRED,
+    SAT_HEALTH,
+    SAT_LOST,
+    SAT_SLIP,
+    SatelliteTracker,
+    UBXMessage,
+    UBXReader,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def navsig(sigs: list) -> bytes:
+    kwargs = {"iTOW": 1000, "numSigs": len(sigs)}
+    for i, (gnss, svid, sigid, cno, health) in enumerate(sigs, 1):
+        kwargs.update(
+            {
+                f"gnssId_{i:02d}": gnss,
+                f"svId_{i:02d}": svid,
+                f"sigId_{i:02d}": sigid,
+                f"prRes_{i:02d}": -1.5,
+                f"cno_{i:02d}": cno,
+                f"qualityInd_{i:02d}": 7,
+                f"health_{i:02d}": health,
+            }
+        )
+    return UBXMessage("NAV", "NAV-SIG", GET, **kwargs).serialize()
+
+
+def rawx(meas: list) -> bytes:
+    kwargs = {"rcvTow": 1.0, "week": 2400, "numMeas": len(meas)}
+    for i, (gnss, svid, sigid, locktime) in enumerate(meas, 1):
+        kwargs.update(
+            {
+                f"gnssId_{i:02d}": gnss,
+                f"svId_{i:02d}": svid,
+                f"sigId_{i:02d}": sigid,
+                f"locktime_{i:02d}": locktime,
+                f"cno_{i:02d}": 40,
+            }
+        )
+    return UBXMessage("RXM", "RXM-RAWX", GET, **kwargs).serialize()
+
+
+def navsat(svs: list, nav2: bool = False) -> bytes:
+    kwargs = {"iTOW": 1000, "numSvs": len(svs)}
+    for i, (gnss, svid, cno) in enumerate(svs, 1):
+        kwargs.update(
+            {f"gnssId_{i:02d}": gnss, f"svId_{i:02d}": svid, f"cno_{i:02d}": cno}
+        )
+    cls, msg = ("NAV2", "NAV2-SAT") if nav2 else ("NAV", "NAV-SAT")
+    return UBXMessage(cls, msg, GET, **kwargs).serialize()
+
+
+class SatellitesTest(unittest.TestCase):
+    def testNAV(self):
+        tracker = SatelliteTracker()
+        events = []
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            for raw, parsed in UBXReader(stream, protfilter=2):
+                evts = tracker.update(raw, now=5.0)
+                events += evts
+                if parsed.identity != "NAV-SAT":
+                    continue
+                self.assertEqual(len(evts), parsed.numSvs)
+                for i in range(1, parsed.numSvs + 1):
+                    state = tracker.get(
+                        getattr(parsed, f"gnssId_{i:02d}"),
+                        getattr(parsed, f"svId_{i:02d}"),
+                    )
+                    for name in ("cno", "elev", "azim", "health", "qualityInd"):
+                        self.assertEqual(
+                            state[name], getattr(parsed, f"{name}_{i:02d}")
+                        )
+                    self.assertAlmostEqual(
+                        state["prRes"], getattr(parsed, f"prRes_{i:02d}"), 5
+                    )
+        self.assertEqual(tracker.count, 2)
+        self.assertEqual(sum(evt[0] == SAT_ACQUIRED for evt in events), len(tracker))
+        # NAV-SIG secondary signal inherits NAV-SAT elevation and azimuth
+        prim, sec = tracker.get(3, 5, 0), tracker.get(3, 5, 1)
+        self.assertEqual((sec["elev"], sec["azim"]), (prim["elev"], prim["azim"]))
+        self.assertEqual(
+            (sec["firstSeen"], sec["lastSeen"], sec["tracked"]), (5.0, 5.0, True)
+        )
+        self.assertIsNone(tracker.get(3, 5, 7))
+
+    def testEvents(self):
+        tracker = SatelliteTracker()
+        self.assertEqual(
+            tracker.update(navsig([(0, 1, 0, 40, 1), (0, 1, 3, 30, 1)]), now=1.0),
+            [(SAT_ACQUIRED, 0, 1, 0), (SAT_ACQUIRED, 0, 1, 3)],
+        )
+        self.assertEqual(tracker.update(rawx([(0, 1, 3, 5000)]), now=2.0), [])
+        self.assertEqual(
+            tracker.update(navsig([(0, 1, 0, 41, 2)]), now=3.0),
+            [(SAT_HEALTH, 0, 1, 0)],
+        )  # (0, 1, 3) still reported by RXM-RAWX
+        self.assertEqual(
+            tracker.update(rawx([(0, 1, 3, 200), (2, 4, 0, 100)]), now=4.0),
+            [(SAT_SLIP, 0, 1, 3), (SAT_ACQUIRED, 2, 4, 0)],
+        )
+        self.assertEqual(
+            tracker.update(rawx([(2, 4, 0, 200)]), now=5.0), [(SAT_LOST, 0, 1, 3)]
+        )
+        self.assertEqual(
+            tracker.update(navsig([(0, 1, 0, 41, 2), (0, 1, 3, 30, 1)]), now=6.0),
+            [(SAT_ACQUIRED, 0, 1, 3)],
+        )
+        state = tracker.get(0, 1, 3)
+        self.assertEqual(
+            (state["locktime"], state["firstSeen"], state["lastSeen"]), (200, 1.0, 6.0)
+        )
+        self.assertEqual(
+            (tracker.get(0, 1, 0)["cno"], tracker.get(0, 1, 0)["health"]), (41, 2)
+        )
+        self.assertEqual(
+            tracker.update(navsig([]), now=7.0),
+            [(SAT_LOST, 0, 1, 0), (SAT_LOST, 0, 1, 3)],
+        )
+        self.assertEqual(len(tracker), 1)
+        self.assertFalse(tracker.get(0, 1, 0)["tracked"])
+
+    def testNAV2(self):  # primary and secondary outputs are separate sources
+        tracker = SatelliteTracker()
+        self.assertEqual(
+            tracker.update(navsat([(0, 1, 40), (0, 2, 35)]), now=1.0),
+            [(SAT_ACQUIRED, 0, 1, 0), (SAT_ACQUIRED, 0, 2, 0)],
+        )
+        for epoch in range(2, 5):
+            self.assertEqual(
+                tracker.update(navsat([(0, 1, 41)], nav2=True), now=epoch), []
+            )
+            self.assertEqual(
+                tracker.update(navsat([(0, 1, 40), (0, 2, 35)]), now=epoch), []
+            )
+        self.assertEqual(len(tracker), 2)
+        self.assertEqual(
+            tracker.update(navsat([(0, 1, 40)]), now=5.0), [(SAT_LOST, 0, 2, 0)]
+        )
+        self.assertEqual(tracker.update(navsat([], nav2=True), now=5.0), [])
+        self.assertEqual(tracker.update(navsat([]), now=6.0), [(SAT_LOST, 0, 1, 0)])
+
+    def testSnapshot(self):
+        tracker = SatelliteTracker()
+        tracker.update(navsig([(0, 1, 0, 40, 1), (2, 11, 5, 35, 1), (3, 21, 0, 45, 0)]))
+        tracker.update(navsig([(0, 1, 0, 40, 1), (3, 21, 0, 46, 0)]))
+        snap = tracker.snapshot(("svId", "sigId", "cno"))
+        self.assertEqual(list(snap), ["svId", "sigId", "cno"])
+        self.assertEqual(snap["svId"], array("B", [1, 21]))
+        self.assertEqual(snap["cno"], array("B", [40, 46]))
+        snap = tracker.snapshot(tracked=False)
+        self.assertEqual(snap["sigId"], array("B", [0, 5, 0]))
+        self.assertEqual(snap["prRes"].typecode, "f")
+        self.assertEqual(len(snap), 12)
+        snap["cno"][0] = 0  # snapshot is a copy
+        self.assertEqual(tracker.get(0, 1)["cno"], 40)
+
+    def testRun(self):
+        tracker = SatelliteTracker()
+        with open(os.path.join(DIRNAME, "pygpsdata-RXMRAWX.log"), "rb") as stream:
+            self.assertEqual(tracker.run(stream), 14)
+        self.assertEqual(tracker.count, 14)
+        self.assertEqual(len(tracker), 21)
+        self.assertEqual(tracker.update(b"\xb5b\x01\x07\x00\x00"), [])
+        self.assertEqual(tracker.update(b"\xb5b\x02\x15\x10\x00"), [])  # truncated
+        raw = rawx([(0, 1, 0, 100)])
+        self.assertEqual(tracker.update(raw[:-10] + raw[-2:]), [])
+        self.assertEqual(tracker.count, 14)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+ESF sensor ring buffer tests for pyubx2.ubxsensor
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from array import array
+from struct import pack
+
+from pyubx2 import GET, ParameterError, SensorBuffer, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def word(datatype: int, field: int) -> int:
+    return (datatype << 24) | (field & 0xFFFFFF)
+
+
+def esfraw(samples: list) -> bytes:
+    payload = pack("<L", 0)
+    for datatype, field, stag in samples:
+        payload += pack("<LL", word(datatype, field), stag)
+    return UBXMessage("ESF", "ESF-RAW", GET, payload=payload).serialize()
+
+
+def esfmeas(ttag: int, data: list, calibttag: int | None = None) -> bytes:
+    flags = len(data) << 11 | (0 if calibttag is None else 8)
+    payload = pack("<LHH", ttag, flags, 0)
+    for datatype, field in data:
+        payload += pack("<L", word(datatype, field))
+    if calibttag is not None:
+        payload += pack("<L", calibttag)
+    return UBXMessage("ESF", "ESF-MEAS", GET, payload=payload).serialize()
+
+
+class SensorTest(unittest.TestCase):
+    def testESFMEAS(self):
+        sensors = SensorBuffer(size=100)
+        with open(os.path.join(DIRNAME, "pygpsdata-ESF.log"), "rb") as stream:
+            self.assertEqual(sensors.run(stream), 19)
+            stream.seek(0)
+            msgs = [parsed for _, parsed in UBXReader(stream)]
+        self.assertEqual(sensors.datatypes, [5, 12, 13, 14, 16, 17, 18])
+        self.assertEqual(sensors.calibttag, msgs[-1].dataField_05)  # calibTtag
+        expected = {}
+        for msg in msgs:
+            for i in range(1, msg.numMeas + 1):
+                expected.setdefault(getattr(msg, f"dataType_{i:02d}"), []).append(
+                    (msg.timeTag, getattr(msg, f"dataField_{i:02d}"))
+                )
+        for datatype, vals in expected.items():
+            ttags, values = sensors.samples(datatype)
+            self.assertEqual(ttags, array("I", [ttag for ttag, _ in vals]))
+            self.assertEqual(len(values), len(vals))
+        ttag, value = sensors.latest(12)
+        self.assertEqual((ttag, value), (74132, 26.41))  # gyro temp 2641 * 0.01
+        self.assertEqual(sensors.latest(13)[1], -269 * 2**-12)  # signed 24 bit
+
+    def testESFRAW(self):
+        sensors = SensorBuffer(size=3)
+        raw = esfraw(
+            [(16, 1024, 100), (17, -2048, 100), (5, 4096, 100), (16, 512, 110)]
+        )
+        self.assertEqual(sensors.update(raw), 4)
+        self.assertEqual(
+            sensors.samples(16), (array("I", [100, 110]), array("d", [1.0, 0.5]))
+        )
+        self.assertEqual(sensors.latest(17), (100, -2.0))
+        self.assertEqual(sensors.latest(5), (100, 1.0))
+        sensors.update(esfraw([(16, 1024 * n, 110 + 10 * n) for n in range(1, 4)]))
+        self.assertEqual(
+            sensors.samples(16),
+            (array("I", [120, 130, 140]), array("d", [1.0, 2.0, 3.0])),
+        )
+        self.assertEqual(sensors.latest(16), (140, 3.0))
+        self.assertEqual(sensors.size, 3)
+        self.assertEqual(sensors.count, 2)
+
+    def testTicks(self):
+        sensors = SensorBuffer()
+        raw = esfmeas(5000, [(8, 1234), (9, 0x800000 | 1234), (11, -1500)], 4990)
+        self.assertEqual(sensors.update(raw), 3)
+        self.assertEqual(sensors.latest(8), (5000, 1234))
+        self.assertEqual(sensors.latest(9), (5000, -1234))  # backward
+        self.assertEqual(sensors.latest(11), (5000, -1.5))
+        self.assertEqual(sensors.calibttag, 4990)
+        self.assertEqual(sensors.datatypes, [8, 9, 11])  # calibTtag not a sample
+        self.assertEqual(sensors.update(esfmeas(5100, [(10, 7)])), 1)
+        self.assertEqual(sensors.calibttag, 4990)
+
+    def testErrors(self):
+        with self.assertRaisesRegex(ParameterError, "Invalid size 0"):
+            SensorBuffer(size=0)
+        sensors = SensorBuffer()
+        with self.assertRaisesRegex(
+            ParameterError, "No samples received for data type 5"
+        ):
+            sensors.samples(5)
+        self.assertEqual(sensors.update(b"\xb5b\x01\x07\x00\x00"), 0)
+        raw = esfmeas(5000, [(5, 1), (13, 2)], 4990)
+        self.assertEqual(sensors.update(raw[:-6] + raw[-2:]), 0)  # truncated
+        self.assertEqual(sensors.count, 0)
+        with self.assertRaises(ParameterError):
+            sensors.latest(5)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+MON-SPAN spectrum waterfall tests for pyubx2.ubxspectrum
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from array import array
+from struct import pack
+
+from pyubx2 import GET, ParameterError, SpectrumWaterfall, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def monspan(spectra: list, center: int = 1583400000, pga: int = 54) -> bytes:
+    payload = pack("<BB2x", 0, len(spectra))
+    for spec in spectra:
+        payload += bytes(spec) + pack("<LLLB3x", 128000000, 500000, center, pga)
+    return UBXMessage("MON", "MON-SPAN", GET, payload=payload).serialize()
+
+
+class SpectrumTest(unittest.TestCase):
+    def testSample(self):
+        swf = SpectrumWaterfall(depth=5)
+        with open(
+            os.path.join(DIRNAME, "..", "examples", "mon_span.ubx"), "rb"
+        ) as stream:
+            self.assertEqual(swf.run(stream), 7)
+            stream.seek(0)
+            spans = [
+                parsed
+                for _, parsed in UBXReader(stream)
+                if parsed.identity == "MON-SPAN"
+            ]
+        self.assertEqual((swf.count, swf.blocks, swf.depth), (7, 2, 5))
+        last = spans[-1]
+        self.assertEqual(list(swf.spectrum(0)), last.spectrum_01)
+        self.assertEqual(list(swf.spectrum(0, 1)), spans[-2].spectrum_01)
+        self.assertEqual(swf.pga(0), last.pga_01)
+        freqs = swf.frequencies(0)
+        self.assertEqual(len(freqs), 256)
+        self.assertEqual(freqs[0], last.center_01 - last.span_01 / 2)
+        self.assertEqual(freqs[1] - freqs[0], last.res_01)
+        self.assertEqual(
+            list(swf.maxhold(0)), list(map(max, *(msg.spectrum_01 for msg in spans)))
+        )
+        held = [msg.spectrum_01 for msg in spans[-5:]]
+        self.assertEqual(list(swf.average(0)), [sum(col) / 5 for col in zip(*held)])
+        self.assertEqual(swf.waterfall(0), b"".join(bytes(spec) for spec in held))
+
+    def testRing(self):
+        swf = SpectrumWaterfall(depth=3)
+        self.assertEqual(swf.update(monspan([[10] * 256, [1] * 256])), 2)
+        self.assertEqual(swf.update(monspan([[20] * 256])), 1)
+        self.assertEqual(swf.waterfall(0), bytes([10] * 256 + [20] * 256))
+        self.assertEqual(swf.waterfall(1), bytes([1] * 256))
+        self.assertEqual(swf.average(0), array("d", [15.0] * 256))
+        for val in (30, 5, 6, 7):  # unprocessed 30 is evicted after 5
+            swf.update(monspan([[val] * 256], center=1227600000, pga=40))
+        self.assertEqual(swf.spectrum(0), array("B", [7] * 256))
+        self.assertEqual(swf.spectrum(0, 2), array("B", [5] * 256))
+        self.assertEqual(swf.waterfall(0), bytes([5] * 256 + [6] * 256 + [7] * 256))
+        self.assertEqual(swf.average(0)[0], 6.0)
+        self.assertEqual(swf.maxhold(0)[0], 30)
+        self.assertEqual(swf.frequencies(0)[128], 1227600000)
+        self.assertEqual(swf.pga(0), 40)
+        swf.reset_maxhold()
+        self.assertEqual(swf.maxhold(0), array("B", [0] * 256))
+        swf.update(monspan([[4] * 256]))
+        self.assertEqual(swf.maxhold(0)[255], 4)
+        self.assertEqual(swf.count, 7)
+
+    def testErrors(self):
+        with self.assertRaisesRegex(ParameterError, "Invalid depth 0"):
+            SpectrumWaterfall(depth=0)
+        swf = SpectrumWaterfall()
+        with self.assertRaisesRegex(
+            ParameterError, "No spectra received for RF block 0"
+        ):
+            swf.spectrum()
+        self.assertEqual(swf.update(b"\xb5b\x01\x07\x00\x00"), 0)
+        raw = monspan([[1] * 256])
+        self.assertEqual(swf.update(raw[:-10] + raw[-2:]), 0)
+        swf.update(raw)
+        with self.assertRaisesRegex(
+            ParameterError, "Spectrum 1 not held - 1 available"
+        ):
+            swf.spectrum(0, 1)
+        with self.assertRaises(ParameterError):
+            swf.maxhold(1)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
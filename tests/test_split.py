@@ -0,0 +1,115 @@
+"""
+Log split and filter tests for pyubx2.ubxsplit
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+from threading import Event
+
+from pyubx2 import (
+    GET,
+    UBX_PROTOCOL,
+    ParameterError,
+    UBXMessage,
+    UBXReader,
+    UBXSplitter,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class SplitTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            self.data = stream.read()
+        self.frames = [
+            (raw, parsed.identity) for raw, parsed in UBXReader(BytesIO(self.data))
+        ]
+
+    def tearDown(self):
+        pass
+
+    def testidentities(self):
+        out = BytesIO()
+        spl = UBXSplitter(out, identities=("NAV-PVT", "GPGSA"))
+        self.assertEqual(spl.run(BytesIO(self.data)), 5)
+        self.assertEqual(
+            out.getvalue(),
+            b"".join(
+                raw for raw, identity in self.frames if identity in ("NAV-PVT", "GPGSA")
+            ),
+        )
+        out = BytesIO()
+        spl = UBXSplitter(out, protfilter=UBX_PROTOCOL)
+        spl.run(BytesIO(self.data))
+        self.assertEqual(spl.count, 3)
+
+    def testitowrange(self):
+        out = BytesIO()
+        spl = UBXSplitter(out, itowrange=(201786000, 201787000))
+        self.assertEqual(spl.run(BytesIO(self.data)), 3)  # NAV-PVT, GPGGA, GPGSA
+        self.assertEqual(out.getvalue(), b"".join(raw for raw, _ in self.frames[3:6]))
+        data = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n" + self.data
+        self.assertEqual(
+            UBXSplitter(BytesIO(), itowrange=(0, 1e9)).run(BytesIO(data)), 7
+        )
+
+    def testbyterange(self):
+        sizes = [len(raw) for raw, _ in self.frames]
+        start = 10  # mid-frame, resyncs to next frame
+        end = sum(sizes[:4]) + 5  # frame 4 not complete
+        out = BytesIO()
+        spl = UBXSplitter(out)
+        self.assertEqual(spl.run(BytesIO(self.data), byterange=(start, end)), 3)
+        self.assertEqual(out.getvalue(), b"".join(raw for raw, _ in self.frames[1:4]))
+
+    def testperiod(self):
+        data = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+        for itow in (3599000, 3600000, 3601000, 7200000, 0):
+            data += UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=itow).serialize()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            spl = UBXSplitter(
+                os.path.join(tmpdir, "log-{:02d}-{itow}.ubx"), period=3600
+            )
+            self.assertEqual(spl.run(BytesIO(data)), 6)
+            self.assertEqual(
+                [os.path.basename(f) for f in spl.files],
+                [
+                    "log-00-0.ubx",
+                    "log-01-3600000.ubx",
+                    "log-02-7200000.ubx",
+                    "log-03-0.ubx",
+                ],
+            )
+            counts = []
+            for filename in spl.files:
+                with open(filename, "rb") as stream:
+                    counts.append(len(list(UBXReader(stream))))
+            self.assertEqual(counts, [2, 2, 1, 1])
+
+    def testerrors(self):
+        with self.assertRaisesRegex(
+            ParameterError, "Output must be a file name pattern if period > 0"
+        ):
+            UBXSplitter(BytesIO(), period=60)
+        stop = Event()
+        stop.set()
+        self.assertEqual(
+            UBXSplitter(BytesIO()).run(BytesIO(self.data), stopevent=stop), 0
+        )
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
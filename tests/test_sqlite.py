@@ -0,0 +1,251 @@
+"""
+SQLite loader tests for pyubx2.ubxsqlite
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from io import BytesIO
+from threading import Event
+
+from pyubx2 import GET, ParameterError, SQLiteLoader, UBXMessage, UBXReader
+from pyubx2.ubxsqlite import _bind
+
+DIRNAME = os.path.dirname(__file__)
+ZED = os.path.join(DIRNAME, "pygpsdata-NAV-ZED-X20P.log")
+NAVLOG = os.path.join(DIRNAME, "pygpsdata-NAV.log")
+
+
+def parsed(path: str, identity: str) -> list:
+    with open(path, "rb") as stream:
+        return [
+            (raw, msg) for raw, msg in UBXReader(stream) if msg.identity == identity
+        ]
+
+
+class StopAfter(Event):
+    def __init__(self, calls: int):
+        super().__init__()
+        self._calls = calls
+
+    def is_set(self) -> bool:
+        self._calls -= 1
+        return self._calls < 0
+
+
+class SQLiteTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.tmpdir.name, "gnss.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def testSchema(self):
+        with SQLiteLoader(self.db, identities=("NAV-PVT", "NAV-HPPOSLLH")) as sql:
+            self.assertEqual(sql.load(ZED), 4)
+            self.assertEqual(
+                sql.tables, {"NAV-PVT": "nav_pvt", "NAV-HPPOSLLH": "nav_hpposllh"}
+            )
+            con = sql.connection
+            self.assertEqual(
+                con.execute("PRAGMA journal_mode").fetchone()[0].lower(), "wal"
+            )
+            cols = [row[1] for row in con.execute("PRAGMA table_info(nav_pvt)")]
+            self.assertEqual(cols[:5], ["_id", "_source", "_offset", "iTOW", "year"])
+            self.assertIn("gnssFixOk", cols)  # bitfield flags
+            self.assertIn("carrSoln", cols)
+            self.assertNotIn("flags", cols)
+            self.assertFalse([col for col in cols if col.startswith("reserved")])
+            types = {
+                row[1]: row[2] for row in con.execute("PRAGMA table_info(nav_pvt)")
+            }
+            self.assertEqual((types["iTOW"], types["lat"]), ("INTEGER", "REAL"))
+            con.row_factory = sqlite3.Row
+            rows = con.execute("SELECT * FROM nav_pvt ORDER BY _id").fetchall()
+            with open(ZED, "rb") as stream:
+                data = stream.read()
+            for row, (raw, msg) in zip(rows, parsed(ZED, "NAV-PVT")):
+                self.assertEqual(data[row["_offset"] : row["_offset"] + len(raw)], raw)
+                for col in ("iTOW", "fixType", "gnssFixOk", "lat", "lon", "hMSL"):
+                    self.assertEqual(row[col], getattr(msg, col))
+            self.assertEqual(rows[0]["_source"], 1)
+            hpp = con.execute("SELECT lat, lon, height FROM nav_hpposllh").fetchall()
+            for row, (_, msg) in zip(hpp, parsed(ZED, "NAV-HPPOSLLH")):
+                self.assertEqual(
+                    (row["lat"], row["lon"], row["height"]),
+                    (msg.lat, msg.lon, msg.height),  # including _HP components
+                )
+            con.row_factory = None
+        self.assertIsNone(sql.connection)
+        sql.close()  # idempotent
+
+    def testGroups(self):
+        with SQLiteLoader(":memory:", identities=["NAV-SAT"]) as sql:
+            self.assertEqual(sql.load(NAVLOG), 1)
+            con = sql.connection
+            (_, msg), *_ = parsed(NAVLOG, "NAV-SAT")
+            rows = con.execute(
+                "SELECT _msg, _idx, gnssId, svId, cno, svUsed FROM nav_sat_group ORDER BY _idx"
+            ).fetchall()
+            self.assertEqual(len(rows), msg.numSvs)
+            for msgid, idx, gnssid, svid, cno, used in rows:
+                self.assertEqual(msgid, 1)
+                self.assertEqual(
+                    (gnssid, svid, cno, used),
+                    tuple(
+                        getattr(msg, f"{att}_{idx:02d}")
+                        for att in ("gnssId", "svId", "cno", "svUsed")
+                    ),
+                )
+            self.assertEqual(
+                con.execute("SELECT numSvs FROM nav_sat").fetchone()[0], msg.numSvs
+            )
+
+    def testAllIdentities(self):
+        with SQLiteLoader(":memory:") as sql:
+            self.assertEqual(sql.load(NAVLOG), sql.count)
+            self.assertIn("NAV-SAT", sql.tables)
+            self.assertIn("NAV-PVT", sql.tables)
+            # fixed size groups are flattened
+            raw = UBXMessage(
+                "MON", "MON-SPAN", GET, numRfBlocks=1, spectrum_01=list(range(256))
+            ).serialize()
+            self.assertTrue(sql.update(raw))
+            raw = UBXMessage("MON", "MON-HW", GET, VP_17=b"\x09").serialize()
+            self.assertTrue(sql.update(raw))
+            raw = UBXMessage("INF", "INF-NOTICE", GET, message="hello").serialize()
+            self.assertTrue(sql.update(raw))
+            # column names which differ only in case are suffixed
+            raw = UBXMessage("CFG", "CFG-NAVX5", GET, minCno=1, minCNO=30).serialize()
+            self.assertTrue(sql.update(raw))
+            self.assertFalse(sql.update(b"\xb5b\x06\x01\x00\x00\x07\x16"))  # not GET
+            self.assertEqual(sql.flush(), 4)
+            con = sql.connection
+            self.assertEqual(
+                con.execute("SELECT minCno, minCNO_ FROM cfg_navx5").fetchone(), (1, 30)
+            )
+            self.assertEqual(
+                con.execute("SELECT spectrum FROM mon_span_group").fetchone()[0],
+                bytes(range(256)),
+            )
+            self.assertEqual(
+                con.execute("SELECT VP_16, VP_17 FROM mon_hw").fetchone(),
+                (b"\x00", b"\x09"),
+            )
+            self.assertEqual(
+                con.execute("SELECT message FROM inf_notice").fetchone()[0], "hello"
+            )
+
+    def testResume(self):
+        with open(ZED, "rb") as stream:
+            data = stream.read()
+        log = os.path.join(self.tmpdir.name, "growing.ubx")
+        with open(log, "wb") as stream:
+            stream.write(data[:3000])  # ends mid-message
+        with SQLiteLoader(self.db, batchsize=5) as sql:
+            first = sql.load(log, stopevent=StopAfter(25))
+            self.assertGreater(first, 0)
+            offset = sql.offset(log)
+            self.assertEqual(sql.pending, 0)
+            self.assertEqual(offset, 906)  # end of 25th message
+            self.assertEqual(
+                sql.connection.execute("SELECT COUNT(*) FROM nav_pvt").fetchone()[0], 1
+            )
+        self.assertEqual(SQLiteLoader(self.db).offset(os.path.relpath(log)), offset)
+        with open(log, "ab") as stream:  # file grows
+            stream.write(data[3000:])
+        with SQLiteLoader(self.db, batchsize=5) as sql:
+            second = sql.load(log)
+            self.assertEqual(sql.load(log), 0)  # nothing new
+            self.assertEqual(sql.offset(log), len(data))
+            self.assertEqual(sql.offset("nosuchfile.ubx"), 0)
+            con = sql.connection
+            total = sql.count
+        with SQLiteLoader(":memory:") as ref:
+            self.assertEqual(ref.load(ZED), first + second)
+            for table in ref.tables.values():
+                expected = ref.connection.execute(
+                    f"SELECT * FROM {table} ORDER BY _id"
+                ).fetchall()
+                with sqlite3.connect(self.db) as con:
+                    actual = con.execute(
+                        f"SELECT * FROM {table} ORDER BY _id"
+                    ).fetchall()
+                self.assertEqual(
+                    [row[:1] + row[2:] for row in actual],  # _source differs
+                    [row[:1] + row[2:] for row in expected],
+                )
+        self.assertEqual(total, second)
+        with SQLiteLoader(self.db) as sql:
+            self.assertEqual(sql.load(log, restart=True), first + second)
+            with open(log, "wb") as stream:  # file replaced by smaller one
+                stream.write(data[:500])
+            self.assertGreater(sql.load(log), 0)
+            nav = sql.connection.execute("SELECT MAX(_id) FROM nav_pvt").fetchone()[0]
+            self.assertGreater(nav, 2)  # ids continue from existing rows
+
+    def testStream(self):
+        with open(ZED, "rb") as stream:
+            data = stream.read()
+        with SQLiteLoader(":memory:", identities=("NAV-PVT",), batchsize=3) as sql:
+            self.assertEqual(sql.run(BytesIO(data * 4)), 8)
+            self.assertEqual(sql.pending, 0)
+            con = sql.connection
+            self.assertEqual(
+                con.execute(
+                    "SELECT COUNT(*), COUNT(_source), COUNT(_offset) FROM nav_pvt"
+                ).fetchone(),
+                (8, 0, 0),
+            )
+            (raw, _), *_ = parsed(ZED, "NAV-PVT")
+            for _ in range(2):
+                self.assertTrue(sql.update(raw))
+            self.assertEqual(sql.pending, 2)
+            self.assertTrue(sql.update(raw))
+            self.assertEqual((sql.pending, sql.count), (0, 11))
+            stop = Event()
+            stop.set()
+            self.assertEqual(sql.run(BytesIO(data), stop), 0)
+
+    def testErrors(self):
+        with self.assertRaisesRegex(ParameterError, "Invalid identity NAV-XXX"):
+            SQLiteLoader(":memory:", identities=("NAV-PVT", "NAV-XXX"))
+        with self.assertRaisesRegex(ParameterError, "Invalid batchsize 0"):
+            SQLiteLoader(":memory:", batchsize=0)
+        sql = SQLiteLoader(self.db, identities=("NAV-PVT",))
+        (raw, _), *_ = parsed(ZED, "NAV-PVT")
+        self.assertFalse(sql.update(raw[:-1] + b"\x00"))  # bad checksum
+        self.assertEqual(sql.rejected, 1)
+        # existing table with constraint violated by inserted rows
+        con = sql.connection
+        con.execute(
+            'CREATE TABLE nav_pvt ("_id" INTEGER PRIMARY KEY, "iTOW" INTEGER CHECK("iTOW" < 0))'
+        )
+        self.assertTrue(sql.update(raw))
+        with self.assertRaises(sqlite3.IntegrityError):
+            sql.flush()
+        self.assertEqual(sql.pending, 0)
+        self.assertIn(
+            "hMSL", [row[1] for row in con.execute("PRAGMA table_info(nav_pvt)")]
+        )  # column added
+        self.assertEqual(con.execute("SELECT COUNT(*) FROM nav_pvt").fetchone()[0], 0)
+        self.assertFalse(con.in_transaction)
+        sql.close()
+        self.assertEqual(_bind(1 << 63), str(1 << 63))
+        self.assertEqual(_bind(-(1 << 63)), -(1 << 63))
+        self.assertEqual(_bind([1, 2]), b"\x01\x02")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
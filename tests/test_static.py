@@ -15,7 +15,7 @@ import unittest
 from datetime import datetime
 
 import pyubx2.ubxtypes_core as ubt
-from pyubx2 import POLL, SET, UBX_CLASSES, UBXMessage, UBXReader
+from pyubx2 import GET, POLL, SET, UBX_CLASSES, UBXMessage, UBXReader
 from pyubx2.ubxhelpers import (
     attsiz,
     att2idx,
@@ -38,7 +38,10 @@ from pyubx2.ubxhelpers import (
     msgstr2bytes,
     process_monver,
     protocol,
+    raw2identity,
+    raw2itow,
     sigid2str,
+    ubxidentity,
     utc2itow,
     val2bytes,
     val2sphp,
@@ -402,6 +405,41 @@ class StaticTest(unittest.TestCase):
         res = val2signmag(-10, "U24")
         self.assertEqual(res, 0b1000000000000000000001010)
 
+    def testraw2identity(self):
+        res = raw2identity(UBXMessage("NAV", "NAV-CLOCK", POLL).serialize())
+        self.assertEqual(res, "NAV-CLOCK")
+        res = raw2identity(b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n")
+        self.assertEqual(res, "GNGLL")
+        res = raw2identity(b"$PUBX,00,103607.00,5327.03942,N*6C\r\n")
+        self.assertEqual(res, "PUBX00")
+        res = raw2identity(b"$PGRMZ,2282,f,3*21\r\n")
+        self.assertEqual(res, "PGRMZ")
+        res = raw2identity(b"\xd3\x00\x04\x4c\xe0\x00\x80\xed\xed\xd6")
+        self.assertEqual(res, "1230")
+        res = raw2identity(b"\xd3\x00\x05\xfe\xc3\x92\x00\x00\x00\x00\x00")
+        self.assertEqual(res, "4076_201")
+        res = raw2identity(b"\x01\x02\x03\x04")
+        self.assertEqual(res, "UNKNOWN")
+
+    def testraw2itow(self):
+        msg = UBXMessage("NAV", "NAV-PVT", GET, iTOW=403327000)
+        self.assertEqual(raw2itow(msg.serialize()), 403327000)
+        msg = UBXMessage("NAV", "NAV-HPPOSECEF", GET, iTOW=123456)  # offset 4
+        self.assertEqual(raw2itow(msg.serialize()), 123456)
+        msg = UBXMessage("RXM", "RXM-RAWX", GET, rcvTow=403327.0005, week=2300)
+        self.assertEqual(raw2itow(msg.serialize()), 403327000)
+        self.assertIsNone(raw2itow(UBXMessage("NAV", "NAV-PVT", POLL).serialize()))
+        self.assertIsNone(raw2itow(b"\xb5b\x01\x07\x02\x00\x01\x02\x0b\x47"))
+        self.assertIsNone(raw2itow(UBXMessage("MON", "MON-VER", GET).serialize()))
+        self.assertIsNone(raw2itow(b"$GNGLL,5327.04319,S,00214.41396,E,*68\r\n"))
+
+    def testubxidentity(self):
+        self.assertEqual(ubxidentity(b"\x01", b"\x07"), "NAV-PVT")
+        self.assertEqual(ubxidentity(b"\x13", b"\x00", b"\x01\x00"), "MGA-GPS-EPH")
+        self.assertEqual(ubxidentity(b"\x13", b"\x80", b"\x01\x00"), "MGA-DBD")
+        self.assertEqual(ubxidentity(b"\x01", b"\xfe"), "NAV-01fe-NOMINAL")
+        self.assertEqual(ubxidentity(b"\x99", b"\x01"), "UNKNOWN-9901-NOMINAL")
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
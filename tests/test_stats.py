@@ -0,0 +1,148 @@
+"""
+UBXReader stats tests for pyubx2.ubxstats
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import calc_checksum
+
+from pyubx2 import (
+    ERR_IGNORE,
+    VALCKSUM,
+    VALNONE,
+    UBXReader,
+    UBXReaderStats,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def readall(name: str, **kwargs) -> UBXReader:
+    with open(os.path.join(DIRNAME, name), "rb") as stream:
+        ubr = UBXReader(stream, stats=True, quitonerror=ERR_IGNORE, **kwargs)
+        for _ in ubr:
+            pass
+    return ubr
+
+
+class StatsTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def teststatsbadck(self):
+        stats = readall("pygpsdata-MIXED3BADCK.log").stats()
+        self.assertEqual(
+            {
+                k: stats[k]
+                for k in ("frames", "bytes", "checksum", "errors", "discarded")
+            },
+            {"frames": 5, "bytes": 404, "checksum": 1, "errors": 0, "discarded": 10},
+        )
+        self.assertEqual(
+            stats["protocols"]["UBX"],
+            {"frames": 2, "bytes": 200, "checksum": 1, "errors": 0},
+        )
+        self.assertEqual(
+            stats["protocols"]["NMEA"],
+            {"frames": 3, "bytes": 204, "checksum": 0, "errors": 0},
+        )
+        pvt = stats["identities"]["NAV-PVT"]
+        self.assertEqual(
+            (pvt["protocol"], pvt["frames"], pvt["checksum"]), ("UBX", 2, 1)
+        )
+        dec = pvt["decode"]
+        self.assertEqual(dec["count"], 1)  # failed decode not timed
+        self.assertEqual(dec["min_ns"], dec["max_ns"])
+        self.assertEqual(dec["mean_ns"], dec["total_ns"])
+        ((bucket, count),) = dec["histogram"].items()
+        self.assertEqual(count, 1)
+        self.assertTrue(bucket // 2 <= dec["total_ns"] < bucket)
+        self.assertEqual(stats["identities"]["GPGGA"]["decode"]["count"], 2)
+
+    def teststatsbadcrc(self):
+        stats = readall("pygpsdata-MIXED-RTCM3BADCRC.log").stats()
+        self.assertEqual(stats["frames"], 10)
+        self.assertEqual(stats["protocols"]["RTCM3"]["checksum"], 1)
+        self.assertEqual(stats["identities"]["1005"]["checksum"], 1)
+        self.assertNotIn("decode", stats["identities"]["1005"])
+
+    def teststatsnmea(self):
+        def nmea(content: bytes, cksum: bytes | None = None) -> bytes:
+            if cksum is None:
+                cksum = calc_checksum(content.decode()).encode()
+            return b"$" + content + b"*" + cksum + b"\r\n"
+
+        gga = b"GPGGA,011228.75,0100.00000,N,,E,0,0,0.0,0.0,,0.0,,0.0,0"
+        badtype = gga.replace(b"E,0", b"E,q")  # invalid quality
+        for validate, badck in ((VALCKSUM, 1), (VALNONE, 0)):
+            with self.subTest(validate=validate):
+                ubr = UBXReader(
+                    BytesIO(nmea(gga) + nmea(gga, b"00") + nmea(badtype)),
+                    stats=True,
+                    quitonerror=ERR_IGNORE,
+                    validate=validate,
+                )
+                for _ in ubr:
+                    pass
+                gpgga = ubr.stats()["identities"]["GPGGA"]
+                self.assertEqual(
+                    (gpgga["frames"], gpgga["checksum"], gpgga["errors"]),
+                    (3, badck, 1),
+                )
+        self.assertFalse(UBXReader._cksum_failed(b"$GPGGA,1\r\n"))  # badly formed
+
+    def teststatsbadhdr(self):
+        stats = readall("pygpsdata-BADHDR.log").stats()
+        self.assertEqual(
+            (stats["frames"], stats["errors"], stats["discarded"]), (2, 1, 100)
+        )
+        self.assertEqual(
+            stats["identities"]["UNKNOWN"],
+            {"protocol": "", "frames": 0, "bytes": 0, "checksum": 0, "errors": 1},
+        )
+        self.assertNotIn("", stats["protocols"])
+
+    def teststatsnoparse(self):
+        ubr = readall("pygpsdata-MIXED-RTCM3.log", parsing=False)
+        stats = ubr.stats(reset=True)
+        self.assertEqual(stats["frames"], 10)
+        self.assertEqual(
+            [i for i, v in stats["identities"].items() if "decode" in v], []
+        )
+        self.assertEqual(ubr.stats(), UBXReaderStats().snapshot())
+
+    def teststatsdisabled(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            ubr = UBXReader(stream)
+            ubr.read()
+        self.assertEqual(ubr.stats(), {})
+        self.assertEqual(
+            UBXReaderStats().snapshot(),
+            {
+                "frames": 0,
+                "bytes": 0,
+                "checksum": 0,
+                "errors": 0,
+                "discarded": 0,
+                "protocols": {},
+                "identities": {},
+            },
+        )
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -13,10 +13,13 @@ Created on 3 Oct 2020
 import sys
 import os
 import unittest
-from io import StringIO
-from logging import ERROR
+from io import BufferedReader, BytesIO, StringIO
+from logging import ERROR, WARNING
+from threading import Event
+from unittest.mock import patch
 
 from pyubx2 import (
+    UBXMessage,
     UBXReader,
     VALCKSUM,
     UBX_PROTOCOL,
@@ -29,6 +32,7 @@ from pyubx2 import (
 )
 from pyrtcm.exceptions import RTCMParseError
 from pyubx2.exceptions import UBXParseError
+from pyubx2.ubxreader import validframes
 import pyubx2.ubxtypes_core as ubt
 
 DIRNAME = os.path.dirname(__file__)
@@ -750,6 +754,64 @@ class StreamTest(unittest.TestCase):
                 i += 1
             self.assertEqual(i, len(EXPECTED_RESULTS))
 
+    def testRESYNC(self):  # bulk resync on peekable stream
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            data = stream.read()
+        expected = [parsed.identity for _, parsed in UBXReader(BytesIO(data))]
+        noise = bytes(b for b in range(256) if b not in (0xB5, 0x24, 0xD3)) * 20
+        split = len(UBXReader(BytesIO(data)).read()[0])  # end of first message
+        stream = BufferedReader(BytesIO(noise + data[0:split] + noise + data[split:]))
+        ubr = UBXReader(stream, stats=True)
+        self.assertEqual([parsed.identity for _, parsed in ubr], expected)
+        self.assertEqual(ubr.stats()["discarded"], len(noise) * 2)
+
+    def testBADCK_STATUS(self):  # invalid UBX frames handled without exception
+        msg = UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=1).serialize()
+        badck = msg[:-1] + b"\x00"
+        badlen = msg[:4] + b"\x02\x00" + msg[6:]
+        badhdr = b"\xb6" + msg[1:]
+        ubr = UBXReader(BytesIO(badck + badlen + msg), quitonerror=ERR_IGNORE)
+        self.assertEqual([parsed.identity for _, parsed in ubr], ["NAV-CLOCK"])
+        for raw, err in (
+            (badck, "Message checksum b'8\\x00' invalid - should be b'8\\xf2'"),
+            (badlen, "Invalid payload length b'\\x02\\x00' - should be b'\\x14\\x00'"),
+            (badhdr, "Invalid message header b'\\xb6b' - should be b'\\xb5b'"),
+        ):
+            with self.assertRaises(UBXParseError) as context:
+                UBXReader.parse(raw)
+            self.assertEqual(str(context.exception), err)
+
+    def testERRORINTERVAL(self):  # rate-limited error reporting
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3BADCK.log"), "rb") as stream:
+            data = stream.read()
+        with self.assertLogs(level=WARNING) as log:
+            clock = [100.0]
+            with patch("pyubx2.ubxreader.monotonic", lambda: clock[0]):
+                ubr = UBXReader(
+                    BytesIO(data * 3), quitonerror=ERR_LOG, errorinterval=0.2
+                )
+                for i, _ in enumerate(ubr):
+                    if i == 7:  # end of second copy
+                        clock[0] += 0.25
+        self.assertEqual(len(log.output), 3)
+        self.assertIn("Message checksum", log.output[0])
+        self.assertEqual(
+            log.output[1],
+            "WARNING:pyubx2.ubxreader:1 errors suppressed in last 0.2 seconds",
+        )
+        self.assertIn("Message checksum", log.output[2])
+
+    def testVALIDFRAMES(self):  # raw frames filtered by id and checksum
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3BADCK.log"), "rb") as stream:
+            data = stream.read()
+        frames = list(validframes(BytesIO(data * 2), (b"\x01\x07",)))
+        self.assertEqual(len(frames), 2)  # bad checksum and NMEA skipped
+        self.assertEqual(frames[0], frames[1])
+        self.assertEqual(list(validframes(BytesIO(data), (b"\x01\x35",))), [])
+        stop = Event()
+        stop.set()
+        self.assertEqual(list(validframes(BytesIO(data), (b"\x01\x07",), stop)), [])
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -71,6 +71,14 @@ class StreamTest(unittest.TestCase):
                     self.assertEqual(raw, EXPECTED_RESULTS[i])
                     self.assertIsNone(parsed)
                     i += 1
+
+    def testDecode(self):  # test deferred decoding of unparsed data
+        EXPECTED_RESULTS = ("GNGLL", "1005", "4072", "1077", "1087", "1097", "1127", "1230", "NAV-PVT", "GNRMC")
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            ubr = UBXReader(stream, parsing=False)
+            res = tuple(ubr.decode(raw).identity for raw, _ in ubr)
+        self.assertEqual(res, EXPECTED_RESULTS)
+        self.assertIsNone(ubr.decode(b"\x01\x02\x03"))
             # sys.stdout = stdout_saved
 
     def testIterator(
@@ -98,6 +106,14 @@ class StreamTest(unittest.TestCase):
                     self.assertIsNone(parsed)
                     i += 1
 
+    def testDecode(self):  # test deferred decoding of unparsed data
+        EXPECTED_RESULTS = ("GNGLL", "1005", "4072", "1077", "1087", "1097", "1127", "1230", "NAV-PVT", "GNRMC")
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            ubr = UBXReader(stream, parsing=False)
+            res = tuple(ubr.decode(raw).identity for raw, _ in ubr)
+        self.assertEqual(res, EXPECTED_RESULTS)
+        self.assertIsNone(ubr.decode(b"\x01\x02\x03"))
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
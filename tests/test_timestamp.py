@@ -0,0 +1,146 @@
+"""
+Receive timestamp and timestamped recording tests for pyubx2.ubxtimestamp
+and pyubx2.ubxrecorder
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+from datetime import datetime, timezone
+from io import BytesIO
+from threading import Event
+from time import monotonic
+
+from pyubx2 import (
+    ERR_RAISE,
+    GET,
+    UBX_PROTOCOL,
+    FrameTimestamp,
+    UBXMessage,
+    UBXReader,
+    UBXRecorder,
+    UBXReplayer,
+    UBXStreamError,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+def wallns(dt: datetime) -> int:
+    return int(dt.replace(tzinfo=timezone.utc).timestamp() * 1e6) * 1000
+
+
+class TimestampTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testframetimestamp(self):
+        ts = FrameTimestamp(1000, 3500, 2000, 4500)
+        self.assertEqual(ts.transit, 2500)
+        self.assertEqual(repr(ts), "FrameTimestamp(1000, 3500, 2000, 4500)")
+        self.assertEqual(ts, FrameTimestamp(1000, 3500, 2000, 4500))
+        self.assertNotEqual(ts, FrameTimestamp(1000, 3500, 2000, 4501))
+        self.assertNotEqual(ts, "FrameTimestamp")
+        now = FrameTimestamp.now(mono_first=5)
+        self.assertEqual(now.mono_first, 5)
+        self.assertEqual(now.wall_first, now.wall_done)
+
+    def testlatency(self):
+        # 2026-10-18 12:00:00.075 UTC = Sunday + 43218.075s GPS (18 leapseconds)
+        utc = datetime(2026, 10, 18, 12, 0, 0, 75000)
+        ts = FrameTimestamp(0, 0, 0, wallns(utc))
+        self.assertEqual(ts.utc, utc)
+        msg = UBXMessage("NAV", "NAV-PVT", GET, iTOW=43218000)
+        self.assertEqual(ts.latency(msg), 75)
+        self.assertEqual(ts.latency(msg, leaps=17), -925)
+        msg = UBXMessage("NAV", "NAV-PVT", GET, iTOW=604799950)  # previous week
+        ts = FrameTimestamp(0, 0, 0, wallns(datetime(2026, 10, 17, 23, 59, 42, 20000)))
+        self.assertEqual(ts.latency(msg), 70)
+        self.assertIsNone(ts.latency(UBXMessage("MON", "MON-VER", GET)))
+
+    def testreadertimestamps(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            ubr = UBXReader(stream, timestamps=True, protfilter=UBX_PROTOCOL)
+            self.assertIsNone(ubr.timestamp)
+            last = None
+            for _, _ in ubr:
+                ts = ubr.timestamp
+                self.assertIsInstance(ts, FrameTimestamp)
+                self.assertGreaterEqual(ts.mono_done, ts.mono_first)
+                self.assertGreaterEqual(ts.wall_done, ts.wall_first)
+                self.assertIsNot(ts, last)
+                last = ts
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED3.log"), "rb") as stream:
+            ubr = UBXReader(stream)
+            ubr.read()
+            self.assertIsNone(ubr.timestamp)
+
+    def testrecordreplay(self):
+        rec = BytesIO()
+        with open(os.path.join(DIRNAME, "pygpsdata-MIXED-RTCM3.log"), "rb") as stream:
+            ubr = UBXReader(stream, timestamps=True)
+            recorder = UBXRecorder(rec)
+            expected = []
+            while True:
+                raw, parsed = ubr.read()
+                if raw is None:
+                    break
+                recorder.write(raw, ubr.timestamp)
+                expected.append((raw, str(parsed), ubr.timestamp))
+        recorder.write(expected[0][0])  # timestamped now
+        self.assertEqual(recorder.count, len(expected) + 1)
+        rec.seek(0)
+        rpl = UBXReplayer(rec)
+        res = [(raw, str(parsed), rpl.timestamp) for raw, parsed in rpl]
+        self.assertEqual(res[:-1], expected)
+        self.assertEqual(res[-1][:2], expected[0][:2])
+        self.assertGreater(res[-1][2].mono_done, expected[-1][2].mono_done)
+
+    def testrun(self):
+        rec = BytesIO()
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV.log"), "rb") as stream:
+            ubr = UBXReader(stream)  # no reader timestamps
+            self.assertEqual(UBXRecorder(rec).run(ubr), 28)
+        stop = Event()
+        stop.set()
+        self.assertEqual(UBXRecorder(BytesIO()).run(ubr, stop), 0)
+        rec.seek(0)
+        rpl = UBXReplayer(rec, parsing=False)
+        raw, parsed = rpl.read()
+        self.assertIsNone(parsed)
+        self.assertEqual(raw[:2], b"\xb5\x62")
+
+    def testrealtime(self):
+        rec = BytesIO()
+        recorder = UBXRecorder(rec)
+        raw = UBXMessage("NAV", "NAV-CLOCK", GET, iTOW=1).serialize()
+        for i in range(3):
+            recorder.write(raw, FrameTimestamp(0, i * 50000000, 0, 0))  # 50ms apart
+        rec.seek(0)
+        start = monotonic()
+        self.assertEqual(len(list(UBXReplayer(rec, realtime=True))), 3)
+        self.assertGreaterEqual(monotonic() - start, 0.09)
+
+    def testrecordingerrors(self):
+        with self.assertRaisesRegex(
+            UBXStreamError, "Invalid timestamped recording header b'UBXTS\\\\x02'"
+        ):
+            UBXReplayer(BytesIO(b"UBXTS\x02"))
+        rpl = UBXReplayer(BytesIO(b"UBXTS\x01\x00\x00\x00"), quitonerror=ERR_RAISE)
+        with self.assertRaisesRegex(UBXStreamError, "Truncated record header"):
+            rpl.read()
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
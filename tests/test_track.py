@@ -0,0 +1,230 @@
+"""
+GPX/KML track writer tests for pyubx2.ubxtrack
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import os
+import unittest
+import xml.etree.ElementTree as ET
+from io import StringIO
+from math import cos, hypot, radians
+from random import Random
+from struct import pack
+
+from pyubx2 import GET, ParameterError, TrackWriter, UBXMessage, UBXReader
+
+DIRNAME = os.path.dirname(__file__)
+GPX = "{http://www.topografix.com/GPX/1/1}"
+KML = "{http://www.opengis.net/kml/2.2}"
+MLAT = 1 / 111195.08  # 1 m of latitude in degrees
+
+
+def navpvt(
+    itow: int, lat: float, lon: float, hmsl: float = 50.0, flags: int = 1
+) -> bytes:
+    secs, msec = divmod(itow, 1000)
+    mins, secs = divmod(secs, 60)
+    payload = pack(
+        "<LHBBBBBB4xiBB2xiiii",
+        itow,
+        2026,
+        10,
+        18,
+        12,
+        mins % 60,
+        secs,
+        3,  # validDate, validTime
+        msec * 1000000,
+        3,
+        flags,
+        round(lon * 1e7),
+        round(lat * 1e7),
+        round(hmsl * 1000) + 48000,
+        round(hmsl * 1000),
+    )
+    return UBXMessage("NAV", "NAV-PVT", GET, payload=payload + b"\x00" * 52).serialize()
+
+
+def gpxpoints(xml: str) -> list:
+    root = ET.fromstring(xml)
+    return [
+        [(float(pt.get("lat")), float(pt.get("lon"))) for pt in seg]
+        for seg in root.iter(f"{GPX}trkseg")
+    ]
+
+
+def offtrack(lat: float, lon: float, track: list) -> float:
+    # planar distance in metres from point to nearest segment of track
+    scale = 111195.08
+    xscale = scale * cos(radians(lat))
+    best = None
+    for (lat1, lon1), (lat2, lon2) in zip(track, track[1:]):
+        x1, y1 = (lon1 - lon) * xscale, (lat1 - lat) * scale
+        x2, y2 = (lon2 - lon) * xscale, (lat2 - lat) * scale
+        dx, dy = x2 - x1, y2 - y1
+        seg2 = dx * dx + dy * dy
+        t = 0 if seg2 == 0 else max(0, min(1, -(x1 * dx + y1 * dy) / seg2))
+        dist = hypot(x1 + t * dx, y1 + t * dy)
+        best = dist if best is None else min(best, dist)
+    return best
+
+
+class TrackTest(unittest.TestCase):
+    def testStraight(self):
+        out = StringIO()
+        with TrackWriter(out) as trk:
+            for i in range(200):  # 1 m steps north
+                self.assertTrue(trk.write(navpvt(i * 1000, 53.0 + i * MLAT, -2.0)))
+        self.assertEqual((trk.count, trk.written, trk.segments), (200, 2, 1))
+        segs = gpxpoints(out.getvalue())
+        self.assertEqual(segs, [[(53.0, -2.0), (53.0017896, -2.0)]])
+        root = ET.fromstring(out.getvalue())
+        times = [elem.text for elem in root.iter(f"{GPX}time")]
+        self.assertEqual(times[1:], ["2026-10-18T12:00:00Z", "2026-10-18T12:03:19Z"])
+        self.assertEqual(root.find(f"{GPX}trk/{GPX}name").text, "pyubx2 track")
+
+    def testTolerance(self):
+        rng = Random(2)
+        lat, lon = 53.0, -2.0
+        raws, points = [], []
+        for i in range(1000):  # random walk with ~2 m steps
+            lat += rng.gauss(0, 2) * MLAT
+            lon += rng.gauss(0, 2) * MLAT / cos(radians(53))
+            raws.append(navpvt(i * 1000, lat, lon))
+            points.append((round(lat, 7), round(lon, 7)))
+        counts = []
+        for tolerance, window in ((5.0, 100), (1.0, 500), (0.0, 500)):
+            out = StringIO()
+            with TrackWriter(out, tolerance=tolerance, window=window) as trk:
+                for raw in raws:
+                    trk.write(raw)
+            (track,) = gpxpoints(out.getvalue())
+            self.assertEqual(len(track), trk.written)
+            self.assertEqual((track[0], track[-1]), (points[0], points[-1]))
+            for lat, lon in points:
+                self.assertLessEqual(offtrack(lat, lon, track), tolerance + 0.01)
+            counts.append(trk.written)
+        self.assertEqual(track, points)  # tolerance 0
+        self.assertLess(counts[0], counts[1])
+        self.assertLess(counts[1], counts[2])
+
+    def testSegments(self):
+        out = StringIO()
+        trk = TrackWriter(out, fmt="kml", tolerance=0.5, window=3, name="drive")
+        for i in range(10):
+            trk.write(navpvt(i * 1000, 53.0 + i * 10 * MLAT, -2.0 + (i % 2) * 1e-4))
+        self.assertFalse(trk.write(navpvt(10000, 53.1, -2.0, flags=0)))  # fix lost
+        self.assertFalse(trk.write(navpvt(11000, 53.1, -2.0, flags=0)))
+        for i in range(3):
+            trk.write(navpvt(12000 + i * 1000, 53.1 + i * MLAT, -2.0))
+        trk.close()
+        trk.close()
+        self.assertFalse(trk.write(navpvt(20000, 53.2, -2.0)))
+        root = ET.fromstring(out.getvalue())
+        self.assertEqual(root.find(f"{KML}Document/{KML}name").text, "drive")
+        coords = [elem.text.split() for elem in root.iter(f"{KML}coordinates")]
+        self.assertEqual([len(seg) for seg in coords], [10, 2])
+        self.assertEqual(coords[1][0], "-2.0000000,53.1000000,50.000")
+        self.assertEqual((trk.count, trk.written, trk.segments), (13, 12, 2))
+
+    def testHPPOSLLH(self):
+        with open(os.path.join(DIRNAME, "pygpsdata-NAV-ZED-X20P.log"), "rb") as stream:
+            msgs = [
+                parsed
+                for _, parsed in UBXReader(stream)
+                if parsed.identity in ("NAV-PVT", "NAV-HPPOSLLH")
+            ]
+            stream.seek(0)
+            out = StringIO()
+            with TrackWriter(out, identity="NAV-HPPOSLLH", tolerance=0) as trk:
+                self.assertEqual(trk.run(stream), 2)
+        root = ET.fromstring(out.getvalue())
+        points = list(root.iter(f"{GPX}trkpt"))
+        hpps = [msg for msg in msgs if msg.identity == "NAV-HPPOSLLH"]
+        pvts = [msg for msg in msgs if msg.identity == "NAV-PVT"]
+        for point, hpp, pvt in zip(points, hpps, pvts):
+            self.assertAlmostEqual(float(point.get("lat")), hpp.lat, 9)
+            self.assertAlmostEqual(float(point.get("lon")), hpp.lon, 9)
+            self.assertAlmostEqual(
+                float(point.find(f"{GPX}ele").text), hpp.hMSL / 1000, 3
+            )
+            self.assertEqual(
+                point.find(f"{GPX}time").text[11:19],
+                f"{pvt.hour:02d}:{pvt.min:02d}:{pvt.second:02d}",
+            )
+        self.assertEqual(len(points[0].get("lat").split(".")[1]), 9)
+        raw = UBXMessage("NAV", "NAV-HPPOSLLH", GET, invalidLlh=1).serialize()
+        self.assertFalse(TrackWriter(StringIO(), identity="NAV-HPPOSLLH").write(raw))
+
+    def testPOSLLH(self):
+        out = StringIO()
+        with TrackWriter(out, identity="NAV-POSLLH", tolerance=0) as trk:
+            self.assertFalse(trk.write(navpvt(1000, 53.0, -2.0)))  # timestamp only
+            raw = UBXMessage(
+                "NAV", "NAV-POSLLH", GET, iTOW=1500, lat=53.1, lon=-2.1, hMSL=12345
+            ).serialize()
+            self.assertTrue(trk.write(raw))
+            self.assertFalse(trk.write(b"\xb5b\x01\x02\x00\x00"))  # truncated
+        point = ET.fromstring(out.getvalue()).find(f"{GPX}trk/{GPX}trkseg/{GPX}trkpt")
+        self.assertEqual(
+            (point.get("lat"), point.get("lon")), ("53.1000000", "-2.1000000")
+        )
+        self.assertEqual(point.find(f"{GPX}time").text, "2026-10-18T12:00:01.500Z")
+        self.assertEqual(point.find(f"{GPX}ele").text, "12.345")
+
+    def testPOSLLHFixLost(self):
+        def posllh(itow: int, lat: float) -> bytes:
+            return UBXMessage(
+                "NAV", "NAV-POSLLH", GET, iTOW=itow, lat=lat, lon=-2.0, hMSL=50000
+            ).serialize()
+
+        out = StringIO()
+        with TrackWriter(out, identity="NAV-POSLLH", tolerance=0) as trk:
+            self.assertTrue(trk.write(posllh(500, 53.0)))  # no NAV-PVT yet
+            trk.write(navpvt(1000, 53.0, -2.0))
+            self.assertTrue(trk.write(posllh(1000, 53.1)))
+            trk.write(navpvt(2000, 53.0, -2.0, flags=0))  # fix lost, segment ended
+            self.assertFalse(trk.write(posllh(2000, 53.2)))  # dropped
+            trk.write(navpvt(3000, 53.0, -2.0))
+            self.assertTrue(trk.write(posllh(3000, 53.3)))
+        self.assertEqual((trk.count, trk.segments), (3, 2))
+        self.assertEqual(
+            gpxpoints(out.getvalue()), [[(53.0, -2.0), (53.1, -2.0)], [(53.3, -2.0)]]
+        )
+
+    def testNAV2PVT(self):
+        out = StringIO()
+        with TrackWriter(out, tolerance=0, name="A & B <1>") as trk:
+            self.assertTrue(trk.write(navpvt(1000, 53.0, -2.0)))
+            nav2 = b"\xb5b\x29" + navpvt(2000, 53.1, -2.0, flags=0)[3:]
+            self.assertFalse(trk.write(nav2))  # ignored, fix state unchanged
+            self.assertTrue(trk.write(navpvt(3000, 53.2, -2.0)))
+        self.assertEqual(trk.segments, 1)
+        root = ET.fromstring(out.getvalue())
+        self.assertEqual(root.find(f"{GPX}trk/{GPX}name").text, "A & B <1>")
+
+    def testErrors(self):
+        with self.assertRaisesRegex(ParameterError, "Invalid format csv"):
+            TrackWriter(StringIO(), fmt="csv")
+        with self.assertRaisesRegex(ParameterError, "Invalid identity NAV-SAT"):
+            TrackWriter(StringIO(), identity="NAV-SAT")
+        with self.assertRaisesRegex(ParameterError, "Invalid window 2"):
+            TrackWriter(StringIO(), window=2)
+        out = StringIO()
+        with TrackWriter(out, fmt="kml") as trk:
+            self.assertFalse(trk.write(b"\xb5b\x01\x35\x00\x00"))
+        root = ET.fromstring(out.getvalue())  # empty but valid
+        self.assertEqual(len(list(root.iter(f"{KML}Placemark"))), 0)
+        self.assertEqual(trk.segments, 0)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()